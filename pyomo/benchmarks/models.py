@@ -0,0 +1,235 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+"""Scalable models used by the Pyomo performance benchmarks.
+
+Each model is registered with :py:data:`BenchmarkModels` as a function
+that takes a single size parameter ``n`` and returns a constructed
+:py:class:`ConcreteModel` that is ready to be written.  The time to call
+the function is reported as the model "construction" time, so any
+transformations needed to obtain an algebraic model (e.g., discretizing
+a DAE or relaxing a GDP) are performed by the model function.
+
+The model data are generated deterministically from the indices so
+that results are comparable across runs.
+
+"""
+
+from pyomo.common.factory import Factory
+from pyomo.core import (
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    RangeSet,
+    Set,
+    TransformationFactory,
+    Var,
+    exp,
+    log,
+)
+
+BenchmarkModels = Factory('benchmark model')
+
+
+@BenchmarkModels.register(
+    'transport_lp', 'Transportation LP with n plants and n markets (n**2 variables)'
+)
+def transport_lp(n, storage='object'):
+    m = ConcreteModel(name='transport_lp')
+    m.I = RangeSet(n)
+    m.J = RangeSet(n)
+    m.supply = Param(m.I, initialize=lambda m, i: 10 + (7 * i) % 13)
+    m.demand = Param(m.J, initialize=lambda m, j: 5 + (3 * j) % 11)
+    m.cost = Param(m.I, m.J, initialize=lambda m, i, j: 1 + (i * j) % 17)
+    m.x = Var(m.I, m.J, domain=NonNegativeReals, storage=storage)
+    m.c_supply = Constraint(
+        m.I, rule=lambda m, i: sum(m.x[i, j] for j in m.J) <= m.supply[i]
+    )
+    m.c_demand = Constraint(
+        m.J, rule=lambda m, j: sum(m.x[i, j] for i in m.I) >= m.demand[j]
+    )
+    m.obj = Objective(expr=sum(m.cost[i, j] * m.x[i, j] for i in m.I for j in m.J))
+    return m
+
+
+@BenchmarkModels.register(
+    'transport_lp_array',
+    "Transportation LP with n plants and n markets, with the variables "
+    "declared with storage='array'",
+)
+def transport_lp_array(n):
+    return transport_lp(n, storage='array')
+
+
+@BenchmarkModels.register(
+    'ranged_lp',
+    'LP with n ranged constraints over 4*isqrt(n) variables (20 nonzeros per '
+    'constraint)',
+)
+def ranged_lp(n):
+    from math import isqrt
+
+    m = ConcreteModel(name='ranged_lp')
+    nx = 4 * max(isqrt(n), 5)
+    m.I = RangeSet(nx)
+    m.J = RangeSet(n)
+    m.x = Var(m.I, bounds=(-10, 10))
+    m.c = Constraint(
+        m.J,
+        rule=lambda m, j: (
+            -j,
+            sum((1 + (j + k) % 7) * m.x[(j * 13 + k * 7) % nx + 1] for k in range(20)),
+            j,
+        ),
+    )
+    m.obj = Objective(expr=sum((i % 5 - 2) * m.x[i] for i in m.I))
+    return m
+
+
+@BenchmarkModels.register(
+    'long_linear_sum', 'LP with a single constraint and objective with n terms'
+)
+def long_linear_sum(n):
+    m = ConcreteModel(name='long_linear_sum')
+    m.I = RangeSet(n)
+    m.x = Var(m.I, bounds=(0, 1))
+    m.c = Constraint(expr=sum((1 + i % 7) * m.x[i] for i in m.I) <= n)
+    m.obj = Objective(expr=sum((i % 5 - 2) * m.x[i] for i in m.I))
+    return m
+
+
+@BenchmarkModels.register(
+    'nonlinear_sum',
+    'NLP with n constraints mixing nonlinear and linear terms over n variables',
+)
+def nonlinear_sum(n):
+    m = ConcreteModel(name='nonlinear_sum')
+    m.I = RangeSet(n)
+    m.x = Var(m.I, bounds=(1, 10), initialize=1)
+    m.c = Constraint(
+        m.I,
+        rule=lambda m, i: exp(m.x[i]) * m.x[i % n + 1]
+        + log(m.x[i % n + 1]) ** 2
+        + 2 * m.x[i]
+        - 3 * m.x[i % n + 1]
+        <= 100 + i,
+    )
+    m.obj = Objective(expr=sum((m.x[i] - i % 3) ** 2 for i in m.I))
+    return m
+
+
+@BenchmarkModels.register(
+    'network_flow',
+    'Min-cost flow LP over n nodes and 5*n arcs (explicit arc Set and '
+    'immutable arc data)',
+)
+def network_flow(n):
+    m = ConcreteModel(name='network_flow')
+    m.N = RangeSet(n)
+    m.A = Set(
+        initialize=[(i, (i + k * k) % n + 1) for i in m.N for k in range(1, 6)], dimen=2
+    )
+    m.cost = Param(m.A, initialize=lambda m, i, j: 1 + (i * j) % 13)
+    m.cap = Param(m.A, initialize=lambda m, i, j: 5 + (i + 3 * j) % 11)
+    m.supply = Param(m.N, initialize=lambda m, i: (i % 5) - 2)
+    m.flow = Var(m.A, bounds=lambda m, i, j: (0, m.cap[i, j]))
+
+    def balance_rule(m, i):
+        succ = sorted({(i + k * k) % n + 1 for k in range(1, 6)})
+        pred = sorted({(i - k * k - 2) % n + 1 for k in range(1, 6)})
+        return (
+            sum(m.flow[i, j] for j in succ) - sum(m.flow[j, i] for j in pred)
+            == m.supply[i]
+        )
+
+    m.balance = Constraint(m.N, rule=balance_rule)
+    m.obj = Objective(expr=sum(m.cost[a] * m.flow[a] for a in m.A))
+    return m
+
+
+@BenchmarkModels.register(
+    'dense_qp', 'Quadratic program with a dense n x n objective Hessian'
+)
+def dense_qp(n):
+    m = ConcreteModel(name='dense_qp')
+    m.I = RangeSet(n)
+    m.Q = Param(
+        m.I,
+        m.I,
+        initialize=lambda m, i, j: float(n) if i == j else ((i + j) % 5) / 10.0,
+    )
+    m.c = Param(m.I, initialize=lambda m, i: (i % 3) - 1)
+    m.x = Var(m.I, bounds=(0, 1))
+    m.budget = Constraint(expr=sum(m.x[i] for i in m.I) == 1)
+    m.obj = Objective(
+        expr=sum(m.Q[i, j] * m.x[i] * m.x[j] for i in m.I for j in m.I)
+        + sum(m.c[i] * m.x[i] for i in m.I)
+    )
+    return m
+
+
+@BenchmarkModels.register(
+    'dae_collocation',
+    'Double integrator optimal control problem discretized by collocation '
+    'over n finite elements',
+)
+def dae_collocation(n):
+    from pyomo.dae import ContinuousSet, DerivativeVar
+
+    m = ConcreteModel(name='dae_collocation')
+    m.t = ContinuousSet(bounds=(0, 1))
+    m.x1 = Var(m.t, initialize=0)
+    m.x2 = Var(m.t, initialize=0)
+    m.u = Var(m.t, bounds=(-10, 10), initialize=0)
+    m.dx1 = DerivativeVar(m.x1, wrt=m.t)
+    m.dx2 = DerivativeVar(m.x2, wrt=m.t)
+    m.ode1 = Constraint(m.t, rule=lambda m, t: m.dx1[t] == m.x2[t])
+    m.ode2 = Constraint(m.t, rule=lambda m, t: m.dx2[t] == m.u[t] - 0.1 * m.x2[t] ** 2)
+    m.x1[0].fix(1)
+    m.x2[0].fix(0)
+    m.final = Constraint(expr=m.x1[1] == 0)
+    m.obj = Objective(expr=sum(m.u[t] ** 2 for t in m.t))
+    TransformationFactory('dae.collocation').apply_to(
+        m, wrt=m.t, nfe=n, ncp=3, scheme='LAGRANGE-RADAU'
+    )
+    return m
+
+
+@BenchmarkModels.register(
+    'gdp', 'Disjunctive model with n two-term disjunctions (Big-M relaxation)'
+)
+def gdp(n):
+    from pyomo.gdp import Disjunct, Disjunction
+
+    m = ConcreteModel(name='gdp')
+    m.I = RangeSet(n)
+    m.x = Var(m.I, bounds=(0, 10))
+    m.cost = Param(m.I, initialize=lambda m, i: 1 + (5 * i) % 7)
+
+    def d_rule(d, i, k):
+        m = d.model()
+        if k:
+            d.c = Constraint(expr=m.x[i] >= 8)
+        else:
+            d.c = Constraint(expr=m.x[i] <= 2)
+
+    m.d = Disjunct(m.I, [0, 1], rule=d_rule)
+    m.disjunction = Disjunction(m.I, rule=lambda m, i: [m.d[i, 0], m.d[i, 1]])
+    m.link = Constraint(
+        m.I,
+        rule=lambda m, i: m.x[i] + m.x[i % n + 1] >= 9 if n > 1 else Constraint.Skip,
+    )
+    m.obj = Objective(expr=sum(m.cost[i] * m.x[i] for i in m.I))
+    TransformationFactory('gdp.bigm').apply_to(m)
+    return m
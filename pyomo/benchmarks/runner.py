@@ -0,0 +1,530 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+"""Driver for running the Pyomo performance benchmarks.
+
+:py:func:`run_benchmarks` builds each requested model from
+:py:data:`~pyomo.benchmarks.models.BenchmarkModels` at each requested
+size and records (as a JSON-compatible dict):
+
+- the time to construct the model,
+- the time to write the model with each requested writer (and the size
+  of the generated output),
+- the peak memory allocated (as reported by :py:mod:`tracemalloc`)
+  while constructing and writing the model, and
+- the statistics for the NL writer's constraint representation cache
+  (see the `incremental` NL writer option) when re-writing an
+  unchanged model, and
+- the time for each requested expression visitor (see
+  :py:data:`VISITORS`) to walk every active objective and constraint
+  in the model, and
+- the time to save and load the model with each requested serializer
+  (see :py:data:`SERIALIZERS`), and the size of the saved file, and
+- the time to clone the model with each requested cloner (see
+  :py:data:`CLONERS`), the memory retained by the clone, and the
+  data shared with the original model.
+
+Timings are the best of `repeat` runs.  Memory is measured in a
+separate pass (tracing allocations perturbs the timing results).  The
+model load time can be compared with the construction time (the time
+to rebuild the model from scratch).
+Results from different commits can be compared with
+:py:func:`compare_results`.
+
+"""
+
+import datetime
+import gc
+import io
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+
+from pyomo.common.dependencies import scipy
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.timing import default_timer
+from pyomo.core import Constraint, Objective, Var
+from pyomo.core.expr import _visitor_core
+from pyomo.benchmarks.models import BenchmarkModels
+import pyomo.version
+
+
+def _write_nl(model):
+    from pyomo.repn.plugins.nl_writer import NLWriter
+
+    ostream = io.StringIO()
+    NLWriter().write(model, ostream)
+    return len(ostream.getvalue())
+
+
+def _write_lp(model):
+    from pyomo.repn.plugins.lp_writer import LPWriter
+
+    ostream = io.StringIO()
+    LPWriter().write(model, ostream)
+    return len(ostream.getvalue())
+
+
+def _write_gams(model):
+    from pyomo.repn.plugins.gams_writer import ProblemWriter_gams
+
+    ostream = io.StringIO()
+    ProblemWriter_gams()(model, ostream, None, {})
+    return len(ostream.getvalue())
+
+
+def _write_baron(model):
+    from pyomo.repn.plugins.baron_writer import ProblemWriter_bar
+
+    ostream = io.StringIO()
+    ProblemWriter_bar()(model, ostream, None, {})
+    return len(ostream.getvalue())
+
+
+def _compile_standard_form(model):
+    from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+
+    A = LinearStandardFormCompiler().write(model).A
+    return A.nnz
+
+
+#: Mapping of writer name to a function that writes the model and
+#: returns a measure of the output size (the number of characters in
+#: the generated file, or the number of nonzeros in the standard form)
+WRITERS = {
+    'nl': _write_nl,
+    'lp': _write_lp,
+    'gams': _write_gams,
+    'baron': _write_baron,
+    'standard_form': _compile_standard_form,
+}
+
+
+def _walk_linear(exprs):
+    from pyomo.repn.linear import LinearRepnVisitor
+
+    visitor = LinearRepnVisitor({})
+    return sum(len(visitor.walk_expression(expr).linear) for expr in exprs)
+
+
+def _walk_identify_variables(exprs):
+    from pyomo.core.expr.visitor import identify_variables
+
+    return sum(1 for expr in exprs for v in identify_variables(expr))
+
+
+def _walk_fbbt(exprs):
+    from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
+
+    return sum(1 for expr in exprs if compute_bounds_on_expr(expr) != (None, None))
+
+
+#: Mapping of visitor name to a function that walks a list of
+#: expressions with a :py:class:`StreamBasedExpressionVisitor` and
+#: returns a measure of the result size (the number of linear terms,
+#: the number of variables, or the number of bounded expressions)
+VISITORS = {
+    'linear': _walk_linear,
+    'identify_variables': _walk_identify_variables,
+    'fbbt': _walk_fbbt,
+}
+
+
+def _save_model_file(model, filename):
+    from pyomo.core.base.serialization import save_model
+
+    save_model(model, filename)
+
+
+def _load_model_file(filename):
+    from pyomo.core.base.serialization import load_model
+
+    return load_model(filename)
+
+
+#: Mapping of serializer name to a tuple of functions that save a model
+#: to a file and load the model from that file
+SERIALIZERS = {'model_file': (_save_model_file, _load_model_file)}
+
+
+def _clone(model):
+    return model.clone(), None
+
+
+def _clone_shared(model):
+    clone, report = model.clone(share=True, report=True)
+    return clone, {slot: getattr(report, slot) for slot in report.__slots__}
+
+
+#: Mapping of cloner name to a function that clones the model and
+#: returns the clone and a description of the data shared with the
+#: model (or None)
+CLONERS = {'copy': _clone, 'share': _clone_shared}
+
+
+def _expressions(model):
+    exprs = [obj.expr for obj in model.component_data_objects(Objective, active=True)]
+    exprs.extend(
+        con.body for con in model.component_data_objects(Constraint, active=True)
+    )
+    return exprs
+
+
+def _git_revision():
+    try:
+        return (
+            subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=os.path.dirname(os.path.abspath(pyomo.version.__file__)),
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10,
+            ).stdout.strip()
+            or None
+        )
+    except Exception:
+        return None
+
+
+def benchmark_metadata():
+    """Return a dict describing the environment the benchmarks ran in"""
+    return {
+        'pyomo_version': pyomo.version.version,
+        'git_revision': _git_revision(),
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'compiled_visitor': _visitor_core.compiled,
+    }
+
+
+def _timed(fcn, *args, **kwds):
+    gc.collect()
+    start = default_timer()
+    ans = fcn(*args, **kwds)
+    return default_timer() - start, ans
+
+
+def _peak_memory(fcn, *args, **kwds):
+    gc.collect()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    ans = fcn(*args, **kwds)
+    return tracemalloc.get_traced_memory()[1] - start, ans
+
+
+def _retained_memory(fcn, *args, **kwds):
+    gc.collect()
+    start = tracemalloc.get_traced_memory()[0]
+    ans = fcn(*args, **kwds)
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - start, ans
+
+
+def _repn_cache_stats(model):
+    from pyomo.repn.plugins.nl_writer import NLWriter
+
+    writer = NLWriter()
+    writer.write(model, io.StringIO(), incremental=True)
+    cache = writer._repn_cache
+    cold_misses = cache.misses
+    warm_time, _ = _timed(writer.write, model, io.StringIO(), incremental=True)
+    return {
+        'entries': len(cache.entries),
+        'cold_misses': cold_misses,
+        'warm_hits': cache.hits,
+        'warm_misses': cache.misses,
+        'warm_write_time': warm_time,
+    }
+
+
+def _serialize(save, load, model, filename, repeat):
+    save_times = []
+    load_times = []
+    for i in range(repeat):
+        t, _ = _timed(save, model, filename)
+        save_times.append(t)
+        t, _ = _timed(load, filename)
+        load_times.append(t)
+    return {
+        'save_time': min(save_times),
+        'load_time': min(load_times),
+        'file_size': os.path.getsize(filename),
+    }
+
+
+def run_benchmark(
+    name,
+    size,
+    writers=('nl', 'lp'),
+    repeat=1,
+    memory=True,
+    visitors=(),
+    serializers=(),
+    cloners=(),
+):
+    """Run the benchmarks for a single model and size
+
+    Returns a dict of the results.  Errors raised while writing or
+    saving the model (e.g., compiling a nonlinear model into standard
+    form) are recorded in the results and do not abort the benchmark.
+
+    """
+    for writer in writers:
+        if writer not in WRITERS:
+            raise ValueError(
+                "Unknown benchmark writer '%s' (expected one of %s)"
+                % (writer, ', '.join(sorted(WRITERS)))
+            )
+    for visitor in visitors:
+        if visitor not in VISITORS:
+            raise ValueError(
+                "Unknown benchmark visitor '%s' (expected one of %s)"
+                % (visitor, ', '.join(sorted(VISITORS)))
+            )
+    for serializer in serializers:
+        if serializer not in SERIALIZERS:
+            raise ValueError(
+                "Unknown benchmark serializer '%s' (expected one of %s)"
+                % (serializer, ', '.join(sorted(SERIALIZERS)))
+            )
+    for cloner in cloners:
+        if cloner not in CLONERS:
+            raise ValueError(
+                "Unknown benchmark cloner '%s' (expected one of %s)"
+                % (cloner, ', '.join(sorted(CLONERS)))
+            )
+    result = {'model': name, 'size': size}
+
+    construct_time = []
+    for i in range(repeat):
+        # Release the previous model before building the next one
+        model = None
+        t, model = _timed(BenchmarkModels, name, n=size, exception=True)
+        construct_time.append(t)
+    result['construct_time'] = min(construct_time)
+    result['n_vars'] = sum(1 for _ in model.component_data_objects(Var))
+    result['n_constraints'] = sum(
+        1 for _ in model.component_data_objects(Constraint, active=True)
+    )
+
+    if 'standard_form' in writers:
+        # Import scipy before timing the compiler (the standard form
+        # compiler defers the import until it is first needed)
+        scipy.sparse
+
+    result['writers'] = {}
+    for writer in writers:
+        times = []
+        try:
+            for i in range(repeat):
+                t, output_size = _timed(WRITERS[writer], model)
+                times.append(t)
+        except Exception as e:
+            result['writers'][writer] = {'error': '%s: %s' % (type(e).__name__, e)}
+            continue
+        result['writers'][writer] = {'time': min(times), 'output_size': output_size}
+
+    if 'nl' in writers and 'error' not in result['writers']['nl']:
+        result['repn_cache'] = _repn_cache_stats(model)
+
+    if visitors:
+        exprs = _expressions(model)
+        result['visitors'] = {}
+        for visitor in visitors:
+            times = []
+            for i in range(repeat):
+                t, result_size = _timed(VISITORS[visitor], exprs)
+                times.append(t)
+            result['visitors'][visitor] = {
+                'time': min(times),
+                'result_size': result_size,
+            }
+
+    if serializers:
+        result['serializers'] = {}
+        with TempfileManager.new_context() as tempfiles:
+            for serializer in serializers:
+                save, load = SERIALIZERS[serializer]
+                fname = tempfiles.create_tempfile(suffix='.' + serializer)
+                try:
+                    info = _serialize(save, load, model, fname, repeat)
+                except Exception as e:
+                    info = {'error': '%s: %s' % (type(e).__name__, e)}
+                result['serializers'][serializer] = info
+
+    if cloners:
+        result['cloners'] = {}
+        for cloner in cloners:
+            times = []
+            for i in range(repeat):
+                # Release the previous clone before cloning again
+                clone = None
+                t, (clone, shared) = _timed(CLONERS[cloner], model)
+                times.append(t)
+            clone = None
+            info = result['cloners'][cloner] = {'time': min(times)}
+            if shared is not None:
+                info['shared'] = shared
+
+    if memory:
+        model = None
+        tracemalloc.start()
+        try:
+            result['construct_memory'], model = _peak_memory(
+                BenchmarkModels, name, n=size, exception=True
+            )
+            for writer in writers:
+                info = result['writers'][writer]
+                if 'error' not in info:
+                    info['memory'], _ = _peak_memory(WRITERS[writer], model)
+            with TempfileManager.new_context() as tempfiles:
+                for serializer in serializers:
+                    info = result['serializers'][serializer]
+                    if 'error' not in info:
+                        save, load = SERIALIZERS[serializer]
+                        fname = tempfiles.create_tempfile(suffix='.' + serializer)
+                        save(model, fname)
+                        info['load_memory'], _ = _peak_memory(load, fname)
+            for cloner in cloners:
+                info = result['cloners'][cloner]
+                info['memory'], _ = _retained_memory(CLONERS[cloner], model)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(
+    models=None,
+    sizes=(100,),
+    writers=('nl', 'lp'),
+    repeat=1,
+    memory=True,
+    log=None,
+    visitors=(),
+    serializers=(),
+    cloners=(),
+):
+    """Run the benchmarks for all combinations of models and sizes
+
+    Parameters
+    ----------
+    models: list of str
+        The models to run (defaults to all models registered with
+        :py:data:`BenchmarkModels`)
+    sizes: list of int
+        The size parameters to build each model with
+    writers: list of str
+        The writers (keys of :py:data:`WRITERS`) to benchmark
+    repeat: int
+        The number of times to repeat each timing (the best time is
+        reported)
+    memory: bool
+        If True, record the peak memory used while constructing and
+        writing each model
+    log: file-like, optional
+        Stream to report progress to
+    visitors: list of str
+        The expression visitors (keys of :py:data:`VISITORS`) to
+        benchmark
+    serializers: list of str
+        The serializers (keys of :py:data:`SERIALIZERS`) to benchmark
+    cloners: list of str
+        The cloners (keys of :py:data:`CLONERS`) to benchmark
+
+    Returns
+    -------
+    dict
+        JSON-compatible dict with keys ``metadata`` and ``results``
+
+    """
+    if models is None:
+        models = list(BenchmarkModels)
+    results = []
+    for name in models:
+        for size in sizes:
+            if log is not None:
+                log.write('Running %s (n=%s)\n' % (name, size))
+                log.flush()
+            results.append(
+                run_benchmark(
+                    name, size, writers, repeat, memory, visitors, serializers, cloners
+                )
+            )
+    return {'metadata': benchmark_metadata(), 'results': results}
+
+
+def _metrics(result):
+    ans = {
+        'construct_time': result.get('construct_time'),
+        'construct_memory': result.get('construct_memory'),
+    }
+    for writer, info in result.get('writers', {}).items():
+        ans['write_time[%s]' % writer] = info.get('time')
+        ans['write_memory[%s]' % writer] = info.get('memory')
+    for visitor, info in result.get('visitors', {}).items():
+        ans['walk_time[%s]' % visitor] = info.get('time')
+    for serializer, info in result.get('serializers', {}).items():
+        ans['save_time[%s]' % serializer] = info.get('save_time')
+        ans['load_time[%s]' % serializer] = info.get('load_time')
+        ans['load_memory[%s]' % serializer] = info.get('load_memory')
+    for cloner, info in result.get('cloners', {}).items():
+        ans['clone_time[%s]' % cloner] = info.get('time')
+        ans['clone_memory[%s]' % cloner] = info.get('memory')
+    return ans
+
+
+def compare_results(baseline, current):
+    """Compare two sets of benchmark results
+
+    Returns a list of ``(model, size, metric, baseline, current,
+    ratio)`` tuples for every metric recorded in both result sets
+    (ratios greater than 1 indicate that `current` is slower / uses
+    more memory than `baseline`).
+
+    """
+    base = {(r['model'], r['size']): _metrics(r) for r in baseline['results']}
+    rows = []
+    for r in current['results']:
+        key = (r['model'], r['size'])
+        if key not in base:
+            continue
+        for metric, val in _metrics(r).items():
+            ref = base[key].get(metric)
+            if val is None or ref is None:
+                continue
+            rows.append(key + (metric, ref, val, val / ref if ref else None))
+    return rows
+
+
+def format_comparison(rows, ostream=None):
+    """Write the output of :py:func:`compare_results` as a table"""
+    if ostream is None:
+        ostream = sys.stdout
+    fmt = '%-16s %8s %-26s %12s %12s %8s\n'
+    ostream.write(fmt % ('model', 'size', 'metric', 'baseline', 'current', 'ratio'))
+    for model, size, metric, ref, val, ratio in rows:
+        ostream.write(
+            fmt
+            % (
+                model,
+                size,
+                metric,
+                '%.4g' % ref,
+                '%.4g' % val,
+                '-' if ratio is None else '%.3f' % ratio,
+            )
+        )
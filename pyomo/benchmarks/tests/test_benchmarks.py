@@ -0,0 +1,260 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+import json
+import os
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy_available, scipy_available
+from pyomo.common.tee import capture_output
+from pyomo.common.tempfiles import TempfileManager
+
+from pyomo.benchmarks import (
+    BenchmarkModels,
+    run_benchmark,
+    run_benchmarks,
+    compare_results,
+    format_comparison,
+)
+from pyomo.core import Constraint, Var
+from pyomo.scripting.pyomo_main import main
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_models(self):
+        self.assertEqual(
+            list(BenchmarkModels),
+            [
+                'transport_lp',
+                'transport_lp_array',
+                'ranged_lp',
+                'long_linear_sum',
+                'nonlinear_sum',
+                'network_flow',
+                'dense_qp',
+                'dae_collocation',
+                'gdp',
+            ],
+        )
+        m = BenchmarkModels('transport_lp', n=3)
+        self.assertEqual(len(m.x), 9)
+        m = BenchmarkModels('transport_lp_array', n=3)
+        self.assertEqual(len(m.x), 9)
+        self.assertIsNotNone(m.x._array)
+        self.assertEqual(len(list(m.component_data_objects(Constraint))), 6)
+        m = BenchmarkModels('ranged_lp', n=4)
+        self.assertEqual(len(m.x), 20)
+        self.assertEqual(len(m.c), 4)
+        self.assertTrue(all(c.has_lb() and c.has_ub() for c in m.c.values()))
+        m = BenchmarkModels('long_linear_sum', n=5)
+        self.assertEqual(m.c.body.nargs(), 5)
+        m = BenchmarkModels('nonlinear_sum', n=3)
+        self.assertEqual(len(m.c), 3)
+        m = BenchmarkModels('network_flow', n=7)
+        self.assertEqual(len(m.A), 21)
+        self.assertEqual(len(m.flow), 21)
+        self.assertEqual(m.flow[1, 3].ub, 15)
+        m = BenchmarkModels('dae_collocation', n=2)
+        # 2 finite elements with 3 collocation points each
+        self.assertEqual(len(m.t), 7)
+        m = BenchmarkModels('gdp', n=2)
+        # The disjunctions were relaxed to binary variables
+        self.assertEqual(len(list(m.component_data_objects(Var, descend_into=True))), 6)
+        self.assertTrue(m.find_component('_pyomo_gdp_bigm_reformulation') is not None)
+
+    def test_run_benchmark(self):
+        result = run_benchmark('transport_lp', 3, writers=('nl', 'lp'))
+        self.assertEqual(result['model'], 'transport_lp')
+        self.assertEqual(result['size'], 3)
+        self.assertEqual(result['n_vars'], 9)
+        self.assertEqual(result['n_constraints'], 6)
+        self.assertGreater(result['construct_memory'], 0)
+        self.assertEqual(set(result['writers']), {'nl', 'lp'})
+        for info in result['writers'].values():
+            self.assertEqual(set(info), {'time', 'output_size', 'memory'})
+        self.assertEqual(
+            {k: v for k, v in result['repn_cache'].items() if k != 'warm_write_time'},
+            {'entries': 6, 'cold_misses': 6, 'warm_hits': 6, 'warm_misses': 0},
+        )
+
+        result = run_benchmark('dense_qp', 3, writers=('lp',), memory=False)
+        self.assertNotIn('construct_memory', result)
+        self.assertNotIn('repn_cache', result)
+        self.assertNotIn('memory', result['writers']['lp'])
+
+        with self.assertRaisesRegex(ValueError, "Unknown benchmark writer 'foo'"):
+            run_benchmark('dense_qp', 3, writers=('foo',))
+        with self.assertRaisesRegex(ValueError, "Unknown benchmark model: 'foo'"):
+            run_benchmark('foo', 3)
+
+    def test_visitors(self):
+        result = run_benchmark(
+            'transport_lp',
+            3,
+            writers=(),
+            memory=False,
+            visitors=('linear', 'identify_variables', 'fbbt'),
+        )
+        self.assertEqual(
+            {k: v['result_size'] for k, v in result['visitors'].items()},
+            # 9 objective terms + 3 * 3 + 3 * 3 constraint terms
+            {'linear': 27, 'identify_variables': 27, 'fbbt': 7},
+        )
+        rows = compare_results({'results': [result]}, {'results': [result]})
+        self.assertEqual(
+            [row[2] for row in rows if row[2].startswith('walk_time')],
+            ['walk_time[linear]', 'walk_time[identify_variables]', 'walk_time[fbbt]'],
+        )
+        with self.assertRaisesRegex(ValueError, "Unknown benchmark visitor 'foo'"):
+            run_benchmark('dense_qp', 3, visitors=('foo',))
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_serializers(self):
+        result = run_benchmark(
+            'transport_lp', 3, writers=(), serializers=('model_file',)
+        )
+        info = result['serializers']['model_file']
+        self.assertEqual(
+            set(info), {'save_time', 'load_time', 'file_size', 'load_memory'}
+        )
+        self.assertGreater(info['file_size'], 0)
+        rows = compare_results({'results': [result]}, {'results': [result]})
+        self.assertEqual(
+            [row[2] for row in rows if 'model_file' in row[2]],
+            [
+                'save_time[model_file]',
+                'load_time[model_file]',
+                'load_memory[model_file]',
+            ],
+        )
+        # DAE models are not supported by the model file format
+        result = run_benchmark(
+            'dae_collocation', 2, writers=(), serializers=('model_file',)
+        )
+        self.assertIn('ContinuousSet', result['serializers']['model_file']['error'])
+        with self.assertRaisesRegex(ValueError, "Unknown benchmark serializer 'foo'"):
+            run_benchmark('dense_qp', 3, serializers=('foo',))
+
+    def test_cloners(self):
+        result = run_benchmark('network_flow', 7, writers=(), cloners=('copy', 'share'))
+        self.assertEqual(set(result['cloners']['copy']), {'time', 'memory'})
+        info = result['cloners']['share']
+        self.assertEqual(set(info), {'time', 'memory', 'shared'})
+        self.assertEqual(
+            info['shared'],
+            {
+                'shared_expressions': 0,
+                'copied_expressions': 57,
+                'shared_params': 3,
+                'shared_param_values': 49,
+                'shared_sets': 1,
+                'shared_set_members': 21,
+            },
+        )
+        rows = compare_results({'results': [result]}, {'results': [result]})
+        self.assertEqual(
+            [row[2] for row in rows if row[2].startswith('clone')],
+            [
+                'clone_time[copy]',
+                'clone_memory[copy]',
+                'clone_time[share]',
+                'clone_memory[share]',
+            ],
+        )
+        with self.assertRaisesRegex(ValueError, "Unknown benchmark cloner 'foo'"):
+            run_benchmark('dense_qp', 3, cloners=('foo',))
+
+    def test_string_writers(self):
+        result = run_benchmark(
+            'nonlinear_sum', 3, writers=('gams', 'baron'), memory=False
+        )
+        for info in result['writers'].values():
+            self.assertEqual(set(info), {'time', 'output_size'})
+        result = run_benchmark(
+            'long_linear_sum', 10, writers=('gams', 'baron'), memory=False
+        )
+        for info in result['writers'].values():
+            self.assertEqual(set(info), {'time', 'output_size'})
+
+    @unittest.skipUnless(scipy_available, "scipy is not available")
+    def test_writer_error(self):
+        result = run_benchmark('dense_qp', 2, writers=('standard_form',))
+        self.assertIn('error', result['writers']['standard_form'])
+        result = run_benchmark('transport_lp', 2, writers=('standard_form',))
+        self.assertEqual(result['writers']['standard_form']['output_size'], 8)
+        # Each ranged constraint generates 2 rows with 20 nonzeros
+        result = run_benchmark('ranged_lp', 4, writers=('standard_form',))
+        self.assertEqual(result['writers']['standard_form']['output_size'], 160)
+
+    def test_run_and_compare(self):
+        results = run_benchmarks(sizes=[2], memory=False)
+        self.assertEqual(set(results), {'metadata', 'results'})
+        self.assertEqual(
+            [(r['model'], r['size']) for r in results['results']],
+            [(name, 2) for name in BenchmarkModels],
+        )
+        # The results must be serializable
+        results = json.loads(json.dumps(results))
+
+        rows = compare_results(results, results)
+        # nonlinear_sum cannot be written by the LP writer
+        self.assertEqual(len(rows), 3 * len(results['results']) - 1)
+        for row in rows:
+            self.assertIn(row[-1], (1, None))
+        with capture_output() as OUT:
+            format_comparison(rows)
+        self.assertIn('write_time[nl]', OUT.getvalue())
+
+    def test_command(self):
+        with TempfileManager.new_context() as tempfile:
+            dname = tempfile.mkdtemp()
+            baseline = os.path.join(dname, 'baseline.json')
+            current = os.path.join(dname, 'current.json')
+            with capture_output() as OUT:
+                main(['benchmark', 'gdp', '-n', '2', '--no-memory', '-o', baseline])
+                main(
+                    [
+                        'benchmark',
+                        'gdp',
+                        '-n',
+                        '2',
+                        '-n',
+                        '3',
+                        '-w',
+                        'lp',
+                        '--serializer',
+                        'model_file',
+                        '--cloner',
+                        'share',
+                        '-o',
+                        current,
+                        '--compare',
+                        baseline,
+                    ]
+                )
+            self.assertIn('Running gdp (n=3)', OUT.getvalue())
+            self.assertIn('write_time[lp]', OUT.getvalue())
+            with open(current) as FILE:
+                results = json.load(FILE)
+            self.assertEqual([r['size'] for r in results['results']], [2, 3])
+            self.assertIn('memory', results['results'][0]['writers']['lp'])
+            # The relaxed GDP model contains (unsupported) Disjuncts
+            self.assertIn('error', results['results'][1]['serializers']['model_file'])
+            self.assertIn('shared', results['results'][1]['cloners']['share'])
+
+            with capture_output() as OUT:
+                main(['benchmark', '--list'])
+            self.assertIn('transport_lp', OUT.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
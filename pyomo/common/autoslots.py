@@ -11,6 +11,7 @@
 
 import collections
 import types
+from itertools import chain
 from copy import deepcopy
 from weakref import ref as _weakref_ref
 
@@ -140,6 +141,24 @@ def fast_deepcopy(obj, memo):
         return _deepcopy_dispatcher[obj.__class__](obj, memo, _id)
 
 
+def all_atomic(values):
+    """Return True if all `values` are atomic (or tuples of atomic values)
+
+    Atomic values are never duplicated by :py:func:`fast_deepcopy`, so
+    containers of atomic values can be shared by an object and its
+    copy (as long as the container is not modified).
+
+    """
+    classes = set(map(type, values))
+    if tuple in classes:
+        classes.remove(tuple)
+        if not _atomic_types.issuperset(
+            map(type, chain.from_iterable(v for v in values if v.__class__ is tuple))
+        ):
+            return False
+    return _atomic_types.issuperset(classes)
+
+
 class AutoSlots(type):
     """Metaclass to automatically collect `__slots__` for generic pickling
 
@@ -477,3 +496,78 @@ class AutoSlots(type):
                 # than to simplify assign to __dict__.
                 self.__dict__.clear()
                 self.__dict__.update(fields)
+
+
+class _StateCopiers(dict):
+    # Map each class to the list of (slot, mapper) pairs used to copy
+    # its state in bulk, or None if instances of the class must be
+    # copied through their __deepcopy_state__()
+    def __missing__(self, cls):
+        Mixin = AutoSlots.Mixin
+        info = getattr(cls, '__auto_slots__', None)
+        if (
+            info is None
+            or info.has_dict
+            or cls.__deepcopy_state__ is not Mixin.__deepcopy_state__
+            or cls.__getstate__ is not Mixin.__getstate__
+            or cls.__setstate__ is not Mixin.__setstate__
+        ):
+            ans = None
+        else:
+            ans = [
+                (slot, info.slot_mappers.get(i)) for i, slot in enumerate(info.slots)
+            ]
+        self[cls] = ans
+        return ans
+
+
+_state_copiers = _StateCopiers()
+
+
+def fast_deepcopy_states(pairs, memo):
+    """Copy the state of each ``(source, new)`` object pair
+
+    This is equivalent to calling ``source.__deepcopy_state__(memo,
+    new)`` for each pair, but copies the state of fully slotted
+    :py:class:`AutoSlots` objects (that do not customize their
+    state) directly, without building (and preserving) the
+    intermediate state lists.  This is used to populate the objects
+    that were created in bulk by :meth:`Component.__deepcopy__`.
+
+    """
+    setter = object.__setattr__
+    # Keep the encoded (mapped) field values alive until the end of the
+    # deepcopy (see :meth:`AutoSlots.Mixin.__deepcopy_state__`)
+    keep_alive = memo.setdefault('__auto_slots__', []).append
+    for src, new in pairs:
+        fields = _state_copiers[src.__class__]
+        if fields is None:
+            src.__deepcopy_state__(memo, new)
+            continue
+        memo_size = len(memo)
+        state = []
+        try:
+            for slot, mapper in fields:
+                val = getattr(src, slot)
+                if mapper is None:
+                    if val.__class__ not in _atomic_types and (
+                        # (component indices are usually tuples of
+                        # atomic values, which are never duplicated)
+                        val.__class__ is not tuple
+                        or not _atomic_types.issuperset(map(type, val))
+                    ):
+                        val = fast_deepcopy(val, memo)
+                else:
+                    val = mapper(True, val)
+                    keep_alive(val)
+                    val = mapper(False, fast_deepcopy(val, memo))
+                state.append(val)
+        except:
+            # Remove any entries added to the memo and fall back on the
+            # (more careful) general implementation
+            for _ in range(len(memo) - memo_size):
+                memo.popitem()
+            src.__deepcopy_state__(memo, new)
+            continue
+        for (slot, mapper), val in zip(fields, state):
+            setter(new, slot, val)
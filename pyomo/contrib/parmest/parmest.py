@@ -40,9 +40,12 @@ else:
 import re
 import importlib as im
 import logging
+import multiprocessing
+import pickle
 import types
 import json
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 from functools import singledispatchmethod
 
@@ -227,6 +230,75 @@ def _experiment_instance_creation_callback(
     return instance
 
 
+# The estimator used by the worker processes started by _Q_opt_samples()
+_worker_estimator = None
+
+
+def _init_Q_opt_worker(estimator_class, init_args):
+    global _worker_estimator
+    if isinstance(init_args, bytes):
+        init_args = pickle.loads(init_args)
+    _worker_estimator = estimator_class(*init_args)
+
+
+def _worker_Q_opt(bootlist):
+    return _worker_estimator._Q_opt(bootlist=bootlist)[1]
+
+
+def _Q_opt_samples(estimator, samples, n_workers, mp_context=None):
+    """Solve the parameter estimation problem for each sample
+
+    Each sample is a list of experiment (scenario) numbers.  Returns the
+    list of estimated theta values (pd.Series) for each sample.  If
+    `n_workers` is greater than 1, the (independent) estimation problems
+    are distributed across a pool of `n_workers` processes.  The
+    experiment definitions (and objective function) are pickled and sent
+    to each worker process, which creates its own copy of the estimator
+    (and not from any previously built model).  As the workers do not
+    rely on any state inherited from this process, this works with all
+    multiprocessing start methods (including 'spawn', the default on
+    Windows and macOS).  Experiments that cannot be pickled (e.g., models
+    built from locally defined rules) are only supported by forking the
+    worker processes.
+
+    """
+    if n_workers is None or n_workers <= 1 or len(samples) <= 1:
+        return [estimator._Q_opt(bootlist=sample)[1] for sample in samples]
+
+    try:
+        init_args = pickle.dumps(estimator._worker_init_args())
+    except Exception as e:
+        if (mp_context is not None and mp_context.get_start_method() != 'fork') or (
+            'fork' not in multiprocessing.get_all_start_methods()
+        ):
+            raise ValueError(
+                "Estimating with n_workers > 1 requires that the experiments "
+                "and the objective function can be pickled: %s: %s"
+                % (type(e).__name__, e)
+            ) from e
+        logger.warning(
+            "The experiments (or the objective function) cannot be pickled "
+            "(%s: %s); starting the worker processes by forking the current "
+            "process" % (type(e).__name__, e)
+        )
+        init_args = estimator._worker_init_args()
+        mp_context = multiprocessing.get_context('fork')
+    n_workers = min(n_workers, len(samples))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=mp_context,
+        initializer=_init_Q_opt_worker,
+        initargs=(type(estimator), init_args),
+    ) as executor:
+        return list(
+            executor.map(
+                _worker_Q_opt,
+                samples,
+                chunksize=max(1, len(samples) // (4 * n_workers)),
+            )
+        )
+
+
 def SSE(model):
     """
     Sum of squared error between `experiment_output` model and data values
@@ -348,6 +420,18 @@ class Estimator(object):
             solver_options,
         )
 
+    def _worker_init_args(self):
+        """
+        Return the arguments for creating this estimator in a worker process
+        """
+        return (
+            self.exp_list,
+            self.obj_function,
+            self.tee,
+            self.diagnostic_mode,
+            self.solver_options,
+        )
+
     def _return_theta_names(self):
         """
         Return list of fitted model parameter names
@@ -925,6 +1009,7 @@ class Estimator(object):
         replacement=True,
         seed=None,
         return_samples=False,
+        n_workers=None,
     ):
         """
         Parameter estimation using bootstrap resampling of the data
@@ -943,6 +1028,10 @@ class Estimator(object):
         return_samples: bool, optional
             Return a list of sample numbers used in each bootstrap estimation.
             Default is False.
+        n_workers: int or None, optional
+            Number of worker processes used to solve the (independent)
+            estimation problems for each sample. Default is None (solve
+            the problems sequentially in this process).
 
         Returns
         -------
@@ -959,6 +1048,7 @@ class Estimator(object):
                 replacement=replacement,
                 seed=seed,
                 return_samples=return_samples,
+                n_workers=n_workers,
             )
 
         assert isinstance(bootstrap_samples, int)
@@ -966,6 +1056,7 @@ class Estimator(object):
         assert isinstance(replacement, bool)
         assert isinstance(seed, (type(None), int))
         assert isinstance(return_samples, bool)
+        assert isinstance(n_workers, (type(None), int))
 
         if samplesize is None:
             samplesize = len(self.exp_list)
@@ -978,11 +1069,11 @@ class Estimator(object):
         task_mgr = utils.ParallelTaskManager(bootstrap_samples)
         local_list = task_mgr.global_to_local_data(global_list)
 
-        bootstrap_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        bootstrap_theta = _Q_opt_samples(
+            self, [list(sample) for idx, sample in local_list], n_workers
+        )
+        for (idx, sample), thetavals in zip(local_list, bootstrap_theta):
             thetavals['samples'] = sample
-            bootstrap_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(bootstrap_theta)
         bootstrap_theta = pd.DataFrame(global_bootstrap_theta)
@@ -993,7 +1084,7 @@ class Estimator(object):
         return bootstrap_theta
 
     def theta_est_leaveNout(
-        self, lNo, lNo_samples=None, seed=None, return_samples=False
+        self, lNo, lNo_samples=None, seed=None, return_samples=False, n_workers=None
     ):
         """
         Parameter estimation where N data points are left out of each sample
@@ -1009,6 +1100,10 @@ class Estimator(object):
             Random seed
         return_samples: bool, optional
             Return a list of sample numbers that were left out. Default is False.
+        n_workers: int or None, optional
+            Number of worker processes used to solve the (independent)
+            estimation problems for each sample. Default is None (solve
+            the problems sequentially in this process).
 
         Returns
         -------
@@ -1020,13 +1115,18 @@ class Estimator(object):
         # check if we are using deprecated parmest
         if self.pest_deprecated is not None:
             return self.pest_deprecated.theta_est_leaveNout(
-                lNo, lNo_samples=lNo_samples, seed=seed, return_samples=return_samples
+                lNo,
+                lNo_samples=lNo_samples,
+                seed=seed,
+                return_samples=return_samples,
+                n_workers=n_workers,
             )
 
         assert isinstance(lNo, int)
         assert isinstance(lNo_samples, (type(None), int))
         assert isinstance(seed, (type(None), int))
         assert isinstance(return_samples, bool)
+        assert isinstance(n_workers, (type(None), int))
 
         samplesize = len(self.exp_list) - lNo
 
@@ -1038,12 +1138,12 @@ class Estimator(object):
         task_mgr = utils.ParallelTaskManager(len(global_list))
         local_list = task_mgr.global_to_local_data(global_list)
 
-        lNo_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        lNo_theta = _Q_opt_samples(
+            self, [list(sample) for idx, sample in local_list], n_workers
+        )
+        for (idx, sample), thetavals in zip(local_list, lNo_theta):
             lNo_s = list(set(range(len(self.exp_list))) - set(sample))
             thetavals['lNo'] = np.sort(lNo_s)
-            lNo_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(lNo_theta)
         lNo_theta = pd.DataFrame(global_bootstrap_theta)
@@ -1489,6 +1589,10 @@ class _DeprecatedEstimator(object):
             self.callback_data[0], (dict, pd.DataFrame, str)
         ), "The scenarios in data must be a dictionary, DataFrame or filename"
 
+        # A copy of the theta_names provided by the user (to recreate
+        # this estimator in worker processes).  Note that
+        # _create_parmest_model() updates self.theta_names in place.
+        self._theta_names_arg = list(theta_names)
         if len(theta_names) == 0:
             self.theta_names = ['parmest_dummy_var']
         else:
@@ -1503,6 +1607,20 @@ class _DeprecatedEstimator(object):
         # boolean to indicate if model is initialized using a square solve
         self.model_initialized = False
 
+    def _worker_init_args(self):
+        """
+        Return the arguments for creating this estimator in a worker process
+        """
+        return (
+            self.model_function,
+            self.callback_data,
+            self._theta_names_arg,
+            self.obj_function,
+            self.tee,
+            self.diagnostic_mode,
+            self.solver_options,
+        )
+
     def _return_theta_names(self):
         """
         Return list of fitted model parameter names
@@ -2054,6 +2172,7 @@ class _DeprecatedEstimator(object):
         replacement=True,
         seed=None,
         return_samples=False,
+        n_workers=None,
     ):
         """
         Parameter estimation using bootstrap resampling of the data
@@ -2071,6 +2190,10 @@ class _DeprecatedEstimator(object):
             Random seed
         return_samples: bool, optional
             Return a list of sample numbers used in each bootstrap estimation
+        n_workers: int or None, optional
+            Number of worker processes used to solve the (independent)
+            estimation problems for each sample. Default is None (solve
+            the problems sequentially in this process).
 
         Returns
         -------
@@ -2083,6 +2206,7 @@ class _DeprecatedEstimator(object):
         assert isinstance(replacement, bool)
         assert isinstance(seed, (type(None), int))
         assert isinstance(return_samples, bool)
+        assert isinstance(n_workers, (type(None), int))
 
         if samplesize is None:
             samplesize = len(self.callback_data)
@@ -2095,11 +2219,11 @@ class _DeprecatedEstimator(object):
         task_mgr = utils.ParallelTaskManager(bootstrap_samples)
         local_list = task_mgr.global_to_local_data(global_list)
 
-        bootstrap_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        bootstrap_theta = _Q_opt_samples(
+            self, [list(sample) for idx, sample in local_list], n_workers
+        )
+        for (idx, sample), thetavals in zip(local_list, bootstrap_theta):
             thetavals['samples'] = sample
-            bootstrap_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(bootstrap_theta)
         bootstrap_theta = pd.DataFrame(global_bootstrap_theta)
@@ -2110,7 +2234,7 @@ class _DeprecatedEstimator(object):
         return bootstrap_theta
 
     def theta_est_leaveNout(
-        self, lNo, lNo_samples=None, seed=None, return_samples=False
+        self, lNo, lNo_samples=None, seed=None, return_samples=False, n_workers=None
     ):
         """
         Parameter estimation where N data points are left out of each sample
@@ -2126,6 +2250,10 @@ class _DeprecatedEstimator(object):
             Random seed
         return_samples: bool, optional
             Return a list of sample numbers that were left out
+        n_workers: int or None, optional
+            Number of worker processes used to solve the (independent)
+            estimation problems for each sample. Default is None (solve
+            the problems sequentially in this process).
 
         Returns
         -------
@@ -2137,6 +2265,7 @@ class _DeprecatedEstimator(object):
         assert isinstance(lNo_samples, (type(None), int))
         assert isinstance(seed, (type(None), int))
         assert isinstance(return_samples, bool)
+        assert isinstance(n_workers, (type(None), int))
 
         samplesize = len(self.callback_data) - lNo
 
@@ -2148,12 +2277,12 @@ class _DeprecatedEstimator(object):
         task_mgr = utils.ParallelTaskManager(len(global_list))
         local_list = task_mgr.global_to_local_data(global_list)
 
-        lNo_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        lNo_theta = _Q_opt_samples(
+            self, [list(sample) for idx, sample in local_list], n_workers
+        )
+        for (idx, sample), thetavals in zip(local_list, lNo_theta):
             lNo_s = list(set(range(len(self.callback_data))) - set(sample))
             thetavals['lNo'] = np.sort(lNo_s)
-            lNo_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(lNo_theta)
         lNo_theta = pd.DataFrame(global_bootstrap_theta)
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import multiprocessing
 import platform
 import sys
 import os
@@ -113,6 +114,20 @@ class TestRooneyBiegler(unittest.TestCase):
         graphics.pairwise_plot(theta_est, thetavals)
         graphics.pairwise_plot(theta_est, thetavals, 0.8, ["MVN", "KDE", "Rect"])
 
+    def test_bootstrap_parallel(self):
+        serial = self.pest.theta_est_bootstrap(4, seed=524, return_samples=True)
+        parallel = self.pest.theta_est_bootstrap(
+            4, seed=524, return_samples=True, n_workers=2
+        )
+        self.assertEqual(list(serial['samples']), list(parallel['samples']))
+        del serial['samples']
+        del parallel['samples']
+        self.assertTrue(np.allclose(serial.values, parallel.values))
+
+        serial = self.pest.theta_est_leaveNout(1)
+        parallel = self.pest.theta_est_leaveNout(1, n_workers=3)
+        self.assertTrue(np.allclose(serial.values, parallel.values))
+
     @unittest.skipIf(
         not graphics.imports_available, "parmest.graphics imports are unavailable"
     )
@@ -323,6 +338,112 @@ class TestRooneyBiegler(unittest.TestCase):
         self.assertAlmostEqual(cov[1, 1], 0.04124, places=2)  # 0.04124 from paper
 
 
+class _PicklableEstimator(object):
+    # Minimal (module-level, so picklable) stand-in for an Estimator
+    # that reports the sample and the process that "solved" it
+    def __init__(self, exp_list):
+        self.exp_list = exp_list
+
+    def _worker_init_args(self):
+        return (self.exp_list,)
+
+    def _Q_opt(self, bootlist=None):
+        return 0, pd.Series(
+            {
+                'first': self.exp_list[bootlist[0]],
+                'total': sum(self.exp_list[i] for i in bootlist),
+                'pid': os.getpid(),
+            }
+        )
+
+
+@unittest.skipIf(
+    not parmest.parmest_available,
+    "Cannot test parmest: required dependencies are missing",
+)
+class TestParallelSamplesSpawn(unittest.TestCase):
+    def test_spawn(self):
+        est = _PicklableEstimator([10, 20, 30, 40])
+        samples = [[0, 1], [1, 2], [2, 3], [3, 0], [0, 2]]
+        serial = parmest._Q_opt_samples(est, samples, 1)
+        parallel = parmest._Q_opt_samples(
+            est, samples, 2, multiprocessing.get_context('spawn')
+        )
+        self.assertEqual([s['total'] for s in serial], [30, 50, 70, 50, 40])
+        self.assertEqual([s['total'] for s in parallel], [s['total'] for s in serial])
+        self.assertEqual([s['first'] for s in parallel], [s['first'] for s in serial])
+        self.assertNotIn(os.getpid(), {s['pid'] for s in parallel})
+
+    def test_unpicklable_experiments(self):
+        est = _PicklableEstimator([lambda: 1, lambda: 2])
+        with self.assertRaisesRegex(ValueError, "can be pickled: .*lambda"):
+            parmest._Q_opt_samples(
+                est, [[0], [1]], 2, multiprocessing.get_context('spawn')
+            )
+
+
+@unittest.skipIf(
+    not parmest.parmest_available,
+    "Cannot test parmest: required dependencies are missing",
+)
+@unittest.skipIf(
+    'fork' not in multiprocessing.get_all_start_methods(),
+    "Test relies on forked worker processes",
+)
+class TestParallelSamples(unittest.TestCase):
+    # Replaces Estimator._Q_opt with a function that reports the
+    # sample and the process that "solved" it (forked worker processes
+    # inherit the patched method)
+    def _fake_Q_opt(self, bootlist=None, **kwds):
+        return 0, pd.Series(
+            {'first': bootlist[0], 'total': sum(bootlist), 'pid': os.getpid()}
+        )
+
+    def setUp(self):
+        from pyomo.contrib.parmest.examples.rooney_biegler.rooney_biegler import (
+            RooneyBieglerExperiment,
+        )
+
+        data = pd.DataFrame(
+            data=[[1, 8.3], [2, 10.3], [3, 19.0], [4, 16.0], [5, 15.6], [7, 19.8]],
+            columns=["hour", "y"],
+        )
+        exp_list = [RooneyBieglerExperiment(data.loc[i, :]) for i in data.index]
+        self.pest = parmest.Estimator(exp_list)
+
+    def test_bootstrap(self):
+        with unittest.mock.patch.object(
+            parmest.Estimator, '_Q_opt', TestParallelSamples._fake_Q_opt
+        ):
+            serial = self.pest.theta_est_bootstrap(20, seed=42, return_samples=True)
+            parallel = self.pest.theta_est_bootstrap(
+                20, seed=42, return_samples=True, n_workers=3
+            )
+        self.assertEqual(len(parallel), 20)
+        self.assertEqual(list(serial['samples']), list(parallel['samples']))
+        self.assertEqual(list(serial['total']), list(parallel['total']))
+        self.assertEqual(list(parallel['total']), [sum(s) for s in parallel['samples']])
+        self.assertEqual(set(serial['pid']), {os.getpid()})
+        self.assertNotIn(os.getpid(), set(parallel['pid']))
+
+    def test_leaveNout(self):
+        with unittest.mock.patch.object(
+            parmest.Estimator, '_Q_opt', TestParallelSamples._fake_Q_opt
+        ):
+            serial = self.pest.theta_est_leaveNout(2, return_samples=True)
+            parallel = self.pest.theta_est_leaveNout(
+                2, return_samples=True, n_workers=4
+            )
+        # all 15 combinations of 4 (of 6) experiments
+        self.assertEqual(len(parallel), 15)
+        for col in ('first', 'total'):
+            self.assertEqual(list(serial[col]), list(parallel[col]))
+        self.assertEqual(
+            [list(s) for s in serial['lNo']], [list(s) for s in parallel['lNo']]
+        )
+        self.assertNotIn(os.getpid(), set(parallel['pid']))
+
+
 @unittest.skipIf(
     not parmest.parmest_available,
     "Cannot test parmest: required dependencies are missing",
@@ -1085,6 +1206,13 @@ class TestRooneyBieglerDeprecated(unittest.TestCase):
             thetavals["rate_constant"], 0.5311, places=2
         )  # 0.5311 from the paper
 
+    def test_worker_init_args(self):
+        self.pest.theta_est()
+        # worker processes are created from the theta_names that were
+        # originally provided (not the names updated by theta_est())
+        args = self.pest.pest_deprecated._worker_init_args()
+        self.assertEqual(args[2], ["asymptote", "rate_constant"])
+
     @unittest.skipIf(
         not graphics.imports_available, "parmest.graphics imports are unavailable"
     )
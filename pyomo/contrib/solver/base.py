@@ -14,11 +14,12 @@ from typing import Sequence, Dict, Optional, Mapping, NoReturn, List, Tuple
 import os
 
 from pyomo.core.base.constraint import ConstraintData
-from pyomo.core.base.var import VarData
+from pyomo.core.base.var import VarData, _load_var_values
 from pyomo.core.base.param import ParamData
 from pyomo.core.base.block import BlockData
 from pyomo.core.base.objective import Objective, ObjectiveData
 from pyomo.common.config import document_kwargs_from_configdict, ConfigValue
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.enums import IntEnum
 from pyomo.common.errors import ApplicationError
 from pyomo.common.deprecation import deprecation_warning
@@ -206,8 +207,8 @@ class PersistentSolverBase(SolverBase):
             A list of the variables whose solution should be loaded. If vars_to_load is None, then the solution
             to all primal variables will be loaded.
         """
-        for v, val in self._get_primals(vars_to_load=vars_to_load).items():
-            v.set_value(val, skip_validation=True)
+        primals = self._get_primals(vars_to_load=vars_to_load)
+        _load_var_values(primals.keys(), primals.values())
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
     @abc.abstractmethod
@@ -231,6 +232,25 @@ class PersistentSolverBase(SolverBase):
             f'{type(self)} does not support the get_primals method'
         )
 
+    def _get_primals_array(self, var_order: Sequence[VarData]):
+        """
+        Get a numpy array of the primal values of the variables in var_order.
+
+        Parameters
+        ----------
+        var_order : Sequence[VarData]
+            The variables whose primal values should be returned.
+
+        Returns
+        -------
+        numpy.ndarray
+            The primal values (in the same order as var_order).
+        """
+        primals = self._get_primals(vars_to_load=var_order)
+        return np.fromiter(
+            (primals[v] for v in var_order), dtype=float, count=len(var_order)
+        )
+
     def _get_duals(
         self, cons_to_load: Optional[Sequence[ConstraintData]] = None
     ) -> Dict[ConstraintData, float]:
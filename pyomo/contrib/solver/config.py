@@ -207,6 +207,7 @@ class AutoUpdateConfig(ConfigDict):
     update_named_expressions: bool
     update_objective: bool
     treat_fixed_vars_as_params: bool
+    track_changes: bool
     """
 
     def __init__(
@@ -352,6 +353,22 @@ class AutoUpdateConfig(ConfigDict):
                 updating the values of fixed variables is much faster this way.""",
             ),
         )
+        self.track_changes: bool = self.declare(
+            'track_changes',
+            ConfigValue(
+                domain=bool,
+                default=False,
+                description="""
+                If True, the solver registers an observer with the Pyomo modeling components
+                and records which variables, parameters, constraints, and objectives are
+                modified between solves. Subsequent updates then only inspect the modified
+                components (the cost is proportional to the number of modifications rather
+                than to the size of the model). Structural changes to blocks (adding /
+                removing components or (de)activating blocks) still trigger a full rescan
+                of the model. Modifications made outside of the component APIs (e.g.,
+                changing the members of a Set used as a variable domain) are not detected.""",
+            ),
+        )
 
 
 class PersistentSolverConfig(SolverConfig):
@@ -14,7 +14,7 @@ import logging
 import math
 from typing import List, Optional
 from pyomo.common.collections import ComponentSet, ComponentMap, OrderedSet
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import attempt_import, numpy as np
 from pyomo.common.errors import PyomoException
 from pyomo.common.tee import capture_output, TeeStream
 from pyomo.common.timing import HierarchicalTimer
@@ -28,6 +28,7 @@ from pyomo.core.base.sos import SOSConstraintData
 from pyomo.core.base.param import ParamData
 from pyomo.core.expr.numvalue import value, is_constant, is_fixed, native_numeric_types
 from pyomo.repn import generate_standard_repn
+from pyomo.repn.cache import get_repn_cache
 from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
 from pyomo.contrib.solver.base import PersistentSolverBase
 from pyomo.contrib.solver.results import Results, TerminationCondition, SolutionStatus
@@ -100,6 +101,12 @@ class GurobiSolutionLoader(PersistentSolutionLoader):
             vars_to_load=vars_to_load, solution_number=solution_number
         )
 
+    def get_primals_array(self, var_order, solution_number=0):
+        self._assert_solution_still_valid()
+        return self._solver._get_primals_array(
+            var_order, solution_number=solution_number
+        )
+
 
 class _MutableLowerBound(object):
     def __init__(self, expr):
@@ -505,10 +512,16 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
         if self._objective is None:
             self.set_objective(None)
 
-    def _get_expr_from_pyomo_expr(self, expr):
+    def _get_expr_from_pyomo_expr(self, expr, obj=None):
         mutable_linear_coefficients = list()
         mutable_quadratic_coefficients = list()
-        repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
+        repn_cache = None if obj is None else get_repn_cache(self._model)
+        if repn_cache is None:
+            repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
+        else:
+            repn = repn_cache.standard_repn(
+                obj, expr, quadratic=True, compute_values=False
+            )
 
         degree = repn.polynomial_degree()
         if (degree is None) or (degree > 2):
@@ -563,7 +576,7 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
                 repn_constant,
                 mutable_linear_coefficients,
                 mutable_quadratic_coefficients,
-            ) = self._get_expr_from_pyomo_expr(con.body)
+            ) = self._get_expr_from_pyomo_expr(con.body, con)
 
             if (
                 gurobi_expr.__class__ in {gurobipy.LinExpr, gurobipy.Var}
@@ -828,7 +841,7 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
                 repn_constant,
                 mutable_linear_coefficients,
                 mutable_quadratic_coefficients,
-            ) = self._get_expr_from_pyomo_expr(obj.expr)
+            ) = self._get_expr_from_pyomo_expr(obj.expr, obj)
 
         mutable_constant = _MutableConstant()
         mutable_constant.expr = repn_constant
@@ -975,6 +988,34 @@ class Gurobi(PersistentSolverUtils, PersistentSolverBase):
             v.set_value(val, skip_validation=True)
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
+    def _get_primals_array(self, var_order, solution_number=0):
+        if self._needs_updated:
+            self._update_gurobi_model()
+
+        if self._solver_model.SolCount == 0:
+            raise RuntimeError(
+                'Solver does not currently have a valid solution. Please '
+                'check the termination condition.'
+            )
+
+        var_map = self._pyomo_var_to_solver_var_map
+        gurobi_vars = [var_map[id(v)] for v in var_order]
+        if solution_number == 0:
+            vals = self._solver_model.getAttr("X", gurobi_vars)
+        else:
+            if (
+                self.get_model_attr('NumIntVars') == 0
+                and self.get_model_attr('NumBinVars') == 0
+            ):
+                raise ValueError(
+                    'Cannot obtain suboptimal solutions for a continuous model'
+                )
+            original_solution_number = self.get_gurobi_param_info('SolutionNumber')[2]
+            self.set_gurobi_param('SolutionNumber', solution_number)
+            vals = self._solver_model.getAttr("Xn", gurobi_vars)
+            self.set_gurobi_param('SolutionNumber', original_solution_number)
+        return np.array(vals, dtype=float)
+
     def _get_primals(self, vars_to_load=None, solution_number=0):
         if self._needs_updated:
             self._update_gurobi_model()  # this is needed to ensure that solutions cannot be loaded after the model has been changed
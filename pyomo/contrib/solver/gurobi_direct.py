@@ -17,7 +17,7 @@ import os
 
 from pyomo.common.config import ConfigValue
 from pyomo.common.collections import ComponentMap, ComponentSet
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import attempt_import, numpy as np
 from pyomo.common.enums import ObjectiveSense
 from pyomo.common.errors import MouseTrap
 from pyomo.common.shutdown import python_is_shutting_down
@@ -71,6 +71,8 @@ class GurobiDirectSolutionLoader(SolutionLoaderBase):
         self._pyo_cons = pyo_cons
         self._pyo_vars = pyo_vars
         self._pyo_obj = pyo_obj
+        # maps id(VarData) -> column index (built on demand)
+        self._var_index = None
         GurobiDirect._num_instances += 1
 
     def __del__(self):
@@ -101,14 +103,32 @@ class GurobiDirectSolutionLoader(SolutionLoaderBase):
                 'check the termination condition.'
             )
 
+        if not vars_to_load:
+            self.load_vars_from_array(self._pyo_vars, self._grb_vars.x)
+            return
         iterator = zip(self._pyo_vars, self._grb_vars.x.tolist())
-        if vars_to_load:
-            vars_to_load = ComponentSet(vars_to_load)
-            iterator = filter(lambda var_val: var_val[0] in vars_to_load, iterator)
+        vars_to_load = ComponentSet(vars_to_load)
+        iterator = filter(lambda var_val: var_val[0] in vars_to_load, iterator)
         for p_var, g_var in iterator:
             p_var.set_value(g_var, skip_validation=True)
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
+    def get_primals_array(self, var_order, solution_number=0):
+        assert solution_number == 0
+        if self._grb_model.SolCount == 0:
+            raise RuntimeError(
+                'Solver does not currently have a valid solution. Please '
+                'check the termination condition.'
+            )
+        if self._var_index is None:
+            self._var_index = {id(v): i for i, v in enumerate(self._pyo_vars)}
+        var_index = self._var_index
+        return self._grb_vars.x[
+            np.fromiter(
+                (var_index[id(v)] for v in var_order), dtype=int, count=len(var_order)
+            )
+        ]
+
     def get_primals(self, vars_to_load=None, solution_number=0):
         assert solution_number == 0
         if self._grb_model.SolCount == 0:
@@ -326,9 +326,16 @@ class Ipopt(SolverBase):
             # be terminated with '\n' regardless of platform.  We will
             # disable universal newlines in the NL file to prevent
             # Python from mapping those '\n' to '\r\n' on Windows.
-            with open(basename + '.nl', 'w', newline='\n') as nl_file, open(
-                basename + '.row', 'w'
-            ) as row_file, open(basename + '.col', 'w') as col_file:
+            # Binary NL files must be written in binary mode (and the
+            # ASL will then also write a binary SOL file).
+            binary = config.writer_config.binary
+            if binary:
+                nl_file = open(basename + '.nl', 'wb')
+            else:
+                nl_file = open(basename + '.nl', 'w', newline='\n')
+            with nl_file, open(basename + '.row', 'w') as row_file, open(
+                basename + '.col', 'w'
+            ) as col_file:
                 timer.start('write_nl_file')
                 self._writer.config.set_value(config.writer_config)
                 try:
@@ -408,7 +415,7 @@ class Ipopt(SolverBase):
                     results.timing_info.total_seconds = 0
             else:
                 if os.path.isfile(basename + '.sol'):
-                    with open(basename + '.sol', 'r') as sol_file:
+                    with open(basename + '.sol', 'rb' if binary else 'r') as sol_file:
                         timer.start('parse_sol')
                         results = self._parse_solution(sol_file, nl_info)
                         timer.stop('parse_sol')
@@ -535,7 +542,7 @@ class Ipopt(SolverBase):
 
         return iters, nofunc_time, func_time, total_time
 
-    def _parse_solution(self, instream: io.TextIOBase, nl_info: NLWriterInfo):
+    def _parse_solution(self, instream: io.IOBase, nl_info: NLWriterInfo):
         results = Results()
         res, sol_data = parse_sol_file(
             sol_file=instream, nl_info=nl_info, result=results
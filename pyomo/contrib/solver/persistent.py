@@ -10,21 +10,36 @@
 #  __________________________________________________________________________
 
 import abc
+import weakref
 from typing import List
 
 from pyomo.core.base.constraint import ConstraintData, Constraint
 from pyomo.core.base.sos import SOSConstraintData, SOSConstraint
-from pyomo.core.base.var import VarData
+from pyomo.core.base.var import VarData, Var
 from pyomo.core.base.param import ParamData, Param
-from pyomo.core.base.objective import ObjectiveData
+from pyomo.core.base.objective import ObjectiveData, Objective
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.observer import (
+    ChangeLog,
+    register_change_log,
+    unregister_change_log,
+)
 from pyomo.common.collections import ComponentMap
 from pyomo.common.timing import HierarchicalTimer
 from pyomo.core.expr.numvalue import NumericConstant
 from pyomo.contrib.solver.util import collect_vars_and_named_exprs, get_objective
 
+_tracked_ctypes = {Var, Param, Constraint, SOSConstraint, Expression, Objective}
+
 
 class PersistentSolverUtils(abc.ABC):
     def __init__(self):
+        # Note that set_instance() re-runs __init__(): stop recording
+        # changes into any previously registered change log
+        if getattr(self, '_change_log_finalizer', None) is not None:
+            self._change_log_finalizer()
+        self._change_log = None
+        self._change_log_finalizer = None
         self._model = None
         self._active_constraints = {}  # maps constraint to (lower, body, upper)
         self._vars = {}  # maps var id to (var, lb, ub, fixed, domain, value)
@@ -185,6 +200,39 @@ class PersistentSolverUtils(abc.ABC):
             self._obj_named_expressions = []
             self._set_objective(obj)
 
+    def _start_change_tracking(self):
+        self._stop_change_tracking()
+        # Only record modifications to the model this solver is attached to
+        self._change_log = register_change_log(ChangeLog(self._model))
+        # Unregister the log when this solver is garbage collected
+        self._change_log_finalizer = weakref.finalize(
+            self, unregister_change_log, self._change_log
+        )
+
+    def _stop_change_tracking(self):
+        if self._change_log_finalizer is not None:
+            self._change_log_finalizer()
+        self._change_log = None
+        self._change_log_finalizer = None
+
+    def _in_model(self, comp, active):
+        """Return True if the component data `comp` is (still) attached to
+        self._model (and, if `active`, is active and only declared on
+        active blocks)."""
+        parent = comp.parent_component()
+        if parent is None:
+            return False
+        if active and not (comp.active and parent.active):
+            return False
+        blk = parent.parent_block()
+        while blk is not None:
+            if active and not blk.active:
+                return False
+            if blk is self._model:
+                return True
+            blk = blk.parent_block()
+        return False
+
     def add_block(self, block):
         param_dict = {}
         for p in block.component_objects(Param, descend_into=True):
@@ -207,6 +255,8 @@ class PersistentSolverUtils(abc.ABC):
         obj = get_objective(block)
         if obj is not None:
             self.set_objective(obj)
+        if block is self._model and self.config.auto_updates.track_changes:
+            self._start_change_tracking()
 
     @abc.abstractmethod
     def _remove_constraints(self, cons: List[ConstraintData]):
@@ -332,6 +382,20 @@ class PersistentSolverUtils(abc.ABC):
         if timer is None:
             timer = HierarchicalTimer()
         config = self.config.auto_updates
+        # If we are tracking changes (and only "simple" components were
+        # modified), then we only need to look at the components that
+        # were modified since the last update.  Structural changes
+        # (e.g., adding / removing components or (de)activating blocks)
+        # fall back on scanning the entire model.
+        log = self._change_log
+        if not config.track_changes:
+            if log is not None:
+                self._stop_change_tracking()
+                log = None
+        elif log is None:
+            self._start_change_tracking()
+        if log is not None and not _tracked_ctypes.issuperset(log.modified):
+            log = None
         new_vars = []
         old_vars = []
         new_params = []
@@ -349,39 +413,62 @@ class PersistentSolverUtils(abc.ABC):
         timer.stop('vars')
         timer.start('params')
         if config.check_for_new_or_removed_params:
-            current_params_dict = {}
-            for p in self._model.component_objects(Param, descend_into=True):
-                if p.mutable:
-                    for _p in p.values():
-                        current_params_dict[id(_p)] = _p
-            for p_id, p in current_params_dict.items():
-                if p_id not in self._params:
-                    new_params.append(p)
-            for p_id, p in self._params.items():
-                if p_id not in current_params_dict:
-                    old_params.append(p)
+            if log is None:
+                current_params_dict = {}
+                for p in self._model.component_objects(Param, descend_into=True):
+                    if p.mutable:
+                        for _p in p.values():
+                            current_params_dict[id(_p)] = _p
+                for p_id, p in current_params_dict.items():
+                    if p_id not in self._params:
+                        new_params.append(p)
+                for p_id, p in self._params.items():
+                    if p_id not in current_params_dict:
+                        old_params.append(p)
+            else:
+                for p in log.get(Param):
+                    if self._in_model(p, active=False):
+                        if id(p) not in self._params and p.parent_component().mutable:
+                            new_params.append(p)
+                    elif id(p) in self._params:
+                        old_params.append(p)
         timer.stop('params')
         timer.start('cons')
         if config.check_for_new_or_removed_constraints or config.update_constraints:
-            current_cons_dict = {
-                c: None
-                for c in self._model.component_data_objects(
-                    Constraint, descend_into=True, active=True
-                )
-            }
-            current_sos_dict = {
-                c: None
-                for c in self._model.component_data_objects(
-                    SOSConstraint, descend_into=True, active=True
-                )
-            }
+            if log is None:
+                current_cons_dict = {
+                    c: None
+                    for c in self._model.component_data_objects(
+                        Constraint, descend_into=True, active=True
+                    )
+                }
+                current_sos_dict = {
+                    c: None
+                    for c in self._model.component_data_objects(
+                        SOSConstraint, descend_into=True, active=True
+                    )
+                }
+                old_cons_candidates = self._vars_referenced_by_con.keys()
+            else:
+                current_cons_dict = {}
+                current_sos_dict = {}
+                old_cons_candidates = []
+                for ctype, current in (
+                    (Constraint, current_cons_dict),
+                    (SOSConstraint, current_sos_dict),
+                ):
+                    for c in log.get(ctype):
+                        if self._in_model(c, active=True):
+                            current[c] = None
+                        elif c in self._vars_referenced_by_con:
+                            old_cons_candidates.append(c)
             for c in current_cons_dict.keys():
                 if c not in self._vars_referenced_by_con:
                     new_cons.append(c)
             for c in current_sos_dict.keys():
                 if c not in self._vars_referenced_by_con:
                     new_sos.append(c)
-            for c in self._vars_referenced_by_con.keys():
+            for c in old_cons_candidates:
                 if c not in current_cons_dict and c not in current_sos_dict:
                     if (c.ctype is Constraint) or (
                         c.ctype is None and isinstance(c, ConstraintData)
@@ -400,7 +487,9 @@ class PersistentSolverUtils(abc.ABC):
 
         # sticking this between removal and addition
         # is important so that we don't do unnecessary work
-        if config.update_parameters:
+        if config.update_parameters and (
+            log is None or Param in log.modified or Var in log.modified
+        ):
             self.update_parameters()
 
         self.add_parameters(new_params)
@@ -430,7 +519,14 @@ class PersistentSolverUtils(abc.ABC):
         timer.start('vars')
         if config.update_vars:
             end_vars = {v_id: v_tuple[0] for v_id, v_tuple in self._vars.items()}
-            vars_to_check = [v for v_id, v in end_vars.items() if v_id in start_vars]
+            if log is None:
+                vars_to_check = [
+                    v for v_id, v in end_vars.items() if v_id in start_vars
+                ]
+            else:
+                vars_to_check = [
+                    v for v in log.get(Var) if id(v) in start_vars and id(v) in end_vars
+                ]
         if config.update_vars:
             vars_to_update = []
             for v in vars_to_check:
@@ -456,7 +552,9 @@ class PersistentSolverUtils(abc.ABC):
         self.add_constraints(cons_to_remove_and_add)
         timer.stop('cons')
         timer.start('named expressions')
-        if config.update_named_expressions:
+        if config.update_named_expressions and (
+            log is None or Expression in log.modified
+        ):
             cons_to_update = []
             for c, expr_list in self._named_expressions.items():
                 if c in new_cons_set:
@@ -473,7 +571,10 @@ class PersistentSolverUtils(abc.ABC):
                     break
         timer.stop('named expressions')
         timer.start('objective')
-        if self.config.auto_updates.check_for_new_objective:
+        if log is not None and Objective not in log.modified:
+            # No objective was modified or (de)activated
+            pyomo_obj = self._objective
+        elif self.config.auto_updates.check_for_new_objective:
             pyomo_obj = get_objective(self._model)
             if pyomo_obj is not self._objective:
                 need_to_set_objective = True
@@ -494,3 +595,8 @@ class PersistentSolverUtils(abc.ABC):
         timer.start('vars')
         self.remove_variables(old_vars)
         timer.stop('vars')
+
+        # Everything modified up to this point (including any temporary
+        # changes made while updating the solver) has been processed
+        if self._change_log is not None:
+            self._change_log.clear()
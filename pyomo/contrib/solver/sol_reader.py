@@ -10,18 +10,30 @@
 #  ___________________________________________________________________________
 
 
-from typing import Tuple, Dict, Any, List
+from typing import Tuple, Dict, Any, List, Union
+from itertools import islice
 import io
+import struct
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.repn.plugins.nl_writer import NLWriterInfo
 from pyomo.contrib.solver.results import Results, SolutionStatus, TerminationCondition
 
 
 class SolFileData:
+    """The data read from an AMPL solution (``.sol``) file
+
+    When numpy is available, :attr:`primals` and :attr:`duals` are 1-D
+    float64 :class:`numpy.ndarray` objects (ordered as in the
+    :class:`NLWriterInfo` variables and constraints, respectively).
+    Otherwise, they are lists of floats.
+
+    """
+
     def __init__(self) -> None:
-        self.primals: List[float] = list()
-        self.duals: List[float] = list()
+        self.primals: Union[np.ndarray, List[float]] = list()
+        self.duals: Union[np.ndarray, List[float]] = list()
         self.var_suffixes: Dict[str, Dict[int, Any]] = dict()
         self.con_suffixes: Dict[str, Dict[Any]] = dict()
         self.obj_suffixes: Dict[str, Dict[int, Any]] = dict()
@@ -30,8 +42,64 @@ class SolFileData:
 
 
 def parse_sol_file(
-    sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
+    sol_file: io.IOBase, nl_info: NLWriterInfo, result: Results
 ) -> Tuple[Results, SolFileData]:
+    """Parse an AMPL solution (``.sol``) file
+
+    Both the text and the binary (as written by the ASL for binary NL
+    files) ``.sol`` formats are supported.  Binary files must be
+    opened in binary mode; the format is detected from the file
+    contents.  When numpy is available, the duals and primals are
+    returned as numpy arrays (ordered as in ``nl_info.constraints`` and
+    ``nl_info.variables``, respectively).
+
+    """
+    if isinstance(sol_file, (io.RawIOBase, io.BufferedIOBase)):
+        data = sol_file.read()
+        if data[:_BINARY_MARKER_LEN] == _BINARY_MARKER:
+            return _parse_binary_sol_file(io.BytesIO(data), nl_info, result)
+        sol_file = io.StringIO(data.decode())
+    return _parse_text_sol_file(sol_file, nl_info, result)
+
+
+def _check_options(model_objects, nl_info):
+    number_of_options = model_objects[0]
+    # Identify the total number of variables and constraints
+    number_of_cons = model_objects[number_of_options + 1]
+    number_of_duals = model_objects[number_of_options + 2]
+    number_of_vars = model_objects[number_of_options + 3]
+    number_of_primals = model_objects[number_of_options + 4]
+    assert number_of_cons == len(nl_info.constraints)
+    assert number_of_vars == len(nl_info.variables)
+    return number_of_duals, number_of_primals
+
+
+def _too_many_options_error():
+    # We are adding in this DeveloperError to see if the alternative case
+    # is ever actually hit in the wild. In a previous iteration of the sol
+    # reader, there was logic to check for the number of options, but it
+    # was uncovered by tests and unclear if actually necessary.
+    return DeveloperError("""
+The sol file reader has hit an unexpected error while parsing. The number of
+options recorded is greater than 4. Please report this error to the Pyomo
+developers.
+                                 """)
+
+
+def _read_text_values(sol_file, n):
+    """Read `n` lines (each containing one number) from `sol_file`"""
+    lines = list(islice(sol_file, n))
+    if len(lines) != n:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected {n} values; found {len(lines)}."
+        )
+    if numpy_available:
+        # Bulk-convert all the values at once
+        return np.array(lines, dtype=float)
+    return list(map(float, lines))
+
+
+def _parse_text_sol_file(sol_file, nl_info, result):
     sol_data = SolFileData()
 
     #
@@ -54,31 +122,18 @@ def parse_sol_file(
     if "Options" in line:
         line = sol_file.readline()
         number_of_options = int(line)
-        # We are adding in this DeveloperError to see if the alternative case
-        # is ever actually hit in the wild. In a previous iteration of the sol
-        # reader, there was logic to check for the number of options, but it
-        # was uncovered by tests and unclear if actually necessary.
         if number_of_options > 4:
-            raise DeveloperError(
-                """
-The sol file reader has hit an unexpected error while parsing. The number of
-options recorded is greater than 4. Please report this error to the Pyomo
-developers.
-                                 """
-            )
+            raise _too_many_options_error()
+        model_objects.append(number_of_options)
         for i in range(number_of_options + 4):
             line = sol_file.readline()
             model_objects.append(int(line))
     else:
         raise PyomoException("ERROR READING `sol` FILE. No 'Options' line found.")
-    # Identify the total number of variables and constraints
-    number_of_cons = model_objects[number_of_options + 1]
-    number_of_vars = model_objects[number_of_options + 3]
-    assert number_of_cons == len(nl_info.constraints)
-    assert number_of_vars == len(nl_info.variables)
+    number_of_duals, number_of_primals = _check_options(model_objects, nl_info)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+    duals = _read_text_values(sol_file, number_of_duals)
+    variable_vals = _read_text_values(sol_file, number_of_primals)
 
     # Parse the exit code line and capture it
     exit_code = [0, 0]
@@ -94,6 +149,188 @@ developers.
         raise PyomoException(
             f"ERROR READING `sol` FILE. Expected `objno`; received {line}."
         )
+    _process_exit_code(result, message, exit_code)
+
+    if result.solution_status != SolutionStatus.noSolution:
+        sol_data.primals = variable_vals
+        sol_data.duals = duals
+        ### Read suffixes ###
+        line = sol_file.readline()
+        while line:
+            line = line.strip()
+            if line == "":
+                continue
+            line = line.split()
+            # Some sort of garbage we tag onto the solver message, assuming we are past the suffixes
+            if line[0] != 'suffix':
+                # We assume this is the start of a
+                # section like kestrel_option, which
+                # comes after all suffixes.
+                remaining = ""
+                line = sol_file.readline()
+                while line:
+                    remaining += line.strip() + "; "
+                    line = sol_file.readline()
+                result.extra_info.solver_message += remaining
+                break
+            read_data_type = int(line[1])
+            convert_function = int
+            if (read_data_type & 4) == 4:
+                convert_function = float
+            number_of_entries = int(line[2])
+            # The third entry is name length, and it is length+1. This is unnecessary
+            # except for data validation.
+            # The fourth entry is table "length", e.g., memory size.
+            number_of_string_lines = int(line[5])
+            suffix_name = sol_file.readline().strip()
+            # Add any arbitrary string lines to the "other" list
+            for line in range(number_of_string_lines):
+                sol_data.other.append(sol_file.readline())
+            entries = []
+            for cnt in range(number_of_entries):
+                suf_line = sol_file.readline().split()
+                entries.append((int(suf_line[0]), convert_function(suf_line[1])))
+            _store_suffix(sol_data, read_data_type, suffix_name, entries)
+            line = sol_file.readline()
+
+    return result, sol_data
+
+
+#
+# Binary .sol files are written as a sequence of Fortran-style
+# "records": each record is framed by its length in bytes (as a
+# native-endian 32-bit integer) both before and after the record data.
+# The file is structured as:
+#
+#   - a record containing the 6 characters "binary"
+#   - one record for each line of the solver message, terminated by
+#     an empty record
+#   - the options record (32-bit integers): [nopts, opts..., n_con,
+#     n_duals, n_var, n_primals]
+#   - a record of n_duals doubles (omitted if n_duals is 0)
+#   - a record of n_primals doubles (omitted if n_primals is 0)
+#   - the objno record (32-bit integers): [objno, solve_result_num]
+#   - for each suffix: a header record (32-bit integers): [kind, n,
+#     namelen, tablen], a record with the suffix name, a record with
+#     the suffix table (omitted if tablen is 0), and a record of n
+#     (index, value) pairs, where index is a 32-bit integer and value
+#     is either a double (if kind & 4) or a 32-bit integer
+#
+_int = struct.Struct('=i')
+_BINARY_MARKER = _int.pack(6) + b'binary'
+_BINARY_MARKER_LEN = len(_BINARY_MARKER)
+
+
+def _read_record(sol_file, required=True):
+    header = sol_file.read(_int.size)
+    if len(header) < _int.size:
+        if required:
+            raise PyomoException(
+                "ERROR READING binary `sol` FILE. Unexpected end of file."
+            )
+        return None
+    (n,) = _int.unpack(header)
+    data = sol_file.read(n)
+    trailer = sol_file.read(_int.size)
+    if len(data) != n or len(trailer) != _int.size or _int.unpack(trailer)[0] != n:
+        raise PyomoException(
+            "ERROR READING binary `sol` FILE. Mismatched record length."
+        )
+    return data
+
+
+def _unpack_doubles(data):
+    if numpy_available:
+        # frombuffer returns a read-only view of the (immutable) bytes
+        return np.frombuffer(data, dtype='=f8').copy()
+    return list(struct.unpack(f'={len(data) // 8}d', data))
+
+
+def _unpack_ints(data):
+    return list(struct.unpack(f'={len(data) // _int.size}i', data))
+
+
+def _parse_binary_sol_file(sol_file, nl_info, result):
+    sol_data = SolFileData()
+    _read_record(sol_file)  # "binary"
+
+    message = []
+    while True:
+        line = _read_record(sol_file)
+        if not line:
+            break
+        message.append(line.decode().strip())
+    message = '\n'.join(message)
+
+    model_objects = _unpack_ints(_read_record(sol_file))
+    if model_objects[0] > 4:
+        raise _too_many_options_error()
+    number_of_duals, number_of_primals = _check_options(model_objects, nl_info)
+
+    if number_of_duals:
+        duals = _unpack_doubles(_read_record(sol_file))
+    else:
+        duals = _unpack_doubles(b'')
+    if number_of_primals:
+        variable_vals = _unpack_doubles(_read_record(sol_file))
+    else:
+        variable_vals = _unpack_doubles(b'')
+    if len(duals) != number_of_duals or len(variable_vals) != number_of_primals:
+        raise PyomoException(
+            "ERROR READING binary `sol` FILE. Expected "
+            f"{number_of_duals} duals and {number_of_primals} primals; "
+            f"found {len(duals)} and {len(variable_vals)}."
+        )
+
+    exit_code = _unpack_ints(_read_record(sol_file))
+    if len(exit_code) != 2:
+        raise PyomoException(
+            "ERROR READING binary `sol` FILE. Expected two numbers in "
+            f"`objno` record; received {exit_code}."
+        )
+    _process_exit_code(result, message, exit_code)
+
+    if result.solution_status != SolutionStatus.noSolution:
+        sol_data.primals = variable_vals
+        sol_data.duals = duals
+        ### Read suffixes ###
+        header = _read_record(sol_file, required=False)
+        while header:
+            read_data_type, number_of_entries, _, table_len = _unpack_ints(header)
+            suffix_name = _read_record(sol_file).decode().strip()
+            if table_len:
+                sol_data.other.extend(
+                    _read_record(sol_file).decode().splitlines(keepends=True)
+                )
+            if (read_data_type & 4) == 4:
+                fmt = '=id'
+            else:
+                fmt = '=ii'
+            data = _read_record(sol_file) if number_of_entries else b''
+            _store_suffix(
+                sol_data,
+                read_data_type,
+                suffix_name,
+                [(int(i), v) for i, v in struct.iter_unpack(fmt, data)],
+            )
+            header = _read_record(sol_file, required=False)
+
+    return result, sol_data
+
+
+def _store_suffix(sol_data, read_data_type, suffix_name, entries):
+    data_type = read_data_type & 3  # 0-var, 1-con, 2-obj, 3-prob
+    if data_type == 0:  # Var
+        sol_data.var_suffixes[suffix_name] = dict(entries)
+    elif data_type == 1:  # Con
+        sol_data.con_suffixes[suffix_name] = dict(entries)
+    elif data_type == 2:  # Obj
+        sol_data.obj_suffixes[suffix_name] = dict(entries)
+    elif data_type == 3:  # Prob
+        sol_data.problem_suffixes[suffix_name] = [val for _, val in entries]
+
+
+def _process_exit_code(result, message, exit_code):
     result.extra_info.solver_message = message.strip().replace('\n', '; ')
     exit_code_message = ''
     if (exit_code[1] >= 0) and (exit_code[1] <= 99):
@@ -134,74 +371,3 @@ developers.
             result.extra_info.solver_message += '; ' + exit_code_message
     else:
         result.extra_info.solver_message = exit_code_message
-
-    if result.solution_status != SolutionStatus.noSolution:
-        sol_data.primals = variable_vals
-        sol_data.duals = duals
-        ### Read suffixes ###
-        line = sol_file.readline()
-        while line:
-            line = line.strip()
-            if line == "":
-                continue
-            line = line.split()
-            # Some sort of garbage we tag onto the solver message, assuming we are past the suffixes
-            if line[0] != 'suffix':
-                # We assume this is the start of a
-                # section like kestrel_option, which
-                # comes after all suffixes.
-                remaining = ""
-                line = sol_file.readline()
-                while line:
-                    remaining += line.strip() + "; "
-                    line = sol_file.readline()
-                result.extra_info.solver_message += remaining
-                break
-            read_data_type = int(line[1])
-            data_type = read_data_type & 3  # 0-var, 1-con, 2-obj, 3-prob
-            convert_function = int
-            if (read_data_type & 4) == 4:
-                convert_function = float
-            number_of_entries = int(line[2])
-            # The third entry is name length, and it is length+1. This is unnecessary
-            # except for data validation.
-            # The fourth entry is table "length", e.g., memory size.
-            number_of_string_lines = int(line[5])
-            suffix_name = sol_file.readline().strip()
-            # Add any arbitrary string lines to the "other" list
-            for line in range(number_of_string_lines):
-                sol_data.other.append(sol_file.readline())
-            if data_type == 0:  # Var
-                sol_data.var_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    var_ndx = int(suf_line[0])
-                    sol_data.var_suffixes[suffix_name][var_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 1:  # Con
-                sol_data.con_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    con_ndx = int(suf_line[0])
-                    sol_data.con_suffixes[suffix_name][con_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 2:  # Obj
-                sol_data.obj_suffixes[suffix_name] = dict()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    obj_ndx = int(suf_line[0])
-                    sol_data.obj_suffixes[suffix_name][obj_ndx] = convert_function(
-                        suf_line[1]
-                    )
-            elif data_type == 3:  # Prob
-                sol_data.problem_suffixes[suffix_name] = list()
-                for cnt in range(number_of_entries):
-                    suf_line = sol_file.readline().split()
-                    sol_data.problem_suffixes[suffix_name].append(
-                        convert_function(suf_line[1])
-                    )
-            line = sol_file.readline()
-
-    return result, sol_data
@@ -13,9 +13,10 @@ import abc
 from typing import Sequence, Dict, Optional, Mapping, NoReturn
 
 from pyomo.core.base.constraint import ConstraintData
-from pyomo.core.base.var import VarData
+from pyomo.core.base.var import VarData, _load_var_values
 from pyomo.core.expr import value
 from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.errors import DeveloperError
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.contrib.solver.sol_reader import SolFileData
@@ -41,10 +42,55 @@ class SolutionLoaderBase(abc.ABC):
             to all primal variables will be loaded. Even if vars_to_load is specified, the values of other
             variables may also be loaded depending on the interface.
         """
-        for v, val in self.get_primals(vars_to_load=vars_to_load).items():
-            v.set_value(val, skip_validation=True)
+        primals = self.get_primals(vars_to_load=vars_to_load)
+        _load_var_values(primals.keys(), primals.values())
         StaleFlagManager.mark_all_as_stale(delayed=True)
 
+    def load_vars_from_array(self, var_order: Sequence[VarData], values) -> NoReturn:
+        """
+        Load an array of values into the value attribute of the variables.
+
+        This is the bulk counterpart to :meth:`load_vars` and is
+        typically used with the array returned by
+        :meth:`get_primals_array`.
+
+        Parameters
+        ----------
+        var_order: list
+            The variables to load
+        values: numpy.ndarray
+            The values to load into the variables (in the same order as var_order)
+        """
+        if len(values) != len(var_order):
+            raise ValueError(
+                f'Cannot load {len(values)} values into {len(var_order)} variables'
+            )
+        if hasattr(values, 'tolist'):
+            # Setting native floats is significantly faster than
+            # setting numpy scalars
+            values = values.tolist()
+        _load_var_values(var_order, values)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+
+    def get_primals_array(self, var_order: Sequence[VarData]):
+        """
+        Returns a numpy array of the solution values of the variables in var_order.
+
+        Parameters
+        ----------
+        var_order: list
+            The variables whose solution values should be retrieved
+
+        Returns
+        -------
+        primals: numpy.ndarray
+            The solution values (in the same order as var_order)
+        """
+        primals = self.get_primals(vars_to_load=var_order)
+        return np.fromiter(
+            (primals[v] for v in var_order), dtype=float, count=len(var_order)
+        )
+
     @abc.abstractmethod
     def get_primals(
         self, vars_to_load: Optional[Sequence[VarData]] = None
@@ -118,6 +164,10 @@ class PersistentSolutionLoader(SolutionLoaderBase):
         self._assert_solution_still_valid()
         return self._solver._get_primals(vars_to_load=vars_to_load)
 
+    def get_primals_array(self, var_order: Sequence[VarData]):
+        self._assert_solution_still_valid()
+        return self._solver._get_primals_array(var_order)
+
     def get_duals(
         self, cons_to_load: Optional[Sequence[ConstraintData]] = None
     ) -> Dict[ConstraintData, float]:
@@ -138,76 +188,88 @@ class SolSolutionLoader(SolutionLoaderBase):
     def __init__(self, sol_data: SolFileData, nl_info: NLWriterInfo) -> None:
         self._sol_data = sol_data
         self._nl_info = nl_info
+        # Cached (lazily-built) variable order, var id -> position index,
+        # and vector of (unscaled) primal values
+        self._var_order = None
+        self._var_index = None
+        self._primals = None
 
-    def load_vars(self, vars_to_load: Optional[Sequence[VarData]] = None) -> NoReturn:
+    def _assert_solution_is_valid(self):
         if self._nl_info is None:
             raise RuntimeError(
                 'Solution loader does not currently have a valid solution. Please '
                 'check results.TerminationCondition and/or results.SolutionStatus.'
             )
+
+    def _get_var_order(self):
+        if self._var_order is None:
+            self._var_order = self._nl_info.variables + [
+                v for v, _ in self._nl_info.eliminated_vars
+            ]
+            self._var_index = {id(v): i for i, v in enumerate(self._var_order)}
+        return self._var_order
+
+    def _get_primals_vector(self):
+        """Return the vector of primal values for all variables (ordered
+        as in :meth:`_get_var_order`)"""
+        if self._primals is not None:
+            return self._primals
+        nl_info = self._nl_info
         if self._sol_data is None:
-            assert len(self._nl_info.variables) == 0
+            assert len(nl_info.variables) == 0
+            primals = np.zeros(0)
         else:
-            if self._nl_info.scaling:
-                for v, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    v.set_value(val / scale, skip_validation=True)
-            else:
-                for v, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    v.set_value(val, skip_validation=True)
-
-        for v, v_expr in self._nl_info.eliminated_vars:
-            v.value = value(v_expr)
+            primals = np.asarray(self._sol_data.primals, dtype=float)
+            if nl_info.scaling:
+                primals = primals / np.asarray(nl_info.scaling.variables, dtype=float)
+        if nl_info.eliminated_vars:
+            val_map = dict(zip(map(id, nl_info.variables), primals.tolist()))
+            for v, v_expr in nl_info.eliminated_vars:
+                val_map[id(v)] = value(
+                    replace_expressions(v_expr, substitution_map=val_map)
+                )
+            primals = np.concatenate(
+                (
+                    primals,
+                    np.fromiter(
+                        (val_map[id(v)] for v, _ in nl_info.eliminated_vars),
+                        dtype=float,
+                        count=len(nl_info.eliminated_vars),
+                    ),
+                )
+            )
+        self._primals = primals
+        return primals
 
-        StaleFlagManager.mark_all_as_stale(delayed=True)
+    def load_vars(self, vars_to_load: Optional[Sequence[VarData]] = None) -> NoReturn:
+        self._assert_solution_is_valid()
+        self.load_vars_from_array(self._get_var_order(), self._get_primals_vector())
 
     def get_primals(
         self, vars_to_load: Optional[Sequence[VarData]] = None
     ) -> Mapping[VarData, float]:
-        if self._nl_info is None:
-            raise RuntimeError(
-                'Solution loader does not currently have a valid solution. Please '
-                'check results.TerminationCondition and/or results.SolutionStatus.'
-            )
-        val_map = dict()
-        if self._sol_data is None:
-            assert len(self._nl_info.variables) == 0
-        else:
-            if self._nl_info.scaling is None:
-                scale_list = [1] * len(self._nl_info.variables)
-            else:
-                scale_list = self._nl_info.scaling.variables
-            for v, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
-            ):
-                val_map[id(v)] = val / scale
-
-        for v, v_expr in self._nl_info.eliminated_vars:
-            val = replace_expressions(v_expr, substitution_map=val_map)
-            v_id = id(v)
-            val_map[v_id] = val
-
-        res = ComponentMap()
+        self._assert_solution_is_valid()
+        var_order = self._get_var_order()
+        primals = self._get_primals_vector().tolist()
         if vars_to_load is None:
-            vars_to_load = self._nl_info.variables + [
-                v for v, _ in self._nl_info.eliminated_vars
-            ]
-        for v in vars_to_load:
-            res[v] = val_map[id(v)]
-
-        return res
+            return ComponentMap(zip(var_order, primals))
+        var_index = self._var_index
+        return ComponentMap((v, primals[var_index[id(v)]]) for v in vars_to_load)
+
+    def get_primals_array(self, var_order: Sequence[VarData]):
+        self._assert_solution_is_valid()
+        self._get_var_order()
+        var_index = self._var_index
+        return self._get_primals_vector()[
+            np.fromiter(
+                (var_index[id(v)] for v in var_order), dtype=int, count=len(var_order)
+            )
+        ]
 
     def get_duals(
         self, cons_to_load: Optional[Sequence[ConstraintData]] = None
     ) -> Dict[ConstraintData, float]:
-        if self._nl_info is None:
-            raise RuntimeError(
-                'Solution loader does not currently have a valid solution. Please '
-                'check results.TerminationCondition and/or results.SolutionStatus.'
-            )
+        self._assert_solution_is_valid()
         if len(self._nl_info.eliminated_vars) > 0:
             raise NotImplementedError(
                 'For now, turn presolve off (opt.config.writer_config.linear_presolve=False) '
@@ -229,9 +291,11 @@ class SolSolutionLoader(SolutionLoaderBase):
             cons_to_load = set(self._nl_info.constraints)
         else:
             cons_to_load = set(cons_to_load)
-        for c, val, scale in zip(
-            self._nl_info.constraints, self._sol_data.duals, scale_list
-        ):
+        duals = self._sol_data.duals
+        if not isinstance(duals, list):
+            # Return Python floats (not numpy scalars)
+            duals = duals.tolist()
+        for c, val, scale in zip(self._nl_info.constraints, duals, scale_list):
             if c in cons_to_load:
                 res[c] = val * scale / obj_scale
         return res
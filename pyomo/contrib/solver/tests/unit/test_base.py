@@ -110,6 +110,7 @@ class TestPersistentSolverBase(unittest.TestCase):
             'CONFIG',
             '_get_duals',
             '_get_primals',
+            '_get_primals_array',
             '_get_reduced_costs',
             '_load_vars',
             'add_block',
@@ -0,0 +1,272 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import gc
+
+from pyomo.common import unittest
+from pyomo.contrib.solver.config import PersistentSolverConfig
+from pyomo.contrib.solver.persistent import PersistentSolverUtils
+from pyomo.core.base import observer
+import pyomo.environ as pyo
+
+
+class _RecordingSolver(PersistentSolverUtils):
+    """Persistent solver that records the calls made by update()"""
+
+    def __init__(self):
+        super().__init__()
+        self.config = PersistentSolverConfig()
+        self.calls = []
+
+    def _log(self, name, items):
+        self.calls.append((name, sorted(str(i) for i in items)))
+
+    def _add_variables(self, variables):
+        self._log('add_vars', (v.name for v in variables))
+
+    def _add_parameters(self, params):
+        self._log('add_params', (p.name for p in params))
+
+    def _add_constraints(self, cons):
+        self._log('add_cons', (c.name for c in cons))
+
+    def _add_sos_constraints(self, cons):
+        self._log('add_sos', (c.name for c in cons))
+
+    def _set_objective(self, obj):
+        self._log('set_objective', [] if obj is None else [obj.name])
+
+    def _remove_constraints(self, cons):
+        self._log('remove_cons', (c.name for c in cons))
+
+    def _remove_sos_constraints(self, cons):
+        self._log('remove_sos', (c.name for c in cons))
+
+    def _remove_variables(self, variables):
+        self._log('remove_vars', (v.name for v in variables))
+
+    def _remove_parameters(self, params):
+        self._log('remove_params', (p.name for p in params))
+
+    def _update_variables(self, variables):
+        self._log('update_vars', (v.name for v in variables))
+
+    def update_parameters(self):
+        self.calls.append(('update_params', []))
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.I = pyo.RangeSet(3)
+    m.x = pyo.Var(m.I, bounds=(0, 10))
+    m.y = pyo.Var()
+    m.p = pyo.Param(mutable=True, initialize=1)
+    m.c = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] <= m.p * i)
+    m.d = pyo.Constraint(expr=m.y >= sum(m.x.values()))
+    m.obj = pyo.Objective(expr=m.y)
+    return m
+
+
+class TestChangeTracking(unittest.TestCase):
+    def setUp(self):
+        # Ensure change logs from previous (collected) solvers are
+        # unregistered
+        gc.collect()
+        self.assertEqual(len(observer._change_logs), 0)
+
+    def _solver(self, m, track_changes=True):
+        opt = _RecordingSolver()
+        opt.config.auto_updates.track_changes = track_changes
+        opt.set_instance(m)
+        opt.calls = []
+        return opt
+
+    def _updates(self, opt):
+        opt.calls = []
+        opt.update()
+        # Drop the no-op calls
+        return [c for c in opt.calls if c[1] or c[0] == 'update_params']
+
+    def test_default_off(self):
+        m = _model()
+        opt = self._solver(m, track_changes=False)
+        self.assertIsNone(opt._change_log)
+        self.assertEqual(len(observer._change_logs), 0)
+        m.x[1].setub(5)
+        self.assertEqual(
+            self._updates(opt), [('update_params', []), ('update_vars', ['x[1]'])]
+        )
+
+    def test_no_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        self.assertIsNotNone(opt._change_log)
+        self.assertEqual(self._updates(opt), [])
+
+    def test_var_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        m.x[1].setub(5)
+        m.x[3].domain = pyo.Integers
+        # Changing the value of a free variable is not a modification
+        m.x[2].set_value(3)
+        self.assertEqual(
+            self._updates(opt),
+            [('update_params', []), ('update_vars', ['x[1]', 'x[3]'])],
+        )
+        self.assertEqual(len(opt._change_log), 0)
+        # Fixing a variable (treated as a parameter) regenerates the
+        # constraints that use it
+        m.x[2].fix(1)
+        self.assertEqual(
+            self._updates(opt),
+            [
+                ('update_params', []),
+                ('update_vars', ['x[2]']),
+                ('remove_cons', ['c[2]', 'd']),
+                ('remove_vars', ['x[2]']),
+                ('add_vars', ['x[2]']),
+                ('add_cons', ['c[2]', 'd']),
+            ],
+        )
+        m.x[2].set_value(2)
+        self.assertEqual(
+            self._updates(opt),
+            [
+                ('update_params', []),
+                ('update_vars', ['x[2]']),
+                ('remove_cons', ['c[2]', 'd']),
+                ('remove_vars', ['x[2]']),
+                ('add_vars', ['x[2]']),
+                ('add_cons', ['c[2]', 'd']),
+            ],
+        )
+
+    def test_param_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        m.p = 5
+        self.assertEqual(self._updates(opt), [('update_params', [])])
+
+    def test_constraint_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        m.c[2].deactivate()
+        m.c[3] = m.x[3] <= 4
+        self.assertEqual(
+            self._updates(opt),
+            [
+                ('remove_cons', ['c[2]']),
+                ('remove_cons', ['c[3]']),
+                ('add_cons', ['c[3]']),
+            ],
+        )
+        m.c[2].activate()
+        del m.c[1]
+        self.assertEqual(
+            self._updates(opt),
+            [('remove_cons', ['[Unattached ConstraintData]']), ('add_cons', ['c[2]'])],
+        )
+        self.assertEqual(set(opt._active_constraints), {m.c[2], m.c[3], m.d})
+
+    def test_objective_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        m.obj.sense = pyo.maximize
+        self.assertEqual(self._updates(opt), [('set_objective', ['obj'])])
+        m.obj.deactivate()
+        self.assertEqual(self._updates(opt), [])
+        self.assertIsNone(opt._objective)
+        m.obj.expr = m.x[1]
+        m.obj.activate()
+        self.assertEqual(self._updates(opt), [('set_objective', ['obj'])])
+        self.assertIs(opt._objective_expr, m.obj.expr)
+
+    def test_structural_changes(self):
+        m = _model()
+        opt = self._solver(m)
+        m.e = pyo.Constraint(expr=m.x[1] + m.x[2] <= 1)
+        self.assertIn(pyo.Block, opt._change_log.modified)
+        self.assertEqual(
+            self._updates(opt), [('update_params', []), ('add_cons', ['e'])]
+        )
+        m.b = pyo.Block()
+        m.b.e = pyo.Constraint(expr=m.x[3] <= 1)
+        opt.update()
+        m.b.deactivate()
+        self.assertEqual(
+            self._updates(opt), [('remove_cons', ['b.e']), ('update_params', [])]
+        )
+
+    def test_scoped_to_model(self):
+        m = _model()
+        m.b = pyo.Block()
+        m.b.z = pyo.Var()
+        other = _model()
+        opt = self._solver(m)
+        other.x[1].setub(5)
+        other.p = 3
+        other.c[1].deactivate()
+        self.assertEqual(len(opt._change_log), 0)
+        # Modifications to sub-blocks are recorded
+        m.b.z.setlb(0)
+        m.x[2].setlb(1)
+        self.assertEqual(opt._change_log.get(pyo.Var), [m.b.z, m.x[2]])
+        # Objects removed from the model are still recorded
+        m.del_component(m.b)
+        self.assertEqual(opt._change_log.get(pyo.Block), [m])
+        self.assertEqual(len(opt._change_log), 3)
+
+    def test_weak_references(self):
+        m = _model()
+        opt = self._solver(m)
+        m.v = pyo.Var([1, 2])
+        m.v[1].setub(1)
+        m.v[2].setub(2)
+        v1 = m.v[1]
+        self.assertEqual(opt._change_log.get(pyo.Var), [m.v[1], m.v[2]])
+        # The log does not keep modified objects alive
+        m.del_component(m.v)
+        gc.collect()
+        self.assertEqual(opt._change_log.get(pyo.Var), [v1])
+        del v1
+        gc.collect()
+        self.assertEqual(opt._change_log.get(pyo.Var), [])
+        self.assertEqual(opt._change_log.get(pyo.Block), [m])
+        self.assertEqual(self._updates(opt), [('update_params', [])])
+
+    def test_unregister(self):
+        m = _model()
+        opt = self._solver(m)
+        self.assertEqual(len(observer._change_logs), 1)
+        # Re-loading the model replaces the log
+        opt.set_instance(m)
+        self.assertEqual(len(observer._change_logs), 1)
+        # Disabling tracking unregisters the log
+        opt.config.auto_updates.track_changes = False
+        opt.update()
+        self.assertIsNone(opt._change_log)
+        self.assertEqual(len(observer._change_logs), 0)
+        # Re-enabling tracking performs a full update first
+        opt.config.auto_updates.track_changes = True
+        m.x[1].setub(5)
+        self.assertEqual(
+            self._updates(opt), [('update_params', []), ('update_vars', ['x[1]'])]
+        )
+        self.assertEqual(len(observer._change_logs), 1)
+        # The log is unregistered when the solver is garbage collected
+        del opt
+        gc.collect()
+        self.assertEqual(len(observer._change_logs), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
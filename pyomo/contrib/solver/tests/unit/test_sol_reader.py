@@ -9,14 +9,49 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import os
+import struct
+
 from pyomo.common import unittest
+from pyomo.common.errors import PyomoException
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.contrib.solver.results import Results, SolutionStatus, TerminationCondition
 from pyomo.contrib.solver.sol_reader import parse_sol_file, SolFileData
 
 currdir = this_file_dir()
 
 
+class _NLInfo(object):
+    def __init__(self, n_cons, n_vars):
+        self.constraints = [None] * n_cons
+        self.variables = [None] * n_vars
+
+
+def _record(data):
+    return struct.pack('=i', len(data)) + data + struct.pack('=i', len(data))
+
+
+def _binary_sol(message, options, duals, primals, objno, suffixes=()):
+    """Generate a binary .sol file"""
+    ans = [_record(b'binary')]
+    ans.extend(_record(line.encode()) for line in message)
+    ans.append(_record(b''))
+    ans.append(_record(struct.pack(f'={len(options)}i', *options)))
+    if duals:
+        ans.append(_record(struct.pack(f'={len(duals)}d', *duals)))
+    if primals:
+        ans.append(_record(struct.pack(f'={len(primals)}d', *primals)))
+    ans.append(_record(struct.pack('=ii', *objno)))
+    for kind, name, vals in suffixes:
+        ans.append(_record(struct.pack('=iiii', kind, len(vals), len(name) + 1, 0)))
+        ans.append(_record(name.encode()))
+        fmt = '=id' if kind & 4 else '=ii'
+        ans.append(_record(b''.join(struct.pack(fmt, *v) for v in vals)))
+    return b''.join(ans)
+
+
 class TestSolFileData(unittest.TestCase):
     def test_default_instantiation(self):
         instance = SolFileData()
@@ -49,3 +84,80 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def _parse(self, fname, n_cons, n_vars, mode='r'):
+        with open(os.path.join(currdir, 'sol_files', fname), mode) as FILE:
+            return parse_sol_file(FILE, _NLInfo(n_cons, n_vars), Results())
+
+    def test_parse_text(self):
+        result, sol_data = self._parse('conopt_optimal.sol', 1, 1)
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(list(sol_data.duals), [1])
+        self.assertEqual(list(sol_data.primals), [1])
+        self.assertEqual(sol_data.var_suffixes, {'sstatus': {0: 1}})
+        self.assertEqual(sol_data.con_suffixes, {'sstatus': {0: 3}})
+
+        result, sol_data = self._parse('infeasible1.sol', 242, 86)
+        self.assertEqual(result.solution_status, SolutionStatus.infeasible)
+        self.assertEqual(
+            result.termination_condition, TerminationCondition.locallyInfeasible
+        )
+        self.assertEqual(len(sol_data.duals), 242)
+        self.assertEqual(len(sol_data.primals), 86)
+        self.assertAlmostEqual(sol_data.duals[0], -3.5031247438024307e-14)
+        self.assertEqual(len(sol_data.var_suffixes['ipopt_zU_out']), 60)
+        self.assertEqual(len(sol_data.var_suffixes['ipopt_zL_out']), 86)
+
+    def test_parse_text_from_binary_stream(self):
+        # Text sol files opened in binary mode are still parsed
+        result, sol_data = self._parse('conopt_optimal.sol', 1, 1, 'rb')
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(list(sol_data.primals), [1])
+        self.assertEqual(sol_data.con_suffixes, {'sstatus': {0: 3}})
+
+    def test_parse_bad_text(self):
+        with self.assertRaisesRegex(PyomoException, "No 'Options' line found"):
+            self._parse('bad_options.sol', 1, 1)
+        with self.assertRaisesRegex(
+            PyomoException, "Expected two numbers in `objno` line"
+        ):
+            self._parse('bad_objnoline.sol', 1, 1)
+
+    def test_parse_binary(self):
+        sol = _binary_sol(
+            ['Ipopt 3.14: Optimal Solution Found'],
+            [3, 1, 1, 0, 2, 2, 3, 3],
+            [0.5, -1.5],
+            [1.0, 2.0, 3.0],
+            [0, 0],
+            [
+                (4, 'ipopt_zU_out', [(0, -1.25), (2, 0.5)]),
+                (1, 'sstatus', [(1, 3)]),
+                (3, 'iters', [(0, 12)]),
+            ],
+        )
+        result, sol_data = parse_sol_file(io.BytesIO(sol), _NLInfo(2, 3), Results())
+        self.assertEqual(result.solution_status, SolutionStatus.optimal)
+        self.assertEqual(
+            result.extra_info.solver_message, 'Ipopt 3.14: Optimal Solution Found'
+        )
+        self.assertEqual(list(sol_data.duals), [0.5, -1.5])
+        self.assertEqual(list(sol_data.primals), [1, 2, 3])
+        self.assertEqual(sol_data.var_suffixes, {'ipopt_zU_out': {0: -1.25, 2: 0.5}})
+        self.assertEqual(sol_data.con_suffixes, {'sstatus': {1: 3}})
+        self.assertEqual(sol_data.problem_suffixes, {'iters': [12]})
+
+        # The primals are returned as (writable) numpy arrays
+        sol_data.primals[0] = 5
+
+    def test_parse_binary_errors(self):
+        sol = _binary_sol(['msg'], [3, 1, 1, 0, 2, 2, 3, 3], [0.5], [], [0, 0])
+        with self.assertRaisesRegex(PyomoException, 'Expected 2 duals and 3 primals'):
+            parse_sol_file(io.BytesIO(sol), _NLInfo(2, 3), Results())
+        sol = _binary_sol(
+            ['msg'], [3, 1, 1, 0, 2, 2, 3, 3], [0.5, 1], [1, 2, 3], [0, 0]
+        )
+        with self.assertRaisesRegex(PyomoException, 'Mismatched record length'):
+            parse_sol_file(io.BytesIO(sol[:-2] + b'xx'), _NLInfo(2, 3), Results())
+        with self.assertRaisesRegex(PyomoException, 'Unexpected end of file'):
+            parse_sol_file(io.BytesIO(sol[:-16]), _NLInfo(2, 3), Results())
@@ -10,7 +10,16 @@
 #  ___________________________________________________________________________
 
 from pyomo.common import unittest
-from pyomo.contrib.solver.solution import SolutionLoaderBase, PersistentSolutionLoader
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.contrib.solver.sol_reader import SolFileData
+from pyomo.contrib.solver.solution import (
+    SolutionLoaderBase,
+    PersistentSolutionLoader,
+    SolSolutionLoader,
+)
+from pyomo.repn.plugins.nl_writer import NLWriterInfo, ScalingFactors
+from pyomo.core.staleflag import StaleFlagManager
+import pyomo.environ as pyo
 
 
 class TestSolutionLoaderBase(unittest.TestCase):
@@ -20,7 +29,14 @@ class TestSolutionLoaderBase(unittest.TestCase):
         self.assertEqual(sorted(expected_list), sorted(member_list))
 
     def test_member_list(self):
-        expected_list = ['load_vars', 'get_primals', 'get_duals', 'get_reduced_costs']
+        expected_list = [
+            'load_vars',
+            'load_vars_from_array',
+            'get_primals',
+            'get_primals_array',
+            'get_duals',
+            'get_reduced_costs',
+        ]
         method_list = [
             method
             for method in dir(SolutionLoaderBase)
@@ -42,7 +58,14 @@ class TestSolSolutionLoader(unittest.TestCase):
     # I am currently unsure how to test this further because it relies heavily on
     # SolFileData and NLWriterInfo
     def test_member_list(self):
-        expected_list = ['load_vars', 'get_primals', 'get_duals', 'get_reduced_costs']
+        expected_list = [
+            'load_vars',
+            'load_vars_from_array',
+            'get_primals',
+            'get_primals_array',
+            'get_duals',
+            'get_reduced_costs',
+        ]
         method_list = [
             method
             for method in dir(SolutionLoaderBase)
@@ -50,6 +73,107 @@ class TestSolSolutionLoader(unittest.TestCase):
         ]
         self.assertEqual(sorted(expected_list), sorted(method_list))
 
+    def _loader(self, scaling=None, storage='object'):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], storage=storage)
+        m.y = pyo.Var()
+        sol_data = SolFileData()
+        sol_data.primals = [1.0, 4.0, 9.0]
+        info = NLWriterInfo(
+            var=[m.x[3], m.x[1], m.x[2]],
+            con=[],
+            obj=[],
+            external_libs=[],
+            row_labels=None,
+            col_labels=None,
+            eliminated_vars=[(m.y, 2 * m.x[1] + 1)],
+            scaling=scaling,
+        )
+        return m, SolSolutionLoader(sol_data, info)
+
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_primals_array(self):
+        m, loader = self._loader()
+        self.assertEqual(
+            loader.get_primals_array([m.x[1], m.y, m.x[3]]).tolist(), [4, 9, 1]
+        )
+        primals = loader.get_primals()
+        self.assertEqual(
+            [(v.name, val) for v, val in primals.items()],
+            [('x[3]', 1), ('x[1]', 4), ('x[2]', 9), ('y', 9)],
+        )
+        primals = loader.get_primals([m.y, m.x[2]])
+        self.assertEqual(
+            [(v.name, val) for v, val in primals.items()], [('y', 9), ('x[2]', 9)]
+        )
+
+        loader.load_vars()
+        self.assertEqual([m.x[i].value for i in m.x], [4, 9, 1])
+        self.assertEqual(m.y.value, 9)
+
+        loader.load_vars_from_array([m.y, m.x[1]], np.array([5.0, 6.0]))
+        self.assertEqual(m.y.value, 5)
+        self.assertEqual(m.x[1].value, 6)
+        self.assertIs(type(m.x[1].value), float)
+        with self.assertRaisesRegex(
+            ValueError, 'Cannot load 1 values into 2 variables'
+        ):
+            loader.load_vars_from_array([m.y, m.x[1]], np.array([5.0]))
+
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_load_array_storage(self):
+        m, loader = self._loader(storage='array')
+        m.x[2].fix()
+        StaleFlagManager.mark_all_as_stale()
+        loader.load_vars()
+        self.assertEqual(m.x.get_values(), {1: 4, 2: 9, 3: 1})
+        self.assertEqual(m.y.value, 9)
+        self.assertIs(type(m.x[1].value), float)
+        self.assertEqual([m.x[i].stale for i in m.x], [False] * 3)
+        loader.load_vars_from_array([m.x[3], m.y], [None, 2])
+        self.assertEqual(m.x.get_values(), {1: 4, 2: 9, 3: None})
+        self.assertTrue(m.x[3].stale)
+        self.assertEqual(m.y.value, 2)
+
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_primals_array_scaled(self):
+        m, loader = self._loader(ScalingFactors([1, 2, 3], [], [1]))
+        self.assertEqual(
+            loader.get_primals_array([m.x[1], m.y, m.x[3], m.x[2]]).tolist(),
+            [2, 5, 1, 3],
+        )
+
+    @unittest.skipUnless(numpy_available, 'numpy is not available')
+    def test_duals(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: m.x >= i)
+        sol_data = SolFileData()
+        sol_data.duals = np.array([0.5, 2.0])
+        info = NLWriterInfo(
+            var=[m.x],
+            con=[m.c[2], m.c[1]],
+            obj=[],
+            external_libs=[],
+            row_labels=None,
+            col_labels=None,
+            eliminated_vars=[],
+            scaling=None,
+        )
+        duals = SolSolutionLoader(sol_data, info).get_duals()
+        self.assertEqual(
+            [(c.name, val) for c, val in duals.items()], [('c[2]', 0.5), ('c[1]', 2)]
+        )
+        # The public API returns Python floats (not numpy scalars)
+        self.assertEqual({type(val) for val in duals.values()}, {float})
+
+    def test_invalid_solution(self):
+        loader = SolSolutionLoader(None, None)
+        with self.assertRaisesRegex(RuntimeError, 'does not currently have a valid'):
+            loader.get_primals_array([])
+        with self.assertRaisesRegex(RuntimeError, 'does not currently have a valid'):
+            loader.load_vars()
+
 
 class TestPersistentSolutionLoader(unittest.TestCase):
     def test_abstract_member_list(self):
@@ -61,7 +185,9 @@ class TestPersistentSolutionLoader(unittest.TestCase):
     def test_member_list(self):
         expected_list = [
             'load_vars',
+            'load_vars_from_array',
             'get_primals',
+            'get_primals_array',
             'get_duals',
             'get_reduced_costs',
             'invalidate',
@@ -119,7 +119,7 @@ from pyomo.core.base.label import (
 # Components
 #
 from pyomo.core.base.component import name, Component, ModelComponentFactory
-from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.base.componentuid import ComponentUID, ComponentUIDIndex
 from pyomo.core.base.action import BuildAction
 from pyomo.core.base.check import BuildCheck
 from pyomo.core.base.set import Set, SetOf, simple_set_rule, RangeSet
@@ -196,6 +196,7 @@ from pyomo.core.base.transformation import (
 )
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.serialization import save_model, load_model
 
 from pyomo.core.util import (
     prod,
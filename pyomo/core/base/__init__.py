@@ -36,7 +36,7 @@ from pyomo.core.expr.boolean_value import (
 )
 
 from pyomo.core.base.component import name, Component, ModelComponentFactory
-from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.base.componentuid import ComponentUID, ComponentUIDIndex
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.label import (
@@ -146,6 +146,7 @@ from pyomo.core.base.suffix import (
 from pyomo.core.base.var import Var, VarData, ScalarVar, VarList
 
 from pyomo.core.base.instance2dat import instance2dat
+from pyomo.core.base.serialization import save_model, load_model
 
 #
 # These APIs are deprecated and should be removed in the near future
@@ -43,6 +43,7 @@ from pyomo.core.base.componentuid import ComponentUID
 from pyomo.core.base.set import Any
 from pyomo.core.base.var import Var
 from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.observer import _change_logs, _structure_version, notify_change
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
     UnindexedComponent_set,
@@ -238,6 +239,57 @@ class _DeduplicateInfo(object):
                 return filterfalse(has_been_seen, items)
 
 
+class CloneReport(object):
+    """Record of the data shared between a block and its clone
+
+    :meth:`BlockData.clone` returns an instance of this class when
+    called with ``share=True`` and ``report=True``.
+
+    Attributes
+    ----------
+    shared_expressions: int
+        The number of expression nodes shared with the clone
+
+    copied_expressions: int
+        The number of expression nodes copied into the clone
+
+    shared_params: int
+        The number of (immutable) indexed Params whose values are
+        shared with the clone
+
+    shared_param_values: int
+        The total number of values in the shared Params
+
+    shared_sets: int
+        The number of Set data objects whose members are shared with
+        the clone
+
+    shared_set_members: int
+        The total number of members in the shared Sets
+
+    """
+
+    __slots__ = (
+        'shared_expressions',
+        'copied_expressions',
+        'shared_params',
+        'shared_param_values',
+        'shared_sets',
+        'shared_set_members',
+    )
+
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, 0)
+
+    def __str__(self):
+        return (
+            "shared %s expression nodes (copied %s), %s Params (%s values), "
+            "and %s Sets (%s members)"
+            % tuple(getattr(self, slot) for slot in self.__slots__)
+        )
+
+
 def _isNotNone(val):
     return val is not None
 
@@ -487,6 +539,13 @@ class PseudoMap(AutoSlots.Mixin):
         return self.items()
 
 
+def _reset_component_index_cache(encode, val):
+    """__autoslot_mappers__ mapper that drops the cached component lists"""
+    if encode and val is not None:
+        return {}
+    return val
+
+
 class BlockData(ActiveComponentData):
     """
     This class holds the fundamental block data.
@@ -498,6 +557,12 @@ class BlockData(ActiveComponentData):
     #  TODO: remove repn caching from the model
     __autoslot_mappers = {'_repn': AutoSlots.encode_as_none}
 
+    # The component index cache (see enable_component_index_cache())
+    # is None if caching is disabled.  The cached lists are never
+    # copied or pickled (only whether caching is enabled).
+    _component_index_cache = None
+    __autoslot_mappers__ = {'_component_index_cache': _reset_component_index_cache}
+
     def __init__(self, component):
         #
         # BLOCK DATA ELEMENTS
@@ -1005,6 +1070,9 @@ component, use the block del_component() and add_component() methods.
                 "Cannot assign the top-level block as a subblock of one of "
                 "its children (%s): creates a circular hierarchy" % (self,)
             )
+        _structure_version[0] += 1
+        if _change_logs:
+            notify_change(self)
         #
         # Set the name and parent pointer of this component.
         #
@@ -1144,6 +1212,10 @@ component, use the block del_component() and add_component() methods.
                 "Attempting to delete a reserved block component:\n\t%s" % (obj.name,)
             )
 
+        _structure_version[0] += 1
+        if _change_logs:
+            notify_change(self)
+
         # Replace the component in the master list with a None placeholder
         idx = self._decl[name]
         del self._decl[name]
@@ -1186,6 +1258,7 @@ component, use the block del_component() and add_component() methods.
         if obj.ctype is new_ctype:
             return
 
+        _structure_version[0] += 1
         name = obj.local_name
         if not preserve_declaration_order:
             # if we don't have to preserve the decl order, then the
@@ -1246,10 +1319,40 @@ component, use the block del_component() and add_component() methods.
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
-    def clone(self, memo=None):
-        """
-        TODO
+    def clone(self, memo=None, share=False, report=False):
+        """Return a copy of this block (and all components it contains)
+
+        Components and component data are always copied.  References
+        to objects outside this block (e.g., global Sets or components
+        on a parent block) are preserved.
+
+        Parameters
+        ----------
+        memo: dict, optional
+            The :py:func:`copy.deepcopy` memo.
+
+        share: bool
+            If True, immutable data is shared between this block and the
+            clone instead of being copied:
+
+            - expression nodes are copied directly (bypassing the
+              general deepcopy() logic), and any expression subtree
+              that does not reference an object in this block (e.g., an
+              expression of constants, immutable Params, or variables on
+              a parent block) is shared;
+
+            - the values of immutable indexed Params and the members of
+              Sets are shared (copy-on-write: a Set or Param copies the
+              shared data before it is first modified).
+
+        report: bool
+            If True, return a ``(clone, report)`` tuple, where `report`
+            is the :py:class:`CloneReport` recording the data that was
+            shared with the clone (requires `share`).
+
         """
+        if report and not share:
+            raise ValueError("Block.clone(): report=True requires share=True")
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
         # model.  It turns out that this was completely unnecessary and
@@ -1273,10 +1376,15 @@ component, use the block del_component() and add_component() methods.
             memo = {}
         memo['__block_scope__'] = {id(self): True, id(None): False}
         memo[id(parent)] = parent
+        if share:
+            clone_report = memo['__clone_report__'] = CloneReport()
 
         with PauseGC():
             new_block = copy.deepcopy(self, memo)
 
+        if share and is_debug_set(logger):
+            logger.debug("Cloned block %s: %s" % (self.name, clone_report))
+
         # We need to "detangle" the new block from the original block
         # hierarchy
         if pc is self:
@@ -1284,6 +1392,8 @@ component, use the block del_component() and add_component() methods.
         else:
             new_block._component = None
 
+        if report:
+            return new_block, clone_report
         return new_block
 
     def contains_component(self, ctype):
@@ -1506,6 +1616,83 @@ component, use the block del_component() and add_component() methods.
         kwargs['active'] = True
         return self.component_data_objects(*args, **kwargs)
 
+    def enable_component_index_cache(self, enable=True):
+        """Enable (or disable) caching the results of component queries
+
+        When enabled, :meth:`component_objects` and
+        :meth:`component_data_objects` called on this block store the
+        flattened list of matching objects for each combination of
+        arguments.  Subsequent queries with the same arguments return
+        the stored list (without walking the block hierarchy) as long
+        as the model structure has not changed.  Adding or removing
+        components (or component data) and (de)activating components
+        invalidate the cached lists.
+
+        Note that when caching is enabled, the query results are
+        collected when iteration begins: components added while
+        iterating over the results are not returned.
+
+        """
+        self._component_index_cache = {} if enable else None
+
+    def _cached_component_query(
+        self, data, ctype, active, sort, descend_into, descent_order
+    ):
+        """Return the (cached) list of matching components or component data"""
+        if ctype is not None and not isclass(ctype):
+            ctype = tuple(ctype)
+        if descend_into not in (None, True, False) and not isclass(descend_into):
+            descend_into = tuple(descend_into)
+        key = (data, ctype, active, sort, descend_into, descent_order)
+        cache = self._component_index_cache
+        ans = cache.get(key, None)
+        if ans is not None and ans[0] == _structure_version[0]:
+            for comp, n in ans[1]:
+                if len(comp._data) != n:
+                    break
+            else:
+                return ans[2]
+
+        # The cached list remains valid as long as no component data is
+        # added to (or removed from) any of the components that were
+        # searched or descended into.  Note that the data in Reference
+        # components can change without modifying the Reference, so
+        # queries that include References are not cached.
+        version = _structure_version[0]
+        if ctype is None:
+            sig_ctype = None
+        else:
+            sig_ctype = set((ctype,) if isclass(ctype) else ctype)
+            if descend_into is True:
+                sig_ctype.add(Block)
+            elif isclass(descend_into):
+                sig_ctype.add(descend_into)
+            elif descend_into:
+                sig_ctype.update(descend_into)
+        signature = []
+        ans = []
+        dedup = _DeduplicateInfo()
+        for _block in self.block_data_objects(
+            active, sort, descend_into, descent_order
+        ):
+            for comp in PseudoMap(_block, sig_ctype, None, False).values():
+                comp_data = getattr(comp, '_data', None)
+                if comp_data is None:
+                    continue
+                if comp_data.__class__ is not dict:
+                    signature = None
+                elif signature is not None:
+                    signature.append((comp, len(comp_data)))
+            if data:
+                ans.extend(
+                    _block._component_data_itervalues(ctype, active, sort, dedup)
+                )
+            else:
+                ans.extend(_block.component_map(ctype, active, sort).values())
+        if signature is not None:
+            cache[key] = (version, signature, ans)
+        return ans
+
     def component_objects(
         self, ctype=None, active=None, sort=False, descend_into=True, descent_order=None
     ):
@@ -1514,6 +1701,11 @@ component, use the block del_component() and add_component() methods.
         component objects in a block.  By default, the
         generator recursively descends into sub-blocks.
         """
+        if self._component_index_cache is not None:
+            yield from self._cached_component_query(
+                False, ctype, active, sort, descend_into, descent_order
+            )
+            return
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
         ):
@@ -1528,6 +1720,11 @@ component, use the block del_component() and add_component() methods.
         block.  By default, this generator recursively
         descends into sub-blocks.
         """
+        if self._component_index_cache is not None:
+            yield from self._cached_component_query(
+                True, ctype, active, sort, descend_into, descent_order
+            )
+            return
         dedup = _DeduplicateInfo()
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
@@ -17,7 +17,7 @@ from weakref import ref as weakref_ref
 
 import pyomo.common
 from pyomo.common import DeveloperError
-from pyomo.common.autoslots import AutoSlots, fast_deepcopy
+from pyomo.common.autoslots import AutoSlots, fast_deepcopy, fast_deepcopy_states
 from pyomo.common.collections import OrderedDict
 from pyomo.common.deprecation import (
     RenamedClass,
@@ -32,6 +32,7 @@ from pyomo.common.sorting import sorted_robust
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.core.base.component_namer import name_repr, index_repr
 from pyomo.core.base.global_set import UnindexedComponent_index
+from pyomo.core.base.observer import _change_logs, _structure_version, notify_change
 
 logger = logging.getLogger('pyomo.core')
 
@@ -203,8 +204,7 @@ class ComponentBase(PyomoObject):
         # means that it should be relatively safe to clone the contents
         # in the same order.
         #
-        for comp, new in component_list:
-            comp.__deepcopy_state__(memo, new)
+        fast_deepcopy_states(component_list, memo)
         return memo[id(self)]
 
     def _create_objects_for_deepcopy(self, memo, component_list):
@@ -721,10 +721,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        _structure_version[0] += 1
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _structure_version[0] += 1
 
 
 class ComponentData(ComponentBase):
@@ -1004,7 +1006,13 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _structure_version[0] += 1
+        if _change_logs:
+            notify_change(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _structure_version[0] += 1
+        if _change_logs:
+            notify_change(self)
@@ -24,6 +24,7 @@ from pyomo.core.base.component_namer import (
     re_number as _re_number,
 )
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
+from pyomo.core.base.observer import _structure_version
 from pyomo.core.base.reference import Reference
 
 
@@ -622,6 +623,153 @@ class ComponentUID(object):
         return i + 1 == len(self._cids)
 
 
+def _has_wildcards(cids):
+    for name, idx in cids:
+        for i in idx:
+            if i.__class__ is slice or i is Ellipsis:
+                return True
+    return False
+
+
+class ComponentUIDIndex(object):
+    """A reusable index for resolving ComponentUIDs on a block
+
+    This maps the (exact) ComponentUIDs of all components and component
+    data on `block` (and its sub-blocks) to the corresponding objects
+    (and back).  The maps are built on first use, so resolving many
+    CUIDs (or generating the CUIDs for many components) does not
+    re-parse strings or re-walk the block hierarchy for each lookup.
+    All CUIDs are relative to `block` (that is, they are equivalent to
+    ``ComponentUID(component, context=block)`` and are resolved as by
+    ``cuid.find_component_on(block)``).
+
+    The index is rebuilt (the next time it is used) after any structural
+    change to the model (adding or removing components or component
+    data, etc.).  CUIDs that contain wildcards are always resolved by
+    :meth:`ComponentUID.find_component_on`.
+
+    Parameters
+    ----------
+    block: BlockData
+        The block to index
+
+    """
+
+    __slots__ = ('_block', '_version', '_objects', '_cuids', '_parsed')
+
+    def __init__(self, block):
+        self._block = block
+        self._version = None
+        self._objects = None
+        self._cuids = None
+        # Cache of parsed CUID strings.  This is independent of the
+        # model, so it is not cleared when the index is rebuilt.
+        self._parsed = {}
+
+    def invalidate(self):
+        """Discard the index (it will be rebuilt the next time it is used)"""
+        self._version = None
+        self._objects = None
+        self._cuids = None
+
+    def _update(self):
+        if self._version == _structure_version[0]:
+            return
+        self._version = _structure_version[0]
+        # Note: the CUIDs of block data are recorded as the index is
+        # built, so the CUID prefix for every block in the hierarchy is
+        # known before we descend into it
+        objects = self._objects = {}
+        cuids = self._cuids = ComponentMap()
+        cuids[self._block] = ()
+        for blk in self._block.block_data_objects(descend_into=True):
+            prefix = cuids.get(blk, None)
+            if prefix is None:
+                prefix = cuids[blk] = ComponentUID(blk, context=self._block)._cids
+            for comp in blk.component_objects(descend_into=False):
+                cids = prefix + ((comp.local_name, ()),)
+                objects[cids] = comp
+                cuids[comp] = cids
+                if not comp.is_indexed():
+                    continue
+                name = comp.local_name
+                is_reference = comp.is_reference()
+                for idx, obj in comp.items():
+                    if idx.__class__ is not tuple or len(idx) == 1:
+                        idx = (idx,)
+                    cids = prefix + ((name, idx),)
+                    objects[cids] = obj
+                    # Only record the CUID of component data from the
+                    # component that owns the data (and not References)
+                    if not is_reference:
+                        cuids[obj] = cids
+
+    def _parse(self, cuid):
+        if cuid.__class__ is ComponentUID:
+            return cuid
+        ans = self._parsed.get(cuid, None)
+        if ans is None:
+            ans = self._parsed[cuid] = ComponentUID(cuid)
+        return ans
+
+    def _find(self, cuid):
+        cuid = self._parse(cuid)
+        if _has_wildcards(cuid._cids):
+            return cuid.find_component_on(self._block)
+        ans = self._objects.get(cuid._cids, None)
+        if ans is not None:
+            return ans
+        ans = cuid.find_component_on(self._block)
+        if ans is not None:
+            # This component (data) was created without changing the
+            # model structure (e.g., accessing a sparse Var).
+            self._objects[cuid._cids] = ans
+        return ans
+
+    def find_component(self, cuid):
+        """Return the component matching `cuid` (or None if not found)
+
+        Parameters
+        ----------
+        cuid: ComponentUID or str
+            The ComponentUID (or its string representation) to resolve
+
+        """
+        self._update()
+        return self._find(cuid)
+
+    def find_components(self, cuids):
+        """Return the list of components matching a sequence of CUIDs
+
+        Each element of `cuids` is a ComponentUID or a string.  CUIDs
+        that do not match any component are returned as None.
+
+        """
+        self._update()
+        return [self._find(cuid) for cuid in cuids]
+
+    def _get(self, component):
+        cids = self._cuids.get(component, None)
+        if cids is None:
+            ans = ComponentUID(component, context=self._block)
+            self._cuids[component] = ans._cids
+            return ans
+        ans = ComponentUID.__new__(ComponentUID)
+        ans._cids = cids
+        return ans
+
+    def get_cuid(self, component):
+        """Return the ComponentUID (relative to the indexed block) for
+        `component`"""
+        self._update()
+        return self._get(component)
+
+    def get_cuids(self, components):
+        """Return the list of ComponentUIDs for a sequence of components"""
+        self._update()
+        return [self._get(component) for component in components]
+
+
 def _int_or_float(n):
     _num = float(n)
     try:
@@ -49,6 +49,7 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.set import Set
 from pyomo.core.base.disable_methods import disable_methods
+from pyomo.core.base.observer import _change_logs, notify_change
 from pyomo.core.base.initializer import (
     Initializer,
     IndexedCallInitializer,
@@ -380,6 +381,8 @@ class ConstraintData(ActiveComponentData):
 
     def set_value(self, expr):
         """Set the expression on this constraint."""
+        if _change_logs:
+            notify_change(self)
         # Clear any previously-cached normalized constraint
         self._expr = None
         if expr.__class__ in _known_relational_expressions:
@@ -32,6 +32,7 @@ from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import IndexedComponent, UnindexedComponent_set
 from pyomo.core.expr.numvalue import as_numeric
 from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.observer import _change_logs, notify_change
 
 logger = logging.getLogger('pyomo.core')
 
@@ -138,6 +139,8 @@ class NamedExpressionData(numeric_expr.NumericValue):
 
     def set_value(self, expr):
         """Set the expression on this expression."""
+        if _change_logs:
+            notify_change(self)
         if expr is None or expr.__class__ in native_numeric_types:
             self._args_ = (expr,)
             return
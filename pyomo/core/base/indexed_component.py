@@ -22,10 +22,12 @@ from pyomo.core.base.component import Component, ActiveComponent, ComponentData
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
+from pyomo.core.base.observer import _change_logs, _structure_version, notify_change
 from pyomo.core.expr.numeric_expr import _ndarray
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.common import DeveloperError
-from pyomo.common.autoslots import fast_deepcopy
+from pyomo.common.autoslots import all_atomic, fast_deepcopy
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.collections import ComponentSet
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import TemplateExpressionError
@@ -356,11 +358,18 @@ class IndexedComponent(Component):
                 _src = self._data
                 memo[id(_src)] = _new._data = _src.__class__()
                 _setter = _new._data.__setitem__
-                for idx, obj in _src.items():
-                    _setter(
-                        fast_deepcopy(idx, memo),
-                        obj._create_objects_for_deepcopy(memo, component_list),
-                    )
+                if all_atomic(_src):
+                    # The indices will not be duplicated by deepcopy()
+                    for idx, obj in _src.items():
+                        _setter(
+                            idx, obj._create_objects_for_deepcopy(memo, component_list)
+                        )
+                else:
+                    for idx, obj in _src.items():
+                        _setter(
+                            fast_deepcopy(idx, memo),
+                            obj._create_objects_for_deepcopy(memo, component_list),
+                        )
 
         return _ans
 
@@ -378,6 +387,7 @@ class IndexedComponent(Component):
     def clear(self):
         """Clear the data in this component"""
         if self.is_indexed():
+            _structure_version[0] += 1
             self._data = {}
         else:
             raise DeveloperError(
@@ -743,6 +753,11 @@ You can silence this warning by one of three ways:
                 del self[idx]
         else:
             # Handle the normal deletion operation
+            _structure_version[0] += 1
+            if _change_logs:
+                obj = self._data[index]
+                if isinstance(obj, ComponentData):
+                    notify_change(obj)
             if self.is_indexed():
                 # Remove reference to this object
                 self._data[index]._component = None
@@ -1228,3 +1243,37 @@ class IndexedComponent_NDArrayMixin(object):
         return _ndarray.NumericNDArray.__array_ufunc__(
             None, ufunc, method, *inputs, **kwargs
         )
+
+    #
+    # Helpers for the bulk (array-based) accessors implemented by the
+    # derived components (e.g., IndexedVar.get_values_array())
+    #
+
+    def _bulk_keys(self, index):
+        """Return the list of indices addressed by a bulk accessor
+
+        If `index` is None, this returns all indices (in the order
+        returned by :meth:`keys`).
+
+        """
+        if index is None:
+            return list(self.keys())
+        return list(index)
+
+    def _bulk_array(self, values, n, dtype=float):
+        """Convert `values` to a 1-D numpy array with `n` elements
+
+        Scalar values are broadcast to all elements.  For float arrays,
+        None is converted to NaN.
+
+        """
+        ans = np.asarray(values, dtype=dtype)
+        if not ans.ndim:
+            return np.full(n, ans, dtype=dtype)
+        if ans.shape != (n,):
+            raise ValueError(
+                "Expected a scalar or a 1-D array with %s elements for "
+                "component '%s' (received an array with shape %s)"
+                % (n, self.name, ans.shape)
+            )
+        return ans
@@ -33,6 +33,7 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.expression import NamedExpressionData
 from pyomo.core.base.set import Set
+from pyomo.core.base.observer import _change_logs, notify_change
 from pyomo.core.base.initializer import (
     Initializer,
     IndexedCallInitializer,
@@ -152,6 +153,8 @@ class ObjectiveData(NamedExpressionData, ActiveComponentData):
     def set_sense(self, sense):
         """Set the sense (direction) of this objective."""
         self._sense = ObjectiveSense(sense)
+        if _change_logs:
+            notify_change(self)
 
 
 class _ObjectiveData(metaclass=RenamedClass):
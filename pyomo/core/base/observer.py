@@ -0,0 +1,135 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Opt-in change notification for modeling components.
+
+Component data objects report modifications (new variable bounds,
+fixing / unfixing variables, new constraint expressions, (de)activation,
+etc.) by calling :func:`notify_change`.  The notification is only
+performed when at least one :class:`ChangeLog` is registered, so the
+cost to models that nobody is observing is a single truth test of
+:data:`_change_logs`.  Change logs may be restricted to a single block
+(e.g., the model a persistent solver is attached to), and only hold
+weak references to the modified objects.
+
+Independently of the change logs, structural modifications (adding or
+removing components or component data, (de)activating components,
+etc.) always increment :data:`_structure_version`.  Caches of model
+structure (e.g., the block component index cache) record the version
+when they are built and are discarded if it changes.
+
+This module intentionally does not import anything from Pyomo so that
+it may be imported by the core component modules.
+
+"""
+
+import weakref
+
+#: The list of currently registered change logs.  Modeling components
+#: test this list before calling :func:`notify_change`.  The list object
+#: is never rebound (only modified in place), so it is safe to import
+#: it directly into other modules.
+_change_logs = []
+
+#: Counter incremented by every structural modification to any model.
+#: The counter is stored in a list (and only updated in place) so that
+#: it can be imported directly into other modules.
+_structure_version = [0]
+
+
+class ChangeLog(object):
+    """Record of the component data modified since the last :meth:`clear`
+
+    Modified objects are grouped by their ``ctype`` (as of the time of
+    the modification), and stored in insertion order.  Note that
+    modifications to a block's structure (adding or removing
+    components, (de)activating the block) are recorded under the
+    block's ctype (e.g., :class:`Block`).
+
+    If `block` is provided, only modifications to objects declared on
+    `block` (or any of its sub-blocks) are recorded.  The log only
+    holds weak references to the modified objects (and to `block`):
+    objects that are garbage collected before the log is processed
+    are silently dropped from the log.
+
+    """
+
+    __slots__ = ('modified', '_block', '__weakref__')
+
+    def __init__(self, block=None):
+        # Map of ctype to a dict mapping id(obj) to a weakref to obj
+        self.modified = {}
+        self._block = None if block is None else weakref.ref(block)
+
+    def __len__(self):
+        return sum(
+            1
+            for refs in self.modified.values()
+            for ref in refs.values()
+            if ref() is not None
+        )
+
+    def record(self, obj):
+        if self._block is not None:
+            block = self._block()
+            if block is None:
+                return
+            if obj is not block:
+                # Note: parent_component() returns None for data whose
+                # owning component was garbage collected
+                parent = obj.parent_component()
+                while parent is not block:
+                    if parent is None:
+                        # obj is not declared on the observed block
+                        return
+                    parent = parent.parent_block()
+        ctype = obj.ctype
+        if ctype in self.modified:
+            self.modified[ctype][id(obj)] = weakref.ref(obj)
+        else:
+            self.modified[ctype] = {id(obj): weakref.ref(obj)}
+
+    def get(self, ctype):
+        """Return the list of modified objects with the specified ctype"""
+        if ctype in self.modified:
+            objs = (ref() for ref in self.modified[ctype].values())
+            return [obj for obj in objs if obj is not None]
+        return []
+
+    def clear(self):
+        self.modified = {}
+
+
+def register_change_log(log=None):
+    """Start recording component modifications into `log`
+
+    If `log` is not provided, a new :class:`ChangeLog` is created.
+    Returns the registered log.
+
+    """
+    if log is None:
+        log = ChangeLog()
+    _change_logs.append(log)
+    return log
+
+
+def unregister_change_log(log):
+    """Stop recording component modifications into `log`"""
+    for i, _log in enumerate(_change_logs):
+        if _log is log:
+            del _change_logs[i]
+            return
+
+
+def notify_change(obj):
+    """Record that `obj` was modified in all registered change logs"""
+    for log in _change_logs:
+        log.record(obj)
@@ -17,7 +17,8 @@ from weakref import ref as weakref_ref
 from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
 
-from pyomo.common.autoslots import AutoSlots
+from pyomo.common.autoslots import AutoSlots, all_atomic
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -33,6 +34,7 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.initializer import Initializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
+from pyomo.core.base.observer import _change_logs, notify_change
 from pyomo.core.base.set import Reals, _AnySet, SetInitializer
 from pyomo.core.base.units_container import units
 from pyomo.core.expr import GetItemExpression
@@ -161,6 +163,8 @@ class ParamData(ComponentData, NumericValue):
         and validation as necessary.
 
         """
+        if _change_logs:
+            notify_change(self)
         #
         # If this param has units, then we need to check the incoming
         # value and see if it is "units compatible".  We only need to
@@ -999,6 +1003,56 @@ class IndexedParam(Param):
             component_list.append((self, _new))
         return _ans
 
+    def __deepcopy_state__(self, memo, new_object):
+        report = memo.get('__clone_report__', None)
+        if (
+            report is not None
+            and not self._mutable
+            and self._constructed
+            and self._data.__class__ is dict
+            and all_atomic(self._data)
+            and all_atomic(self._data.values())
+        ):
+            # This is a Block.clone(share=True): the values of a
+            # constructed immutable Param cannot change, so the clone
+            # can share the _data dict with this Param
+            memo[id(self._data)] = self._data
+            report.shared_params += 1
+            report.shared_param_values += len(self._data)
+        super().__deepcopy_state__(memo, new_object)
+
+    def get_values_array(self, index=None):
+        """Return the parameter values as a 1-D numpy float array.
+
+        Values are returned in the order of `index` (defaults to all
+        indices, in the order returned by :meth:`keys`).  Values that
+        are None are returned as NaN.
+
+        """
+        keys = self._bulk_keys(index)
+        if self._mutable:
+            vals = [self[i]._value for i in keys]
+        else:
+            vals = [self[i] for i in keys]
+        return np.array(vals, dtype=float)
+
+    def set_values_array(self, values, index=None):
+        """Set the values of a mutable Param from a numpy array (or scalar).
+
+        `values` is a scalar or a 1-D array aligned with `index`
+        (defaults to all indices, in the order returned by
+        :meth:`keys`).  NaN values are stored as None.  As with
+        :meth:`store_values`, the indices and values are validated.
+
+        """
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        keys = self._bulk_keys(index)
+        vals = self._bulk_array(values, len(keys)).tolist()
+        self.store_values(
+            {idx: None if val != val else val for idx, val in zip(keys, vals)}
+        )
+
     # Because CP supports indirection [the ability to index objects by
     # another (inter) Var] for certain types (including Var), we will
     # catch the normal RuntimeError and return a (variable)
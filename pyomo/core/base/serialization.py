@@ -0,0 +1,1145 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""A compact, versioned binary file format for constructed models
+
+:func:`save_model` writes a constructed model (or block) to a single
+file and :func:`load_model` rebuilds an equivalent
+:class:`ConcreteModel` from that file without re-running any rules or
+reading any data files.
+
+The file contains a fixed-size preamble (magic string, format version,
+and header length), a JSON header describing the block hierarchy and
+the components on each block, followed by a data section of (64-byte
+aligned) numpy arrays.  All bulk numeric data (Set members, Param and
+Var values, bounds, fixed flags, etc.) is stored in the arrays, and all
+expressions (Expression, Constraint, and Objective expressions and
+expression-valued Var bounds) are stored as a single flat, prefix-encoded
+int64 token array.  By default, :func:`load_model` memory-maps the data
+section, so only the arrays actually needed are read from disk.
+
+Supported components are Set, RangeSet, Param, Var, Expression,
+Constraint, Objective, and Block.  Note that the format stores the
+*state* of the model and not how it was declared: rules, validation
+callbacks, Set domains, and Param domains that are not global sets are
+not stored.  Var values and bounds are stored as float64, and Param
+values that mix int and float values are stored as floats.
+
+"""
+
+import bisect
+import itertools
+import json
+import math
+import struct
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import (
+    native_integer_types,
+    native_numeric_types,
+    native_types,
+)
+from pyomo.common.sorting import sorted_robust
+from pyomo.core.expr.numeric_expr import (
+    NegationExpression,
+    NPV_NegationExpression,
+    PowExpression,
+    NPV_PowExpression,
+    MaxExpression,
+    NPV_MaxExpression,
+    MinExpression,
+    NPV_MinExpression,
+    ProductExpression,
+    NPV_ProductExpression,
+    MonomialTermExpression,
+    DivisionExpression,
+    NPV_DivisionExpression,
+    SumExpression,
+    LinearExpression,
+    NPV_SumExpression,
+    Expr_ifExpression,
+    NPV_Expr_ifExpression,
+    UnaryFunctionExpression,
+    NPV_UnaryFunctionExpression,
+    AbsExpression,
+    NPV_AbsExpression,
+    _MutableSumExpression,
+    _MutableLinearExpression,
+    _MutableNPVSumExpression,
+)
+from pyomo.core.expr.relational_expr import (
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+    NotEqualExpression,
+)
+from pyomo.core.base.block import Block
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.expression import Expression
+from pyomo.core.base.global_set import GlobalSets
+from pyomo.core.base.objective import Objective, ObjectiveSense
+from pyomo.core.base.param import Param, ParamData
+from pyomo.core.base.PyomoModel import ConcreteModel
+from pyomo.core.base.range import NumericRange
+from pyomo.core.base.set import (
+    Set,
+    RangeSet,
+    SetOperator,
+    SetProduct,
+    ArrayOrderedSetData,
+    OrderedSetData,
+    SortedSetData,
+)
+from pyomo.core.base.units_container import units, _PyomoUnit, _pint_unit_mapper
+from pyomo.core.base.var import Var
+from pyomo.core.staleflag import StaleFlagManager
+
+_MAGIC = b'PYOMOMDL'
+_FORMAT_VERSION = 1
+# magic string, format version, (reserved) flags, header length
+_PREAMBLE = struct.Struct('<8sIIQ')
+_ALIGN = 64
+
+#
+# Expression token opcodes.  Leaves are encoded as (opcode, payload)
+# and operators as (opcode, nargs, local data) followed by the
+# (prefix-encoded) arguments.
+#
+_INT = 0  # payload: the integer value
+_FLOAT = 1  # payload: position in the float table
+_CONST = 2  # payload: position in the (JSON) constant table
+_VAR = 3  # payload: position in the Var data table
+_PARAM = 4  # payload: position in the (mutable) Param data table
+_NAMED = 5  # payload: position in the Expression data table
+_UNITS = 6  # payload: position in the string table
+_FIRST_NODE = 16
+
+# The operator opcode is _FIRST_NODE + the position in this tuple.  As
+# the opcodes are stored in the files, new expression types must only
+# be appended to this list.
+_NODE_TYPES = (
+    NegationExpression,
+    NPV_NegationExpression,
+    PowExpression,
+    NPV_PowExpression,
+    MaxExpression,
+    NPV_MaxExpression,
+    MinExpression,
+    NPV_MinExpression,
+    ProductExpression,
+    NPV_ProductExpression,
+    MonomialTermExpression,
+    DivisionExpression,
+    NPV_DivisionExpression,
+    SumExpression,
+    LinearExpression,
+    NPV_SumExpression,
+    Expr_ifExpression,
+    NPV_Expr_ifExpression,
+    UnaryFunctionExpression,
+    NPV_UnaryFunctionExpression,
+    AbsExpression,
+    NPV_AbsExpression,
+    EqualityExpression,
+    InequalityExpression,
+    RangedExpression,
+    NotEqualExpression,
+)
+_node_opcode = {cls: _FIRST_NODE + i for i, cls in enumerate(_NODE_TYPES)}
+# Mutable sums are stored as (and restored to) their immutable equivalents
+_node_opcode[_MutableSumExpression] = _node_opcode[SumExpression]
+_node_opcode[_MutableLinearExpression] = _node_opcode[LinearExpression]
+_node_opcode[_MutableNPVSumExpression] = _node_opcode[NPV_SumExpression]
+
+_SUM_TYPES = {SumExpression, LinearExpression, NPV_SumExpression}
+_UNARY_TYPES = {UnaryFunctionExpression, NPV_UnaryFunctionExpression}
+# Operators that are not created from just a tuple of their arguments
+_SPECIAL_TYPES = _SUM_TYPES | _UNARY_TYPES | {InequalityExpression, RangedExpression}
+
+_SET_ORDER = {'insertion': Set.InsertionOrder, 'sorted': Set.SortedOrder}
+
+
+def _align(n):
+    return -(-n // _ALIGN) * _ALIGN
+
+
+def _to_json(val):
+    # Encode a (hashable) value (index, Set member, or Param value)
+    if val.__class__ is tuple:
+        return {'tuple': [_to_json(v) for v in val]}
+    if val is Param.NoValue:
+        return {'novalue': True}
+    if val is None or val.__class__ in (bool, int, float, str):
+        return val
+    raise ValueError(
+        "Cannot save value %r: values (indices, Set members, and Param "
+        "values) must be bool, int, float, str, None, or tuples of those "
+        "types" % (val,)
+    )
+
+
+def _from_json(val):
+    if val.__class__ is dict:
+        if 'tuple' in val:
+            return tuple(_from_json(v) for v in val['tuple'])
+        return Param.NoValue
+    return val
+
+
+def save_model(model, filename):
+    """Save a constructed model (or block) to a binary model file
+
+    The model can be restored (as a :class:`ConcreteModel`) with
+    :func:`load_model`.
+
+    Parameters
+    ----------
+    model: BlockData
+        The (constructed) model or block to save.  All components in
+        `model` (and any sub-blocks) must be Sets, RangeSets, Params,
+        Vars, Expressions, Constraints, Objectives, or Blocks, and all
+        expressions must only reference Vars, mutable Params, and
+        Expressions within `model`.
+
+    filename: str
+        The name of the file to write.
+
+    """
+    _ModelWriter().write(model, filename)
+
+
+def load_model(filename, mmap=True):
+    """Load a model saved with :func:`save_model`
+
+    Parameters
+    ----------
+    filename: str
+        The name of the file to read.
+
+    mmap: bool
+        If True (the default), the numeric data in the file is
+        memory-mapped (and only read as needed).  Otherwise, the entire
+        file is read into memory.
+
+    Returns
+    -------
+    ConcreteModel
+        A new model with the same components (and component state) as
+        the saved model.
+
+    """
+    with open(filename, 'rb') as FILE:
+        preamble = FILE.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size or preamble[:8] != _MAGIC:
+            raise ValueError("'%s' is not a Pyomo model file" % (filename,))
+        _, version, _, header_len = _PREAMBLE.unpack(preamble)
+        if version > _FORMAT_VERSION:
+            raise ValueError(
+                "Pyomo model file '%s' uses format version %s (this version "
+                "of Pyomo supports versions <= %s)"
+                % (filename, version, _FORMAT_VERSION)
+            )
+        header = json.loads(FILE.read(header_len).decode('utf-8'))
+        data_start = _align(_PREAMBLE.size + header_len)
+        # Note: numpy cannot memory-map an empty data section
+        if mmap and FILE.seek(0, 2) > data_start:
+            buf = None
+        else:
+            FILE.seek(data_start)
+            buf = np.frombuffer(FILE.read(), dtype=np.uint8)
+    if buf is None:
+        buf = np.memmap(filename, dtype=np.uint8, mode='r', offset=data_start)
+    arrays = []
+    for dtype, shape, offset in header['arrays']:
+        dtype = np.dtype(dtype)
+        count = math.prod(shape)
+        arrays.append(
+            buf[offset : offset + count * dtype.itemsize].view(dtype).reshape(shape)
+        )
+    # The reader creates many container objects (and no garbage), so
+    # there is no point in running the cyclic garbage collector
+    with PauseGC():
+        return _ModelReader(header, arrays).read()
+
+
+class _ModelWriter(object):
+    def __init__(self):
+        self.arrays = []
+        self.tokens = []
+        self.floats = []
+        self.float_id = {}
+        self.constants = []
+        self.strings = []
+        self.string_id = {}
+        # Lookup tables (by id()) for the objects that can be referenced
+        # from other components or from expressions.  Positions in
+        # these tables are assigned in the (deterministic) order that
+        # the objects are encountered while walking the model, so the
+        # reader can rebuild the same tables.
+        self.set_id = {}
+        self.var_id = {}
+        self.n_vars = 0
+        self.param_id = {}
+        self.named_id = {}
+        # Expressions are encoded after the entire model has been
+        # walked (so that expressions may reference components that are
+        # declared later in the model)
+        self.deferred = []
+
+    def write(self, model, filename):
+        header = {'name': model.name, 'model': self._block(model)}
+        for rec, field, exprs in self.deferred:
+            rec[field] = self._array(
+                np.array([self._expr(e) for e in exprs], dtype=np.int64)
+            )
+        header['tokens'] = self._array(np.array(self.tokens, dtype=np.int64))
+        header['floats'] = self._array(np.array(self.floats, dtype=np.float64))
+        header['constants'] = self.constants
+        header['strings'] = self.strings
+
+        offset = 0
+        header['arrays'] = info = []
+        for i, arr in enumerate(self.arrays):
+            self.arrays[i] = arr = np.ascontiguousarray(
+                arr, dtype=arr.dtype.newbyteorder('<')
+            )
+            info.append((arr.dtype.str, arr.shape, offset))
+            offset = _align(offset + arr.nbytes)
+        header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+        with open(filename, 'wb') as FILE:
+            FILE.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, 0, len(header)))
+            FILE.write(header)
+            data_start = _align(_PREAMBLE.size + len(header))
+            FILE.write(b'\0' * (data_start - FILE.tell()))
+            for arr, (_, _, offset) in zip(self.arrays, info):
+                FILE.write(b'\0' * (data_start + offset - FILE.tell()))
+                FILE.write(arr.tobytes())
+
+    #
+    # Helpers for encoding data
+    #
+
+    def _array(self, arr):
+        self.arrays.append(arr)
+        return len(self.arrays) - 1
+
+    def _string(self, val):
+        ans = self.string_id.get(val)
+        if ans is None:
+            ans = self.string_id[val] = len(self.strings)
+            self.strings.append(val)
+        return ans
+
+    def _values(self, vals):
+        # Encode a list of indices or Set members.  Lists of ints (or
+        # tuples of ints with the same length) are stored as int64
+        # arrays, everything else in the header.
+        if vals:
+            first = vals[0]
+            try:
+                if all(v.__class__ is int for v in vals):
+                    return {'array': self._array(np.array(vals, dtype=np.int64))}
+                if first.__class__ is tuple:
+                    n = len(first)
+                    if all(
+                        v.__class__ is tuple
+                        and len(v) == n
+                        and all(x.__class__ is int for x in v)
+                        for v in vals
+                    ):
+                        return {'array': self._array(np.array(vals, dtype=np.int64))}
+            except OverflowError:
+                pass
+        return {'json': [_to_json(v) for v in vals]}
+
+    def _numbers(self, vals):
+        # Encode a list of numeric values (e.g., Param values)
+        try:
+            if all(v.__class__ is int for v in vals):
+                return {'array': self._array(np.array(vals, dtype=np.int64))}
+        except OverflowError:
+            pass
+        else:
+            if all(v.__class__ in (int, float) for v in vals):
+                return {'array': self._array(np.array(vals, dtype=np.float64))}
+        return {'json': [_to_json(v) for v in vals]}
+
+    def _floats(self, vals):
+        # Encode a list of floats, where NaN represents None
+        return self._array(
+            np.array([math.nan if v is None else v for v in vals], dtype=np.float64)
+        )
+
+    def _flags(self, vals):
+        return self._array(np.array(vals, dtype=bool))
+
+    def _units(self, u):
+        return str(_pint_unit_mapper(True, u._get_pint_unit()))
+
+    def _set(self, s):
+        # Encode a reference to a set (e.g., an index set or a domain)
+        name = getattr(s, 'local_name', None)
+        if GlobalSets.get(name) is s:
+            return {'global': name}
+        if id(s) in self.set_id:
+            return {'set': self.set_id[id(s)]}
+        if isinstance(s, SetProduct) and s.parent_component() is s:
+            return {
+                'product': [
+                    self._set(x) for x in s.subsets(expand_all_set_operators=False)
+                ]
+            }
+        if not s.isfinite():
+            raise ValueError(
+                "Cannot save a reference to the non-finite set '%s'" % (s.name,)
+            )
+        return {'values': self._values(list(s)), 'dimen': s.dimen}
+
+    def _keys(self, comp, rec, keys):
+        # Record the index of an indexed component.  The indices of
+        # the component data are only stored if they do not match the
+        # index set.
+        index = comp.index_set()
+        rec['index'] = self._set(index)
+        if keys != list(index):
+            rec['keys'] = self._values(keys)
+
+    def _active(self, comp, rec, data):
+        if not comp.active:
+            rec['active'] = False
+        flags = [d.active for d in data]
+        if not all(flags):
+            rec['data_active'] = self._flags(flags)
+
+    def _defer(self, rec, field, exprs):
+        self.deferred.append((rec, field, exprs))
+
+    #
+    # Component handlers
+    #
+
+    def _block(self, block):
+        components = []
+        for comp in block.component_objects(descend_into=False):
+            handler = self._handlers.get(comp.ctype)
+            if handler is None or comp.is_reference():
+                raise ValueError(
+                    "Cannot save component '%s': %s components are not "
+                    "supported by the Pyomo model file format"
+                    % (comp.name, 'Reference' if handler else comp.ctype.__name__)
+                )
+            rec = {'name': comp.local_name, 'type': comp.ctype.__name__}
+            if comp.doc is not None:
+                rec['doc'] = comp.doc
+            handler(self, comp, rec)
+            components.append(rec)
+        return {'components': components}
+
+    def _handle_Block(self, comp, rec):
+        data = list(comp.values())
+        if comp.is_indexed():
+            self._keys(comp, rec, list(comp.keys()))
+        self._active(comp, rec, data)
+        rec['data'] = [self._block(b) for b in data]
+
+    def _handle_RangeSet(self, comp, rec):
+        rec['ranges'] = [(r.start, r.end, r.step, r.closed) for r in comp.ranges()]
+        rec['finite'] = comp.isfinite()
+        self.set_id[id(comp)] = len(self.set_id)
+
+    def _handle_Set(self, comp, rec):
+        data_class = comp._ComponentDataClass if comp.is_indexed() else comp.__class__
+        if isinstance(comp, SetOperator):
+            if isinstance(comp, SetProduct):
+                rec['product'] = [
+                    self._set(s) for s in comp.subsets(expand_all_set_operators=False)
+                ]
+                self.set_id[id(comp)] = len(self.set_id)
+                return
+            # Other set operators are stored as (insertion-ordered)
+            # Sets containing the current members of the operator
+            rec['ordered'] = 'insertion'
+        else:
+            if not issubclass(data_class, OrderedSetData):
+                rec['ordered'] = None
+            elif (
+                issubclass(data_class, SortedSetData)
+                and comp._sort_fcn is sorted_robust
+            ):
+                rec['ordered'] = 'sorted'
+            else:
+                # Note that Sets with a custom sort function are stored
+                # as insertion ordered Sets (in the current order)
+                rec['ordered'] = 'insertion'
+            if issubclass(data_class, ArrayOrderedSetData):
+                rec['storage'] = 'array'
+        dimen = {s.dimen for s in comp.values()}
+        if len(dimen) == 1:
+            dimen = dimen.pop()
+            if dimen is None or dimen.__class__ is int:
+                rec['dimen'] = dimen
+        if comp.is_indexed():
+            keys = list(comp.keys())
+            self._keys(comp, rec, keys)
+            members = []
+            offsets = [0]
+            for s in comp.values():
+                members.extend(s)
+                offsets.append(len(members))
+            rec['offsets'] = self._array(np.array(offsets, dtype=np.int64))
+            rec['members'] = self._values(members)
+        else:
+            rec['members'] = self._values(list(comp))
+        for s in comp.values():
+            self.set_id[id(s)] = len(self.set_id)
+
+    def _handle_Param(self, comp, rec):
+        rec['mutable'] = comp.mutable
+        if comp._default_val is not Param.NoValue:
+            rec['default'] = _to_json(comp._default_val)
+        name = getattr(comp.domain, 'local_name', None)
+        if GlobalSets.get(name) is comp.domain:
+            rec['domain'] = name
+        if comp._units is not None:
+            rec['units'] = self._units(comp._units)
+        if comp.is_indexed():
+            data = comp._data
+            self._keys(comp, rec, list(data))
+        else:
+            # Note: scalar Params without a value have no _data
+            data = {None: comp}
+        if comp.mutable or not comp.is_indexed():
+            rec['values'] = self._numbers([d._value for d in data.values()])
+        else:
+            rec['values'] = self._numbers(list(data.values()))
+        if comp.mutable:
+            param_id = self.param_id
+            for d in data.values():
+                param_id[id(d)] = len(param_id)
+
+    def _handle_Var(self, comp, rec):
+        if comp._units is not None:
+            rec['units'] = self._units(comp._units)
+        store = getattr(comp, '_array', None)
+        if store is not None:
+            rec['storage'] = 'array'
+            keys = list(comp.keys())
+            # Only the existing VarData views can appear in expressions
+            data = None
+            domains = store.domains
+            rec['value'] = self._array(store.value)
+            rec['lb'] = self._array(store.lb)
+            rec['ub'] = self._array(store.ub)
+            rec['fixed'] = self._array(store.fixed)
+            codes = store.domain
+            lb_expr = sorted(store.lb_expr.items())
+            ub_expr = sorted(store.ub_expr.items())
+        else:
+            keys = list(comp.keys())
+            data = list(comp.values())
+            domains = []
+            domain_code = {}
+            codes = []
+            for v in data:
+                code = domain_code.get(id(v._domain))
+                if code is None:
+                    code = domain_code[id(v._domain)] = len(domains)
+                    domains.append(v._domain)
+                codes.append(code)
+            codes = np.array(codes, dtype=np.int32)
+            rec['value'] = self._floats([v._value for v in data])
+            rec['fixed'] = self._flags([v._fixed for v in data])
+            lb = [v._lb for v in data]
+            ub = [v._ub for v in data]
+            lb_expr = [
+                (i, b)
+                for i, b in enumerate(lb)
+                if b is not None and b.__class__ not in native_numeric_types
+            ]
+            ub_expr = [
+                (i, b)
+                for i, b in enumerate(ub)
+                if b is not None and b.__class__ not in native_numeric_types
+            ]
+            for i, _ in lb_expr:
+                lb[i] = None
+            for i, _ in ub_expr:
+                ub[i] = None
+            rec['lb'] = self._floats(lb)
+            rec['ub'] = self._floats(ub)
+        if comp.is_indexed():
+            self._keys(comp, rec, keys)
+        rec['domains'] = [self._set(d) for d in domains]
+        if len(domains) > 1:
+            rec['domain'] = self._array(codes)
+        for field, exprs in (('lb_expr', lb_expr), ('ub_expr', ub_expr)):
+            if exprs:
+                rec[field + '_pos'] = self._array(
+                    np.array([i for i, _ in exprs], dtype=np.int64)
+                )
+                self._defer(rec, field, [e for _, e in exprs])
+        var_id = self.var_id
+        n = self.n_vars
+        if data is None:
+            for v in list(comp._data.values()):
+                var_id[id(v)] = n + v._pos
+            self.n_vars += len(keys)
+        else:
+            for i, v in enumerate(data, n):
+                var_id[id(v)] = i
+            self.n_vars += len(data)
+
+    def _handle_Expression(self, comp, rec):
+        data = list(comp.values())
+        if comp.is_indexed():
+            self._keys(comp, rec, list(comp.keys()))
+        named_id = self.named_id
+        for e in data:
+            named_id[id(e)] = len(named_id)
+        self._defer(rec, 'expr', [e.expr for e in data])
+
+    def _handle_Constraint(self, comp, rec):
+        data = list(comp.values())
+        if comp.is_indexed():
+            self._keys(comp, rec, list(comp.keys()))
+        self._active(comp, rec, data)
+        self._defer(rec, 'expr', [c.expr for c in data])
+
+    def _handle_Objective(self, comp, rec):
+        data = list(comp.values())
+        if comp.is_indexed():
+            self._keys(comp, rec, list(comp.keys()))
+        self._active(comp, rec, data)
+        rec['sense'] = self._array(np.array([o.sense for o in data], dtype=np.int8))
+        self._defer(rec, 'expr', [o.expr for o in data])
+
+    _handlers = {
+        Block: _handle_Block,
+        Set: _handle_Set,
+        RangeSet: _handle_RangeSet,
+        Param: _handle_Param,
+        Var: _handle_Var,
+        Expression: _handle_Expression,
+        Constraint: _handle_Constraint,
+        Objective: _handle_Objective,
+    }
+
+    #
+    # Expression encoding
+    #
+
+    def _expr(self, expr):
+        # Append the prefix encoding of expr to the token array and
+        # return its starting position (-1 for None)
+        if expr is None:
+            return -1
+        tokens = self.tokens
+        ans = len(tokens)
+        var_id = self.var_id
+        param_id = self.param_id
+        named_id = self.named_id
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            cls = node.__class__
+            if cls in native_types:
+                self._constant(node)
+                continue
+            _id = id(node)
+            if _id in var_id:
+                tokens.extend((_VAR, var_id[_id]))
+            elif _id in param_id:
+                tokens.extend((_PARAM, param_id[_id]))
+            elif _id in named_id:
+                tokens.extend((_NAMED, named_id[_id]))
+            elif cls in _node_opcode:
+                args = node.args
+                if cls in _UNARY_TYPES:
+                    data = self._string(node._name)
+                elif cls is InequalityExpression:
+                    data = int(node._strict)
+                elif cls is RangedExpression:
+                    data = node._strict[0] + 2 * node._strict[1]
+                else:
+                    data = 0
+                tokens.extend((_node_opcode[cls], len(args), data))
+                stack.extend(reversed(args))
+            elif cls is _PyomoUnit:
+                tokens.extend((_UNITS, self._string(self._units(node))))
+            elif not node.is_potentially_variable() and node.is_constant():
+                self._constant(node())
+            else:
+                raise ValueError(
+                    "Cannot save expression '%s': the expression references "
+                    "'%s', which is either not part of the saved model or "
+                    "not supported by the Pyomo model file format" % (expr, node)
+                )
+        return ans
+
+    def _constant(self, val):
+        cls = val.__class__
+        if cls in native_integer_types and -(2**63) <= val < 2**63:
+            self.tokens.extend((_INT, int(val)))
+        elif cls is float or (
+            cls in native_numeric_types and cls not in native_integer_types
+        ):
+            val = float(val)
+            ans = self.float_id.get(val)
+            if ans is None or val != val:
+                ans = self.float_id[val] = len(self.floats)
+                self.floats.append(val)
+            self.tokens.extend((_FLOAT, ans))
+        else:
+            self.tokens.extend((_CONST, len(self.constants)))
+            self.constants.append(_to_json(val))
+
+
+class _ModelReader(object):
+    def __init__(self, header, arrays):
+        self.header = header
+        self.arrays = arrays
+        self.sets = []
+        self.vars = []
+        # The starting positions (in the Var data table) and the
+        # [IndexedVar, keys] for Vars with array storage.  The views of
+        # array elements are only created when an expression references
+        # them (and are None in the Var data table until then).
+        self.array_var_start = []
+        self.array_vars = []
+        self.params = []
+        self.named = []
+        # Expressions are decoded (and assigned) after all components
+        # have been created
+        self.deferred = []
+        self.tokens = None
+        self.units = {}
+
+    def read(self):
+        header = self.header
+        model = ConcreteModel(name=header['name'])
+        self._block(model, header['model'])
+
+        arrays = self.arrays
+        self.tokens = arrays[header['tokens']].tolist()
+        self.floats = arrays[header['floats']].tolist()
+        self.constants = [_from_json(v) for v in header['constants']]
+        self.strings = header['strings']
+        for rec, field, assign in self.deferred:
+            assign(self._exprs(arrays[rec[field]].tolist()))
+        return model
+
+    #
+    # Helpers for decoding data
+    #
+
+    def _values(self, desc):
+        if 'json' in desc:
+            return [_from_json(v) for v in desc['json']]
+        arr = self.arrays[desc['array']]
+        if arr.ndim > 1:
+            return list(map(tuple, arr.tolist()))
+        return arr.tolist()
+
+    def _floats(self, pos):
+        return [None if v != v else v for v in self.arrays[pos].tolist()]
+
+    def _flags(self, rec, field, n):
+        if field in rec:
+            return self.arrays[rec[field]].tolist()
+        return [True] * n
+
+    def _var(self, pos):
+        # Return the VarData at position pos in the Var data table
+        # (creating and recording the view of array Var elements)
+        ans = self.vars[pos]
+        if ans is None:
+            i = bisect.bisect_right(self.array_var_start, pos) - 1
+            comp, keys = self.array_vars[i]
+            if keys is None:
+                # Note: keys() returns the indices in storage order
+                keys = self.array_vars[i][1] = list(comp.keys())
+            k = pos - self.array_var_start[i]
+            ans = self.vars[pos] = comp._array_view(keys[k], k)
+        return ans
+
+    def _units(self, val):
+        if val not in self.units:
+            self.units[val] = _PyomoUnit(
+                _pint_unit_mapper(False, val), units._pint_registry
+            )
+        return self.units[val]
+
+    def _set(self, desc):
+        if 'global' in desc:
+            return GlobalSets[desc['global']]
+        if 'set' in desc:
+            return self.sets[desc['set']]
+        if 'product' in desc:
+            return SetProduct(*[self._set(s) for s in desc['product']])
+        return Set(initialize=self._values(desc['values']), dimen=desc['dimen'])
+
+    def _index(self, rec):
+        # Return the positional arguments for declaring the component
+        if 'index' not in rec:
+            return ()
+        desc = rec['index']
+        if 'product' in desc:
+            return tuple(self._set(s) for s in desc['product'])
+        if 'values' in desc:
+            return (self._values(desc['values']),)
+        return (self._set(desc),)
+
+    def _keys(self, rec, index):
+        # Return the indices of the component data (in the saved order)
+        if 'keys' in rec:
+            return self._values(rec['keys'])
+        if not index:
+            return [None]
+        if len(index) == 1:
+            return list(index[0])
+        return list(SetProduct(*index))
+
+    def _active(self, comp, rec, data):
+        for d, flag in zip(data, self._flags(rec, 'data_active', len(data))):
+            if not flag:
+                d.deactivate()
+        if not rec.get('active', True):
+            comp.deactivate()
+
+    def _defer(self, rec, field, assign):
+        self.deferred.append((rec, field, assign))
+
+    #
+    # Component handlers
+    #
+
+    def _block(self, block, rec):
+        for comp_rec in rec['components']:
+            self._handlers[comp_rec['type']](self, block, comp_rec)
+
+    def _add(self, block, rec, comp):
+        if 'doc' in rec:
+            comp.doc = rec['doc']
+        block.add_component(rec['name'], comp)
+        return comp
+
+    def _handle_Block(self, block, rec):
+        index = self._index(rec)
+        comp = self._add(block, rec, Block(*index, dense=False))
+        keys = self._keys(rec, index)
+        data = [comp[k] for k in keys]
+        for b, b_rec in zip(data, rec['data']):
+            self._block(b, b_rec)
+        self._active(comp, rec, data)
+
+    def _handle_RangeSet(self, block, rec):
+        ranges = tuple(
+            NumericRange(start, end, step, tuple(closed))
+            for start, end, step, closed in rec['ranges']
+        )
+        comp = self._add(block, rec, RangeSet(ranges=ranges, finite=rec['finite']))
+        self.sets.append(comp)
+
+    def _handle_Set(self, block, rec):
+        if 'product' in rec:
+            comp = SetProduct(*[self._set(s) for s in rec['product']])
+            self.sets.append(self._add(block, rec, comp))
+            return
+        kwds = {'ordered': _SET_ORDER.get(rec['ordered'], False)}
+        if 'dimen' in rec:
+            kwds['dimen'] = rec['dimen']
+        if 'storage' in rec:
+            kwds['storage'] = rec['storage']
+        members = self._values(rec['members'])
+        index = self._index(rec)
+        if index:
+            offsets = self.arrays[rec['offsets']].tolist()
+            init = {
+                k: members[offsets[i] : offsets[i + 1]]
+                for i, k in enumerate(self._keys(rec, index))
+            }
+            comp = Set(*index, initialize=init, **kwds)
+        else:
+            comp = Set(initialize=members, **kwds)
+        self._add(block, rec, comp)
+        self.sets.extend(comp.values())
+
+    def _handle_Param(self, block, rec):
+        kwds = {'mutable': rec['mutable']}
+        if 'default' in rec:
+            kwds['default'] = _from_json(rec['default'])
+        if 'domain' in rec:
+            kwds['domain'] = GlobalSets[rec['domain']]
+        if 'units' in rec:
+            kwds['units'] = self._units(rec['units'])
+        index = self._index(rec)
+        vals = self._values(rec['values'])
+        if not index:
+            if vals[0] is not Param.NoValue:
+                kwds['initialize'] = vals[0]
+            comp = self._add(block, rec, Param(**kwds))
+            if rec['mutable']:
+                self.params.append(comp)
+            return
+        comp = self._add(block, rec, Param(*index, **kwds))
+        keys = self._keys(rec, index)
+        # The indices and values were validated when the model was
+        # saved, so the component data are stored directly (bypassing
+        # __setitem__() and the domain validation)
+        if rec['mutable']:
+            component = ParamData(comp)._component
+            data = []
+            for k, v in zip(keys, vals):
+                obj = ParamData.__new__(ParamData)
+                obj._component = component
+                obj._index = k
+                obj._value = v
+                data.append(obj)
+            comp._data.update(zip(keys, data))
+            self.params.extend(data)
+        else:
+            comp._data.update(
+                (k, v) for k, v in zip(keys, vals) if v is not Param.NoValue
+            )
+
+    def _handle_Var(self, block, rec):
+        domains = [self._set(d) for d in rec['domains']]
+        kwds = {}
+        if domains:
+            kwds['domain'] = domains[0]
+        if 'units' in rec:
+            kwds['units'] = self._units(rec['units'])
+        if 'storage' in rec:
+            kwds['storage'] = rec['storage']
+        index = self._index(rec)
+        # The position of the first VarData in the Var data table
+        start = len(self.vars)
+        if 'storage' in rec:
+            # Array storage is only supported for dense Vars
+            comp = self._add(block, rec, Var(*index, **kwds))
+            self._array_var_data(comp, rec, domains)
+        elif index:
+            # The VarData are created in bulk (after construction)
+            comp = self._add(block, rec, Var(*index, dense=False, **kwds))
+            self._var_data(comp, self._keys(rec, index), rec, domains)
+            comp._dense = 'keys' not in rec
+        else:
+            comp = self._add(block, rec, Var(**kwds))
+            self.vars.append(comp)
+            lb = self._floats(rec['lb'])[0]
+            ub = self._floats(rec['ub'])[0]
+            comp.set_value(self._floats(rec['value'])[0], skip_validation=True)
+            comp.setlb(lb)
+            comp.setub(ub)
+            comp.fixed = self.arrays[rec['fixed']][0]
+        for field, setter in (('lb_expr', 'setlb'), ('ub_expr', 'setub')):
+            if field in rec:
+                targets = [
+                    self._var(start + i)
+                    for i in self.arrays[rec[field + '_pos']].tolist()
+                ]
+                self._defer(
+                    rec,
+                    field,
+                    lambda exprs, targets=targets, setter=setter: [
+                        getattr(v, setter)(e) for v, e in zip(targets, exprs)
+                    ],
+                )
+
+    def _var_data(self, comp, keys, rec, domains):
+        # Create the VarData for an indexed Var with object storage.
+        # The values were validated when the model was saved, so the
+        # VarData attributes are set directly.
+        arrays = self.arrays
+        values = self._floats(rec['value'])
+        lbs = self._floats(rec['lb'])
+        ubs = self._floats(rec['ub'])
+        fixed = arrays[rec['fixed']].tolist()
+        if 'domain' in rec:
+            codes = arrays[rec['domain']].tolist()
+            var_domains = [domains[code] for code in codes]
+        else:
+            var_domains = itertools.repeat(domains[0])
+        cls = comp._ComponentDataClass
+        component = cls(comp)._component
+        flag = StaleFlagManager.get_flag(0)
+        data = []
+        for k, val, lb, ub, is_fixed, domain in zip(
+            keys, values, lbs, ubs, fixed, var_domains
+        ):
+            v = cls.__new__(cls)
+            v._component = component
+            v._index = k
+            v._value = val
+            v._lb = lb
+            v._ub = ub
+            v._domain = domain
+            v._fixed = is_fixed
+            v._stale = 0 if val is None else flag
+            data.append(v)
+        comp._data.update(zip(keys, data))
+        self.vars.extend(data)
+
+    def _array_var_data(self, comp, rec, domains):
+        # Restore the state of a Var with array storage (whose elements
+        # are in the same order as the index set)
+        arrays = self.arrays
+        comp.set_values_array(arrays[rec['value']], skip_validation=True)
+        comp.set_bounds(arrays[rec['lb']], arrays[rec['ub']])
+        comp.fix_many(arrays[rec['fixed']])
+        store = comp._array
+        if 'domain' in rec:
+            codes = np.array([store.domain_code(d) for d in domains], dtype=np.int32)
+            store.domain[:] = codes[arrays[rec['domain']]]
+        self.array_var_start.append(len(self.vars))
+        self.array_vars.append([comp, None])
+        self.vars.extend(itertools.repeat(None, len(store)))
+
+    def _handle_Expression(self, block, rec):
+        index = self._index(rec)
+        keys = self._keys(rec, index)
+        if 'keys' in rec:
+            comp = Expression(*index, initialize={k: None for k in keys})
+        else:
+            comp = Expression(*index)
+        comp = self._add(block, rec, comp)
+        data = [comp[k] for k in keys]
+        self.named.extend(data)
+        self._defer(
+            rec,
+            'expr',
+            lambda exprs: [e.set_value(expr) for e, expr in zip(data, exprs)],
+        )
+
+    def _handle_Constraint(self, block, rec):
+        index = self._index(rec)
+        comp = self._add(block, rec, Constraint(*index))
+        keys = self._keys(rec, index)
+
+        def assign(exprs):
+            if comp.is_indexed():
+                # The indices were validated when the model was saved
+                setitem = comp._setitem_when_not_present
+                data = [setitem(k, expr) for k, expr in zip(keys, exprs)]
+            else:
+                comp.set_value(exprs[0])
+                data = [comp]
+            self._active(comp, rec, data)
+
+        self._defer(rec, 'expr', assign)
+
+    def _handle_Objective(self, block, rec):
+        index = self._index(rec)
+        comp = self._add(block, rec, Objective(*index))
+        keys = self._keys(rec, index)
+        senses = self.arrays[rec['sense']].tolist()
+
+        def assign(exprs):
+            if comp.is_indexed():
+                # The indices were validated when the model was saved
+                setitem = comp._setitem_when_not_present
+                data = [setitem(k, expr) for k, expr in zip(keys, exprs)]
+            else:
+                comp.set_value(exprs[0])
+                data = [comp]
+            for o, sense in zip(data, senses):
+                o.set_sense(ObjectiveSense(sense))
+            self._active(comp, rec, data)
+
+        self._defer(rec, 'expr', assign)
+
+    _handlers = {
+        'Block': _handle_Block,
+        'Set': _handle_Set,
+        'RangeSet': _handle_RangeSet,
+        'Param': _handle_Param,
+        'Var': _handle_Var,
+        'Expression': _handle_Expression,
+        'Constraint': _handle_Constraint,
+        'Objective': _handle_Objective,
+    }
+
+    #
+    # Expression decoding
+    #
+
+    def _exprs(self, positions):
+        # Decode the expressions starting at each of the positions (-1
+        # for None).  The expressions for a component are decoded in a
+        # single pass, with the leaf tables resolved up front.
+        tokens = self.tokens
+        var = self._var
+        vars = self.vars
+        leaves = [None] * _FIRST_NODE
+        leaves[_FLOAT] = self.floats
+        leaves[_CONST] = self.constants
+        leaves[_PARAM] = self.params
+        leaves[_NAMED] = self.named
+        node_types = _NODE_TYPES
+        make_node = self._node
+        ans = []
+        for pos in positions:
+            if pos < 0:
+                ans.append(None)
+                continue
+            stack = []
+            while 1:
+                op = tokens[pos]
+                if op < _FIRST_NODE:
+                    payload = tokens[pos + 1]
+                    pos += 2
+                    if op == _VAR:
+                        node = vars[payload]
+                        if node is None:
+                            node = var(payload)
+                    elif op == _INT:
+                        node = payload
+                    elif op == _UNITS:
+                        node = self._units(self.strings[payload])
+                    else:
+                        node = leaves[op][payload]
+                else:
+                    nargs = tokens[pos + 1]
+                    data = tokens[pos + 2]
+                    pos += 3
+                    cls = node_types[op - _FIRST_NODE]
+                    if nargs:
+                        stack.append((cls, data, nargs, []))
+                        continue
+                    node = make_node(cls, data, [])
+                while stack:
+                    cls, data, nargs, args = stack[-1]
+                    args.append(node)
+                    if len(args) < nargs:
+                        break
+                    stack.pop()
+                    if cls in _SPECIAL_TYPES:
+                        node = make_node(cls, data, args)
+                    else:
+                        node = cls(tuple(args))
+                else:
+                    ans.append(node)
+                    break
+        return ans
+
+    def _node(self, cls, data, args):
+        if cls in _SUM_TYPES:
+            return cls(args)
+        if cls in _UNARY_TYPES:
+            name = self.strings[data]
+            return cls(tuple(args), name, getattr(math, name))
+        if cls is InequalityExpression:
+            return cls(tuple(args), bool(data))
+        if cls is RangedExpression:
+            return cls(tuple(args), (bool(data & 1), bool(data & 2)))
+        return cls(tuple(args))
@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 from __future__ import annotations
+import array
 import inspect
 import itertools
 import logging
@@ -21,8 +22,9 @@ from collections.abc import Iterator
 from functools import partial
 from typing import Union, Type, Any as typingAny
 
-from pyomo.common.autoslots import AutoSlots
+from pyomo.common.autoslots import AutoSlots, all_atomic
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -74,7 +76,7 @@ from pyomo.core.base.global_set import (
 )
 
 from collections.abc import Sequence
-from operator import itemgetter
+from operator import itemgetter, is_, length_hint
 
 logger = logging.getLogger('pyomo.core')
 
@@ -1142,6 +1144,25 @@ class SetData(ComponentData):
         """
         return SetProduct(self, *args)
 
+    def join(self, other, on=None):
+        """
+        Return the (sparse) join of this set with another set
+
+        The join contains the members of the cross product of this set
+        and `other` where the columns specified by `on` match.  The
+        columns of `other` that appear in `on` are omitted from the
+        join members.  `on` is a sequence of ``(i, j)`` pairs of
+        (0-based) positions into the members of this set and `other`
+        (respectively).  If not specified, the last column of this set
+        is joined to the first column of `other`.
+
+        Iterating over (or testing membership in) the join scales with
+        the size of the operand sets and of the join, and not with the
+        size of the (dense) cross product.
+
+        """
+        return SetJoin(self, other, on=on)
+
     # <= is equivalent to issubset
     # >= is equivalent to issuperset
     # |  is equivalent to union
@@ -1201,6 +1222,15 @@ class _SetDataBase(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+def _isin_values(values):
+    # Convert the argument to Set.isin() into a list of Set values
+    if values.__class__ is np.ndarray:
+        if values.ndim == 2:
+            return list(map(tuple, values.tolist()))
+        return values.tolist()
+    return list(values)
+
+
 class _FiniteSetMixin(object):
     __slots__ = ()
 
@@ -1247,6 +1277,17 @@ class _FiniteSetMixin(object):
     def data(self):
         return tuple(self)
 
+    def isin(self, values):
+        """Test the membership of each of the specified values
+
+        Returns a 1-D numpy bool array indicating which of `values` are
+        members of this Set.  `values` may be any iterable of (scalar
+        or tuple) values, or a 2-D numpy array (where each row is a
+        tuple value).
+
+        """
+        return np.fromiter(map(self.__contains__, _isin_values(values)), dtype=bool)
+
     @property
     @deprecated(
         "The 'value' attribute is deprecated.  Use .data() to "
@@ -1310,7 +1351,7 @@ class _FiniteSetMixin(object):
 class FiniteSetData(_FiniteSetMixin, SetData):
     """A general unordered iterable Set"""
 
-    __slots__ = ('_values', '_domain', '_dimen')
+    __slots__ = ('_values', '_domain', '_dimen', '_shared')
 
     def __init__(self, component):
         SetData.__init__(self, component=component)
@@ -1320,6 +1361,36 @@ class FiniteSetData(_FiniteSetMixin, SetData):
             self._values = set()
         self._domain = Any
         self._dimen = UnknownSetDimen
+        # True if the member storage is shared with a clone of this Set
+        # (see __deepcopy_state__)
+        self._shared = False
+
+    def __deepcopy_state__(self, memo, new_object):
+        report = memo.get('__clone_report__', None)
+        if (
+            report is not None
+            and self.parent_component()._constructed
+            and self._shareable()
+        ):
+            # This is a Block.clone(share=True): the clone shares the
+            # member storage with this Set, and both Sets copy the
+            # storage before they first modify it (see _unshare())
+            self._shared = True
+            for storage in self._shared_storage():
+                memo[id(storage)] = storage
+            report.shared_sets += 1
+            report.shared_set_members += len(self._values)
+        super().__deepcopy_state__(memo, new_object)
+
+    def _shareable(self):
+        return all_atomic(self._values)
+
+    def _shared_storage(self):
+        return (self._values,)
+
+    def _unshare(self):
+        self._values = self._values.copy()
+        self._shared = False
 
     def get(self, value, default=None):
         """
@@ -1381,15 +1452,23 @@ class FiniteSetData(_FiniteSetMixin, SetData):
         return len(self) - N
 
     def _update_impl(self, values):
+        if self._shared:
+            self._unshare()
         self._values.update(values)
 
     def remove(self, val):
+        if self._shared:
+            self._unshare()
         self._values.remove(val)
 
     def discard(self, val):
+        if self._shared:
+            self._unshare()
         self._values.discard(val)
 
     def clear(self):
+        if self._shared:
+            self._unshare()
         self._values.clear()
 
     def set_value(self, val):
@@ -1449,6 +1528,8 @@ class FiniteSetData(_FiniteSetMixin, SetData):
             pass
 
     def pop(self):
+        if self._shared:
+            self._unshare()
         return self._values.pop()
 
     def _cb_domain_verifier(self, domain, val_iter):
@@ -1806,7 +1887,14 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
     def __reversed__(self):
         return reversed(self._values)
 
+    def _shared_storage(self):
+        if self._ordered_values is None:
+            return (self._values,)
+        return (self._values, self._ordered_values)
+
     def _update_impl(self, values):
+        if self._shared:
+            self._unshare()
         for val in values:
             # Note that we reset _ordered_values within the loop because
             # of an old example where the initializer rule makes
@@ -1816,6 +1904,8 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
             self._values[val] = None
 
     def remove(self, val):
+        if self._shared:
+            self._unshare()
         self._values.pop(val)
         self._ordered_values = None
 
@@ -1826,6 +1916,8 @@ class OrderedSetData(_OrderedSetMixin, FiniteSetData):
             pass
 
     def clear(self):
+        if self._shared:
+            self._unshare()
         self._values.clear()
         self._ordered_values = None
 
@@ -1941,6 +2033,839 @@ class _InsertionOrderSetData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+class _ArraySetStorage(object):
+    """Compact, integer-coded storage for the members of a Set
+
+    For Sets of tuples, each position in the member tuples is stored
+    (in insertion order) in an int64 array (:attr:`columns`), along
+    with the (Python) hash of each member (:attr:`hashes`).  Positions
+    that only hold (native) ints store the values directly; for the
+    other positions (:attr:`coded`), every distinct value is assigned
+    an integer code in a single code table (:attr:`values` maps codes
+    to values and :attr:`codes` maps values to codes) that is shared by
+    all coded positions (so equal values of different types, e.g., 1
+    and 1.0, in coded positions are returned as the first of them that
+    was added).  For Sets of scalars, the code is the member position
+    (and the code table is the index).
+
+    Members are located through an open addressing (linear probing)
+    hash table of member positions (:attr:`table`) keyed by the member
+    hash, so locating a member does not require encoding it: a lookup
+    is one (C-level) tuple hash, usually a single probe, and a
+    position-by-position comparison with the member at that position
+    (the stored hashes are only used to rebuild the table and for bulk
+    operations).  Members are hashed, deduplicated, encoded, and
+    inserted into the table in bulk (using numpy), and the table is
+    kept at most half full, so locating a member (:meth:`position`) and
+    retrieving a member by position (:meth:`at`) are O(1).
+
+    The storage provides the subset of the Python set API used by
+    :class:`OrderedSetData`, plus positional access (:meth:`at`,
+    :meth:`position`, :meth:`find`) and vectorized membership tests
+    (:meth:`isin`).  :attr:`state` is replaced whenever the members
+    change (see :func:`_set_state`).
+
+    """
+
+    __slots__ = (
+        'dimen',
+        'values',
+        'codes',
+        'columns',
+        'coded',
+        'fields',
+        'hashes',
+        'table',
+        'mask',
+        'lookup',
+        'state',
+    )
+
+    # Number of members added at a time
+    _CHUNK = 65536
+    # Number of members decoded at a time while iterating
+    _ITER_CHUNK = 1024
+
+    def __init__(self):
+        self.clear()
+
+    def __getstate__(self):
+        # Note: hashes of str (and other) values are not stable across
+        # processes, so the hashes (and the table) are rebuilt
+        return self.dimen, self.values, self.columns, self.coded
+
+    def __setstate__(self, state):
+        self.dimen, self.values, self.columns, self.coded = state
+        self.fields = list(zip(self.columns, self.coded))
+        self.codes = {v: i for i, v in enumerate(self.values)}
+        self.lookup = None
+        self.hashes = array.array('q')
+        self.table = None
+        self.mask = 0
+        if self.dimen:
+            self.hashes.extend(map(hash, self._iter_members()))
+            self._rebuild_table(len(self))
+        self.state = (object(), len(self))
+
+    def clear(self):
+        # dimen is None (no members), 0 (scalar members), or the length
+        # of the member tuples
+        self.dimen = None
+        self.values = []
+        self.codes = {}
+        self.columns = []
+        self.coded = []
+        # (column, coded) pairs (used to decode members)
+        self.fields = []
+        self.hashes = array.array('q')
+        self.table = None
+        self.mask = 0
+        # Cached numpy (object) array of self.values (see _members())
+        self.lookup = None
+        # (epoch, length): the epoch is only replaced by modifications
+        # other than adding members
+        self.state = (object(), 0)
+
+    def copy(self):
+        ans = self.__class__.__new__(self.__class__)
+        ans.dimen = self.dimen
+        ans.values = list(self.values)
+        ans.codes = dict(self.codes)
+        ans.columns = [col[:] for col in self.columns]
+        ans.coded = list(self.coded)
+        ans.fields = list(zip(ans.columns, ans.coded))
+        ans.hashes = self.hashes[:]
+        ans.table = None if self.table is None else self.table[:]
+        ans.mask = self.mask
+        ans.lookup = None
+        ans.state = (object(), len(ans))
+        return ans
+
+    def _appended(self):
+        # Record that members were added
+        if len(self) != self.state[1]:
+            self.state = (self.state[0], len(self))
+
+    def _modified(self):
+        # Record a modification other than adding members
+        self.state = (object(), len(self))
+
+    def __len__(self):
+        if self.dimen:
+            return len(self.columns[0])
+        return len(self.values)
+
+    def __iter__(self):
+        if not self.dimen:
+            return iter(self.values)
+        return self._iter_members()
+
+    def __reversed__(self):
+        if not self.dimen:
+            return reversed(self.values)
+        return self._iter_members(True)
+
+    def __contains__(self, val):
+        return self.find(val) >= 0
+
+    def _set_dimen(self, val):
+        self.dimen = len(val) if val.__class__ is tuple else 0
+        if self.dimen:
+            self.columns = [array.array('q') for _ in range(self.dimen)]
+            self.coded = [False] * self.dimen
+            self.fields = list(zip(self.columns, self.coded))
+            self._rebuild_table(0)
+
+    def _dimen_error(self, val):
+        return ValueError(
+            "Cannot add value %s to a Set declared with storage='array': "
+            "all members must be scalars or tuples of the same length" % (val,)
+        )
+
+    #
+    # Member access (Sets of tuples)
+    #
+
+    def _members(self, start, stop):
+        # Return the list of members at positions [start, stop)
+        values = self.values
+        if self.lookup is None or len(self.lookup) != len(values):
+            self.lookup = np.empty(len(values), dtype=object)
+            self.lookup[:] = values
+        return list(
+            zip(
+                *[
+                    (
+                        self.lookup[np.frombuffer(col[start:stop], dtype=np.int64)]
+                        if coded
+                        else col[start:stop]
+                    ).tolist()
+                    for col, coded in zip(self.columns, self.coded)
+                ]
+            )
+        )
+
+    def _iter_members(self, reverse=False):
+        # Note: the members are decoded a chunk at a time (and the
+        # chunks do not hold references to the column buffers), so the
+        # Set may be modified while it is being iterated over
+        chunk = self._ITER_CHUNK
+        if reverse:
+            return itertools.chain.from_iterable(
+                reversed(self._members(max(stop - chunk, 0), stop))
+                for stop in range(len(self), 0, -chunk)
+            )
+        return itertools.chain.from_iterable(
+            self._members(start, start + chunk) for start in range(0, len(self), chunk)
+        )
+
+    #
+    # Hash table management (Sets of tuples)
+    #
+
+    def _column_arrays(self):
+        return [np.frombuffer(col, dtype=np.int64) for col in self.columns]
+
+    def _rebuild_table(self, n):
+        # (Re)build the hash table with room for n members
+        bits = max(3, (2 * n).bit_length())
+        table = np.full(1 << bits, -1, dtype=np.intc)
+        self.mask = mask = len(table) - 1
+        if len(self):
+            todo = np.arange(len(self))
+            slot = np.frombuffer(self.hashes, dtype=np.int64) & mask
+            while len(todo):
+                # The members are distinct, so it does not matter which
+                # of the members claiming a free slot gets it: the
+                # others move to the next slot
+                free = table[slot] < 0
+                table[slot[free]] = todo[free]
+                rest = table[slot] != todo
+                todo = todo[rest]
+                slot = (slot[rest] + 1) & mask
+        self.table = array.array('i', table.tobytes())
+
+    def _insert(self, chunk, hashes, types=None):
+        # Add the members in chunk (with the corresponding int64 array
+        # of hashes) that are not already in the Set (keeping the first
+        # occurrence of repeated members)
+        n = len(self)
+        k = len(chunk)
+        if 2 * (n + k) > len(self.table):
+            # Leave room to grow (to limit the number of rebuilds)
+            self._rebuild_table(2 * (n + k))
+        table = np.frombuffer(self.table, dtype=np.intc)
+        mask = self.mask
+        old_hashes = np.frombuffer(self.hashes, dtype=np.int64)
+        added = np.zeros(k, dtype=bool)
+        added_slot = np.zeros(k, dtype=np.intp)
+        todo = np.arange(k)
+        slot = hashes & mask
+        while len(todo):
+            pos = table[slot]
+            # Candidates whose hash matches the member in an occupied
+            # slot are compared with that member (positions >= n are
+            # candidates added in this call)
+            occ = np.flatnonzero(pos >= 0)
+            p = pos[occ]
+            h = np.empty(len(p), dtype=np.int64)
+            old = p < n
+            h[old] = old_hashes[p[old]]
+            old = ~old
+            h[old] = hashes[p[old] - n]
+            match = occ[h == hashes[todo[occ]]]
+            same = np.zeros(len(todo), dtype=bool)
+            for i, p in zip(match.tolist(), pos[match].tolist()):
+                j = int(todo[i])
+                if p < n:
+                    same[i] = self.at(p) == chunk[j]
+                    continue
+                # Note: the slot may have been handed over (below) to an
+                # earlier candidate in this round
+                p = int(table[slot[i]])
+                if chunk[p - n] == chunk[j]:
+                    same[i] = True
+                    if p - n > j:
+                        # A later occurrence of this member claimed the
+                        # slot: keep the first occurrence instead
+                        added[p - n] = False
+                        added[j] = True
+                        added_slot[j] = added_slot[p - n]
+                        table[slot[i]] = n + j
+            # Candidates claim the free slots (when several candidates
+            # claim the same slot, one of them gets it)
+            free = np.flatnonzero(pos < 0)
+            cand = n + todo[free]
+            claimed = slot[free]
+            table[claimed] = cand
+            won = table[claimed] == cand
+            win = todo[free[won]]
+            added[win] = True
+            added_slot[win] = claimed[won]
+            # Repeated members are discarded, other candidates in
+            # occupied slots move to the next slot, and candidates that
+            # lost a free slot check it again
+            move = pos >= 0
+            move &= ~same
+            retry = np.zeros(len(todo), dtype=bool)
+            retry[free[~won]] = True
+            slot = np.where(move, (slot + 1) & mask, slot)
+            keep = move | retry
+            todo = todo[keep]
+            slot = slot[keep]
+        new = np.flatnonzero(added)
+        table[added_slot[new]] = n + np.arange(len(new), dtype=np.intc)
+        # Release the buffers before resizing the arrays
+        del table, old_hashes
+        if len(new) < k:
+            chunk = [chunk[i] for i in new.tolist()]
+        self.hashes.frombytes(hashes[new].tobytes())
+        self._encode_columns(chunk, types)
+
+    def _encode_columns(self, chunk, types=None):
+        # Append the members in chunk to the columns (types, if known,
+        # is a list of supersets of the types in each column)
+        if not chunk:
+            return
+        n = len(chunk)
+        codes = self.codes
+        level = self.values
+        for i, col in enumerate(self.columns):
+            get = itemgetter(i)
+            if not self.coded[i]:
+                if types is None:
+                    col_types = set(map(type, map(get, chunk)))
+                else:
+                    col_types = types[i]
+                if col_types == {int}:
+                    try:
+                        col.frombytes(
+                            np.fromiter(
+                                map(get, chunk), dtype=np.int64, count=n
+                            ).tobytes()
+                        )
+                        continue
+                    except OverflowError:
+                        pass
+                self._code_column(i)
+            new = [v for v in dict.fromkeys(map(get, chunk)) if v not in codes]
+            codes.update(zip(new, range(len(level), len(level) + len(new))))
+            level.extend(new)
+            col.frombytes(
+                np.fromiter(
+                    map(codes.__getitem__, map(get, chunk)), dtype=np.int64, count=n
+                ).tobytes()
+            )
+
+    def _code_column(self, i):
+        # Replace the (int) values in column i by their codes
+        col = self.columns[i]
+        self.coded[i] = True
+        self.fields = list(zip(self.columns, self.coded))
+        if not col:
+            return
+        codes = self.codes
+        level = self.values
+        new = [v for v in dict.fromkeys(col.tolist()) if v not in codes]
+        codes.update(zip(new, range(len(level), len(level) + len(new))))
+        level.extend(new)
+        col[:] = array.array(
+            'q',
+            np.fromiter(
+                map(codes.__getitem__, col), dtype=np.int64, count=len(col)
+            ).tobytes(),
+        )
+
+    def _remove_last(self):
+        # Remove the last member from the hash table (backward shift
+        # deletion, so that no probe sequences are broken)
+        table = self.table
+        hashes = self.hashes
+        mask = self.mask
+        slot = hashes[-1] & mask
+        last = len(hashes) - 1
+        while table[slot] != last:
+            slot = (slot + 1) & mask
+        table[slot] = -1
+        j = slot
+        while True:
+            j = (j + 1) & mask
+            p = table[j]
+            if p < 0:
+                break
+            home = hashes[p] & mask
+            # Move p into the hole unless its home slot is cyclically
+            # in (slot, j]
+            if (j > slot and (home <= slot or home > j)) or (
+                j < slot and slot >= home > j
+            ):
+                table[slot] = p
+                table[j] = -1
+                slot = j
+        del hashes[-1]
+        for col in self.columns:
+            del col[-1]
+
+    #
+    # Set API
+    #
+
+    def update(self, values):
+        values = iter(values)
+        while True:
+            chunk = list(itertools.islice(values, self._CHUNK))
+            if not chunk:
+                break
+            self.extend(chunk, hint=length_hint(values))
+
+    def reserve(self, n):
+        """Make room (in the hash table) for `n` members (Sets of tuples)"""
+        if 2 * n > len(self.table):
+            self._rebuild_table(n)
+
+    def extend(self, chunk, types=None, hint=0):
+        """Add the members in the list `chunk`
+
+        `types` (if known) is the list of the sets of the types that
+        appear in each position of the members (a single position for
+        Sets of scalars).  `hint` is the number of members that are
+        expected to be added after this chunk.
+
+        """
+        if not chunk:
+            return
+        if self.dimen is None:
+            self._set_dimen(chunk[0])
+        if not self.dimen:
+            if types is None or tuple in types[0]:
+                for val in chunk:
+                    if val.__class__ is tuple:
+                        raise self._dimen_error(val)
+            codes = self.codes
+            level = self.values
+            for val in chunk:
+                if val not in codes:
+                    codes[val] = len(level)
+                    level.append(val)
+        elif len(chunk) == 1:
+            self._add(chunk[0])
+        else:
+            d = self.dimen
+            self.reserve(len(self) + len(chunk) + hint)
+            if types is None and (
+                set(map(type, chunk)) != {tuple} or set(map(len, chunk)) != {d}
+            ):
+                for val in chunk:
+                    if val.__class__ is not tuple or len(val) != d:
+                        raise self._dimen_error(val)
+            self._insert(
+                chunk,
+                np.fromiter(map(hash, chunk), dtype=np.int64, count=len(chunk)),
+                types,
+            )
+        self._appended()
+
+    def _add(self, val):
+        # Add a single member (without the numpy overhead)
+        if val.__class__ is not tuple or len(val) != self.dimen:
+            raise self._dimen_error(val)
+        if self.find(val) >= 0:
+            return
+        h = hash(val)
+        pos = len(self.hashes)
+        if 2 * pos + 2 > len(self.table):
+            self._rebuild_table(2 * pos + 2)
+        table = self.table
+        mask = self.mask
+        slot = h & mask
+        while table[slot] >= 0:
+            slot = (slot + 1) & mask
+        table[slot] = pos
+        self.hashes.append(h)
+        self._encode_columns([val])
+
+    def find(self, val):
+        """Return the (0-based) position of `val` (-1 if not a member)"""
+        if not self.dimen:
+            return self.codes.get(val, -1)
+        if val.__class__ is not tuple and not isinstance(val, tuple):
+            return -1
+        table = self.table
+        mask = self.mask
+        slot = hash(val) & mask
+        while True:
+            pos = table[slot]
+            if pos < 0:
+                return -1
+            # Compare the member at pos with val (without decoding the
+            # whole member)
+            values = self.values
+            for (col, coded), v in zip(self.fields, val):
+                x = values[col[pos]] if coded else col[pos]
+                if x is not v and x != v:
+                    break
+            else:
+                if len(val) == self.dimen:
+                    return pos
+            slot = (slot + 1) & mask
+
+    def position(self, val):
+        """Return the (0-based) position of `val` (raises KeyError)"""
+        pos = self.find(val)
+        if pos < 0:
+            raise KeyError(val)
+        return pos
+
+    def at(self, pos):
+        """Return the member at the (0-based, nonnegative) position `pos`"""
+        if self.dimen:
+            values = self.values
+            ans = []
+            for col, coded in self.fields:
+                ans.append(values[col[pos]] if coded else col[pos])
+            return tuple(ans)
+        return self.values[pos]
+
+    def remove(self, val):
+        pos = self.position(val)
+        if not self.dimen:
+            level = self.values
+            del level[pos]
+            if pos == len(level):
+                del self.codes[val]
+            else:
+                self.codes = {v: i for i, v in enumerate(level)}
+            self._modified()
+            return
+        if pos == len(self) - 1:
+            self._remove_last()
+        else:
+            del self.hashes[pos]
+            for col in self.columns:
+                del col[pos]
+            self._rebuild_table(len(self))
+        self._modified()
+
+    def discard(self, val):
+        try:
+            self.remove(val)
+        except KeyError:
+            pass
+
+    def _isin_encoded(self, values, idx, query):
+        # Return a bool array indicating which values[idx] (with the
+        # encoded columns query) are members
+        h = np.fromiter(
+            map(hash, map(values.__getitem__, idx.tolist())),
+            dtype=np.int64,
+            count=len(idx),
+        )
+        # Probe the table: a member matches if all its codes match
+        table = np.frombuffer(self.table, dtype=np.intc)
+        hashes = np.frombuffer(self.hashes, dtype=np.int64)
+        columns = self._column_arrays()
+        mask = self.mask
+        hit_all = np.zeros(len(idx), dtype=bool)
+        todo = np.arange(len(idx))
+        slot = h & mask
+        while len(todo):
+            pos = table[slot]
+            occupied = pos >= 0
+            p = np.where(occupied, pos, 0)
+            hit = occupied & (hashes[p] == h[todo])
+            for col, c in zip(columns, query):
+                hit &= col[p] == c[todo]
+            hit_all[todo[hit]] = True
+            more = occupied & ~hit
+            todo = todo[more]
+            slot = (slot[more] + 1) & mask
+        return hit_all
+
+    def isin(self, values):
+        """Return a numpy bool array indicating which `values` are members"""
+        values = _isin_values(values)
+        n = len(values)
+        if not self.dimen:
+            if self.dimen is None:
+                return np.zeros(n, dtype=bool)
+            # Note: 1-tuples are the same (normalized) index as their
+            # value
+            return np.fromiter(
+                (
+                    (v[0] if v.__class__ is tuple and len(v) == 1 else v) in self.codes
+                    for v in values
+                ),
+                dtype=bool,
+                count=n,
+            )
+        d = self.dimen
+        if not n:
+            return np.zeros(0, dtype=bool)
+        if set(map(type, values)) == {tuple} and set(map(len, values)) == {d}:
+            found = np.ones(n, dtype=bool)
+        else:
+            found = np.fromiter(
+                (v.__class__ is tuple and len(v) == d for v in values),
+                dtype=bool,
+                count=n,
+            )
+            # Replace the values with the wrong dimension by a value
+            # that cannot match
+            filler = (_NotFound,) * d
+            values = [v if ok else filler for v, ok in zip(values, found.tolist())]
+        # Encode the query values column by column.  Values that do not
+        # appear in the code table cannot match a coded column.  Values
+        # other than (int64) ints may still compare equal to the values
+        # in an int column (e.g., 1.0), so those are located (after the
+        # vectorized search) one at a time.
+        codes = self.codes.get
+        exact = found.copy()
+        query = []
+        for i, coded in enumerate(self.coded):
+            col = map(itemgetter(i), values)
+            if coded:
+                q = np.fromiter(
+                    map(codes, col, itertools.repeat(-1, n)), dtype=np.int64, count=n
+                )
+                found &= q >= 0
+            else:
+                q = None
+                if set(map(type, map(itemgetter(i), values))) == {int}:
+                    try:
+                        q = np.fromiter(col, dtype=np.int64, count=n)
+                    except OverflowError:
+                        col = map(itemgetter(i), values)
+                if q is None:
+                    q = np.fromiter(
+                        (
+                            (
+                                v
+                                if v.__class__ is int and _INT64_MIN < v <= _INT64_MAX
+                                else _INT64_MIN
+                            )
+                            for v in col
+                        ),
+                        dtype=np.int64,
+                        count=n,
+                    )
+                exact &= q != _INT64_MIN
+            query.append(q)
+        slow = np.flatnonzero(found & ~exact).tolist()
+        found &= exact
+        idx = np.flatnonzero(found)
+        found[idx] = False
+        if len(idx) and len(self):
+            found[idx] = self._isin_encoded(values, idx, [q[idx] for q in query])
+        for i in slow:
+            found[i] = self.find(values[i]) >= 0
+        return found
+
+
+class _VerifiedChunks(object):
+    """Iterable over the members in (chunk, types, hint) triples
+
+    :class:`ArrayOrderedSetData` adds the chunks directly to its
+    storage; any other consumer iterates over the members.
+
+    """
+
+    __slots__ = ('chunks',)
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(map(itemgetter(0), self.chunks))
+
+
+class ArrayOrderedSetData(InsertionOrderSetData):
+    """
+    This class defines the data for an insertion ordered set whose
+    members are stored in compact, integer-coded arrays.
+
+    The distinct values in the members are mapped to integer codes,
+    and the member codes are stored in integer arrays with a hash
+    index.  This provides O(1) membership tests, :meth:`ord`, and
+    :meth:`at`, vectorized membership tests (:meth:`isin`), and memory
+    use proportional to the integer encoding (and not to the member
+    tuples).  All members must be scalars or tuples of the same
+    length.  Removing members (other than the last member) is O(n).
+
+    Constructor Arguments:
+        component   The Set object that owns this data.
+
+    Public Class Attributes:
+    """
+
+    __slots__ = ()
+
+    def __init__(self, component):
+        self._values = _ArraySetStorage()
+        self._ordered_values = None
+        FiniteSetData.__init__(self, component=component)
+
+    def __contains__(self, value):
+        # Members are stored normalized, so look for the value as given
+        # before falling back on the general (normalizing) test (which
+        # is not needed for native scalars and flat tuples of native
+        # values)
+        try:
+            if self._values.find(value) >= 0:
+                return True
+        except TypeError:
+            return super().__contains__(value)
+        if value.__class__ in native_types or (
+            value.__class__ is tuple
+            and len(value) > 1
+            and native_types.issuperset(map(type, value))
+        ):
+            return False
+        return super().__contains__(value)
+
+    def get(self, value, default=None):
+        # Members are stored normalized, so values are only normalized
+        # if they are not found as given
+        try:
+            if self._values.find(value) >= 0:
+                return value
+        except TypeError:
+            # Unhashable values (e.g., lists) may normalize to members
+            pass
+        if normalize_index.flatten:
+            normalized = normalize_index(value)
+            if normalized is not value and self._values.find(normalized) >= 0:
+                return normalized
+        return default
+
+    def _shareable(self):
+        # The (integer) columns can always be shared: only the coded
+        # values need to be checked
+        return all_atomic(self._values.values)
+
+    def _update_impl(self, values):
+        if self._shared:
+            self._unshare()
+        if values.__class__ is _VerifiedChunks:
+            for chunk, types, hint in values.chunks:
+                self._values.extend(chunk, types, hint)
+        else:
+            self._values.update(values)
+
+    def _cb_normalized_dimen_verifier(self, dimen, val_iter):
+        # Verify the members a chunk at a time
+        return _VerifiedChunks(self._verified_chunks(dimen, val_iter))
+
+    def _verified_chunks(self, dimen, val_iter):
+        # Chunks where every member is already normalized (a native
+        # scalar or a flat tuple of native values) with the Set
+        # dimension are passed through as is (along with the types in
+        # each position of the members), and only the other chunks are
+        # verified (and normalized) member by member.
+        verify = super()._cb_normalized_dimen_verifier
+        while True:
+            chunk = list(itertools.islice(val_iter, _ArraySetStorage._CHUNK))
+            if not chunk:
+                return
+            dimen = self._dimen
+            types = None
+            if dimen == 1:
+                types = [set(map(type, chunk))]
+            elif (
+                dimen.__class__ is int
+                and dimen
+                and set(map(type, chunk)) == {tuple}
+                and set(map(len, chunk)) == {dimen}
+            ):
+                types = [
+                    set(map(type, map(itemgetter(i), chunk))) for i in range(dimen)
+                ]
+            hint = length_hint(val_iter)
+            if types is not None and all(map(native_types.issuperset, types)):
+                yield chunk, types, hint
+                continue
+            chunk = list(verify(dimen, iter(chunk)))
+            # Stop at Set.End (without discarding the members that
+            # precede it in this chunk)
+            for i, val in enumerate(chunk):
+                if val is Set.End:
+                    yield chunk[:i], None, 0
+                    return
+            yield chunk, None, hint
+
+    def remove(self, val):
+        if self._shared:
+            self._unshare()
+        self._values.remove(val)
+
+    def at(self, index):
+        """
+        Return the specified member of the set.
+
+        The public Set API is 1-based, even though the
+        internal storage is (pythonically) 0-based.
+        """
+        if index.__class__ is int and index >= 1:
+            i = index - 1
+        else:
+            i = self._to_0_based_index(index)
+        try:
+            return self._values.at(i)
+        except IndexError:
+            raise IndexError(f"{self.name} index out of range") from None
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then an IndexError is raised.
+        """
+        try:
+            return self._values.position(item) + 1
+        except KeyError:
+            if item.__class__ is not tuple or len(item) > 1:
+                raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+        try:
+            return self._values.position(item[0]) + 1
+        except KeyError:
+            raise ValueError("%s.ord(x): x not in %s" % (self.name, self.name))
+
+    def isin(self, values):
+        values = _isin_values(values)
+        ans = self._values.isin(values)
+        if normalize_index.flatten:
+            # Values that were not found may normalize to members (e.g.,
+            # 1-tuples or nested tuples), unless they are native scalars
+            # or flat tuples of native values
+            missed = np.flatnonzero(~ans).tolist()
+            missed_values = list(map(values.__getitem__, missed))
+            types = set(map(type, missed_values))
+            if native_types.issuperset(types) or (
+                types == {tuple}
+                and 1 not in set(map(len, missed_values))
+                and native_types.issuperset(
+                    map(type, itertools.chain.from_iterable(missed_values))
+                )
+            ):
+                return ans
+            for i in missed:
+                val = values[i]
+                if val.__class__ is tuple:
+                    if len(val) > 1 and native_types.issuperset(map(type, val)):
+                        continue
+                elif val.__class__ in native_types:
+                    continue
+                ans[i] = self.get(val, _NotFound) is not _NotFound
+        return ans
+
+    isin.__doc__ = _FiniteSetMixin.isin.__doc__
+
+
 class _SortedSetMixin(object):
     """"""
 
@@ -1979,6 +2904,8 @@ class SortedSetData(_SortedSetMixin, OrderedSetData):
         return reversed(self._ordered_values)
 
     def _update_impl(self, values):
+        if self._shared:
+            self._unshare()
         for val in values:
             # Note that we reset _ordered_values within the loop because
             # of an old example where the initializer rule makes
@@ -2062,6 +2989,13 @@ class Set(IndexedComponent):
           ``<function>``          Ordered with this comparison function
           ======================  =====================================
 
+    storage : str, optional
+        How the members of the Set are stored: ``'object'`` (a Python
+        dict of the members) [default] or ``'array'`` (compact,
+        integer-coded arrays with a hash index; see
+        :class:`ArrayOrderedSetData`).  ``'array'`` requires an
+        insertion ordered Set.
+
     within : initialiser(set), optional
         A set that defines the valid values that can be contained
         in this set. If the latter is indexed, the former can be indexed or
@@ -2176,8 +3110,22 @@ class Set(IndexedComponent):
                         )
                     )
                 )
+        storage = kwds.get('storage', 'object')
+        if storage != 'object':
+            if storage != 'array':
+                raise ValueError(
+                    "Set 'storage' argument is not valid (must be one of "
+                    "{'array', 'object'})"
+                )
+            if ordered is not Set.InsertionOrder:
+                raise ValueError(
+                    "Set storage='array' is only supported for insertion "
+                    "ordered Sets"
+                )
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
-            if ordered is Set.InsertionOrder:
+            if storage == 'array':
+                return super(Set, cls).__new__(AbstractArrayOrderedScalarSet)
+            elif ordered is Set.InsertionOrder:
                 return super(Set, cls).__new__(AbstractOrderedScalarSet)
             elif ordered is Set.SortedOrder:
                 return super(Set, cls).__new__(AbstractSortedScalarSet)
@@ -2185,7 +3133,9 @@ class Set(IndexedComponent):
                 return super(Set, cls).__new__(AbstractFiniteScalarSet)
         else:
             newObj = super(Set, cls).__new__(IndexedSet)
-            if ordered is Set.InsertionOrder:
+            if storage == 'array':
+                newObj._ComponentDataClass = ArrayOrderedSetData
+            elif ordered is Set.InsertionOrder:
                 newObj._ComponentDataClass = InsertionOrderSetData
             elif ordered is Set.SortedOrder:
                 newObj._ComponentDataClass = SortedSetData
@@ -2200,6 +3150,7 @@ class Set(IndexedComponent):
         initialize=None,
         dimen=UnknownSetDimen,
         ordered=InsertionOrder,
+        storage='object',
         within=None,
         domain=None,
         bounds=None,
@@ -2215,6 +3166,8 @@ class Set(IndexedComponent):
         # The ordered flag was processed by __new__, but if this is a
         # sorted set, then we need to set the sorting function
         _ordered = kwds.pop('ordered', None)
+        # The storage flag was also processed by __new__
+        kwds.pop('storage', None)
         if _ordered and _ordered is not Set.InsertionOrder and _ordered is not True:
             if inspect.isfunction(_ordered):
                 self._sort_fcn = _ordered
@@ -2518,6 +3471,23 @@ class OrderedSimpleSet(metaclass=RenamedClass):
     __renamed__version__ = '6.0'
 
 
+class ArrayOrderedScalarSet(_ScalarOrderedSetMixin, ArrayOrderedSetData, Set):
+    def __init__(self, **kwds):
+        # In case someone inherits from us, we will provide a rational
+        # default for the "ordered" flag
+        kwds.setdefault('ordered', Set.InsertionOrder)
+
+        ArrayOrderedSetData.__init__(self, component=self)
+        Set.__init__(self, **kwds)
+
+    def construct(self, data=None):
+        super().construct(data)
+        # The members are held (compactly) by the array storage: do not
+        # retain the initialization data (which may hold a tuple for
+        # every member)
+        self._init_values = None
+
+
 class SortedScalarSet(_ScalarOrderedSetMixin, SortedSetData, Set):
     def __init__(self, **kwds):
         # In case someone inherits from us, we will provide a rational
@@ -2554,6 +3524,11 @@ class AbstractOrderedSimpleSet(metaclass=RenamedClass):
     __renamed__version__ = '6.0'
 
 
+@disable_methods(_ORDEREDSET_API + _SETDATA_API)
+class AbstractArrayOrderedScalarSet(ArrayOrderedScalarSet):
+    pass
+
+
 @disable_methods(_ORDEREDSET_API + _SETDATA_API)
 class AbstractSortedScalarSet(SortedScalarSet):
     pass
@@ -4249,18 +5224,28 @@ class SetProduct_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
-        found = self._find_val(item)
-        if found is None:
-            raise IndexError(
-                "Cannot identify position of %s in Set %s: item not in Set"
-                % (item, self.name)
-            )
-        val, cutPoints = found
-        if cutPoints is not None:
-            val = tuple(
-                val[cutPoints[i] : cutPoints[i + 1]] for i in range(len(self._sets))
-            )
-        _idx = tuple(s.ord(val[i]) - 1 for i, s in enumerate(self._sets))
+        _idx = None
+        if item.__class__ is tuple and len(item) == len(self._sets):
+            # Fast path for items that are trivially split with a
+            # single index for each subset: the subsets both locate and
+            # validate the values
+            try:
+                _idx = tuple(s.ord(v) - 1 for s, v in zip(self._sets, item))
+            except (IndexError, TypeError, ValueError):
+                pass
+        if _idx is None:
+            found = self._find_val(item)
+            if found is None:
+                raise IndexError(
+                    "Cannot identify position of %s in Set %s: item not in Set"
+                    % (item, self.name)
+                )
+            val, cutPoints = found
+            if cutPoints is not None:
+                val = tuple(
+                    val[cutPoints[i] : cutPoints[i + 1]] for i in range(len(self._sets))
+                )
+            _idx = tuple(s.ord(val[i]) - 1 for i, s in enumerate(self._sets))
         _len = list(len(_) for _ in self._sets)
         _len.append(1)
         ans = 0
@@ -4273,6 +5258,302 @@ class SetProduct_OrderedSet(
 ############################################################################
 
 
+def _set_state(s):
+    """Return a tuple of objects identifying the current state of `s`
+
+    The returned objects are replaced (and not modified in place)
+    whenever the members (or member order) of `s` change, so two states
+    are equal if all of their entries are identical (see
+    :func:`_same_state`).  Returns None if the state of `s` cannot be
+    tracked.
+
+    """
+    if isinstance(s, SetOperator):
+        ans = ()
+        for _s in s._sets:
+            _state = _set_state(_s)
+            if _state is None:
+                return None
+            ans += _state
+        return ans
+    if isinstance(s, ArrayOrderedSetData):
+        # The array storage replaces its state whenever the members
+        # change
+        return (s._values.state,)
+    if isinstance(s, OrderedSetData):
+        # Every modification of an ordered Set discards the
+        # _ordered_values list
+        if s._ordered_values is None:
+            s._rebuild_ordered_values()
+        return (s._ordered_values,)
+    if isinstance(s, FiniteRangeSetData):
+        return (s._ranges,)
+    return None
+
+
+def _same_state(state0, state1):
+    return len(state0) == len(state1) and all(map(is_, state0, state1))
+
+
+def _appended_state(s, state0, state1, n):
+    """Return True if the first `n` members of the ordered Set `s` are
+    the same in `state1` as in `state0` (the states returned by
+    :func:`_set_state`), i.e., members were only added after them"""
+    if isinstance(s, ArrayOrderedSetData):
+        # The storage epoch is only replaced when members are removed
+        return state1[0][0] is state0[0][0] and state1[0][1] >= n
+    if isinstance(s, OrderedSetData):
+        return len(state1[0]) >= n and state1[0][:n] == state0[0][:n]
+    return False
+
+
+class SetJoin(SetOperator):
+    """A (sparse) relational join of two finite Sets
+
+    The members of the join are the members ``a + b`` of the cross
+    product of the two operand Sets where ``a[i] == b[j]`` for all
+    ``(i, j)`` pairs in the join specification (`on`).  The matched
+    columns from the second Set are omitted from the join members.
+
+    """
+
+    __slots__ = tuple()
+    # The index of the second Set, the length, and (for ordered joins)
+    # the members of the join are cached along with the state of the
+    # operand Sets they were computed from (see _join_data()).  The
+    # cache is discarded when the join is cloned or pickled.
+    __autoslot_mappers__ = {'_join_cache': AutoSlots.encode_as_none}
+    _join_cache = None
+
+    _operator = " JOIN "
+
+    def __new__(cls, *args, **kwds):
+        if cls != SetJoin:
+            return super(SetJoin, cls).__new__(cls)
+
+        set0, set1 = SetOperator._checkArgs(*args)
+        if not (set0[1] and set1[1]):
+            raise TypeError("SetJoin is only defined for finite Sets")
+        if set0[0] and set1[0]:
+            cls = SetJoin_OrderedSet
+        else:
+            cls = SetJoin_FiniteSet
+        return cls.__new__(cls)
+
+    def __init__(self, *args, **kwds):
+        on = kwds.pop('on', None)
+        if on is not None:
+            on = tuple(tuple(_) for _ in on)
+            if any(len(_) != 2 for _ in on):
+                raise ValueError(
+                    "SetJoin: 'on' must be a sequence of (i, j) column "
+                    "position pairs (received %s)" % (on,)
+                )
+        self._on = on
+        super().__init__(*args, **kwds)
+
+    def _expression_str(self):
+        ans = super()._expression_str()
+        if self._on is None:
+            return ans
+        return "%s ON %s" % (ans, self._on)
+
+    def _join_plan(self):
+        """Return the dimensions of the operands and the joined columns
+
+        Returns
+        -------
+        dimen: tuple
+            the dimensions of the two operand Sets
+        cols0: tuple
+            the (nonnegative) joined column positions in the first Set
+        cols1: tuple
+            the (nonnegative) joined column positions in the second Set
+        keep1: tuple
+            the column positions of the second Set that are not joined
+        """
+        dimen = tuple(s.dimen for s in self._sets)
+        for s, d in zip(self._sets, dimen):
+            if d is None or d is UnknownSetDimen:
+                raise ValueError(
+                    "Cannot join Sets with unknown or non-uniform dimension "
+                    "(Set %s has dimen=%s)" % (s.name, d)
+                )
+        on = self._on
+        if on is None:
+            on = ((-1, 0),)
+        cols0 = []
+        cols1 = []
+        for i, j in on:
+            if not (-dimen[0] <= i < dimen[0] and -dimen[1] <= j < dimen[1]):
+                raise ValueError(
+                    "SetJoin: invalid column pair %s for joining Sets "
+                    "with dimen=%s and dimen=%s" % ((i, j), dimen[0], dimen[1])
+                )
+            cols0.append(i % dimen[0])
+            cols1.append(j % dimen[1])
+        if len(set(cols1)) != len(cols1):
+            raise ValueError(
+                "SetJoin: column %s of Set %s appears more than once in "
+                "the join specification" % (cols1, self._sets[1].name)
+            )
+        keep1 = tuple(j for j in range(dimen[1]) if j not in cols1)
+        return dimen, tuple(cols0), tuple(cols1), keep1
+
+    def ranges(self):
+        # The join is a (sparse) subset of the cross product, so
+        # (like other finite Sets) the ranges are the members
+        return FiniteSetData.ranges(self)
+
+    @property
+    def dimen(self):
+        d0, d1 = (s.dimen for s in self._sets)
+        if d0 is None or d1 is None:
+            return None
+        elif d0 is UnknownSetDimen or d1 is UnknownSetDimen:
+            return UnknownSetDimen
+        return d0 + len(self._join_plan()[3])
+
+
+class SetJoin_FiniteSet(_FiniteSetMixin, SetJoin):
+    __slots__ = tuple()
+
+    def _join_data(self):
+        """Return the join plan and the index of the second Set
+
+        Returns a list ``[state, plan, index, len, members, positions]``
+        that is reused as long as the operand Sets are not modified.
+        The length, members and positions are filled in on demand.
+
+        """
+        state = _set_state(self)
+        cache = self._join_cache
+        if state is not None and cache is not None and _same_state(cache[0], state):
+            return cache
+        plan = self._join_plan()
+        cache = [state, plan, self._index_second(plan), None, None, None]
+        if state is not None:
+            self._join_cache = cache
+        return cache
+
+    def _index_second(self, plan):
+        # Index the members of the second set by the joined columns
+        dimen, cols0, cols1, keep1 = plan
+        index = {}
+        for b in self._sets[1]:
+            if dimen[1] == 1:
+                b = (b,)
+            key = tuple(b[j] for j in cols1)
+            rest = tuple(b[j] for j in keep1)
+            if key in index:
+                index[key].append(rest)
+            else:
+                index[key] = [rest]
+        return index
+
+    def _iter_impl(self):
+        cache = self._join_data()
+        if cache[4] is not None:
+            return iter(cache[4])
+        return self._iter_members(cache[1], cache[2])
+
+    def _iter_members(self, plan, index):
+        dimen, cols0, cols1, keep1 = plan
+        if dimen[0] + len(keep1) == 1:
+            # All columns of the second set were joined: the join is
+            # the subset of the first set with a match in the second set
+            n = len(cols0)
+            return (a for a in self._sets[0] if (a,) * n in index)
+        return self._iter_join(index, dimen[0] == 1, cols0)
+
+    def _iter_join(self, index, scalar, cols0):
+        for a in self._sets[0]:
+            if scalar:
+                a = (a,)
+            rest = index.get(tuple(a[i] for i in cols0), None)
+            if rest is not None:
+                for r in rest:
+                    yield a + r
+
+    def get(self, value, default=None):
+        dimen, cols0, cols1, keep1 = self._join_plan()
+        val = normalize_index(value)
+        if val.__class__ is not tuple:
+            val = (val,)
+        if len(val) != dimen[0] + len(keep1):
+            return default
+        a = val[: dimen[0]]
+        b = [None] * dimen[1]
+        for i, j in zip(cols0, cols1):
+            b[j] = a[i]
+        for j, v in zip(keep1, val[dimen[0] :]):
+            b[j] = v
+        if (a[0] if dimen[0] == 1 else a) not in self._sets[0]:
+            return default
+        if (b[0] if dimen[1] == 1 else tuple(b)) not in self._sets[1]:
+            return default
+        return val[0] if len(val) == 1 else val
+
+    def __len__(self):
+        """
+        Return the number of elements in the set.
+        """
+        cache = self._join_data()
+        if cache[3] is None:
+            dimen, cols0, cols1, keep1 = cache[1]
+            index = cache[2]
+            ans = 0
+            for a in self._sets[0]:
+                if dimen[0] == 1:
+                    a = (a,)
+                rest = index.get(tuple(a[i] for i in cols0), None)
+                if rest is not None:
+                    ans += len(rest)
+            cache[3] = ans
+        return cache[3]
+
+
+class SetJoin_OrderedSet(_ScalarOrderedSetMixin, _OrderedSetMixin, SetJoin_FiniteSet):
+    __slots__ = tuple()
+
+    def _ordered_data(self):
+        # Materialize the members of the join (and their positions)
+        cache = self._join_data()
+        if cache[4] is None:
+            members = list(self._iter_members(cache[1], cache[2]))
+            cache[3] = len(members)
+            cache[5] = {v: i for i, v in enumerate(members)}
+            cache[4] = members
+        return cache
+
+    def at(self, index):
+        members = self._ordered_data()[4]
+        idx = self._to_0_based_index(index)
+        try:
+            return members[idx]
+        except IndexError:
+            raise IndexError(f"{self.name} index out of range") from None
+
+    def ord(self, item):
+        """
+        Return the position index of the input value.
+
+        Note that Pyomo Set objects have positions starting at 1 (not 0).
+
+        If the search item is not in the Set, then an IndexError is raised.
+        """
+        val = self.get(item, _NotFound)
+        if val is _NotFound:
+            raise IndexError(
+                "Cannot identify position of %s in Set %s: item not in Set"
+                % (item, self.name)
+            )
+        return self._ordered_data()[5][val] + 1
+
+
+############################################################################
+
+
 class _AnySet(SetData, Set):
     def __init__(self, **kwds):
         SetData.__init__(self, component=self)
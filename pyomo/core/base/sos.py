@@ -18,6 +18,7 @@ from pyomo.common.timing import ConstructionTimer
 
 from pyomo.core.base.misc import apply_indexed_rule
 from pyomo.core.base.component import ActiveComponentData, ModelComponentFactory
+from pyomo.core.base.observer import _change_logs, notify_change
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.indexed_component import (
     ActiveIndexedComponent,
@@ -90,6 +91,8 @@ class SOSConstraintData(ActiveComponentData):
             yield v, w
 
     def set_items(self, variables, weights):
+        if _change_logs:
+            notify_change(self)
         self._variables = []
         self._weights = []
         for v, w in zip(variables, weights):
@@ -111,6 +111,8 @@ information.
 import logging
 import sys
 
+from contextlib import contextmanager
+
 from pyomo.common.dependencies import pint as pint_module, pint_available
 from pyomo.common.modeling import NOTSET
 from pyomo.core.expr.numvalue import (
@@ -438,14 +440,105 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         There are class attributes (dicts) that map the expression node type to the
         particular method that should be called to return the units of the node based
         on the units of its child arguments. This map is used in exitNode.
+
+        Within the walker, units are carried as "units records": tuples
+        of (dimensions, scale factor, pint unit), where the dimensions
+        are a sorted tuple of (base dimension, exponent) pairs and the
+        scale factor converts the units to the base units.  Records are
+        interned (one per pint unit), and the results of multiplying,
+        dividing, and raising records to constant powers are memoized,
+        so pint is only used the first time a particular unit (or
+        combination of units) is encountered.  Consistency checks only
+        compare the dimensions and scale factors.  The pint unit is
+        returned when the walker finishes.
         """
         super(PintUnitExtractionVisitor, self).__init__()
         self._pyomo_units_container = pyomo_units_container
-        self._pint_dimensionless = None
-        self._equivalent_pint_units = pyomo_units_container._equivalent_pint_units
-        self._equivalent_to_dimensionless = (
-            pyomo_units_container._equivalent_to_dimensionless
-        )
+        self._tol = units_equivalence_tolerance
+        self._rel_diff = pyomo_units_container._rel_diff
+        self._dimensionless = None
+        # Map of (pint registry, pint unit) to the (interned) units record
+        self._records = {}
+        # Memoized results of operations on units records, keyed on
+        # (operator, id(record), id(other record)) (or the exponent for
+        # '**').  The values are (record, other operand, result) so that
+        # the operands remain alive (and their ids are not reused).
+        self._operations = {}
+        # Cache of the units records of named expressions and of the
+        # units of leaf components, keyed on object id.  This is only
+        # active within PyomoUnitsContainer.units_cache()
+        self._cache = None
+
+    def _record(self, pint_unit):
+        """Return the units record for a pint unit"""
+        # Note: pint units from different registries cannot be compared,
+        # so the registry is part of the key (and is compared first)
+        try:
+            key = pint_unit._REGISTRY, pint_unit
+            return self._records[key]
+        except KeyError:
+            pass
+        except (AttributeError, TypeError):
+            # not a pint object, or unhashable (e.g., a pint Quantity
+            # with an array magnitude)
+            return self._make_record(pint_unit)
+        ans = self._records[key] = self._make_record(pint_unit)
+        return ans
+
+    def _make_record(self, pint_unit):
+        try:
+            registry = pint_unit._REGISTRY
+        except AttributeError:
+            registry = self._pyomo_units_container._pint_registry
+        factor, base_units = registry.get_base_units(pint_unit)
+        dims = base_units.dimensionality
+        return tuple(sorted((k, v) for k, v in dims.items() if v)), factor, pint_unit
+
+    def _operation(self, op, a, b):
+        """Return the (memoized) units record for `a op b`
+
+        `a` is a units record, `b` is either a units record or (for
+        '**') a constant exponent.
+
+        """
+        if op == '**':
+            key = op, id(a), b.__class__, b
+        else:
+            key = op, id(a), id(b)
+        ans = self._operations.get(key, None)
+        if ans is not None:
+            return ans[2]
+        if op == '*':
+            pint_unit = a[2] * b[2]
+        elif op == '/':
+            pint_unit = a[2] / b[2]
+        else:
+            pint_unit = a[2] ** b
+        # these operations can create a quantity, but we want a pint
+        # unit object
+        if hasattr(pint_unit, 'units'):
+            pint_unit = pint_unit.units
+        ans = self._record(pint_unit)
+        self._operations[key] = a, b, ans
+        return ans
+
+    def _equivalent_pint_units(self, a, b):
+        """Return True if the units records `a` and `b` are equivalent"""
+        if a is b:
+            return True
+        if a[0] != b[0]:
+            dims_a = dict(a[0])
+            dims_b = dict(b[0])
+            for key in dims_a.keys() | dims_b.keys():
+                if self._rel_diff(dims_a.get(key, 0), dims_b.get(key, 0)) >= self._tol:
+                    return False
+        return self._rel_diff(a[1], b[1]) <= self._tol
+
+    def _equivalent_to_dimensionless(self, a):
+        """Return True if the units record `a` is dimensionless"""
+        if a is self._dimensionless:
+            return True
+        return not a[0] and self._rel_diff(a[1], 1.0) <= self._tol
 
     def _get_unit_for_equivalent_children(self, node, child_units):
         """
@@ -458,11 +551,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         # TODO: This may be expensive for long summations and, in the
         # case of reporting only, we may want to skip the checks
@@ -470,17 +563,17 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
 
         # verify that the pint units are equivalent from each
         # of the child nodes - assume that PyomoUnits are equivalent
-        pint_unit_0 = child_units[0]
-        for pint_unit_i in child_units:
-            if not self._equivalent_pint_units(pint_unit_0, pint_unit_i):
+        unit_0 = child_units[0]
+        for unit_i in child_units:
+            if unit_i is not unit_0 and not self._equivalent_pint_units(unit_0, unit_i):
                 raise InconsistentUnitsError(
-                    pint_unit_0,
-                    pint_unit_i,
+                    unit_0[2],
+                    unit_i[2],
                     'Error in units found in expression: %s' % (node,),
                 )
 
         # checks were OK, return the first one in the list
-        return pint_unit_0
+        return unit_0
 
     def _get_unit_for_product(self, node, child_units):
         """
@@ -493,20 +586,14 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 2
-
-        pint_unit = child_units[0] * child_units[1]
-
-        if hasattr(pint_unit, 'units'):
-            return pint_unit.units
-
-        return pint_unit
+        return self._operation('*', child_units[0], child_units[1])
 
     def _get_unit_for_division(self, node, child_units):
         """
@@ -519,16 +606,14 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 2
-
-        # this operation can create a quantity, but we want a pint unit object
-        return child_units[0] / child_units[1]
+        return self._operation('/', child_units[0], child_units[1])
 
     def _get_unit_for_pow(self, node, child_units):
         """
@@ -541,11 +626,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 2
 
@@ -560,21 +645,21 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         # common case - exponent is a constant number
         exponent = node.args[1]
         if type(exponent) in nonpyomo_leaf_types:
-            return child_units[0] ** value(exponent)
+            return self._operation('**', child_units[0], value(exponent))
 
         # if base is dimensioness, exponent doesn't matter
         if self._equivalent_to_dimensionless(child_units[0]):
-            return self._pint_dimensionless
+            return self._dimensionless
 
         # base is not dimensionless, exponent is dimensionless
         # ensure that the exponent is fixed
         if not exponent.is_fixed():
             raise UnitsError(
-                f"The base of an exponent has units {child_units[0]}, but "
+                f"The base of an exponent has units {child_units[0][2]}, but "
                 "the exponent is not a fixed numerical value."
             )
 
-        return child_units[0] ** value(exponent)
+        return self._operation('**', child_units[0], value(exponent))
 
     def _get_unit_for_single_child(self, node, child_units):
         """
@@ -587,11 +672,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 1
         return child_units[0]
@@ -609,33 +694,33 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         # get the list of arg_units
         arg_units = node.get_arg_units()
-        dless = self._pint_dimensionless
+        get_pint_units = self._pyomo_units_container._get_pint_units
         if arg_units is None:
             # they should all be dimensionless
-            arg_units = [dless] * len(child_units)
+            arg_units = [self._dimensionless] * len(child_units)
         else:
             # copy arg_units so we don't overwrite the ones in the expression object
-            arg_units = list(arg_units)
-            for i, a in enumerate(arg_units):
-                arg_units[i] = self._pyomo_units_container._get_pint_units(a)
+            arg_units = [self._record(get_pint_units(a)) for a in arg_units]
 
-        for arg_unit, pint_unit in zip(arg_units, child_units):
-            assert arg_unit is not None
-            if not self._equivalent_pint_units(arg_unit, pint_unit):
+        for arg_unit, unit in zip(arg_units, child_units):
+            assert arg_unit[2] is not None
+            if not self._equivalent_pint_units(arg_unit, unit):
                 raise InconsistentUnitsError(
-                    arg_unit, pint_unit, 'Inconsistent units found in ExternalFunction.'
+                    arg_unit[2],
+                    unit[2],
+                    'Inconsistent units found in ExternalFunction.',
                 )
 
         # now return the units in node.get_units
-        return self._pyomo_units_container._get_pint_units(node.get_units())
+        return self._record(get_pint_units(node.get_units()))
 
     def _get_dimensionless_with_dimensionless_children(self, node, child_units):
         """
@@ -648,20 +733,20 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
-        for pint_unit in child_units:
-            if not self._equivalent_to_dimensionless(pint_unit):
+        for unit in child_units:
+            if not self._equivalent_to_dimensionless(unit):
                 raise UnitsError(
                     f'Expected no units or dimensionless units in {node}, '
-                    f'but found {pint_unit}.'
+                    f'but found {unit[2]}.'
                 )
 
-        return self._pint_dimensionless
+        return self._dimensionless
 
     def _get_dimensionless_no_children(self, node, child_units):
         """
@@ -674,16 +759,16 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 0
         # may need more checks for dimensionless for other types
         assert type(node) is IndexTemplate
-        return self._pint_dimensionless
+        return self._dimensionless
 
     def _get_unit_for_unary_function(self, node, child_units):
         """
@@ -697,11 +782,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 1
         func_name = node.getname()
@@ -726,11 +811,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 3
 
@@ -738,8 +823,8 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         # already checked)
         if not self._equivalent_pint_units(child_units[1], child_units[2]):
             raise InconsistentUnitsError(
-                child_units[1],
-                child_units[2],
+                child_units[1][2],
+                child_units[2][2],
                 'Error in units found in expression: %s' % (node,),
             )
 
@@ -758,25 +843,26 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 1
 
         if self._equivalent_to_dimensionless(child_units[0]):
-            return self._pint_dimensionless
+            return self._dimensionless
         if self._equivalent_pint_units(
-            child_units[0], self._pyomo_units_container._pint_registry.radian
+            child_units[0],
+            self._record(self._pyomo_units_container._pint_registry.radian),
         ):
-            return self._pint_dimensionless
+            return self._dimensionless
 
         # units are not None, dimensionless, or radians
         raise UnitsError(
             'Expected radians or dimensionless in argument to function '
-            'in expression %s, but found %s' % (node, child_units[0])
+            'in expression %s, but found %s' % (node, child_units[0][2])
         )
 
     def _get_radians_with_dimensionless_child(self, node, child_units):
@@ -791,20 +877,20 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 1
 
         if self._equivalent_to_dimensionless(child_units[0]):
-            return self._pyomo_units_container._pint_registry.radian
+            return self._record(self._pyomo_units_container._pint_registry.radian)
 
         raise UnitsError(
             f'Expected dimensionless argument to function in expression {node},'
-            f' but found {child_units[0]}'
+            f' but found {child_units[0][2]}'
         )
 
     def _get_unit_sqrt(self, node, child_units):
@@ -818,14 +904,14 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             The parent node of the children
 
         child_units : list
-           This is a list of pint units (one for each of the children)
+           This is a list of units records (one for each of the children)
 
         Returns
         -------
-        : pint unit
+        : units record
         """
         assert len(child_units) == 1
-        return child_units[0] ** 0.5
+        return self._operation('**', child_units[0], 0.5)
 
     node_type_method_map = {
         EXPR.EqualityExpression: _get_unit_for_equivalent_children,
@@ -884,7 +970,9 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         # Refresh the cached dimensionless (in case the underlying pint
         # registry was either changed or had not been set when the
         # PyomoUnitsContainer was originally created).
-        self._pint_dimensionless = self._pyomo_units_container._pint_dimensionless
+        self._dimensionless = self._record(
+            self._pyomo_units_container._pint_dimensionless
+        )
         walk, result = self.beforeChild(None, expr, 0)
         if not walk:
             result = self.finalizeResult(result)
@@ -893,21 +981,40 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
     def beforeChild(self, node, child, child_idx):
         ctype = child.__class__
         if ctype in native_types:
-            return False, self._pint_dimensionless
+            return False, self._dimensionless
 
         if child.is_expression_type():
+            if self._cache is not None and child.is_named_expression_type():
+                ans = self._cache.get(id(child), None)
+                if ans is not None:
+                    return False, ans[1]
             return True, None
 
         # this is a leaf, but not a native type
         if ctype is _PyomoUnit:
-            return False, child._get_pint_unit()
+            pyomo_unit = child
         elif hasattr(child, 'get_units'):
             # might want to add other common types here
             pyomo_unit = child.get_units()
-            pint_unit = self._pyomo_units_container._get_pint_units(pyomo_unit)
-            return False, pint_unit
-
-        return False, self._pint_dimensionless
+            if pyomo_unit is None:
+                return False, self._dimensionless
+        else:
+            return False, self._dimensionless
+
+        cache = self._cache
+        if cache is not None:
+            ans = cache.get(id(pyomo_unit), None)
+            if ans is not None:
+                return False, ans[1]
+        if pyomo_unit.__class__ is _PyomoUnit:
+            # Most components store their units as a _PyomoUnit:
+            # avoid walking the (trivial) units expression
+            ans = self._record(pyomo_unit._pint_unit)
+        else:
+            ans = self._record(self._pyomo_units_container._get_pint_units(pyomo_unit))
+        if cache is not None:
+            cache[id(pyomo_unit)] = pyomo_unit, ans
+        return False, ans
 
     def exitNode(self, node, data):
         """Visitor callback when moving up the expression tree.
@@ -927,8 +1034,10 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
             hasattr(node, 'is_named_expression_type')
             and node.is_named_expression_type()
         ):
-            pint_unit = self._get_unit_for_single_child(node, data)
-            return pint_unit
+            unit = self._get_unit_for_single_child(node, data)
+            if self._cache is not None:
+                self._cache[id(node)] = (node, unit)
+            return unit
 
         raise TypeError(
             f'An unhandled expression node type: {type(node)} was encountered '
@@ -936,10 +1045,11 @@ class PintUnitExtractionVisitor(EXPR.StreamBasedExpressionVisitor):
         )
 
     def finalizeResult(self, result):
-        if hasattr(result, 'units'):
+        pint_unit = result[2]
+        if hasattr(pint_unit, 'units'):
             # likely, we got a quantity object and not a units object
-            return result.units
-        return result
+            return pint_unit.units
+        return pint_unit
 
 
 class PyomoUnitsContainer(object):
@@ -977,6 +1087,9 @@ class PyomoUnitsContainer(object):
             self._pint_dimensionless = None
         else:
             self._pint_dimensionless = self._pint_registry.dimensionless
+        # Map of pint unit to its (scale factor, dimensionality) in base
+        # units (see _get_base_units)
+        self._base_units_cache = {}
         self._pintUnitExtractionVisitor = PintUnitExtractionVisitor(self)
 
     def load_definitions_from_file(self, definition_file):
@@ -1160,26 +1273,44 @@ class PyomoUnitsContainer(object):
             scale = 1.0
         return abs(a - b) / scale
 
+    def _get_base_units(self, a):
+        """Return the (scale factor, dimensionality) of a pint unit
+
+        The dimensionality is returned as a dict mapping base dimensions
+        to their exponents.  As resolving base units through pint is
+        expensive, the results are cached (by pint unit).
+
+        """
+        try:
+            return self._base_units_cache[a]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable (e.g., a pint Quantity with an array magnitude)
+            base = self._pint_registry.get_base_units(a)
+            return base[0], dict(base[1].dimensionality)
+        base = self._pint_registry.get_base_units(a)
+        ans = self._base_units_cache[a] = (base[0], dict(base[1].dimensionality))
+        return ans
+
     def _equivalent_pint_units(self, a, b, TOL=1e-12):
         if a is b or a == b:
             return True
-        base_a = self._pint_registry.get_base_units(a)
-        base_b = self._pint_registry.get_base_units(b)
-        if base_a[1] != base_b[1]:
-            uc_a = base_a[1].dimensionality
-            uc_b = base_b[1].dimensionality
+        scale_a, uc_a = self._get_base_units(a)
+        scale_b, uc_b = self._get_base_units(b)
+        if uc_a != uc_b:
             for key in uc_a.keys() | uc_b.keys():
                 if self._rel_diff(uc_a.get(key, 0), uc_b.get(key, 0)) >= TOL:
                     return False
-        return self._rel_diff(base_a[0], base_b[0]) <= TOL
+        return self._rel_diff(scale_a, scale_b) <= TOL
 
     def _equivalent_to_dimensionless(self, a, TOL=1e-12):
         if a is self._pint_dimensionless or a == self._pint_dimensionless:
             return True
-        base_a = self._pint_registry.get_base_units(a)
-        if not base_a[1].dimensionless:
+        scale_a, uc_a = self._get_base_units(a)
+        if uc_a:
             return False
-        return self._rel_diff(base_a[0], 1.0) <= TOL
+        return self._rel_diff(scale_a, 1.0) <= TOL
 
     def _get_pint_units(self, expr):
         """
@@ -1221,6 +1352,40 @@ class PyomoUnitsContainer(object):
         """
         return _PyomoUnit(self._get_pint_units(expr), self._pint_registry)
 
+    @contextmanager
+    def units_cache(self):
+        """Context manager to cache units while checking many expressions
+
+        Within this context, the units of named expressions (e.g.,
+        Expression components) are only determined once, and then
+        reused for every expression that references them.  This can
+        dramatically speed up checking models where named expressions
+        are shared by many constraints.  The model should not be
+        modified within this context.  Nested contexts reuse the
+        outermost cache.
+
+        .. doctest::
+            :skipif: not pint_available
+
+            >>> from pyomo.environ import ConcreteModel, Var, Expression, units as u
+            >>> m = ConcreteModel()
+            >>> m.x = Var(units=u.m)
+            >>> m.e = Expression(expr=m.x**2)
+            >>> with u.units_cache():
+            ...     print(u.get_units(m.e + 1*u.m**2), u.get_units(m.e / m.x))
+            m**2 m
+
+        """
+        visitor = self._pintUnitExtractionVisitor
+        if visitor._cache is not None:
+            yield
+            return
+        visitor._cache = {}
+        try:
+            yield
+        finally:
+            visitor._cache = None
+
     def _pint_convert_temp_from_to(
         self, numerical_value, pint_from_units, pint_to_units
     ):
@@ -1393,6 +1558,7 @@ class PyomoUnitsContainer(object):
             )
         self._pint_registry = pint_registry
         self._pint_dimensionless = self._pint_registry.dimensionless
+        self._base_units_cache = {}
 
     @property
     def pint_registry(self):
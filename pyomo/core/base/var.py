@@ -10,12 +10,14 @@
 #  ___________________________________________________________________________
 
 from __future__ import annotations
+import itertools
 import logging
 import sys
 from pyomo.common.pyomo_typing import overload
-from weakref import ref as weakref_ref
+from weakref import ref as weakref_ref, WeakValueDictionary
 from typing import Union, Type
 
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -29,10 +31,13 @@ from pyomo.core.expr.numvalue import (
     value,
     is_potentially_variable,
     native_numeric_types,
+    native_integer_types,
 )
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.disable_methods import disable_methods
+from pyomo.core.base.enums import SortComponents
+from pyomo.core.base.observer import _change_logs, notify_change
 from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set,
@@ -50,6 +55,9 @@ from pyomo.core.base.set import (
     SetInitializer,
     real_global_set_ids,
     integer_global_set_ids,
+    _appended_state,
+    _same_state,
+    _set_state,
 )
 from pyomo.core.base.units_container import units
 
@@ -58,6 +66,8 @@ logger = logging.getLogger('pyomo.core')
 _inf = float('inf')
 _ninf = -_inf
 _nonfinite_values = {_inf, _ninf}
+# Integers that can be stored exactly in a float64
+_max_exact_int = 2**53
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
     + [(_, False) for _ in integer_global_set_ids]
@@ -187,6 +197,8 @@ class VarData(ComponentData, NumericValue):
 
         self._value = val
         self._stale = StaleFlagManager.get_flag(self._stale)
+        if _change_logs and self._fixed:
+            notify_change(self)
 
     @property
     def value(self):
@@ -212,6 +224,8 @@ class VarData(ComponentData, NumericValue):
             self._domain = SetInitializer(domain)(
                 self.parent_block(), self.index(), self
             )
+            if _change_logs:
+                notify_change(self)
         except:
             logger.error(
                 "%s is not a valid domain. Variable domains must be an "
@@ -382,6 +396,8 @@ class VarData(ComponentData, NumericValue):
     @lower.setter
     def lower(self, val):
         self._lb = self._process_bound(val, 'lower')
+        if _change_logs:
+            notify_change(self)
 
     @property
     def upper(self):
@@ -407,6 +423,8 @@ class VarData(ComponentData, NumericValue):
     @upper.setter
     def upper(self, val):
         self._ub = self._process_bound(val, 'upper')
+        if _change_logs:
+            notify_change(self)
 
     def get_units(self):
         """Return the units for this variable entry."""
@@ -450,6 +468,8 @@ class VarData(ComponentData, NumericValue):
     @fixed.setter
     def fixed(self, val):
         self._fixed = bool(val)
+        if _change_logs:
+            notify_change(self)
 
     @property
     def stale(self):
@@ -580,6 +600,520 @@ class _GeneralVarData(metaclass=RenamedClass):
     __renamed__version__ = '6.7.2'
 
 
+class _ArrayVarStorage(object):
+    """Columnar (numpy array) storage for the elements of an IndexedVar
+
+    This holds the state of every element of an IndexedVar declared
+    with ``storage='array'``.  Elements are stored in the order of the
+    (ordered) index set: element `i` is the ``i+1``-th member of the
+    index set, so the storage does not duplicate the index.  Each
+    element stores its value, lower bound, and upper bound as float64
+    (where NaN represents None), the fixed flag as a bool, the stale
+    flag as an int64, and the domain as an int32 code into
+    :attr:`domains`.  Bounds that are not native numeric values (e.g.,
+    expressions involving mutable Params) are stored in the
+    :attr:`lb_expr` and :attr:`ub_expr` dicts (keyed by position).
+
+    So that array-backed elements behave (and are written) the same as
+    VarData objects, the :attr:`value_int`, :attr:`lb_int`, and
+    :attr:`ub_int` flags record values that were set as (exactly
+    representable) integers, which are returned as ``int``.
+
+    """
+
+    __slots__ = (
+        'index_set',
+        'state',
+        'value',
+        'lb',
+        'ub',
+        'value_int',
+        'lb_int',
+        'ub_int',
+        'lb_expr',
+        'ub_expr',
+        'fixed',
+        'stale',
+        'domain',
+        'domains',
+        'domain_codes',
+    )
+
+    def __init__(self, index_set, n=0):
+        self.index_set = index_set
+        self.state = _set_state(index_set)
+        self.value = np.full(n, np.nan)
+        self.lb = np.full(n, np.nan)
+        self.ub = np.full(n, np.nan)
+        self.value_int = np.zeros(n, dtype=bool)
+        self.lb_int = np.zeros(n, dtype=bool)
+        self.ub_int = np.zeros(n, dtype=bool)
+        self.lb_expr = {}
+        self.ub_expr = {}
+        self.fixed = np.zeros(n, dtype=bool)
+        self.stale = np.zeros(n, dtype=np.int64)
+        self.domain = np.zeros(n, dtype=np.int32)
+        self.domains = []
+        self.domain_codes = {}
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getstate__(self):
+        # The stale flags are only meaningful within this process, so
+        # (like VarData) we store the stale state as a bool
+        return (
+            self.index_set,
+            self.value,
+            self.lb,
+            self.ub,
+            self.value_int,
+            self.lb_int,
+            self.ub_int,
+            self.lb_expr,
+            self.ub_expr,
+            self.fixed,
+            StaleFlagManager.is_stale(self.stale),
+            self.domain,
+            self.domains,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.index_set,
+            self.value,
+            self.lb,
+            self.ub,
+            self.value_int,
+            self.lb_int,
+            self.ub_int,
+            self.lb_expr,
+            self.ub_expr,
+            self.fixed,
+            stale,
+            self.domain,
+            self.domains,
+        ) = state
+        # The index set may not be completely restored yet: the state
+        # is recorded the next time the index set is checked
+        self.state = None
+        self.stale = np.where(stale, 0, StaleFlagManager.get_flag(0))
+        self.domain_codes = {id(d): code for code, d in enumerate(self.domains)}
+
+    def check_index_set(self, var):
+        """Verify that the members of the index set were not reordered
+
+        Elements are located by their position in the index set, so
+        the only supported modification of the index set after the
+        storage is created is adding new members at the end.
+
+        """
+        state = _set_state(self.index_set)
+        if self.state is None or state is None or _same_state(state, self.state):
+            self.state = state
+            return
+        if _appended_state(self.index_set, self.state, state, len(self)):
+            # The index set members were only appended
+            self.state = state
+            return
+        raise RuntimeError(
+            "The index set of Var '%s' (declared with storage='array') was "
+            "modified after the Var was constructed.  Only adding members "
+            "to the end of an ordered index set is supported." % (var.name,)
+        )
+
+    def domain_code(self, domain):
+        """Return the code used to store `domain` in :attr:`domain`"""
+        code = self.domain_codes.get(id(domain))
+        if code is None:
+            code = self.domain_codes[id(domain)] = len(self.domains)
+            self.domains.append(domain)
+        return code
+
+    def extend(self, n):
+        """Add storage for (uninitialized) elements up to position `n`"""
+        k = n - len(self)
+        self.value = np.append(self.value, np.full(k, np.nan))
+        self.lb = np.append(self.lb, np.full(k, np.nan))
+        self.ub = np.append(self.ub, np.full(k, np.nan))
+        self.value_int = np.append(self.value_int, np.zeros(k, dtype=bool))
+        self.lb_int = np.append(self.lb_int, np.zeros(k, dtype=bool))
+        self.ub_int = np.append(self.ub_int, np.zeros(k, dtype=bool))
+        self.fixed = np.append(self.fixed, np.zeros(k, dtype=bool))
+        self.stale = np.append(self.stale, np.zeros(k, dtype=np.int64))
+        self.domain = np.append(self.domain, np.zeros(k, dtype=np.int32))
+
+    def broadcast(self, pos, fields):
+        """Copy the `fields` of the element at `pos` to every element"""
+        for name in fields:
+            if name in ('lb', 'ub'):
+                expr_map = getattr(self, name + '_expr')
+                if pos in expr_map:
+                    val = expr_map[pos]
+                    expr_map.update((i, val) for i in range(len(self)))
+            if name in ('value', 'lb', 'ub'):
+                arr = getattr(self, name + '_int')
+                arr[:] = arr[pos]
+            arr = getattr(self, name)
+            arr[:] = arr[pos]
+
+
+def _is_exact_int(val):
+    # Return True if val is an integer that can be stored (exactly) as
+    # a float64 (and should be returned as an int)
+    return (
+        val.__class__ in native_integer_types
+        and -_max_exact_int <= val <= _max_exact_int
+    )
+
+
+def _array_native_values(vals, ints):
+    # Return the list of native values from a float array (where NaN is
+    # None) and the corresponding bool array of integer flags
+    return [
+        None if val != val else int(val) if is_int else val
+        for val, is_int in zip(vals.tolist(), ints.tolist())
+    ]
+
+
+class _ArrayVarData(VarData):
+    """A VarData view of one element of an array-backed IndexedVar
+
+    The element state is read from (and written to) the
+    :class:`_ArrayVarStorage` owned by the IndexedVar.  Views are
+    created on demand, and the IndexedVar only holds weak references
+    to them: a view is reused for as long as anything (e.g., an
+    expression or a ComponentMap) references it, so there is a single
+    object for each variable, but the views of unreferenced elements
+    do not accumulate in memory.
+
+    """
+
+    __slots__ = ('_store', '_pos')
+
+    def __init__(self, component, store, pos):
+        self._component = weakref_ref(component)
+        self._index = NOTSET
+        self._store = store
+        self._pos = pos
+
+    def __getstate__(self):
+        return [self.parent_component(), self._index, self._store, self._pos]
+
+    def __setstate__(self, state):
+        component, self._index, self._store, self._pos = state
+        self._component = None if component is None else weakref_ref(component)
+
+    @property
+    def _value(self):
+        store = self._store
+        val = store.value.item(self._pos)
+        if val != val:
+            return None
+        if store.value_int[self._pos]:
+            return int(val)
+        return val
+
+    @_value.setter
+    def _value(self, val):
+        store = self._store
+        store.value[self._pos] = np.nan if val is None else val
+        store.value_int[self._pos] = _is_exact_int(val)
+
+    @property
+    def _lb(self):
+        store = self._store
+        val = store.lb.item(self._pos)
+        if val != val:
+            return store.lb_expr.get(self._pos, None)
+        if store.lb_int[self._pos]:
+            return int(val)
+        return val
+
+    @_lb.setter
+    def _lb(self, val):
+        store = self._store
+        if val is None or val.__class__ in native_numeric_types:
+            store.lb[self._pos] = np.nan if val is None else val
+            store.lb_int[self._pos] = _is_exact_int(val)
+            store.lb_expr.pop(self._pos, None)
+        else:
+            store.lb[self._pos] = np.nan
+            store.lb_int[self._pos] = False
+            store.lb_expr[self._pos] = val
+
+    @property
+    def _ub(self):
+        store = self._store
+        val = store.ub.item(self._pos)
+        if val != val:
+            return store.ub_expr.get(self._pos, None)
+        if store.ub_int[self._pos]:
+            return int(val)
+        return val
+
+    @_ub.setter
+    def _ub(self, val):
+        store = self._store
+        if val is None or val.__class__ in native_numeric_types:
+            store.ub[self._pos] = np.nan if val is None else val
+            store.ub_int[self._pos] = _is_exact_int(val)
+            store.ub_expr.pop(self._pos, None)
+        else:
+            store.ub[self._pos] = np.nan
+            store.ub_int[self._pos] = False
+            store.ub_expr[self._pos] = val
+
+    @property
+    def _domain(self):
+        store = self._store
+        return store.domains[store.domain[self._pos]]
+
+    @_domain.setter
+    def _domain(self, val):
+        self._store.domain[self._pos] = self._store.domain_code(val)
+
+    @property
+    def _fixed(self):
+        return bool(self._store.fixed[self._pos])
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._store.fixed[self._pos] = val
+
+    @property
+    def _stale(self):
+        return int(self._store.stale[self._pos])
+
+    @_stale.setter
+    def _stale(self, val):
+        self._store.stale[self._pos] = val
+
+
+class _ArrayVarCursor(_ArrayVarData):
+    """A temporary view used to update the array storage in bulk
+
+    Cursors are not recorded in the owning IndexedVar (and may be moved
+    between elements by updating :attr:`_pos` and :attr:`_index`).
+
+    """
+
+    __slots__ = ()
+
+    def index(self):
+        return self._index
+
+
+def _group_array_views(var_list):
+    """Group the elements of array-backed Vars in `var_list` by storage
+
+    Returns a list of ``(store, indices, positions)`` tuples (where
+    `indices` are the positions of the views in `var_list` and
+    `positions` are their positions in `store`) and the list of the
+    positions of all other variables in `var_list`.
+
+    """
+    arrays = {}
+    others = []
+    store = None
+    for i, v in enumerate(var_list):
+        if v.__class__ is not _ArrayVarData:
+            others.append(i)
+            continue
+        if v._store is not store:
+            # Note: elements of the same Var are usually contiguous
+            store = v._store
+            if id(store) not in arrays:
+                arrays[id(store)] = (store, [], [])
+            idx, pos = arrays[id(store)][1:]
+        idx.append(i)
+        pos.append(v._pos)
+    return [
+        (store, idx, np.array(pos, dtype=np.intp))
+        for store, idx, pos in arrays.values()
+    ], others
+
+
+def _var_values(var_list):
+    """Return the list of the values of the variables in `var_list`
+
+    This is the bulk equivalent of ``[v.value for v in var_list]``: the
+    values of elements of array-backed Vars are read directly from the
+    array storage.
+
+    """
+    arrays, others = _group_array_views(var_list)
+    ans = [None] * len(var_list)
+    for store, idx, pos in arrays:
+        for i, val in zip(
+            idx, _array_native_values(store.value[pos], store.value_int[pos])
+        ):
+            ans[i] = val
+    for i in others:
+        ans[i] = var_list[i].value
+    return ans
+
+
+def _var_bounds(var_list):
+    """Return the list of the bounds of the variables in `var_list`
+
+    This is the bulk equivalent of ``[v.bounds for v in var_list]``: the
+    bounds of elements of array-backed Vars are computed directly from
+    the array storage (calling ``domain.bounds()`` once per domain).
+
+    """
+    arrays, others = _group_array_views(var_list)
+    ans = [None] * len(var_list)
+    for store, idx, pos in arrays:
+        domain_bounds = [d.bounds() for d in store.domains]
+        lb_expr = store.lb_expr
+        ub_expr = store.ub_expr
+        for i, p, lb, ub, code in zip(
+            idx,
+            pos.tolist(),
+            _array_native_values(store.lb[pos], store.lb_int[pos]),
+            _array_native_values(store.ub[pos], store.ub_int[pos]),
+            store.domain[pos].tolist(),
+        ):
+            if (
+                lb in _nonfinite_values
+                or ub in _nonfinite_values
+                or (lb is None and p in lb_expr)
+                or (ub is None and p in ub_expr)
+            ):
+                # Expressions and non-finite values are handled (and
+                # validated) by VarData.bounds
+                ans[i] = var_list[i].bounds
+                continue
+            domain_lb, domain_ub = domain_bounds[code]
+            if lb is None:
+                lb = domain_lb
+            elif domain_lb is not None:
+                lb = max(lb, domain_lb)
+            if ub is None:
+                ub = domain_ub
+            elif domain_ub is not None:
+                ub = min(ub, domain_ub)
+            ans[i] = lb, ub
+    for i in others:
+        ans[i] = var_list[i].bounds
+    return ans
+
+
+def _load_var_values(var_list, values):
+    """Set the values of the variables in `var_list` (without validation)
+
+    This is the bulk equivalent of calling ``v.set_value(val,
+    skip_validation=True)`` for each variable (as is done when loading
+    solutions).  Native numeric values for elements of array-backed Vars
+    are written directly into the array storage.
+
+    """
+    var_list = list(var_list)
+    values = list(values)
+    arrays, others = _group_array_views(var_list)
+    for store, idx, pos in arrays:
+        vals = [values[i] for i in idx]
+        if not all(
+            val is None or val.__class__ in native_numeric_types for val in vals
+        ):
+            others.extend(idx)
+            continue
+        store.value_int[pos] = [_is_exact_int(val) for val in vals]
+        vals = np.array(vals, dtype=float)
+        store.value[pos] = vals
+        # Note: passing the most recent flag correctly advances a
+        # "delayed" global stale flag
+        flag = StaleFlagManager.get_flag(int(store.stale[pos].max()))
+        store.stale[pos] = np.where(np.isnan(vals), 0, flag)
+        if _change_logs:
+            # VarData.set_value() only reports changes to fixed variables
+            for i in idx:
+                if var_list[i].fixed:
+                    notify_change(var_list[i])
+    for i in others:
+        var_list[i].set_value(values[i], skip_validation=True)
+
+
+def _array_in_domain(domain, vals):
+    """Return a mask of the elements of `vals` (a float array) in `domain`
+
+    Domains that are regular continuous or integer intervals are tested
+    without calling ``domain.__contains__`` for each value.  Note that
+    the vectorized test is exact (no tolerance), so it may report values
+    that the domain would accept as being outside the domain.
+
+    """
+    interval = domain.get_interval() if hasattr(domain, 'get_interval') else None
+    if interval is None or interval[2] not in (0, 1):
+        return np.fromiter(
+            (val in domain for val in vals.tolist()), dtype=bool, count=len(vals)
+        )
+    lb, ub, step = interval
+    ans = np.ones(len(vals), dtype=bool)
+    if lb is not None:
+        ans &= vals >= lb
+    if ub is not None:
+        ans &= vals <= ub
+    if step:
+        offset = vals - (lb if lb is not None else ub if ub is not None else 0)
+        ans &= offset == np.floor(offset)
+    return ans
+
+
+class _ArrayVarViewDict(WeakValueDictionary):
+    """The (weakly referenced) views of the elements of an array-backed Var
+
+    Python dicts do not release memory as items are removed, so the
+    underlying dict is rebuilt once most of the views that it held
+    (e.g., the views created while writing a model) have been removed.
+
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._capacity = len(self.data)
+        remove = self._remove
+
+        def _remove(wr, selfref=weakref_ref(self)):
+            self = selfref()
+            if self is None:
+                return
+            # The dict is largest just before views start being removed
+            self._capacity = max(self._capacity, len(self.data))
+            remove(wr)
+            if (
+                not self._iterating
+                and self._capacity > 256
+                and 4 * len(self.data) < self._capacity
+            ):
+                self.data = dict(self.data)
+                self._capacity = len(self.data)
+
+        self._remove = _remove
+
+
+class _ArrayVarViews(list):
+    """The (index, view) pairs of the views of an array-backed Var
+
+    This is how the (weakly referenced) views are stored in the state
+    of the Var (see :func:`_array_views_mapper`).
+
+    """
+
+    __slots__ = ()
+
+
+def _array_views_mapper(encode, val):
+    """__autoslot_mappers__ mapper for the views of array-backed Vars"""
+    if encode:
+        if val.__class__ is _ArrayVarViewDict:
+            return _ArrayVarViews(val.items())
+    elif val.__class__ is _ArrayVarViews:
+        return _ArrayVarViewDict(val)
+    return val
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
     """A numeric variable, which may be defined over an index.
@@ -599,6 +1133,13 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             :meth:`index_set` when constructing the Var (True) or just the
             variables returned by ``initialize``/``rule`` (False).  Defaults
             to ``True``.
+        storage (str, optional): How the state of the elements of an
+            indexed Var is stored: ``'object'`` (a separate
+            :class:`VarData` object for each element) or ``'array'``
+            (numpy arrays owned by the Var, with :class:`VarData` views
+            created only when elements are accessed).  ``'array'``
+            requires a finite index set and ``dense=True``.  Defaults
+            to ``'object'``.
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
         name (str, optional): Name for this component.
@@ -606,6 +1147,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
     """
 
     _ComponentDataClass = VarData
+    __autoslot_mappers__ = {'_data': _array_views_mapper}
 
     @overload
     def __new__(cls: Type[Var], *args, **kwargs) -> Union[ScalarVar, IndexedVar]: ...
@@ -634,6 +1176,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         initialize=None,
         rule=None,
         dense=True,
+        storage='object',
         units=None,
         name=None,
         doc=None,
@@ -651,6 +1194,8 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         )
         _bounds_arg = kwargs.pop('bounds', None)
         self._dense = kwargs.pop('dense', True)
+        self._storage = kwargs.pop('storage', 'object')
+        self._array = None
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
@@ -668,19 +1213,53 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 "for scalar variables; converting to dense=True" % (self.name,)
             )
             self._dense = True
+        if self._storage != 'object':
+            if self._storage != 'array':
+                raise ValueError(
+                    "Unknown Var storage '%s' (expected 'object' or 'array')"
+                    % (self._storage,)
+                )
+            if not self.is_indexed() or not self._dense:
+                raise ValueError(
+                    "storage='array' is only supported for dense indexed "
+                    "Var components"
+                )
         self._rule_bounds = BoundInitializer(_bounds_arg, self)
 
     def flag_as_stale(self):
         """
         Set the 'stale' attribute of every variable data object to True.
         """
+        if self._array is not None:
+            self._array.stale[:] = 0  # True
+            return
         for var_data in self._data.values():
             var_data.stale = True
 
+    def _unfixed_items(self, sort=SortComponents.UNSORTED):
+        """Iterate over the (index, VarData) items that are not fixed
+
+        This is used by the writers to record the variables in this
+        component without creating VarData views for the fixed elements
+        of array-backed Vars.
+
+        """
+        return ((idx, v) for idx, v in self.items(sort) if not v.fixed)
+
     def get_values(self, include_fixed_values=True):
         """
         Return a dictionary of index-value pairs.
         """
+        if self._array is not None:
+            store = self._array
+            vals = _array_native_values(store.value, store.value_int)
+            if include_fixed_values:
+                return dict(zip(self.keys(), vals))
+            return {
+                idx: val
+                for idx, val, fixed in zip(self.keys(), vals, store.fixed)
+                if not fixed
+            }
         if include_fixed_values:
             return {idx: vardata.value for idx, vardata in self._data.items()}
         return {
@@ -747,7 +1326,9 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 )
                 self._dense = False
 
-            if self._rule_init is not None and self._rule_init.contains_indices():
+            if self._storage == 'array':
+                self._construct_array()
+            elif self._rule_init is not None and self._rule_init.contains_indices():
                 # Historically we have allowed Vars to be initialized by
                 # a sparse map (i.e., a dict containing only some of the
                 # keys).  We will wrap the incoming initializer to map
@@ -829,6 +1410,78 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         finally:
             timer.report()
 
+    def _construct_array(self):
+        """Initialize the array storage for an array-backed Var
+
+        This applies the domain, bounds, and initial value rules to
+        every index without creating the VarData views.
+
+        """
+        index_set = self.index_set()
+        if not index_set.isfinite() or not index_set.isordered():
+            raise ValueError(
+                "Var '%s': storage='array' requires a finite, ordered index set"
+                % (self.name,)
+            )
+        store = self._array = _ArrayVarStorage(index_set, len(index_set))
+        # The views of the elements are only weakly referenced (see
+        # _ArrayVarData)
+        self._data = _ArrayVarViewDict()
+        if not len(store):
+            return
+        block = self.parent_block()
+        # A (temporary) view used to validate and store each element
+        cursor = self._array_cursor()
+
+        if self._rule_domain.constant():
+            cursor._domain = self._rule_domain(block, cursor._index, self)
+            store.broadcast(0, ('domain',))
+        else:
+            for cursor._pos, cursor._index in enumerate(index_set):
+                cursor._domain = self._rule_domain(block, cursor._index, self)
+
+        call_bounds_rule = False
+        if self._rule_bounds is not None:
+            call_bounds_rule = not self._rule_bounds.constant()
+            for cursor._pos, cursor._index in enumerate(index_set):
+                lb, ub = self._rule_bounds(block, cursor._index)
+                cursor._lb = cursor._process_bound(lb, 'lower')
+                cursor._ub = cursor._process_bound(ub, 'upper')
+                if not call_bounds_rule:
+                    store.broadcast(0, ('lb', 'ub'))
+                    break
+
+        init = self._rule_init
+        if init is None:
+            return
+        if init.contains_indices():
+            # As with the standard construction, map KeyErrors from
+            # sparse initializers to None (for indices added later)
+            self._rule_init = DefaultInitializer(init, None, KeyError)
+            for index in init.indices():
+                pos = self._array_position(index)
+                if pos is None:
+                    index = self._validate_index(index)
+                    pos = self._array_position(index)
+                cursor._pos, cursor._index = pos, index
+                cursor.set_value(init(block, index))
+        elif init.constant() and self._rule_domain.constant() and not call_bounds_rule:
+            cursor.set_value(init(block, cursor._index))
+            store.broadcast(0, ('value', 'stale'))
+        else:
+            for cursor._pos, cursor._index in enumerate(index_set):
+                cursor.set_value(init(block, cursor._index))
+
+    def _array_cursor(self, pos=0):
+        """Return a (temporary) view of an element of the array storage
+
+        The returned cursor is not recorded in the component.
+
+        """
+        cursor = _ArrayVarCursor(self, self._array, pos)
+        cursor._index = self._index_set.at(pos + 1)
+        return cursor
+
     #
     # This method must be defined on subclasses of
     # IndexedComponent that support implicit definition
@@ -837,6 +1490,23 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         """Returns the default component data value."""
         if index is None and not self.is_indexed():
             obj = self._data[index] = self
+        elif self._array is not None:
+            store = self._array
+            # Note: the caller (__getitem__) has already verified that
+            # index is in the index set
+            store.check_index_set(self)
+            pos = self._index_set.ord(index) - 1
+            if pos < len(store):
+                # Materialize a view of an existing element
+                return self._array_view(index, pos)
+            # This index was added to the index set after the Var was
+            # constructed: add (and initialize) the elements for all
+            # indices added to the index set before this one, and then
+            # add this element
+            while len(store) < pos:
+                self._getitem_when_not_present(self._index_set.at(len(store) + 1))
+            store.extend(pos + 1)
+            obj = self._array_view(index, pos)
         else:
             obj = self._data[index] = self._ComponentDataClass(component=self)
         parent = self.parent_block()
@@ -876,7 +1546,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             headers.append(('Units', str(self._units)))
         return (
             headers,
-            self._data.items(),
+            self._data.items() if self._array is None else self.items(),
             ("Lower", "Value", "Upper", "Fixed", "Stale", "Domain"),
             lambda k, v: [
                 value(v.lb),
@@ -911,10 +1581,201 @@ class SimpleVar(metaclass=RenamedClass):
 class IndexedVar(Var):
     """An array of variables."""
 
+    def __len__(self):
+        if self._array is not None:
+            return len(self._array)
+        return len(self._data)
+
+    def is_reference(self):
+        if self._array is not None:
+            # Array-backed Vars own their data (_data only holds weak
+            # references to the views of the elements)
+            return False
+        return super().is_reference()
+
+    def __contains__(self, idx):
+        if self._array is not None:
+            pos = self._array_position(idx)
+            return pos is not None and pos < len(self._array)
+        return idx in self._data
+
+    def keys(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
+        store = self._array
+        if store is None:
+            return super().keys(sort, ordered)
+        store.check_index_set(self)
+        n = len(store)
+        if n == len(self._index_set):
+            return super().keys(sort, ordered)
+        # The index set was extended after this (array-backed) Var was
+        # constructed: only return the indices with storage (the first
+        # n members of the index set) in the order specified by sort
+        sort = SortComponents(sort)
+        if SortComponents.SORTED_INDICES in sort:
+            return (
+                idx
+                for idx in self._index_set.sorted_iter()
+                if self._index_set.ord(idx) <= n
+            )
+        return itertools.islice(self._index_set.ordered_iter(), n)
+
+    def values(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
+        if self._array is None:
+            return super().values(sort, ordered)
+        # The keys are known to be valid: bypass __getitem__ (and the
+        # index validation when creating views).  Unless they are
+        # sorted, the keys are returned in storage order.
+        keys = self.keys(sort, ordered)
+        if SortComponents.SORTED_INDICES in SortComponents(sort):
+            return map(self._array_view, keys)
+        return map(self._array_view, keys, itertools.count())
+
+    def items(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
+        if self._array is None:
+            return super().items(sort, ordered)
+        keys = self.keys(sort, ordered)
+        if SortComponents.SORTED_INDICES in SortComponents(sort):
+            return ((idx, self._array_view(idx)) for idx in keys)
+        return ((idx, self._array_view(idx, pos)) for pos, idx in enumerate(keys))
+
+    def _array_position(self, index):
+        # Return the position of index in the array storage (i.e., its
+        # position in the index set), or None if index is not in the
+        # index set
+        self._array.check_index_set(self)
+        if index not in self._index_set:
+            return None
+        return self._index_set.ord(index) - 1
+
+    def _array_view(self, index, pos=None):
+        # Return the (weakly cached) view of the element at index
+        obj = self._data.get(index, None)
+        if obj is None:
+            if pos is None:
+                pos = self._array_position(index)
+            obj = _ArrayVarData(self, self._array, pos)
+            obj._index = index
+            self._data[index] = obj
+        return obj
+
+    def _unfixed_items(self, sort=SortComponents.UNSORTED):
+        if self._array is None:
+            return super()._unfixed_items(sort)
+        # Read the fixed flags directly from the array storage, and only
+        # create views for the elements that are not fixed
+        fixed = self._array.fixed.tolist()
+        keys = self.keys(sort)
+        if SortComponents.SORTED_INDICES in SortComponents(sort):
+            positions = ((idx, self._array_position(idx)) for idx in keys)
+        else:
+            positions = zip(keys, itertools.count())
+        return (
+            (idx, self._array_view(idx, pos))
+            for idx, pos in positions
+            if not fixed[pos]
+        )
+
+    def __delitem__(self, index):
+        if self._array is not None:
+            raise TypeError(
+                "Cannot delete elements of Var '%s' declared with storage='array'"
+                % (self.name,)
+            )
+        super().__delitem__(index)
+
+    def _notify_array_views(self, positions=None):
+        # Notify the change logs that the (materialized) elements of an
+        # array-backed Var at the specified positions (default: all)
+        # were modified.  Elements without a view cannot be referenced
+        # by anything being observed.
+        if not _change_logs:
+            return
+        modified = list(self._data.values())
+        if positions is not None:
+            positions = set(positions.tolist())
+            modified = [v for v in modified if v._pos in positions]
+        for vardata in modified:
+            notify_change(vardata)
+
+    def _set_array_value(self, val, skip_validation=False):
+        # Set every element of an array-backed Var to val (converting
+        # val to a native value in the units of this Var, following
+        # VarData.set_value())
+        if val is None or val.__class__ in native_numeric_types:
+            pass
+        elif self._units is not None:
+            val = units.convert_value(
+                num_value=value(val),
+                from_units=units.get_units(val),
+                to_units=self._units,
+            )
+        else:
+            val = value(val)
+        self._set_array_values(
+            slice(None),
+            np.nan if val is None else val,
+            skip_validation,
+            _is_exact_int(val),
+        )
+
+    def _set_array_values(self, pos, vals, skip_validation=False, ints=False):
+        # Set the elements of an array-backed Var at positions pos to
+        # vals (a float scalar or array, where NaN is None).  If ints is
+        # True, the (integer) values are returned as ints.  The values
+        # are validated in bulk, and VarData.set_value() (through a
+        # materialized view) is only called for the elements that would
+        # generate warnings.
+        store = self._array
+        stale = store.stale[pos]
+        if not stale.size:
+            return
+        vals = np.broadcast_to(np.asarray(vals, dtype=float), stale.shape)
+        store.value[pos] = vals
+        store.value_int[pos] = ints
+        # Note: passing the most recent flag correctly advances a
+        # "delayed" global stale flag
+        flag = StaleFlagManager.get_flag(int(stale.max()))
+        store.stale[pos] = np.where(np.isnan(vals), 0, flag)
+        positions = np.arange(len(store))[pos]
+        if not skip_validation:
+            suspect = self._array_suspect(pos, vals)
+            for k in np.flatnonzero(suspect).tolist():
+                p = int(positions[k])
+                view = self._array_view(self._index_set.at(p + 1), p)
+                view.set_value(int(vals[k]) if ints else float(vals[k]))
+        if _change_logs:
+            # VarData.set_value() only reports changes to fixed variables
+            self._notify_array_views(positions[store.fixed[pos]])
+
+    def _array_suspect(self, pos, vals):
+        # Return a mask of the elements (at positions pos) where setting
+        # vals could generate a domain or bounds warning
+        store = self._array
+        with np.errstate(invalid='ignore'):
+            suspect = (vals < store.lb[pos]) | (vals > store.ub[pos])
+        codes = store.domain[pos]
+        for code, domain in enumerate(store.domains):
+            mask = codes == code
+            if mask.any():
+                suspect[mask] |= ~_array_in_domain(domain, vals[mask])
+        if store.lb_expr or store.ub_expr:
+            # Bounds that are expressions are checked by VarData
+            has_expr = np.zeros(len(store), dtype=bool)
+            has_expr[list(store.lb_expr)] = True
+            has_expr[list(store.ub_expr)] = True
+            suspect |= has_expr[pos]
+        suspect &= ~np.isnan(vals)
+        return suspect
+
     def setlb(self, val):
         """
         Set the lower bound for this variable.
         """
+        if self._array is not None:
+            cursor = self._array_cursor()
+            cursor._lb = cursor._process_bound(val, 'lower')
+            self._array.broadcast(0, ('lb',))
+            return self._notify_array_views()
         for vardata in self.values():
             vardata.lower = val
 
@@ -922,6 +1783,11 @@ class IndexedVar(Var):
         """
         Set the upper bound for this variable.
         """
+        if self._array is not None:
+            cursor = self._array_cursor()
+            cursor._ub = cursor._process_bound(val, 'upper')
+            self._array.broadcast(0, ('ub',))
+            return self._notify_array_views()
         for vardata in self.values():
             vardata.upper = val
 
@@ -934,6 +1800,11 @@ class IndexedVar(Var):
         :meth:`set_value`.
 
         """
+        if self._array is not None:
+            if value is not NOTSET:
+                self._set_array_value(value, skip_validation)
+            self._array.fixed[:] = True
+            return self._notify_array_views()
         for vardata in self.values():
             vardata.fix(value, skip_validation)
 
@@ -944,6 +1815,9 @@ class IndexedVar(Var):
         every variable in this :class:`IndexedVar`.
 
         """
+        if self._array is not None:
+            self._array.fixed[:] = False
+            return self._notify_array_views()
         for vardata in self.values():
             vardata.unfix()
 
@@ -964,7 +1838,12 @@ class IndexedVar(Var):
         """Sets the domain for all variables in this container."""
         try:
             domain_rule = SetInitializer(domain)
-            if domain_rule.constant():
+            if self._array is not None and domain_rule.constant():
+                cursor = self._array_cursor()
+                cursor._domain = domain_rule(self.parent_block(), None, self)
+                self._array.broadcast(0, ('domain',))
+                return self._notify_array_views()
+            elif domain_rule.constant():
                 domain = domain_rule(self.parent_block(), None, self)
                 for vardata in self.values():
                     vardata._domain = domain
@@ -976,6 +1855,9 @@ class IndexedVar(Var):
                 parent = self.parent_block()
                 for index, vardata in self.items():
                     vardata._domain = domain_rule(parent, index, self)
+            if _change_logs:
+                for vardata in self.values():
+                    notify_change(vardata)
         except:
             logger.error(
                 "%s is not a valid domain. Variable domains must be an "
@@ -984,6 +1866,219 @@ class IndexedVar(Var):
             )
             raise
 
+    #
+    # Bulk (array-based) accessors
+    #
+
+    def _bulk_data(self, index):
+        # Return the VarData objects addressed by index
+        if index is None:
+            return list(self.values())
+        return [self[i] for i in index]
+
+    def _bulk_positions(self, index):
+        # Return the positions in the array storage of the elements
+        # addressed by index (a slice if all elements are addressed in
+        # storage order)
+        store = self._array
+        store.check_index_set(self)
+        if index is None:
+            # keys() returns the elements in storage order
+            return slice(None)
+        keys = self._bulk_keys(index)
+        index_set = self._index_set
+        n = len(store)
+
+        def _position(idx):
+            if idx in index_set:
+                pos = index_set.ord(idx) - 1
+                if pos < n:
+                    return pos
+            # Validate (and if necessary, add storage for) the element
+            return self[idx]._pos
+
+        return np.fromiter(map(_position, keys), dtype=np.intp, count=len(keys))
+
+    def get_values_array(self, index=None):
+        """Return the variable values as a 1-D numpy float array.
+
+        Values are returned in the order of `index` (defaults to all
+        indices, in the order returned by :meth:`keys`).  Variables
+        without a value are returned as NaN.
+
+        """
+        if self._array is not None:
+            return self._array.value[self._bulk_positions(index)].copy()
+        return np.array([v._value for v in self._bulk_data(index)], dtype=float)
+
+    def set_values_array(self, values, index=None, skip_validation=False):
+        """Set the variable values from a numpy array (or scalar).
+
+        `values` is a scalar or a 1-D array aligned with `index`
+        (defaults to all indices, in the order returned by
+        :meth:`keys`).  Values are in the units of this Var, and NaN
+        clears the variable value.  The default behavior is to validate
+        the values against the variable domains and bounds.
+
+        """
+        if self._array is not None:
+            pos = self._bulk_positions(index)
+            vals = self._bulk_array(values, len(self._array.value[pos]))
+            return self._set_array_values(pos, vals, skip_validation)
+        data = self._bulk_data(index)
+        vals = self._bulk_array(values, len(data)).tolist()
+        for vardata, val in zip(data, vals):
+            vardata.set_value(None if val != val else val, skip_validation)
+
+    def get_bounds_arrays(self, index=None):
+        """Return the variable bounds as a tuple of 1-D numpy float arrays.
+
+        Bounds are returned in the order of `index` (defaults to all
+        indices, in the order returned by :meth:`keys`).  As with
+        :attr:`VarData.bounds`, the bounds are the tighter of the
+        variable bounds and the domain bounds.  Missing bounds are
+        returned as -inf / inf.
+
+        """
+        if self._array is None:
+            bounds = [v.bounds for v in self._bulk_data(index)]
+            lb = np.array([b[0] for b in bounds], dtype=float)
+            ub = np.array([b[1] for b in bounds], dtype=float)
+        else:
+            store = self._array
+            pos = self._bulk_positions(index)
+            lb = store.lb[pos].copy()
+            ub = store.ub[pos].copy()
+            positions = np.arange(len(store))[pos]
+            for arr, exprs in ((lb, store.lb_expr), (ub, store.ub_expr)):
+                if not exprs:
+                    continue
+                for k in np.flatnonzero(np.isin(positions, list(exprs))).tolist():
+                    val = value(exprs[positions[k]])
+                    arr[k] = np.nan if val is None else val
+            codes = store.domain[pos]
+            for code, domain in enumerate(store.domains):
+                mask = codes == code
+                if not mask.any():
+                    continue
+                domain_lb, domain_ub = domain.bounds()
+                if domain_lb is not None:
+                    lb[mask] = np.fmax(lb[mask], domain_lb)
+                if domain_ub is not None:
+                    ub[mask] = np.fmin(ub[mask], domain_ub)
+        lb[np.isnan(lb)] = _ninf
+        ub[np.isnan(ub)] = _inf
+        return lb, ub
+
+    def set_bounds(self, lb=NOTSET, ub=NOTSET, index=None):
+        """Set the variable bounds from numpy arrays (or scalars).
+
+        `lb` and `ub` are scalars or 1-D arrays aligned with `index`
+        (defaults to all indices, in the order returned by
+        :meth:`keys`).  Bounds are in the units of this Var; NaN and
+        -inf / inf remove the bound.  Bounds that are not specified are
+        not changed.
+
+        """
+        if self._array is not None:
+            pos = self._bulk_positions(index)
+            positions = np.arange(len(self._array))[pos]
+            n = len(positions)
+        else:
+            data = self._bulk_data(index)
+            n = len(data)
+        for name, val, invalid in (('lower', lb, _inf), ('upper', ub, _ninf)):
+            if val is NOTSET:
+                continue
+            vals = self._bulk_array(val, n)
+            if (vals == invalid).any():
+                raise ValueError(
+                    "Var '%s': invalid non-finite %s bound (%s)."
+                    % (self.name, name, invalid)
+                )
+            vals = np.where(np.isinf(vals), np.nan, vals)
+            if self._array is None:
+                for vardata, v in zip(data, vals.tolist()):
+                    setattr(vardata, name, None if v != v else v)
+                continue
+            store = self._array
+            bound = 'lb' if name == 'lower' else 'ub'
+            getattr(store, bound)[pos] = vals
+            getattr(store, bound + '_int')[pos] = False
+            exprs = getattr(store, bound + '_expr')
+            if exprs:
+                for p in positions.tolist():
+                    exprs.pop(p, None)
+        if self._array is not None:
+            self._notify_array_views(positions)
+
+    def get_fixed_array(self, index=None):
+        """Return the variable fixed flags as a 1-D numpy bool array.
+
+        Flags are returned in the order of `index` (defaults to all
+        indices, in the order returned by :meth:`keys`).
+
+        """
+        if self._array is not None:
+            return self._array.fixed[self._bulk_positions(index)].copy()
+        return np.array([v._fixed for v in self._bulk_data(index)], dtype=bool)
+
+    def fix_many(self, mask=True, value=NOTSET, index=None, skip_validation=False):
+        """Fix the variables selected by a boolean mask.
+
+        `mask` is a scalar or a 1-D bool array aligned with `index`
+        (defaults to all indices, in the order returned by
+        :meth:`keys`).  If `value` (a scalar or a 1-D array aligned with
+        `index`) is provided, the selected variables are set to the
+        corresponding values before being fixed (see
+        :meth:`set_values_array`).  Variables not selected by the mask
+        are not changed.
+
+        """
+        if self._array is not None:
+            pos = self._bulk_positions(index)
+            positions = np.arange(len(self._array))[pos]
+            mask = self._bulk_array(mask, len(positions), dtype=bool)
+            positions = positions[mask]
+            if value is not NOTSET:
+                vals = self._bulk_array(value, len(mask))[mask]
+                self._set_array_values(positions, vals, skip_validation)
+            self._array.fixed[positions] = True
+            return self._notify_array_views(positions)
+        data = self._bulk_data(index)
+        mask = self._bulk_array(mask, len(data), dtype=bool).tolist()
+        if value is NOTSET:
+            vals = [NOTSET] * len(data)
+        else:
+            vals = [
+                None if v != v else v
+                for v in self._bulk_array(value, len(data)).tolist()
+            ]
+        for vardata, selected, val in zip(data, mask, vals):
+            if selected:
+                vardata.fix(val, skip_validation)
+
+    def unfix_many(self, mask=True, index=None):
+        """Unfix the variables selected by a boolean mask.
+
+        `mask` is a scalar or a 1-D bool array aligned with `index`
+        (defaults to all indices, in the order returned by
+        :meth:`keys`).  Variables not selected by the mask are not
+        changed.
+
+        """
+        if self._array is not None:
+            pos = self._bulk_positions(index)
+            positions = np.arange(len(self._array))[pos]
+            mask = self._bulk_array(mask, len(positions), dtype=bool)
+            self._array.fixed[positions[mask]] = False
+            return self._notify_array_views(positions[mask])
+        data = self._bulk_data(index)
+        mask = self._bulk_array(mask, len(data), dtype=bool).tolist()
+        for vardata, selected in zip(data, mask):
+            if selected:
+                vardata.unfix()
+
     # Because CP supports indirection [the ability to index objects by
     # another (inter) Var] for certain types (including Var), we will
     # catch the normal RuntimeError and return a (variable)
@@ -0,0 +1,379 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Traversal loops for the :py:class:`StreamBasedExpressionVisitor`.
+
+This module holds the node processors (the recursive "general", "bex",
+and "bx" walkers) and the nonrecursive walker loop used by
+:py:class:`~pyomo.core.expr.visitor.StreamBasedExpressionVisitor`.  The
+functions take the visitor as their first argument and are bound to
+the visitor class as methods, so the callback API is unchanged.
+
+The module is deliberately free of any dependencies on the rest of the
+expression system so that it can be compiled with Cython (see
+``setup.py --with-cython``).  When the compiled extension is not
+available, this (pure Python) module is used directly.
+
+"""
+
+import types
+
+from pyomo.common.numeric_types import nonpyomo_leaf_types
+
+
+class RevertToNonrecursive(Exception):
+    pass
+
+
+def process_node_general(visitor, node, recursion_limit):
+    """Recursive routine for processing nodes with general callbacks
+
+    This is the "general" implementation of the
+    StreamBasedExpressionVisitor node processor that can handle any
+    combination of registered callback functions.
+
+    """
+    if not recursion_limit:
+        recursion_limit = visitor._compute_actual_recursion_limit()
+    else:
+        recursion_limit -= 1
+
+    if visitor.enterNode is not None:
+        tmp = visitor.enterNode(node)
+        if tmp is None:
+            args = data = None
+        else:
+            args, data = tmp
+    else:
+        args = None
+        data = []
+    if args is None:
+        if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
+            args = ()
+        else:
+            args = node.args
+
+    # Because we do not require the args to be a context manager, we
+    # will mock up the "with args" using a try-finally.
+    context_manager = hasattr(args, '__enter__')
+    if context_manager:
+        args.__enter__()
+
+    beforeChild = visitor.beforeChild
+    acceptChildResult = visitor.acceptChildResult
+    afterChild = visitor.afterChild
+    child = None
+    try:
+        descend = True
+        child_idx = -1
+        # Note: this relies on iter(iterator) returning the
+        # iterator.  This seems to hold for all common iterators
+        # (list, tuple, generator, etc)
+        arg_iter = iter(args)
+        for child in arg_iter:
+            child_idx += 1
+            if beforeChild is not None:
+                tmp = beforeChild(node, child, child_idx)
+                if tmp is None:
+                    descend = True
+                else:
+                    descend, child_result = tmp
+
+            if descend:
+                child_result = process_node_general(visitor, child, recursion_limit)
+
+            if acceptChildResult is not None:
+                data = acceptChildResult(node, data, child_result, child_idx)
+            elif data is not None:
+                data.append(child_result)
+
+            if afterChild is not None:
+                afterChild(node, child, child_idx)
+    except RevertToNonrecursive:
+        recursive_frame_to_nonrecursive_stack(
+            visitor, node, child, child_idx, arg_iter, data
+        )
+        context_manager = False
+        raise
+    finally:
+        if context_manager:
+            args.__exit__(None, None, None)
+
+    # We are done with this node.  Call exitNode to compute
+    # any result
+    if visitor.exitNode is not None:
+        return visitor.exitNode(node, data)
+    else:
+        return data
+
+
+def process_node_bex(visitor, node, recursion_limit):
+    """Recursive routine for processing nodes with only 'bex' callbacks
+
+    This is a special-case implementation of the "general"
+    StreamBasedExpressionVisitor node processor for the case that
+    only beforeChild, enterNode, and exitNode are defined (see
+    also the definition of the client_methods dict).
+
+    """
+    if not recursion_limit:
+        recursion_limit = visitor._compute_actual_recursion_limit()
+    else:
+        recursion_limit -= 1
+
+    tmp = visitor.enterNode(node)
+    if tmp is None:
+        args = data = None
+    else:
+        args, data = tmp
+    if args is None:
+        if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
+            args = ()
+        else:
+            args = node.args
+
+    # Because we do not require the args to be a context manager, we
+    # will mock up the "with args" using a try-finally.
+    context_manager = hasattr(args, '__enter__')
+    if context_manager:
+        args.__enter__()
+
+    beforeChild = visitor.beforeChild
+    child = None
+    try:
+        child_idx = -1
+        # Note: this relies on iter(iterator) returning the
+        # iterator.  This seems to hold for all common iterators
+        # (list, tuple, generator, etc)
+        arg_iter = iter(args)
+        for child in arg_iter:
+            child_idx += 1
+            tmp = beforeChild(node, child, child_idx)
+            if tmp is None:
+                descend = True
+            else:
+                descend, child_result = tmp
+
+            if descend:
+                data.append(process_node_bex(visitor, child, recursion_limit))
+            else:
+                data.append(child_result)
+    except RevertToNonrecursive:
+        recursive_frame_to_nonrecursive_stack(
+            visitor, node, child, child_idx, arg_iter, data
+        )
+        context_manager = False
+        raise
+    finally:
+        if context_manager:
+            args.__exit__(None, None, None)
+
+    # We are done with this node.  Call exitNode to compute
+    # any result
+    return visitor.exitNode(node, data)
+
+
+def process_node_bx(visitor, node, recursion_limit):
+    """Recursive routine for processing nodes with only 'bx' callbacks
+
+    This is a special-case implementation of the "general"
+    StreamBasedExpressionVisitor node processor for the case that
+    only beforeChild and exitNode are defined (see also the
+    definition of the client_methods dict).
+
+    """
+    if not recursion_limit:
+        recursion_limit = visitor._compute_actual_recursion_limit()
+    else:
+        recursion_limit -= 1
+
+    if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
+        args = ()
+    else:
+        args = node.args
+    data = []
+
+    beforeChild = visitor.beforeChild
+    child = None
+    try:
+        child_idx = -1
+        # Note: this relies on iter(iterator) returning the
+        # iterator.  This seems to hold for all common iterators
+        # (list, tuple, generator, etc)
+        arg_iter = iter(args)
+        for child in arg_iter:
+            child_idx += 1
+            tmp = beforeChild(node, child, child_idx)
+            if tmp is None:
+                descend = True
+            else:
+                descend, child_result = tmp
+            if descend:
+                data.append(process_node_bx(visitor, child, recursion_limit))
+            else:
+                data.append(child_result)
+    except RevertToNonrecursive:
+        recursive_frame_to_nonrecursive_stack(
+            visitor, node, child, child_idx, arg_iter, data
+        )
+        raise
+
+    # We are done with this node.  Call exitNode to compute
+    # any result
+    return visitor.exitNode(node, data)
+
+
+def recursive_frame_to_nonrecursive_stack(
+    visitor, node, child, child_idx, arg_iter, data
+):
+    _arg_list = [None] * child_idx
+    _arg_list.append(child)
+    _arg_list.extend(arg_iter)
+    if not visitor.recursion_stack:
+        # For the deepest stack frame, the recursion limit hit
+        # as we started to enter the child.  As we haven't
+        # started processing it yet, we need to decrement
+        # child_idx so that it is revisited
+        child_idx -= 1
+    visitor.recursion_stack.append(
+        (node, _arg_list, len(_arg_list) - 1, data, child_idx)
+    )
+
+
+def nonrecursive_walker_loop(visitor, ptr):
+    _, node, args, _, data, child_idx = ptr
+    beforeChild = visitor.beforeChild
+    enterNode = visitor.enterNode
+    exitNode = visitor.exitNode
+    acceptChildResult = visitor.acceptChildResult
+    afterChild = visitor.afterChild
+    finalizeResult = visitor.finalizeResult
+    try:
+        while 1:
+            if child_idx < ptr[3]:
+                # Increment the child index pointer here for
+                # consistency.  Note that this means that for the bulk
+                # of the time, 'child_idx' will not match the value of
+                # ptr[5].  This provides a modest performance
+                # improvement, as we only have to recreate the ptr tuple
+                # just before we descend further into the tree (i.e., we
+                # avoid recreating the tuples for the special case where
+                # beforeChild indicates that we should not descend
+                # further).
+                child_idx += 1
+                # This node still has children to process
+                child = ptr[2][child_idx]
+
+                # Notify this node that we are about to descend into a
+                # child.
+                if beforeChild is not None:
+                    tmp = beforeChild(node, child, child_idx)
+                    if tmp is None:
+                        descend = True
+                        child_result = None
+                    else:
+                        descend, child_result = tmp
+                    if not descend:
+                        # We are aborting processing of this child node.
+                        # Tell this node to accept the child result and
+                        # we will move along
+                        if acceptChildResult is not None:
+                            data = acceptChildResult(
+                                node, data, child_result, child_idx
+                            )
+                        elif data is not None:
+                            data.append(child_result)
+                        # And let the node know that we are done with a
+                        # child node
+                        if afterChild is not None:
+                            afterChild(node, child, child_idx)
+                        # Jump to the top to continue processing the
+                        # next child node
+                        continue
+
+                # Update the child argument counter in the stack.
+                # Because we are using tuples, we need to recreate the
+                # "ptr" object (linked list node)
+                ptr = ptr[:4] + (data, child_idx)
+
+                # We are now going to actually enter this node.  The
+                # node will tell us the list of its child nodes that we
+                # need to process
+                if enterNode is not None:
+                    tmp = enterNode(child)
+                    if tmp is None:
+                        args = data = None
+                    else:
+                        args, data = tmp
+                else:
+                    args = None
+                    data = []
+                if args is None:
+                    if (
+                        type(child) in nonpyomo_leaf_types
+                        or not child.is_expression_type()
+                    ):
+                        # Leaves (either non-pyomo types or
+                        # non-Expressions) have no child arguments, so
+                        # are just put on the stack
+                        args = ()
+                    else:
+                        args = child.args
+                if hasattr(args, '__enter__'):
+                    args.__enter__()
+                node = child
+                child_idx = -1
+                ptr = (ptr, node, args, len(args) - 1, data, child_idx)
+
+            else:  # child_idx == ptr[3]:
+                # We are done with this node.  Call exitNode to compute
+                # any result
+                if hasattr(ptr[2], '__exit__'):
+                    ptr[2].__exit__(None, None, None)
+                if exitNode is not None:
+                    node_result = exitNode(node, data)
+                else:
+                    node_result = data
+
+                # Pop the node off the linked list
+                ptr = ptr[0]
+                # If we have returned to the beginning, return the final
+                # answer
+                if ptr is None:
+                    if finalizeResult is not None:
+                        return finalizeResult(node_result)
+                    else:
+                        return node_result
+                # Not done yet, update node to point to the new active
+                # node
+                node, child = ptr[1], node
+                data = ptr[4]
+                child_idx = ptr[5]
+
+                # We need to alert the node to accept the child's result:
+                if acceptChildResult is not None:
+                    data = acceptChildResult(node, data, node_result, child_idx)
+                elif data is not None:
+                    data.append(node_result)
+
+                # And let the node know that we are done with a child node
+                if afterChild is not None:
+                    afterChild(node, child, child_idx)
+
+    finally:
+        while ptr is not None:
+            if hasattr(ptr[2], '__exit__'):
+                ptr[2].__exit__(None, None, None)
+            ptr = ptr[0]
+
+
+#: True if this module was compiled (e.g., by Cython)
+compiled = not isinstance(process_node_general, types.FunctionType)
@@ -10,7 +10,9 @@
 #  ___________________________________________________________________________
 
 import enum
+from operator import is_
 
+from pyomo.common.autoslots import fast_deepcopy, _atomic_types
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.numeric_types import native_types
 from pyomo.core.pyomoobject import PyomoObject
@@ -42,6 +44,54 @@ class ExpressionBase(PyomoObject):
     """
     ASSOCIATIVITY = OperatorAssociativity.LEFT_TO_RIGHT
 
+    # Expression nodes are immutable, so a node (and the subtree below
+    # it) can be shared by a block and its clone if none of its leaves
+    # are copied (see :meth:`BlockData.clone`).  Derived classes that
+    # modify their arguments in place must set this to False.
+    _share_on_clone = True
+
+    def __deepcopy__(self, memo):
+        info = self.__auto_slots__
+        if info.has_dict or not self._share_on_clone or '_args_' not in info.slots:
+            return super().__deepcopy__(memo)
+        # Copy the node directly from its (copied) arguments, bypassing
+        # the general getstate / setstate deepcopy() logic.  Nodes with
+        # local data other than atomic values (e.g., references to
+        # components) are copied through the general deepcopy() logic.
+        state = []
+        for slot in info.slots:
+            if slot == '_args_':
+                continue
+            val = getattr(self, slot)
+            if val.__class__ not in _atomic_types and (
+                val.__class__ is not tuple
+                or not _atomic_types.issuperset(map(type, val))
+            ):
+                return super().__deepcopy__(memo)
+            state.append((slot, val))
+        args = self._args_
+        if '_nargs' in info.slots:
+            args = args[: self._nargs]
+        new_args = [fast_deepcopy(arg, memo) for arg in args]
+        unchanged = all(map(is_, new_args, args))
+        report = memo.get('__clone_report__', None)
+        if report is not None:
+            # This is a Block.clone(share=True): share the node if none
+            # of the arguments were copied
+            if unchanged:
+                report.shared_expressions += 1
+                return self
+            report.copied_expressions += 1
+        if args.__class__ is not list:
+            # As with deepcopy(), tuples of uncopied arguments are reused
+            new_args = self._args_ if unchanged else tuple(new_args)
+        ans = self.__class__.__new__(self.__class__)
+        setter = object.__setattr__
+        setter(ans, '_args_', new_args)
+        for slot, val in state:
+            setter(ans, slot, val)
+        return ans
+
     def nargs(self):
         """Returns the number of child nodes.
 
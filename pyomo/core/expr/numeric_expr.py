@@ -1371,6 +1371,8 @@ class _MutableSumExpression(SumExpression):
 
     __slots__ = ()
 
+    _share_on_clone = False
+
     def make_immutable(self):
         self.__class__ = SumExpression
 
@@ -27,6 +27,8 @@ from pyomo.common.numeric_types import (
     value,
 )
 import pyomo.core.expr.expr_common as common
+from pyomo.core.expr import _visitor_core
+from pyomo.core.expr._visitor_core import RevertToNonrecursive
 from pyomo.core.expr.symbol_map import SymbolMap
 
 try:
@@ -60,10 +62,6 @@ def get_stack_depth():
 RECURSION_LIMIT = 50
 
 
-class RevertToNonrecursive(Exception):
-    pass
-
-
 # NOTE: This module also has dependencies on numeric_expr; however, to
 # avoid circular dependencies, we will NOT import them here.  Instead,
 # until we can resolve the circular dependencies, they will be injected
@@ -300,208 +298,21 @@ class StreamBasedExpressionVisitor(object):
         recursion_limit = (
             sys.getrecursionlimit() - get_stack_depth() - 2 * RECURSION_LIMIT
         )
-        if recursion_limit <= RECURSION_LIMIT:
+        # Note that the compiled node processors do not create Python
+        # frames (so get_stack_depth() cannot see how deep the walker
+        # actually is).  Compiled walkers always switch over to the
+        # (also compiled) nonrecursive walker loop.
+        if recursion_limit <= RECURSION_LIMIT or _visitor_core.compiled:
             self.recursion_stack = []
             raise RevertToNonrecursive()
         return recursion_limit
 
-    def _process_node_general(self, node, recursion_limit):
-        """Recursive routine for processing nodes with general callbacks
-
-        This is the "general" implementation of the
-        StreamBasedExpressionVisitor node processor that can handle any
-        combination of registered callback functions.
-
-        """
-        if not recursion_limit:
-            recursion_limit = self._compute_actual_recursion_limit()
-        else:
-            recursion_limit -= 1
-
-        if self.enterNode is not None:
-            tmp = self.enterNode(node)
-            if tmp is None:
-                args = data = None
-            else:
-                args, data = tmp
-        else:
-            args = None
-            data = []
-        if args is None:
-            if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
-                args = ()
-            else:
-                args = node.args
-
-        # Because we do not require the args to be a context manager, we
-        # will mock up the "with args" using a try-finally.
-        context_manager = hasattr(args, '__enter__')
-        if context_manager:
-            args.__enter__()
-
-        try:
-            descend = True
-            child_idx = -1
-            # Note: this relies on iter(iterator) returning the
-            # iterator.  This seems to hold for all common iterators
-            # (list, tuple, generator, etc)
-            arg_iter = iter(args)
-            for child in arg_iter:
-                child_idx += 1
-                if self.beforeChild is not None:
-                    tmp = self.beforeChild(node, child, child_idx)
-                    if tmp is None:
-                        descend = True
-                    else:
-                        descend, child_result = tmp
-
-                if descend:
-                    child_result = self._process_node(child, recursion_limit)
-
-                if self.acceptChildResult is not None:
-                    data = self.acceptChildResult(node, data, child_result, child_idx)
-                elif data is not None:
-                    data.append(child_result)
-
-                if self.afterChild is not None:
-                    self.afterChild(node, child, child_idx)
-        except RevertToNonrecursive:
-            self._recursive_frame_to_nonrecursive_stack(locals())
-            context_manager = False
-            raise
-        finally:
-            if context_manager:
-                args.__exit__(None, None, None)
-
-        # We are done with this node.  Call exitNode to compute
-        # any result
-        if self.exitNode is not None:
-            return self.exitNode(node, data)
-        else:
-            return data
-
-    def _process_node_bex(self, node, recursion_limit):
-        """Recursive routine for processing nodes with only 'bex' callbacks
-
-        This is a special-case implementation of the "general"
-        StreamBasedExpressionVisitor node processor for the case that
-        only beforeChild, enterNode, and exitNode are defined (see
-        also the definition of the client_methods dict).
-
-        """
-        if not recursion_limit:
-            recursion_limit = self._compute_actual_recursion_limit()
-        else:
-            recursion_limit -= 1
-
-        tmp = self.enterNode(node)
-        if tmp is None:
-            args = data = None
-        else:
-            args, data = tmp
-        if args is None:
-            if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
-                args = ()
-            else:
-                args = node.args
-
-        # Because we do not require the args to be a context manager, we
-        # will mock up the "with args" using a try-finally.
-        context_manager = hasattr(args, '__enter__')
-        if context_manager:
-            args.__enter__()
-
-        try:
-            child_idx = -1
-            # Note: this relies on iter(iterator) returning the
-            # iterator.  This seems to hold for all common iterators
-            # (list, tuple, generator, etc)
-            arg_iter = iter(args)
-            for child in arg_iter:
-                child_idx += 1
-                tmp = self.beforeChild(node, child, child_idx)
-                if tmp is None:
-                    descend = True
-                else:
-                    descend, child_result = tmp
-
-                if descend:
-                    data.append(self._process_node(child, recursion_limit))
-                else:
-                    data.append(child_result)
-        except RevertToNonrecursive:
-            self._recursive_frame_to_nonrecursive_stack(locals())
-            context_manager = False
-            raise
-        finally:
-            if context_manager:
-                args.__exit__(None, None, None)
-
-        # We are done with this node.  Call exitNode to compute
-        # any result
-        return self.exitNode(node, data)
-
-    def _process_node_bx(self, node, recursion_limit):
-        """Recursive routine for processing nodes with only 'bx' callbacks
-
-        This is a special-case implementation of the "general"
-        StreamBasedExpressionVisitor node processor for the case that
-        only beforeChild and exitNode are defined (see also the
-        definition of the client_methods dict).
-
-        """
-        if not recursion_limit:
-            recursion_limit = self._compute_actual_recursion_limit()
-        else:
-            recursion_limit -= 1
-
-        if type(node) in nonpyomo_leaf_types or not node.is_expression_type():
-            args = ()
-        else:
-            args = node.args
-        data = []
-
-        try:
-            child_idx = -1
-            # Note: this relies on iter(iterator) returning the
-            # iterator.  This seems to hold for all common iterators
-            # (list, tuple, generator, etc)
-            arg_iter = iter(args)
-            for child in arg_iter:
-                child_idx += 1
-                tmp = self.beforeChild(node, child, child_idx)
-                if tmp is None:
-                    descend = True
-                else:
-                    descend, child_result = tmp
-                if descend:
-                    data.append(self._process_node(child, recursion_limit))
-                else:
-                    data.append(child_result)
-        except RevertToNonrecursive:
-            self._recursive_frame_to_nonrecursive_stack(locals())
-            raise
-        finally:
-            pass
-
-        # We are done with this node.  Call exitNode to compute
-        # any result
-        return self.exitNode(node, data)
-
-    def _recursive_frame_to_nonrecursive_stack(self, local):
-        child_idx = local['child_idx']
-        _arg_list = [None] * child_idx
-        _arg_list.append(local['child'])
-        _arg_list.extend(local['arg_iter'])
-        if not self.recursion_stack:
-            # For the deepest stack frame, the recursion limit hit
-            # as we started to enter the child.  As we haven't
-            # started processing it yet, we need to decrement
-            # child_idx so that it is revisited
-            child_idx -= 1
-        self.recursion_stack.append(
-            (local['node'], _arg_list, len(_arg_list) - 1, local['data'], child_idx)
-        )
+    # The node processors and nonrecursive walker loop are implemented
+    # in the _visitor_core module (which may be compiled)
+    _process_node_general = _visitor_core.process_node_general
+    _process_node_bex = _visitor_core.process_node_bex
+    _process_node_bx = _visitor_core.process_node_bx
+    _nonrecursive_walker_loop = _visitor_core.nonrecursive_walker_loop
 
     def walk_expression_nonrecursive(self, expr):
         """Nonrecursively walk an expression, calling registered callbacks.
@@ -556,128 +367,6 @@ class StreamBasedExpressionVisitor(object):
             (None, node, args, len(args) - 1, data, -1)
         )
 
-    def _nonrecursive_walker_loop(self, ptr):
-        _, node, args, _, data, child_idx = ptr
-        try:
-            while 1:
-                if child_idx < ptr[3]:
-                    # Increment the child index pointer here for
-                    # consistency.  Note that this means that for the bulk
-                    # of the time, 'child_idx' will not match the value of
-                    # ptr[5].  This provides a modest performance
-                    # improvement, as we only have to recreate the ptr tuple
-                    # just before we descend further into the tree (i.e., we
-                    # avoid recreating the tuples for the special case where
-                    # beforeChild indicates that we should not descend
-                    # further).
-                    child_idx += 1
-                    # This node still has children to process
-                    child = ptr[2][child_idx]
-
-                    # Notify this node that we are about to descend into a
-                    # child.
-                    if self.beforeChild is not None:
-                        tmp = self.beforeChild(node, child, child_idx)
-                        if tmp is None:
-                            descend = True
-                            child_result = None
-                        else:
-                            descend, child_result = tmp
-                        if not descend:
-                            # We are aborting processing of this child node.
-                            # Tell this node to accept the child result and
-                            # we will move along
-                            if self.acceptChildResult is not None:
-                                data = self.acceptChildResult(
-                                    node, data, child_result, child_idx
-                                )
-                            elif data is not None:
-                                data.append(child_result)
-                            # And let the node know that we are done with a
-                            # child node
-                            if self.afterChild is not None:
-                                self.afterChild(node, child, child_idx)
-                            # Jump to the top to continue processing the
-                            # next child node
-                            continue
-
-                    # Update the child argument counter in the stack.
-                    # Because we are using tuples, we need to recreate the
-                    # "ptr" object (linked list node)
-                    ptr = ptr[:4] + (data, child_idx)
-
-                    # We are now going to actually enter this node.  The
-                    # node will tell us the list of its child nodes that we
-                    # need to process
-                    if self.enterNode is not None:
-                        tmp = self.enterNode(child)
-                        if tmp is None:
-                            args = data = None
-                        else:
-                            args, data = tmp
-                    else:
-                        args = None
-                        data = []
-                    if args is None:
-                        if (
-                            type(child) in nonpyomo_leaf_types
-                            or not child.is_expression_type()
-                        ):
-                            # Leaves (either non-pyomo types or
-                            # non-Expressions) have no child arguments, so
-                            # are just put on the stack
-                            args = ()
-                        else:
-                            args = child.args
-                    if hasattr(args, '__enter__'):
-                        args.__enter__()
-                    node = child
-                    child_idx = -1
-                    ptr = (ptr, node, args, len(args) - 1, data, child_idx)
-
-                else:  # child_idx == ptr[3]:
-                    # We are done with this node.  Call exitNode to compute
-                    # any result
-                    if hasattr(ptr[2], '__exit__'):
-                        ptr[2].__exit__(None, None, None)
-                    if self.exitNode is not None:
-                        node_result = self.exitNode(node, data)
-                    else:
-                        node_result = data
-
-                    # Pop the node off the linked list
-                    ptr = ptr[0]
-                    # If we have returned to the beginning, return the final
-                    # answer
-                    if ptr is None:
-                        if self.finalizeResult is not None:
-                            return self.finalizeResult(node_result)
-                        else:
-                            return node_result
-                    # Not done yet, update node to point to the new active
-                    # node
-                    node, child = ptr[1], node
-                    data = ptr[4]
-                    child_idx = ptr[5]
-
-                    # We need to alert the node to accept the child's result:
-                    if self.acceptChildResult is not None:
-                        data = self.acceptChildResult(
-                            node, data, node_result, child_idx
-                        )
-                    elif data is not None:
-                        data.append(node_result)
-
-                    # And let the node know that we are done with a child node
-                    if self.afterChild is not None:
-                        self.afterChild(node, child, child_idx)
-
-        finally:
-            while ptr is not None:
-                if hasattr(ptr[2], '__exit__'):
-                    ptr[2].__exit__(None, None, None)
-                ptr = ptr[0]
-
 
 class SimpleExpressionVisitor(object):
     """
@@ -1664,40 +1353,38 @@ class _ToStringVisitor(ExpressionValueVisitor):
 
     def visit(self, node, values):
         """Visit nodes that have been expanded"""
-        for i, val in enumerate(values):
-            arg = node.arg(i)
-
+        verbose = self.verbose
+        precedence = node.PRECEDENCE
+        for i, arg in enumerate(node.args):
             if arg is None:
                 values[i] = 'Undefined'
             elif arg.__class__ in native_numeric_types:
                 pass
             elif arg.__class__ in nonpyomo_leaf_types:
-                values[i] = f"{val}"
-            else:
-                parens = False
-                if (
-                    not self.verbose
-                    and arg.is_expression_type()
-                    and node.PRECEDENCE is not None
-                ):
-                    if arg.PRECEDENCE is None:
-                        pass
-                    elif node.PRECEDENCE < arg.PRECEDENCE:
+                values[i] = f"{values[i]}"
+            elif (
+                not verbose
+                and precedence is not None
+                and arg.is_expression_type()
+                and arg.PRECEDENCE is not None
+            ):
+                if precedence < arg.PRECEDENCE:
+                    values[i] = f"({values[i]})"
+                elif precedence == arg.PRECEDENCE:
+                    if i == 0:
+                        parens = node.ASSOCIATIVITY != LEFT_TO_RIGHT
+                    elif i == len(values) - 1:
+                        parens = node.ASSOCIATIVITY != RIGHT_TO_LEFT
+                    else:
                         parens = True
-                    elif node.PRECEDENCE == arg.PRECEDENCE:
-                        if i == 0:
-                            parens = node.ASSOCIATIVITY != LEFT_TO_RIGHT
-                        elif i == node.nargs() - 1:
-                            parens = node.ASSOCIATIVITY != RIGHT_TO_LEFT
-                        else:
-                            parens = True
-                if parens:
-                    values[i] = f"({val})"
-
-        if self._expression_handlers and node.__class__ in self._expression_handlers:
-            return self._expression_handlers[node.__class__](self, node, values)
-
-        return node._to_string(values, self.verbose, self.smap)
+                    if parens:
+                        values[i] = f"({values[i]})"
+
+        handlers = self._expression_handlers
+        if handlers and node.__class__ in handlers:
+            return handlers[node.__class__](self, node, values)
+
+        return node._to_string(values, verbose, self.smap)
 
     def visiting_potential_leaf(self, node):
         """
@@ -13,9 +13,11 @@
 #
 
 from io import StringIO
+import gc
 import logging
 import os
 import sys
+import tracemalloc
 import types
 import json
 
@@ -1345,6 +1347,68 @@ class TestBlock(unittest.TestCase):
         self.assertFalse('x' in m.__dict__)
         self.assertIs(m.component('x'), None)
 
+    def test_component_index_cache(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.b = Block(m.I)
+        for b in m.b.values():
+            b.x = Var(m.I)
+            b.c = Constraint(m.I, rule=lambda b, i: b.x[i] >= 0)
+        m.d = Constraint(expr=m.b[1].x[1] <= 1)
+
+        def _check(*args, **kwds):
+            m.enable_component_index_cache(False)
+            ref = list(m.component_data_objects(*args, **kwds))
+            ref_comp = list(m.component_objects(*args, **kwds))
+            m.enable_component_index_cache()
+            for i in range(2):
+                self.assertEqual(list(m.component_data_objects(*args, **kwds)), ref)
+                self.assertEqual(list(m.component_objects(*args, **kwds)), ref_comp)
+
+        self.assertIsNone(m._component_index_cache)
+        m.enable_component_index_cache()
+        _check(Constraint, active=True)
+        self.assertEqual(len(m._component_index_cache), 2)
+
+        # Changes to the model structure invalidate the cache
+        m.b[2].c[1].deactivate()
+        _check(Constraint, active=True)
+        m.b[3].deactivate()
+        _check(Constraint, active=True)
+        _check([Var, Constraint], sort=SortComponents.deterministic)
+        m.b[3].activate()
+        del m.b[1].c[2]
+        _check(Constraint, active=True)
+        m.b[1].c[2] = m.b[1].x[2] <= 4
+        _check(Constraint, active=True)
+        m.e = Constraint(expr=m.b[2].x[1] <= 1)
+        _check(Constraint, active=True)
+        m.del_component(m.d)
+        _check(Constraint, active=True)
+        m.reclassify_component_type(m.e, Expression)
+        _check(Constraint, active=True)
+        m.x = Var(Any, dense=False)
+        _check(Var)
+        m.x[5].value = 1
+        _check(Var)
+        _check(Var, descend_into=False)
+
+        # References are never cached
+        m.r = Reference(m.b[:].x[1])
+        _check(Var)
+        self.assertNotIn((True, Var, None, False, True, None), m._component_index_cache)
+
+        # Clones retain the caching option (but not the cached lists)
+        i = m.clone()
+        self.assertEqual(i._component_index_cache, {})
+        self.assertEqual(
+            [v.name for v in i.component_data_objects(Constraint)],
+            [v.name for v in m.component_data_objects(Constraint)],
+        )
+
+        m.enable_component_index_cache(False)
+        self.assertIsNone(m._component_index_cache)
+
     def test_reclassify_component(self):
         m = Block()
         m.a = Var()
@@ -2500,6 +2564,123 @@ class TestBlock(unittest.TestCase):
             self.assertIs(m.d[i].parent_component(), m.d)
             self.assertIs(m.d[i].parent_block(), m)
 
+    def test_clone_share_expressions(self):
+        m = ConcreteModel()
+        m.z = Var()
+        m.p = Param(initialize=2, mutable=True)
+        m.b = Block()
+        m.b.x = Var([1, 2])
+        m.b.c = Constraint(expr=m.z**2 + EXPR.log(m.z) >= 3)
+        m.b.d = Constraint(expr=m.b.x[1] + m.p * m.b.x[2] + m.z**2 <= 4)
+        m.b.e = Constraint(expr=EXPR.inequality(0, m.b.x[1] * m.b.x[2], 1))
+        m.b.s = Expression(expr=EXPR.exp(m.b.x[1]))
+
+        b, report = m.b.clone(share=True, report=True)
+        self.assertEqual(report.shared_expressions, 5)
+        self.assertEqual(report.copied_expressions, 7)
+        self.assertEqual(
+            str(report),
+            "shared 5 expression nodes (copied 7), 0 Params (0 values), "
+            "and 1 Sets (2 members)",
+        )
+        # Expressions that only reference objects outside the block are
+        # shared
+        self.assertIs(b.c.expr, m.b.c.expr)
+        self.assertIs(b.d.body.arg(1), m.b.d.body.arg(1))
+        # ... everything else is copied
+        self.assertIsNot(b.d.expr, m.b.d.expr)
+        self.assertEqual(str(b.d.expr), 'x[1] + p*x[2] + z**2  <=  4')
+        self.assertIs(b.d.body.arg(0).arg(0), b.x[1])
+        self.assertIs(b.d.body.arg(0).arg(1).arg(0), m.p)
+        self.assertIs(b.d.body.arg(0).arg(1).arg(1), b.x[2])
+        self.assertIs(type(b.e.expr), type(m.b.e.expr))
+        self.assertEqual(list(EXPR.identify_variables(b.e.body)), [b.x[1], b.x[2]])
+        self.assertIs(b.s.expr.arg(0), b.x[1])
+        self.assertEqual(b.s.expr.getname(), 'exp')
+
+        # The default clone copies all expressions
+        b = m.b.clone()
+        self.assertIsNot(b.c.expr, m.b.c.expr)
+        with self.assertRaisesRegex(ValueError, "report=True requires share=True"):
+            m.b.clone(report=True)
+
+    def test_clone_share_data(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(i, 'a%s' % i) for i in range(5)])
+        m.J = Set(initialize=[3, 1, 2], ordered=Set.SortedOrder)
+        m.K = Set(initialize=[1, 2], ordered=False)
+        m.L = Set(initialize=[(1, 2), (3, 4)], storage='array')
+        m.S = Set([1, 2], initialize={1: [1, 2], 2: [m]})
+        m.p = Param(m.I, initialize=lambda m, i, j: i / 2)
+        m.q = Param(m.J, initialize={1: 10, 2: 20}, default=0)
+        m.r = Param(m.J, initialize=3, mutable=True)
+        m.x = Var(m.I)
+
+        c, report = m.clone(share=True, report=True)
+        self.assertEqual(report.shared_params, 2)
+        self.assertEqual(report.shared_param_values, 7)
+        # (including the implicit index of S, but not S[2], which
+        # contains a [copied] model)
+        self.assertEqual(report.shared_sets, 6)
+        self.assertEqual(report.shared_set_members, 16)
+        self.assertIs(c.p._data, m.p._data)
+        self.assertIs(c.q._data, m.q._data)
+        self.assertIsNot(c.r._data, m.r._data)
+        self.assertIs(c.r[1].parent_component(), c.r)
+        self.assertEqual(c.q[3], 0)
+        self.assertIs(c.I._values, m.I._values)
+        self.assertIs(c.S[1]._values, m.S[1]._values)
+        self.assertIsNot(c.S[2]._values, m.S[2]._values)
+        self.assertIs(c.S[2].at(1), c)
+        self.assertIs(c.x.index_set(), c.I)
+
+        # Sets copy the shared members before modifying them
+        c.I.add((5, 'a5'))
+        self.assertEqual(len(c.I), 6)
+        self.assertEqual(len(m.I), 5)
+        m.J.add(0)
+        self.assertEqual(list(m.J), [0, 1, 2, 3])
+        self.assertEqual(list(c.J), [1, 2, 3])
+        self.assertEqual(c.J.ord(3), 3)
+        c.K.remove(1)
+        self.assertEqual(set(m.K), {1, 2})
+        m.L.discard((1, 2))
+        self.assertEqual(list(m.L), [(3, 4)])
+        self.assertEqual(list(c.L), [(1, 2), (3, 4)])
+        self.assertEqual(c.L.ord((3, 4)), 2)
+        c.L.add((5, 6))
+        self.assertEqual(list(c.L), [(1, 2), (3, 4), (5, 6)])
+        c.S[1].clear()
+        self.assertEqual(list(m.S[1]), [1, 2])
+        self.assertEqual(m.S[1].pop(), 2)
+        self.assertEqual(list(c.S[1]), [])
+
+    def test_clone_share_memory(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(i, i % 7) for i in range(5000)])
+        m.p = Param(m.I, initialize=lambda m, i, j: i + 0.5 * j)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m, i, j: m.x[i, j] >= m.p[i, j])
+
+        def clone_size(**kwds):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                c = m.clone(**kwds)
+                gc.collect()
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        copied = clone_size()
+        shared = clone_size(share=True)
+        # The clone does not duplicate the Set members and the Param
+        # values (the keys are not copied in either case)
+        self.assertGreater(
+            copied - shared,
+            0.9 * (sys.getsizeof(m.I._values) + sys.getsizeof(m.p._data)),
+        )
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
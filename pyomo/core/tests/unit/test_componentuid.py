@@ -26,6 +26,7 @@ from pyomo.environ import (
     Constraint,
     Any,
     ComponentUID,
+    ComponentUIDIndex,
     Reference,
 )
 from pyomo.core.base.indexed_component import IndexedComponent
@@ -1249,5 +1250,78 @@ class TestComponentUID(unittest.TestCase):
             cuid = ComponentUID(_slice)
 
 
+class TestComponentUIDIndex(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var([1, 2])
+        m.V = Var([('a', 'b'), (1, '2'), (3, 4)])
+        m.b = Block([1, 2])
+        m.b[1].z = Var([1, '2'])
+        m.b[2].c = Block()
+        m.b[2].c.w = Var(['a', 2])
+        m.r = Reference(m.b[2].c.w)
+        m.s = Var([1, 2, 3], dense=False)
+        return m
+
+    def test_find_components(self):
+        m = self._model()
+        idx = ComponentUIDIndex(m)
+        comps = list(m.component_data_objects(Var))
+        comps.extend(m.component_objects())
+        cuids = [ComponentUID(c) for c in comps]
+        self.assertEqual(idx.find_components(cuids), comps)
+        self.assertEqual(idx.find_components([str(c) for c in cuids]), comps)
+        self.assertIs(idx.find_component('r[a]'), m.b[2].c.w['a'])
+        self.assertIsNone(idx.find_component('x[1]'))
+        self.assertIsNone(idx.find_component('b[3].z'))
+        self.assertIsNone(idx.find_component(ComponentUID('q')))
+        # Wildcards are resolved by find_component_on
+        ref = idx.find_component('b[*].z[1]')
+        self.assertEqual(list(ref.values()), [m.b[1].z[1]])
+
+    def test_get_cuids(self):
+        m = self._model()
+        idx = ComponentUIDIndex(m)
+        comps = list(m.component_data_objects(Var))
+        comps.extend(m.component_objects())
+        cuids = idx.get_cuids(comps)
+        self.assertEqual(cuids, [ComponentUID(c) for c in comps])
+        self.assertEqual(str(idx.get_cuid(m.b[2].c.w['a'])), 'b[2].c.w[a]')
+        self.assertEqual(str(idx.get_cuid(m.V[1, '2'])), "V[1,'2']")
+        self.assertEqual(idx.get_cuid(m.b[2]), ComponentUID('b[2]'))
+
+        # CUIDs are relative to the indexed block
+        idx = ComponentUIDIndex(m.b[2])
+        self.assertEqual(str(idx.get_cuid(m.b[2].c.w[2])), 'c.w[2]')
+        self.assertIs(idx.find_component('c.w[2]'), m.b[2].c.w[2])
+        self.assertIsNone(idx.find_component('x'))
+        with self.assertRaisesRegex(ValueError, "Context 'b\\[2\\]' does not"):
+            idx.get_cuid(m.x)
+
+    def test_invalidation(self):
+        m = self._model()
+        idx = ComponentUIDIndex(m)
+        self.assertIsNone(idx.find_component('u'))
+        m.u = Var()
+        self.assertIs(idx.find_component('u'), m.u)
+        m.del_component(m.u)
+        self.assertIsNone(idx.find_component('u'))
+
+        # Adding sparse component data does not change the model
+        # structure, but the lookup falls back on find_component_on
+        self.assertNotIn(2, m.s)
+        m.s[2] = 5
+        self.assertIs(idx.find_component('s[2]'), m.s[2])
+        self.assertEqual(str(idx.get_cuid(m.s[2])), 's[2]')
+
+        y1 = m.y[1]
+        del m.y[1]
+        self.assertIsNot(idx.find_component('y[1]'), y1)
+
+        idx.invalidate()
+        self.assertIs(idx.find_component('y[2]'), m.y[2])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -24,6 +24,7 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 
 from pyomo.environ import (
     Set,
@@ -2266,6 +2267,32 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(len(m.p), 2)
         self.assertEqual(len(m.p._data), 0)
 
+    @unittest.skipUnless(numpy_available, "Bulk accessors require numpy")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.p = Param(
+            [1, 2, 3], mutable=True, initialize={1: 1, 2: 2}, default=5, within=Any
+        )
+        m.q = Param([1, 2, 3], initialize={1: 1, 2: 2}, default=5)
+        self.assertStructuredAlmostEqual(
+            m.p.get_values_array().tolist(), [1.0, 2.0, 5.0]
+        )
+        self.assertStructuredAlmostEqual(
+            m.q.get_values_array(index=[3, 1]).tolist(), [5.0, 1.0]
+        )
+        m.p.set_values_array(np.array([10, np.nan, 30]))
+        self.assertEqual(m.p.extract_values(), {1: 10, 2: None, 3: 30})
+        self.assertTrue(np.isnan(m.p.get_values_array()[1]))
+        m.p.set_values_array(7, index=[2])
+        self.assertEqual(m.p.extract_values(), {1: 10, 2: 7, 3: 30})
+        with self.assertRaisesRegex(ValueError, "with 3 elements for component 'p'"):
+            m.p.set_values_array([1, 2])
+        with self.assertRaisesRegex(TypeError, "immutable parameter q\\[\\*\\]"):
+            m.q.set_values_array([1, 2, 3])
+        m.r = Param([1, 2], mutable=True, within=NonNegativeReals)
+        with self.assertRaisesRegex(ValueError, "Invalid parameter value: r\\[2\\]"):
+            m.r.set_values_array([1, -1], index=[1, 2])
+
 
 # Add test methods for all intrinsic functions
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests, intrinsic_test_list)
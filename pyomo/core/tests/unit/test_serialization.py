@@ -0,0 +1,257 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import struct
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy_available
+from pyomo.common.tempfiles import TempfileManager
+
+from pyomo.environ import (
+    ConcreteModel,
+    Block,
+    Set,
+    RangeSet,
+    Param,
+    Var,
+    Expression,
+    Constraint,
+    Objective,
+    Suffix,
+    Reference,
+    Any,
+    Binary,
+    NonNegativeIntegers,
+    Expr_if,
+    exp,
+    log,
+    maximize,
+    units,
+    value,
+)
+from pyomo.core.base.serialization import save_model, load_model
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+
+def _pprint(comp):
+    OUT = StringIO()
+    comp.pprint(ostream=OUT)
+    return OUT.getvalue()
+
+
+@unittest.skipUnless(numpy_available, 'numpy is not available')
+class TestModelSerialization(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+        self.fname = TempfileManager.create_tempfile(suffix='.pmb')
+
+    def tearDown(self):
+        TempfileManager.pop()
+
+    def _round_trip(self, m, mmap=True):
+        save_model(m, self.fname)
+        return load_model(self.fname, mmap=mmap)
+
+    def _model(self):
+        m = ConcreteModel(name='test')
+        m.I = Set(initialize=[3, 1, 2], doc='the I set')
+        m.J = Set(initialize=['b', 'a'], ordered=Set.SortedOrder)
+        m.K = Set(initialize=[(1, 'a'), (2, 'b')])
+        m.R = RangeSet(4)
+        m.IJ = m.I * m.J
+        m.S = Set(m.I, initialize=lambda m, i: range(i))
+        m.p = Param(m.I, initialize={1: 1.5, 2: 2.5, 3: 4.5}, mutable=True)
+        m.q = Param(initialize=5)
+        m.r = Param(m.J, initialize={'a': 'x'}, default='y', within=Any)
+        m.s = Param(m.K, initialize={(1, 'a'): 10, (2, 'b'): 20})
+        m.x = Var(m.I, m.J, bounds=(0.0, 10.0), initialize=1.5)
+        m.y = Var(m.R, domain=Binary)
+        m.y[2].fix(1.0)
+        m.y[3].domain = NonNegativeIntegers
+        m.z = Var(bounds=(None, m.p[1]))
+        m.e = Expression(m.I, rule=lambda m, i: m.p[i] * m.x[i, 'a'] ** 2)
+        m.c = Constraint(
+            m.I,
+            rule=lambda m, i: (
+                0,
+                sum(m.x[i, j] for j in m.J) + log(m.x[i, 'b']) + m.e[i],
+                m.p[i],
+            ),
+        )
+        m.c[2].deactivate()
+        m.b = Block([1, 2])
+        m.b[1].v = Var(within=m.R)
+        m.b[2].d = Constraint(
+            expr=abs(m.b[1].v) - m.z / 2 == Expr_if(m.y[1] >= 0, exp(m.z), 2)
+        )
+        m.b[2].deactivate()
+        m.o = Objective(expr=m.x[1, 'a'] + m.b[1].v, sense=maximize)
+        return m
+
+    def test_round_trip(self):
+        m = self._model()
+        for mmap in (True, False):
+            n = self._round_trip(m, mmap)
+            self.assertEqual(n.name, 'test')
+            self.assertEqual(
+                [c.name for c in n.component_objects()],
+                [c.name for c in m.component_objects()],
+            )
+            for name in ('I', 'J', 'K', 'R', 'IJ', 'S', 'p', 'q', 'r', 's'):
+                self.assertEqual(_pprint(n.component(name)), _pprint(m.component(name)))
+            self.assertEqual(n.I.doc, 'the I set')
+            self.assertIs(list(n.x.index_set().subsets())[0], n.I)
+            self.assertEqual(_pprint(n.y), _pprint(m.y))
+            self.assertEqual(_pprint(n.x), _pprint(m.x))
+            self.assertEqual(n.x[3, 'b'].value, 1.5)
+            self.assertFalse(n.x[3, 'b'].stale)
+            self.assertTrue(n.b[1].v.stale)
+            self.assertIs(n.y[3].domain, NonNegativeIntegers)
+            self.assertIs(n.y[3].parent_component(), n.y)
+            self.assertIs(n.z.upper, n.p[1])
+            self.assertIs(n.b[1].v.domain, n.R)
+            for name in ('e[1]', 'c[1]', 'c[3]', 'o', 'b[2].d'):
+                self.assertEqual(
+                    str(n.find_component(name).expr), str(m.find_component(name).expr)
+                )
+            self.assertIs(n.e[2].expr.arg(0), n.p[2])
+            self.assertIs(n.c[1].body.arg(2), n.e[1])
+            self.assertEqual([c.active for c in n.c.values()], [True, True, False])
+            self.assertFalse(n.b[2].active)
+            self.assertTrue(n.b[1].active)
+            self.assertEqual(n.o.sense, maximize)
+            self.assertEqual(value(n.c[3].body), value(m.c[3].body))
+
+    def test_sparse_components(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=range(5))
+        m.x = Var(m.I, dense=False)
+        m.x[2] = 5
+        m.x[4].setlb(1)
+        m.p = Param(m.I, initialize={1: 1}, default=3, mutable=True)
+        m.p[2]
+        m.c = Constraint(m.I)
+        m.c[3] = m.x[4] * m.p[2] <= 1
+        m.o = Objective([1, 2])
+        m.o[2] = m.x[2]
+        m.o[2].sense = maximize
+
+        n = self._round_trip(m)
+        self.assertEqual(list(n.x.keys()), [2, 4])
+        self.assertEqual(n.x[2].value, 5)
+        self.assertEqual(n.x[4].lb, 1)
+        self.assertIsNone(n.x[4].value)
+        # The Var is still sparse
+        n.x[1].value = 3
+        self.assertEqual(list(n.x.keys()), [1, 2, 4])
+        self.assertEqual(n.x[4].index(), 4)
+        self.assertEqual(list(n.p.sparse_keys()), [1, 2])
+        self.assertEqual(n.p[3].value, 3)
+        self.assertEqual(list(n.c.keys()), [3])
+        self.assertIs(n.c[3].body.arg(0), n.p[2])
+        self.assertEqual(list(n.o.keys()), [2])
+        self.assertEqual(n.o[2].sense, maximize)
+
+    def test_array_storage_and_units(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3], storage='array')
+        m.x = Var(m.I, storage='array', units=units.m, initialize=2)
+        m.x[2].fix()
+        m.x[3].domain = NonNegativeIntegers
+        m.p = Param(mutable=True, initialize=4, units=units.s)
+        m.q = Param(mutable=True, initialize=5, units=units.m)
+        m.x[3].setub(m.q)
+        m.c = Constraint(expr=m.x[1] / m.p <= 3 * units.m / units.s)
+
+        n = self._round_trip(m)
+        # Views are only created for referenced members (the views are
+        # weakly held, so unreferenced ones may already be collected)
+        self.assertNotIn(2, n.x._data)
+        self.assertEqual(list(n.I), [1, 2, 3])
+        self.assertIsNotNone(n.x._array)
+        self.assertEqual(list(n.x.get_values_array()), [2, 2, 2])
+        self.assertEqual(list(n.x.get_fixed_array()), [False, True, False])
+        self.assertIs(n.x[3].domain, NonNegativeIntegers)
+        self.assertIs(n.x[3].upper, n.q)
+        self.assertEqual(n.x[2].domain.name, 'Reals')
+        self.assertFalse(n.x[1].stale)
+        self.assertEqual(str(units.get_units(n.x[1])), 'm')
+        self.assertEqual(str(units.get_units(n.p)), 's')
+        self.assertEqual(str(n.c.expr), str(m.c.expr))
+        self.assertEqual(str(units.get_units(n.c.body)), 'm/s')
+
+    def test_linear_expressions(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.p = Param(mutable=True, initialize=2)
+        m.e = Expression(expr=LinearExpression([1, m.p * m.x[1], m.x[2]]))
+        m.f = Expression(expr=m.e)
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 2**70)
+
+        n = self._round_trip(m)
+        self.assertIs(type(n.e.expr), LinearExpression)
+        self.assertEqual(str(n.e.expr), str(m.e.expr))
+        self.assertIs(n.f.expr, n.e)
+        self.assertEqual(n.c.lower, 2**70)
+
+    def test_empty_model(self):
+        n = self._round_trip(ConcreteModel())
+        self.assertEqual(list(n.component_objects()), [])
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.dual = Suffix()
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot save component 'dual': Suffix components are not supported",
+        ):
+            save_model(m, self.fname)
+
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.r = Reference(m.x)
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot save component 'r': Reference components are not supported",
+        ):
+            save_model(m, self.fname)
+
+        m = ConcreteModel()
+        m.x = Var()
+        m.b = Block()
+        m.b.c = Constraint(expr=m.x >= 0)
+        with self.assertRaisesRegex(
+            ValueError, "the expression references 'x', which is either not part"
+        ):
+            save_model(m.b, self.fname)
+
+        m = ConcreteModel()
+        m.p = Param([1], initialize={1: [1, 2]}, within=Any)
+        with self.assertRaisesRegex(ValueError, r"Cannot save value \[1, 2\]"):
+            save_model(m, self.fname)
+
+    def test_invalid_file(self):
+        with open(self.fname, 'wb') as FILE:
+            FILE.write(b'not a model')
+        with self.assertRaisesRegex(ValueError, "is not a Pyomo model file"):
+            load_model(self.fname)
+
+        save_model(ConcreteModel(), self.fname)
+        with open(self.fname, 'r+b') as FILE:
+            FILE.seek(8)
+            FILE.write(struct.pack('<I', 1000))
+        with self.assertRaisesRegex(ValueError, "uses format version 1000"):
+            load_model(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
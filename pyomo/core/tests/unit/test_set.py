@@ -82,9 +82,15 @@ from pyomo.core.base.set import (
     SetProduct_InfiniteSet,
     SetProduct_FiniteSet,
     SetProduct_OrderedSet,
+    SetJoin,
+    SetJoin_FiniteSet,
+    SetJoin_OrderedSet,
     SetData,
     FiniteSetData,
     InsertionOrderSetData,
+    ArrayOrderedSetData,
+    ArrayOrderedScalarSet,
+    AbstractArrayOrderedScalarSet,
     SortedSetData,
     _FiniteSetMixin,
     _OrderedSetMixin,
@@ -3466,6 +3472,145 @@ J : Size=1, Index=None, Ordered=False
         self.assertNotIn((2, 5, 3), m.Z)
 
 
+class TestSetJoin(unittest.TestCase):
+    def test_join(self):
+        m = ConcreteModel()
+        m.ARCS = Set(initialize=[(1, 2), (2, 3), (3, 4), (1, 3)])
+        m.OUT = Set(initialize=[(2, 'a'), (3, 'b'), (3, 'c')])
+        m.J = m.ARCS.join(m.OUT)
+        self.assertIs(type(m.J), SetJoin_OrderedSet)
+        self.assertEqual(str(m.J), 'J')
+        self.assertEqual(m.J._expression_str(), 'ARCS JOIN OUT')
+        self.assertEqual(m.J.dimen, 3)
+        ref = [(1, 2, 'a'), (2, 3, 'b'), (2, 3, 'c'), (1, 3, 'b'), (1, 3, 'c')]
+        self.assertEqual(list(m.J), ref)
+        self.assertEqual(len(m.J), 5)
+        self.assertIn((1, 3, 'c'), m.J)
+        self.assertNotIn((1, 2, 'b'), m.J)
+        self.assertNotIn((3, 4, 'a'), m.J)
+        self.assertNotIn((1, 2), m.J)
+        self.assertNotIn(1, m.J)
+        self.assertEqual(m.J.at(2), (2, 3, 'b'))
+        self.assertEqual(m.J.ord((1, 3, 'b')), 4)
+        with self.assertRaisesRegex(IndexError, "J index out of range"):
+            m.J.at(6)
+        with self.assertRaisesRegex(
+            IndexError, r"Cannot identify position of \(1, 2, 'b'\) in Set J"
+        ):
+            m.J.ord((1, 2, 'b'))
+
+        # The join is a view of the (current) operand sets
+        m.OUT.add((4, 'd'))
+        self.assertIn((3, 4, 'd'), m.J)
+        self.assertEqual(len(m.J), 6)
+
+        m.x = Var(m.J)
+        self.assertEqual(list(m.x), ref[:3] + [(3, 4, 'd')] + ref[3:])
+
+    def test_join_on(self):
+        m = ConcreteModel()
+        m.N = Set(initialize=[1, 2, 3, 4])
+        m.ARCS = Set(initialize=[(1, 2), (2, 3), (3, 4), (1, 3)])
+        m.J = m.ARCS.join(m.ARCS, on=[(0, 0)])
+        self.assertEqual(m.J.dimen, 3)
+        self.assertEqual(
+            list(m.J),
+            [(1, 2, 2), (1, 2, 3), (2, 3, 3), (3, 4, 4), (1, 3, 2), (1, 3, 3)],
+        )
+        self.assertEqual(m.J._expression_str(), 'ARCS JOIN ARCS ON ((0, 0),)')
+
+        # Joining all columns of the second set filters the first set
+        m.K = m.N.join(m.ARCS, on=[(0, 0), (0, -1)])
+        self.assertEqual(list(m.K), [])
+        m.K = m.ARCS.join(m.N, on=[(1, 0)])
+        self.assertEqual(m.K.dimen, 2)
+        self.assertEqual(list(m.K), list(m.ARCS))
+        m.L = m.N.join(m.ARCS, on=[(0, 1)])
+        self.assertEqual(list(m.L), [(2, 1), (3, 2), (3, 1), (4, 3)])
+        self.assertIn((3, 1), m.L)
+        self.assertNotIn((1, 3), m.L)
+        self.assertEqual(len(m.L), 4)
+
+        # Empty join specification is a (sparse) cross product
+        m.T = Set(initialize=[0, 1])
+        m.P = m.ARCS.join(m.T, on=[])
+        self.assertEqual(list(m.P), list(m.ARCS * m.T))
+
+        # Unordered operands result in unordered joins
+        m.U = m.ARCS.join(SetOf({(2, 5)}))
+        self.assertIs(type(m.U), SetJoin_FiniteSet)
+        self.assertEqual(list(m.U), [(1, 2, 5)])
+
+    def test_join_cache(self):
+        m = ConcreteModel()
+        m.ARCS = Set(initialize=[(1, 2), (2, 3), (3, 4), (1, 3)])
+        m.OUT = Set(initialize=[(2, 'a'), (3, 'b'), (3, 'c')])
+        m.J = m.ARCS.join(m.OUT)
+        self.assertEqual(m.J.next((2, 3, 'c')), (1, 3, 'b'))
+        self.assertEqual(m.J.prev((2, 3, 'c')), (2, 3, 'b'))
+        self.assertEqual(m.J.ord((1, 3, 'c')), 5)
+
+        # The index and members are reused while the operands are not
+        # modified
+        cache = m.J._join_cache
+        self.assertEqual(cache[4], list(m.J))
+        self.assertEqual(len(m.J), 5)
+        self.assertIs(m.J._join_cache, cache)
+
+        # ... and rebuilt when they are
+        m.OUT.remove((3, 'b'))
+        self.assertEqual(len(m.J), 3)
+        self.assertIsNot(m.J._join_cache, cache)
+        self.assertEqual(m.J.ord((1, 3, 'c')), 3)
+        m.ARCS.add((4, 2))
+        self.assertEqual(m.J.last(), (4, 2, 'a'))
+        self.assertEqual(m.J.next((1, 3, 'c')), (4, 2, 'a'))
+        m.OUT.clear()
+        self.assertEqual(list(m.J), [])
+
+        # Joins of unordered sets are not cached
+        m.U = m.ARCS.join(SetOf({(2, 5)}))
+        self.assertEqual(len(m.U), 2)
+        self.assertIsNone(m.U._join_cache)
+
+        # The cache is not copied with the model
+        m.OUT.add((2, 'a'))
+        self.assertEqual(m.J.at(1), (1, 2, 'a'))
+        self.assertIsNotNone(m.J._join_cache)
+        self.assertIsNone(m.clone().J._join_cache)
+        self.assertIsNone(pickle.loads(pickle.dumps(m)).J._join_cache)
+
+    def test_join_errors(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[(1, 2)])
+        m.B = Set(initialize=[1, (1, 2)], dimen=None)
+        with self.assertRaisesRegex(TypeError, "only defined for finite Sets"):
+            m.A.join(Reals)
+        with self.assertRaisesRegex(ValueError, "'on' must be a sequence of"):
+            m.A.join(m.A, on=[(0, 1, 2)])
+        with self.assertRaisesRegex(ValueError, r"invalid column pair \(2, 0\)"):
+            list(m.A.join(m.A, on=[(2, 0)]))
+        with self.assertRaisesRegex(ValueError, "appears more than once"):
+            list(m.A.join(m.A, on=[(0, 0), (1, 0)]))
+        j = m.A.join(m.B)
+        self.assertIsNone(j.dimen)
+        with self.assertRaisesRegex(ValueError, "Set B has dimen=None"):
+            list(j)
+
+    def test_abstract_join(self):
+        m = AbstractModel()
+        m.A = Set(dimen=2)
+        m.B = Set(dimen=2)
+        m.J = m.A.join(m.B, on=[(0, 0)])
+        m.x = Var(m.J)
+        i = m.create_instance(
+            data={None: {'A': {None: [(1, 2), (2, 3)]}, 'B': {None: [(1, 5), (2, 6)]}}}
+        )
+        self.assertEqual(list(i.J), [(1, 2, 5), (2, 3, 6)])
+        self.assertEqual(list(i.x), [(1, 2, 5), (2, 3, 6)])
+        self.assertEqual(list(i.clone().J), [(1, 2, 5), (2, 3, 6)])
+
+
 class TestGlobalSets(unittest.TestCase):
     def test_globals(self):
         self.assertEqual(Reals.__class__.__name__, 'GlobalSet')
@@ -5505,6 +5650,255 @@ I : Size=2, Index={1, 2, 3, 4, 5}, Ordered=Insertion
             normalize_index.flatten = _oldFlatten
 
 
+@unittest.skipIf(not numpy_available, "NumPy required for array Set storage")
+class TestArraySetStorage(unittest.TestCase):
+    def test_construction_errors(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegex(ValueError, "Set 'storage' argument is not valid"):
+            m.I = Set(storage='columns')
+        with self.assertRaisesRegex(
+            ValueError, "storage='array' is only supported for insertion ordered"
+        ):
+            m.I = Set(ordered=Set.SortedOrder, storage='array')
+        m.I = Set(initialize=[1, 2], storage='array')
+        self.assertIs(type(m.I), ArrayOrderedScalarSet)
+        self.assertIs(type(Set(storage='array')), AbstractArrayOrderedScalarSet)
+        m.J = Set([1, 2], storage='array')
+        m.J[1] = [3, 1]
+        self.assertIs(type(m.J[1]), ArrayOrderedSetData)
+        self.assertEqual(list(m.J[1]), [3, 1])
+
+    def test_scalar_members(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 'a', 1, 3], storage='array')
+        self.assertTrue(m.I.isordered())
+        self.assertEqual(list(m.I), [3, 'a', 1])
+        self.assertEqual(list(reversed(m.I)), [1, 'a', 3])
+        self.assertEqual(len(m.I), 3)
+        self.assertEqual(m.I.at(2), 'a')
+        self.assertEqual(m.I.at(-1), 1)
+        self.assertEqual(m.I.ord('a'), 2)
+        self.assertEqual(m.I.ord((1,)), 3)
+        self.assertEqual(m.I.next(3), 'a')
+        self.assertEqual(m.I.prev(1), 'a')
+        self.assertIn(1, m.I)
+        self.assertNotIn(2, m.I)
+        with self.assertRaisesRegex(IndexError, "I index out of range"):
+            m.I.at(4)
+        with self.assertRaisesRegex(ValueError, r"I.ord\(x\): x not in I"):
+            m.I.ord(2)
+        with self.assertRaisesRegex(ValueError, "has dimension 2"):
+            m.I.add((1, 2))
+        # Sets with unspecified dimen still require consistent members
+        m.J = Set(initialize=[1, 2], dimen=None, storage='array')
+        with self.assertRaisesRegex(ValueError, "all members must be scalars"):
+            m.J.add((1, 2))
+        m.K = Set(initialize=[(1, 2)], dimen=None, storage='array')
+        with self.assertRaisesRegex(ValueError, "all members must be scalars"):
+            m.K.add(1)
+        with self.assertRaisesRegex(ValueError, "all members must be scalars"):
+            m.K.update([(1, 3), (1, 2, 3)])
+
+        self.assertTrue(m.I.add(5))
+        self.assertFalse(m.I.add(5))
+        m.I.remove('a')
+        self.assertEqual(list(m.I), [3, 1, 5])
+        self.assertEqual(m.I.ord(5), 3)
+        m.I.discard(7)
+        self.assertEqual(m.I.pop(), 5)
+        self.assertEqual(list(m.I), [3, 1])
+        m.I.clear()
+        self.assertEqual(len(m.I), 0)
+        self.assertEqual(list(m.I), [])
+        self.assertEqual(m.I.isin([1, 2]).tolist(), [False, False])
+
+    def test_tuple_members(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 'a'), (2, 'b'), (1, 'b'), (1, 'a')], storage='array')
+        self.assertEqual(m.I.dimen, 2)
+        self.assertEqual(list(m.I), [(1, 'a'), (2, 'b'), (1, 'b')])
+        self.assertEqual(list(reversed(m.I)), [(1, 'b'), (2, 'b'), (1, 'a')])
+        self.assertEqual(m.I.at(3), (1, 'b'))
+        self.assertEqual(m.I.ord((2, 'b')), 2)
+        self.assertEqual(m.I.next((1, 'a')), (2, 'b'))
+        self.assertIn((1, 'b'), m.I)
+        self.assertNotIn((2, 'a'), m.I)
+        self.assertNotIn((1, 'a', 1), m.I)
+        self.assertNotIn(1, m.I)
+        with self.assertRaisesRegex(ValueError, r"I.ord\(x\): x not in I"):
+            m.I.ord((2, 'a'))
+
+        m.I.add((2, 'a'))
+        self.assertEqual(m.I.ord((2, 'a')), 4)
+        m.I.remove((2, 'b'))
+        self.assertEqual(list(m.I), [(1, 'a'), (1, 'b'), (2, 'a')])
+        self.assertEqual(m.I.ord((2, 'a')), 3)
+        m.I.remove((2, 'a'))
+        self.assertEqual(list(m.I), [(1, 'a'), (1, 'b')])
+        self.assertNotIn((2, 'a'), m.I)
+
+    def test_isin(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 2), (2, 3), (3, 4)], storage='array')
+        m.J = Set(initialize=[(1, 2), (2, 3), (3, 4)])
+        query = [(2, 3), (3, 2), (4, 5), 1, (1, 2, 3), (3, 4)]
+        ref = [True, False, False, False, False, True]
+        self.assertEqual(m.I.isin(query).tolist(), ref)
+        self.assertEqual(m.J.isin(query).tolist(), ref)
+        query = np.array([[1, 2], [2, 2], [3, 4]])
+        self.assertEqual(m.I.isin(query).tolist(), [True, False, True])
+        self.assertEqual(m.J.isin(query).tolist(), [True, False, True])
+        self.assertEqual(m.I.isin([]).tolist(), [])
+
+        m.K = Set(initialize=[5, 1, 3], storage='array')
+        self.assertEqual(m.K.isin(np.arange(6)).tolist(), [0, 1, 0, 1, 0, 1])
+
+    def test_isin_normalization(self):
+        # 1-tuples and nested tuples are normalized (as with object
+        # storage)
+        m = ConcreteModel()
+        m.I = Set(initialize=[5, 1, 3], storage='array')
+        m.J = Set(initialize=[5, 1, 3])
+        query = [(1,), (2,), 3, (5.0,)]
+        self.assertEqual(m.I.isin(query).tolist(), [True, False, True, True])
+        self.assertEqual(m.I._values.isin(query).tolist(), [True, False, True, True])
+        self.assertEqual(m.J.isin(query).tolist(), [True, False, True, True])
+        self.assertIn((1,), m.I)
+
+        m.K = Set(initialize=[(1, 2), (2, 3)], storage='array')
+        query = [((1,), 2), (2.0, 3), (1, (2,)), (1, 3)]
+        self.assertEqual(m.K.isin(query).tolist(), [True, True, True, False])
+        self.assertIn(((1,), 2), m.K)
+        self.assertIn((2.0, 3), m.K)
+        m.L = Set(initialize=[('a', 'b')], storage='array')
+        self.assertNotIn('ab', m.L)
+
+    def test_int_columns(self):
+        # Positions that only hold ints store the values directly, and
+        # switch to the code table when other values are added
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 2), (-3, 4)], storage='array')
+        self.assertEqual(m.I._values.coded, [False, False])
+        self.assertEqual(m.I._values.values, [])
+        m.I.add((0.5, 2**70))
+        m.I.add((2, 'x'))
+        self.assertEqual(m.I._values.coded, [True, True])
+        self.assertEqual(list(m.I), [(1, 2), (-3, 4), (0.5, 2**70), (2, 'x')])
+        self.assertIs(type(m.I.at(1)[0]), int)
+        self.assertEqual(m.I.ord((-3, 4)), 2)
+        self.assertEqual(
+            m.I.isin([(-3, 4), (-3.0, 4), (1, 'x'), (0.5, 2**70)]).tolist(),
+            [True, True, False, True],
+        )
+
+        m.J = Set(initialize=[(1, 2), (2, 1)], storage='array')
+        self.assertEqual(
+            m.J.isin([(1.0, 2), (1.5, 2), (2**70, 1)]).tolist(), [True, False, False]
+        )
+
+    def test_repeated_members_in_chunk(self):
+        # The first occurrence of repeated members is kept
+        data = [(3, 'a'), (1, 'b'), (3, 'a'), (2, 'c'), (1, 'b'), (3, 'a')]
+        s = SetModule._ArraySetStorage()
+        s.update(data)
+        self.assertEqual(list(s), [(3, 'a'), (1, 'b'), (2, 'c')])
+        self.assertEqual([s.find(v) for v in data], [0, 1, 0, 2, 1, 0])
+
+    def test_join_cache(self):
+        # Joins of array Sets are cached (until the operands change)
+        m = ConcreteModel()
+        m.ARCS = Set(initialize=[(1, 2), (2, 3), (3, 4), (1, 3)], storage='array')
+        m.OUT = Set(initialize=[(2, 'a'), (3, 'b'), (3, 'c')], storage='array')
+        m.J = m.ARCS.join(m.OUT)
+        self.assertEqual(m.J.ord((1, 3, 'c')), 5)
+        cache = m.J._join_cache
+        self.assertIsNotNone(cache)
+        self.assertEqual(len(m.J), 5)
+        self.assertIs(m.J._join_cache, cache)
+        m.ARCS.add((4, 2))
+        self.assertEqual(m.J.last(), (4, 2, 'a'))
+        self.assertIsNot(m.J._join_cache, cache)
+        cache = m.J._join_cache
+        m.OUT.remove((3, 'b'))
+        self.assertEqual(len(m.J), 4)
+        self.assertIsNot(m.J._join_cache, cache)
+
+    def test_large_updates(self):
+        # Exercise chunked insertion, growing the hash table, and
+        # individually added members
+        m = ConcreteModel()
+        m.I = Set(storage='array')
+        ref = []
+        _storage = SetModule._ArraySetStorage
+        _old = _storage._CHUNK
+        try:
+            _storage._CHUNK = 50
+            data = [(i % 37, 'x%s' % (i % 300), i % 3) for i in range(0, 2000, 7)]
+            m.I.update(data)
+            ref.extend(dict.fromkeys(data))
+            for i in range(40):
+                val = (i, 'y', i % 2)
+                m.I.add(val)
+                ref.append(val)
+            m.I.update(data[:10])
+            self.assertEqual(list(m.I), ref)
+            self.assertEqual(list(reversed(m.I)), ref[::-1])
+        finally:
+            _storage._CHUNK = _old
+        # The hash table is at most half full
+        self.assertGreaterEqual(len(m.I._values.table), 2 * len(ref))
+        for i, v in enumerate(ref):
+            self.assertEqual(m.I.ord(v), i + 1)
+            self.assertEqual(m.I.at(i + 1), v)
+        self.assertEqual(
+            m.I.isin(ref[-4:] + [(0, 'y', 1)]).tolist(), [True] * 4 + [False]
+        )
+        # All values share a single code table
+        self.assertEqual(len(m.I._values.values), len(set(m.I._values.codes)))
+
+    def test_remove_members(self):
+        m = ConcreteModel()
+        data = [tuple(range(i, i + 8)) for i in range(200)]
+        m.I = Set(initialize=data, storage='array')
+        self.assertEqual(list(m.I), data)
+        self.assertEqual(m.I.ord(data[5]), 6)
+        self.assertEqual(m.I.isin([data[3], data[3][::-1]]).tolist(), [True, False])
+        m.I.remove(data[3])
+        del data[3]
+        self.assertNotIn((3, 4, 5, 6, 7, 8, 9, 10), m.I)
+        self.assertEqual(m.I.ord(data[5]), 6)
+        # Removing the last members does not rebuild the hash table
+        table = m.I._values.table
+        for i in range(100):
+            self.assertEqual(m.I.pop(), data.pop())
+        self.assertIs(m.I._values.table, table)
+        self.assertEqual(list(m.I), data)
+        for i, v in enumerate(data):
+            self.assertEqual(m.I.ord(v), i + 1)
+        self.assertEqual(m.I.isin(data).tolist(), [True] * len(data))
+        m.I.add(tuple(range(900, 908)))
+        self.assertEqual(m.I.ord(tuple(range(900, 908))), len(data) + 1)
+
+    def test_construct_releases_data(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 2), (2, 3)], storage='array')
+        self.assertIsNone(m.I._init_values)
+        self.assertEqual(list(m.I), [(1, 2), (2, 3)])
+
+    def test_pickle_clone(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 'a'), (2, 'b')], storage='array')
+        m.J = Set(initialize=['x', 'y'], storage='array')
+        for i in (pickle.loads(pickle.dumps(m)), m.clone()):
+            self.assertIs(type(i.I), ArrayOrderedScalarSet)
+            self.assertEqual(list(i.I), [(1, 'a'), (2, 'b')])
+            self.assertEqual(i.I.ord((2, 'b')), 2)
+            self.assertEqual(list(i.J), ['x', 'y'])
+            i.I.add((3, 'c'))
+            self.assertEqual(len(i.I), 3)
+            self.assertEqual(len(m.I), 2)
+
+
 class TestAbstractSetAPI(unittest.TestCase):
     def testSetData(self):
         # This tests an anstract non-finite set API
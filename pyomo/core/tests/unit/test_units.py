@@ -851,6 +851,48 @@ class TestPyomoUnit(unittest.TestCase):
         m.e = Expression(expr=m.x / m.y)
         self.assertEqual(str(uc.get_units(m.e)), 'kg/m')
 
+    def test_units_cache(self):
+        uc = units
+        m = ConcreteModel()
+        m.x = Var(units=uc.kg)
+        m.y = Var(units=uc.m)
+        m.e = Expression(expr=m.x / m.y)
+        visitor = uc._pintUnitExtractionVisitor
+        self.assertIsNone(visitor._cache)
+        with uc.units_cache():
+            self.assertEqual(str(uc.get_units(m.e)), 'kg/m')
+            cache = visitor._cache
+            # The cache holds the units records (dimensions, scale
+            # factor, pint unit) of the named expressions and of the
+            # units of the leaves
+            self.assertEqual(
+                {id(m.e), id(m.x.get_units()), id(m.y.get_units())}, set(cache)
+            )
+            self.assertIs(cache[id(m.e)][0], m.e)
+            self.assertEqual(
+                cache[id(m.e)][1],
+                ((('[length]', -1), ('[mass]', 1)), 1, uc.get_units(m.e)._pint_unit),
+            )
+            # Nested contexts reuse the outer cache
+            with uc.units_cache():
+                self.assertIs(visitor._cache, cache)
+                self.assertEqual(str(uc.get_units(m.e * m.y)), 'kg')
+            self.assertIs(visitor._cache, cache)
+            # The cached units are used for subsequent expressions
+            # (even if the named expression was changed)
+            m.e.expr = m.x
+            self.assertEqual(str(uc.get_units(m.e * m.y)), 'kg')
+        self.assertIsNone(visitor._cache)
+        self.assertEqual(str(uc.get_units(m.e * m.y)), 'kg*m')
+
+        # Inconsistent expressions are never cached
+        m.e.expr = m.x + m.y
+        with uc.units_cache():
+            with self.assertRaises(InconsistentUnitsError):
+                uc.get_units(m.e)
+            self.assertNotIn(id(m.e), visitor._cache)
+        self.assertIsNone(visitor._cache)
+
     def test_dimensionless(self):
         uc = units
         kg = uc.kg
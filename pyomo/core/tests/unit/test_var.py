@@ -16,6 +16,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
@@ -23,9 +24,11 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
-from pyomo.core.base import IntegerSet
+from pyomo.core.base import IntegerSet, SortComponents
+from pyomo.core.base.var import _var_bounds, _var_values
 from pyomo.core.expr.numeric_expr import (
     NPV_ProductExpression,
     NPV_MaxExpression,
@@ -49,6 +52,8 @@ from pyomo.environ import (
     NonNegativeReals,
     Integers,
     Binary,
+    Constraint,
+    Objective,
     value,
 )
 from pyomo.core.base.units_container import units, pint_available, UnitsError
@@ -1825,5 +1830,388 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.bounds, (0, 1))
 
 
+@unittest.skipUnless(numpy_available, "Bulk accessors require numpy")
+class TestBulkAccessors(unittest.TestCase):
+    storage = 'object'
+
+    def _model(self, **kwds):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3, 4])
+        m.x = Var(m.I, storage=self.storage, **kwds)
+        return m
+
+    def test_values_array(self):
+        m = self._model(initialize={2: 5})
+        self.assertStructuredAlmostEqual(
+            m.x.get_values_array().tolist(), [np.nan, 5, np.nan, np.nan]
+        )
+        m.x.set_values_array([1, 2, None, 4])
+        self.assertEqual(m.x.get_values(), {1: 1, 2: 2, 3: None, 4: 4})
+        self.assertTrue(m.x[3].stale)
+        self.assertFalse(m.x[4].stale)
+        m.x.set_values_array(np.array([7.0, 8.0]), index=[4, 1])
+        self.assertEqual(m.x.get_values_array(index=[1, 4]).tolist(), [8, 7])
+        m.x.set_values_array(0)
+        self.assertEqual(m.x.get_values_array().tolist(), [0, 0, 0, 0])
+        with self.assertRaisesRegex(
+            ValueError,
+            r"1-D array with 4 elements for component 'x' "
+            r"\(received an array with shape \(2,\)\)",
+        ):
+            m.x.set_values_array([1, 2])
+        with self.assertRaises(KeyError):
+            m.x.set_values_array([1], index=[5])
+
+    def test_values_array_validation(self):
+        m = self._model(bounds=(0, 10), domain=Integers)
+        m.x[1].domain = Reals
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array([1.5, 2.5, 11, 3])
+        self.assertNotIn("x[1]", LOG.getvalue())
+        self.assertIn(
+            "Setting Var 'x[2]' to a value `2.5` (float) not in", LOG.getvalue()
+        )
+        self.assertIn("Setting Var 'x[3]' to a numeric value `11", LOG.getvalue())
+        self.assertNotIn("x[4]", LOG.getvalue())
+        self.assertEqual(m.x.get_values(), {1: 1.5, 2: 2.5, 3: 11, 4: 3})
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array([1.5, 2.5, 11, 3], skip_validation=True)
+        self.assertEqual(LOG.getvalue(), "")
+
+    def test_bounds_arrays(self):
+        m = self._model(bounds=(0, 10))
+        m.x[4].domain = Binary
+        lb, ub = m.x.get_bounds_arrays()
+        self.assertEqual(lb.tolist(), [0, 0, 0, 0])
+        self.assertEqual(ub.tolist(), [10, 10, 10, 1])
+        m.x.set_bounds(lb=[None, -np.inf, 2, 0.5])
+        self.assertEqual(m.x[1].bounds, (None, 10))
+        self.assertEqual(m.x[2].bounds, (None, 10))
+        self.assertEqual(m.x[3].bounds, (2, 10))
+        self.assertEqual(m.x[4].bounds, (0.5, 1))
+        lb, ub = m.x.get_bounds_arrays(index=[2, 3])
+        self.assertEqual(lb.tolist(), [-np.inf, 2])
+        m.x.set_bounds(ub=np.inf, index=[1, 2])
+        self.assertEqual(m.x.get_bounds_arrays()[1].tolist(), [np.inf, np.inf, 10, 1])
+        m.p = Param(mutable=True, initialize=3)
+        m.x[1].setub(m.p)
+        m.p = 4
+        self.assertEqual(m.x.get_bounds_arrays()[1].tolist(), [4, np.inf, 10, 1])
+        with self.assertRaisesRegex(
+            ValueError, "Var 'x': invalid non-finite lower bound"
+        ):
+            m.x.set_bounds(lb=np.inf)
+
+    def test_fix_many(self):
+        m = self._model(initialize=1)
+        m.x.fix_many([True, False, True, False])
+        self.assertEqual(m.x.get_fixed_array().tolist(), [True, False, True, False])
+        m.x.fix_many([False, True, True, False], value=[5, 6, 7, 8])
+        self.assertEqual(m.x.get_fixed_array().tolist(), [True, True, True, False])
+        self.assertEqual(m.x.get_values(), {1: 1, 2: 6, 3: 7, 4: 1})
+        m.x.unfix_many([True, True, False, False])
+        self.assertEqual(m.x.get_fixed_array().tolist(), [False, False, True, False])
+        self.assertEqual(m.x.get_fixed_array(index=[3, 4]).tolist(), [True, False])
+        m.x.fix_many(value=0, index=[4])
+        self.assertEqual(m.x.get_fixed_array().tolist(), [False, False, True, True])
+        self.assertEqual(m.x[4].value, 0)
+        m.x.unfix_many()
+        self.assertEqual(m.x.get_fixed_array().tolist(), [False] * 4)
+
+
+class TestBulkAccessorsArrayStorage(TestBulkAccessors):
+    storage = 'array'
+
+
+@unittest.skipUnless(numpy_available, "Array storage requires numpy")
+class TestArrayStorage(unittest.TestCase):
+    def _model(self, storage='array', **kwds):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3, 4])
+        m.x = Var(m.I, storage=storage, **kwds)
+        return m
+
+    def test_bad_storage(self):
+        m = ConcreteModel()
+        with self.assertRaisesRegex(ValueError, "Unknown Var storage 'bogus'"):
+            m.x = Var([1, 2], storage='bogus')
+        with self.assertRaisesRegex(
+            ValueError, "storage='array' is only supported for dense indexed"
+        ):
+            m.y = Var(storage='array')
+        with self.assertRaisesRegex(
+            ValueError, "storage='array' is only supported for dense indexed"
+        ):
+            m.z = Var([1, 2], dense=False, storage='array')
+        with self.assertRaisesRegex(
+            ValueError, "storage='array' requires a finite, ordered index set"
+        ):
+            m.w = Var(Reals, storage='array')
+        m.U = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegex(
+            ValueError, "storage='array' requires a finite, ordered index set"
+        ):
+            m.u = Var(m.U, storage='array')
+
+    def test_construct(self):
+        with LoggingIntercept() as LOG:
+            m = self._model(
+                bounds=lambda m, i: (0, i), initialize={1: 5, 3: 1}, domain=Integers
+            )
+        self.assertEqual(
+            LOG.getvalue().replace('\n', ' '),
+            "Setting Var 'x[1]' to a numeric value `5` outside the bounds (0, 1). ",
+        )
+        self.assertEqual(len(m.x), 4)
+        # No views are created until the elements are accessed
+        self.assertEqual(len(m.x._data), 0)
+        self.assertEqual(m.x.get_values(), {1: 5, 2: None, 3: 1, 4: None})
+        self.assertEqual(len(m.x._data), 0)
+        self.assertEqual(list(m.x), [1, 2, 3, 4])
+        self.assertIn(3, m.x)
+        self.assertNotIn(5, m.x)
+        self.assertEqual([v.bounds for v in m.x.values()], [(0, i) for i in m.I])
+        # Views are only weakly cached
+        self.assertEqual(len(m.x._data), 0)
+        views = list(m.x.values())
+        self.assertEqual(len(m.x._data), 4)
+        self.assertEqual([id(v) for v in m.x.values()], list(map(id, views)))
+        del views
+        self.assertEqual(len(m.x._data), 0)
+        self.assertIs(m.x[2].domain, Integers)
+        self.assertIs(m.x[2].parent_component(), m.x)
+        self.assertEqual(m.x[2].name, 'x[2]')
+        self.assertIs(m.x[2], m.x[2])
+        self.assertIsNone(m.x[2].value)
+        self.assertEqual([v.fixed for v in m.x.values()], [False] * 4)
+
+    def test_compare_object_storage(self):
+        def rule(m, i):
+            return (i % 2, i + 0.5)
+
+        m = self._model(storage='object', bounds=rule, initialize=lambda m, i: i)
+        m.y = Var(m.I, bounds=rule, initialize=lambda m, i: i, storage='array')
+        for x, y in zip(m.x.values(), m.y.values()):
+            self.assertEqual(x.index(), y.index())
+            self.assertEqual(x.value, y.value)
+            self.assertEqual(x.bounds, y.bounds)
+            self.assertEqual(x.stale, y.stale)
+            # Integer values (and bounds) are returned as ints
+            self.assertIs(type(x.value), type(y.value))
+            self.assertEqual(list(map(type, x.bounds)), list(map(type, y.bounds)))
+        self.assertIs(type(m.y[1].value), int)
+        self.assertIs(type(m.y[1].ub), float)
+        m.y[1].value = 1.0
+        self.assertIs(type(m.y[1].value), float)
+        m.y.set_values_array([1, 2, 3, 4])
+        self.assertEqual(m.y.get_values(), {1: 1.0, 2: 2.0, 3: 3.0, 4: 4.0})
+        self.assertEqual(set(map(type, m.y.get_values().values())), {float})
+        m.y.fix(1)
+        self.assertEqual(set(map(type, m.y.get_values().values())), {int})
+        self.assertEqual({type(v.value) for v in m.y.values()}, {int})
+
+    def test_element_updates(self):
+        m = self._model(bounds=(0, 10))
+        m.p = Param(mutable=True, initialize=5)
+        m.x[1].setub(m.p)
+        self.assertEqual(m.x[1].ub, 5)
+        m.p = 3
+        self.assertEqual(m.x[1].ub, 3)
+        self.assertEqual(m.x[2].ub, 10)
+        m.x[2].setlb(None)
+        self.assertEqual(m.x[2].bounds, (None, 10))
+        m.x[3].fix(2)
+        self.assertTrue(m.x[3].fixed)
+        self.assertEqual(
+            m.x.get_values(include_fixed_values=False), {1: None, 2: None, 4: None}
+        )
+        m.x[4].domain = Binary
+        self.assertEqual(m.x[4].bounds, (0, 1))
+        self.assertIs(m.x[1].domain, Reals)
+
+    def test_bulk_updates(self):
+        m = self._model(bounds=(0, 10))
+        m.x[2].setub(1)
+        m.x[3].domain = Integers
+        with LoggingIntercept() as LOG:
+            m.x.fix(2.5)
+        self.assertIn(
+            "Setting Var 'x[2]' to a numeric value `2.5` outside", LOG.getvalue()
+        )
+        self.assertIn(
+            "Setting Var 'x[3]' to a value `2.5` (float) not in domain", LOG.getvalue()
+        )
+        self.assertNotIn("x[1]", LOG.getvalue())
+        self.assertEqual(m.x.get_values(), {i: 2.5 for i in m.I})
+        self.assertEqual([v.fixed for v in m.x.values()], [True] * 4)
+        m.x.unfix()
+        self.assertEqual([v.fixed for v in m.x.values()], [False] * 4)
+        m.x.setlb(-1)
+        m.x.setub(None)
+        self.assertEqual([v.bounds for v in m.x.values()], [(-1, None)] * 4)
+        m.x.domain = Binary
+        self.assertEqual([v.bounds for v in m.x.values()], [(0, 1)] * 4)
+
+    def test_stale(self):
+        m = self._model(initialize=1)
+        self.assertFalse(m.x[1].stale)
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+        StaleFlagManager.mark_all_as_stale()
+        m.x[1].set_value(2)
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+
+    def test_index_set_growth(self):
+        m = self._model(initialize={1: 1}, bounds=(0, 5))
+        m.I.add(5)
+        self.assertEqual(len(m.x), 4)
+        self.assertEqual(list(m.x), [1, 2, 3, 4])
+        self.assertEqual(m.x[5].bounds, (0, 5))
+        self.assertIsNone(m.x[5].value)
+        self.assertEqual(len(m.x), 5)
+        self.assertEqual(list(m.x), [1, 2, 3, 4, 5])
+
+        # Accessing an added index also adds all indices added before it
+        m.I.add(7, 6)
+        self.assertIn(6, m.I)
+        self.assertNotIn(6, m.x)
+        self.assertEqual(m.x[6].bounds, (0, 5))
+        self.assertEqual(list(m.x), [1, 2, 3, 4, 5, 7, 6])
+        self.assertEqual(
+            list(m.x.keys(SortComponents.SORTED_INDICES)), list(range(1, 8))
+        )
+        self.assertEqual(m.x[7].bounds, (0, 5))
+
+        # Other modifications change the position of the elements
+        m.I.remove(2)
+        with self.assertRaisesRegex(
+            RuntimeError,
+            "The index set of Var 'x' \\(declared with storage='array'\\) was "
+            "modified after the Var was constructed",
+        ):
+            m.x[1]
+
+    def test_array_index_set_growth(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[(1, 'a'), (2, 'b')], storage='array')
+        m.x = Var(m.I, initialize=lambda m, i, j: i, storage='array')
+        m.I.add((3, 'c'))
+        self.assertEqual(m.x[3, 'c'].value, 3)
+        self.assertEqual(list(m.x), [(1, 'a'), (2, 'b'), (3, 'c')])
+        self.assertEqual(m.x[2, 'b'].value, 2)
+
+        m.I.remove((1, 'a'))
+        with self.assertRaisesRegex(
+            RuntimeError,
+            "The index set of Var 'x' \\(declared with storage='array'\\) was "
+            "modified after the Var was constructed",
+        ):
+            m.x[2, 'b']
+
+    def test_sorted_keys(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.x = Var(m.I, initialize=lambda m, i: i, storage='array')
+        m.x[1].fix()
+        for sort in (SortComponents.UNSORTED, SortComponents.SORTED_INDICES):
+            ref = list(m.I.sorted_iter() if sort else m.I)
+            self.assertEqual(list(m.x.keys(sort)), ref)
+            self.assertEqual([v.value for v in m.x.values(sort)], ref)
+            self.assertEqual(
+                [(i, v.value) for i, v in m.x.items(sort)], list(zip(ref, ref))
+            )
+            self.assertEqual(
+                [(i, v.index()) for i, v in m.x._unfixed_items(sort)],
+                [(i, i) for i in ref if i != 1],
+            )
+
+    def test_unfixed_items(self):
+        m = self._model()
+        m.x.fix_many([True, False, True, False])
+        x2 = m.x[2]
+        self.assertEqual(list(m.x._unfixed_items()), [(2, x2), (4, m.x[4])])
+        # Views are not created for the fixed elements
+        items = list(m.x._unfixed_items())
+        self.assertEqual(sorted(m.x._data), [2, 4])
+        self.assertIs(items[0][1], x2)
+
+    def test_bulk_bounds_and_values(self):
+        m = ConcreteModel()
+        m.p = Param(initialize=3, mutable=True)
+        m.x = Var([1, 2, 3, 4], initialize={1: 5}, storage='array')
+        m.x[2].setlb(-1)
+        m.x[2].domain = Binary
+        m.x[3].setub(m.p)
+        m.x[4].domain = NonNegativeReals
+        m.x[4].setlb(-2.5)
+        m.y = Var(bounds=(1, 2), initialize=1.5)
+        var_list = [m.x[4], m.y, m.x[3], m.x[2], m.x[1]]
+        self.assertEqual(_var_bounds(var_list), [v.bounds for v in var_list])
+        self.assertEqual(_var_bounds(var_list)[3], (0, 1))
+        self.assertEqual(_var_values(var_list), [None, 1.5, None, None, 5])
+
+    def test_views_released(self):
+        m = ConcreteModel()
+        m.x = Var(range(1000), storage='array')
+        keep = m.x[5]
+        views = list(m.x.values())
+        self.assertEqual(len(m.x._data), 1000)
+        del views
+        # The view table is rebuilt once most of the views are released
+        self.assertEqual(list(m.x._data), [5])
+        self.assertLess(m.x._data._capacity, 1000)
+        self.assertIs(m.x[5], keep)
+
+    def test_delitem(self):
+        m = self._model()
+        with self.assertRaisesRegex(
+            TypeError, "Cannot delete elements of Var 'x' declared with storage='array'"
+        ):
+            del m.x[1]
+
+    def test_clone_pickle(self):
+        m = self._model(bounds=(0, 10), initialize={1: 3})
+        m.x[2].fix(4)
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(i.x._array, m.x._array)
+            self.assertEqual(i.x.get_values(), m.x.get_values())
+            self.assertTrue(i.x[2].fixed)
+            self.assertFalse(i.x[3].fixed)
+            self.assertEqual(i.x[3].bounds, (0, 10))
+            self.assertIs(i.c.body.args[0], i.x[1])
+            i.x[1].set_value(5)
+            self.assertEqual(m.x[1].value, 3)
+
+    def test_writers(self):
+        from pyomo.repn.plugins.nl_writer import NLWriter
+        from pyomo.repn.plugins.lp_writer import LPWriter
+
+        def build(storage, bounds, init, fixed):
+            m = ConcreteModel()
+            m.I = Set(initialize=[1, 2, 3, 4])
+            m.x = Var(m.I, bounds=bounds, initialize=init, storage=storage)
+            m.x[4].fix(fixed)
+            m.x[3].setub(7)
+            m.c = Constraint(expr=sum(m.x[i] for i in (1, 2, 4)) >= 2.5)
+            m.o = Objective(expr=sum(i * m.x[i] for i in m.I))
+            return m
+
+        # Float and integer (bounds and) values are written identically
+        # for both storage types
+        for data in ((0.5, 10.5), 1.5, 2.5), ((0, 10), 1, 2), ((0, 10.5), 1.0, 2):
+            for writer in (LPWriter, NLWriter):
+                ans = []
+                for storage in ('object', 'array'):
+                    OUT = StringIO()
+                    writer().write(
+                        build(storage, *data), OUT, symbolic_solver_labels=True
+                    )
+                    ans.append(OUT.getvalue())
+                self.assertEqual(*ans)
+
+
 if __name__ == "__main__":
     unittest.main()
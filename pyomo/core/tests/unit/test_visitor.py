@@ -57,6 +57,7 @@ from pyomo.core.expr.numeric_expr import (
     AbsExpression,
     NPV_AbsExpression,
 )
+from pyomo.core.expr import _visitor_core
 from pyomo.core.expr.visitor import (
     FixedExpressionError,
     NonConstantExpressionError,
@@ -1705,6 +1706,56 @@ class TestStreamBasedExpressionVisitor_NonRecursive(
         return walker.walk_expression_nonrecursive(expr)
 
 
+class TestStreamBasedExpressionVisitor_Core(unittest.TestCase):
+    def test_node_processor_selection(self):
+        def before(node, child, child_idx):
+            if type(child) in nonpyomo_leaf_types or not child.is_expression_type():
+                return False, child
+            return True, None
+
+        def enter(node):
+            return node.args, []
+
+        def exit(node, data):
+            return len(data)
+
+        walker = StreamBasedExpressionVisitor(beforeChild=before, exitNode=exit)
+        self.assertEqual(walker._process_node.__name__, 'process_node_bx')
+        walker = StreamBasedExpressionVisitor(
+            beforeChild=before, enterNode=enter, exitNode=exit
+        )
+        self.assertEqual(walker._process_node.__name__, 'process_node_bex')
+        walker = StreamBasedExpressionVisitor(exitNode=exit)
+        self.assertEqual(walker._process_node.__name__, 'process_node_general')
+
+        m = ConcreteModel()
+        m.x = Var()
+        e = m.x + 2 * m.x**2
+        for walker in (
+            StreamBasedExpressionVisitor(beforeChild=before, exitNode=exit),
+            StreamBasedExpressionVisitor(
+                beforeChild=before, enterNode=enter, exitNode=exit
+            ),
+        ):
+            self.assertEqual(walker.walk_expression(e), 2)
+            self.assertEqual(walker.walk_expression_nonrecursive(e), 2)
+
+    def test_bound_processors(self):
+        # The core node processors are bound to the visitor class and
+        # can be (re)assigned to instances (see, e.g., the docplex
+        # writer)
+        for name in ('general', 'bex', 'bx'):
+            self.assertIs(
+                getattr(StreamBasedExpressionVisitor, '_process_node_' + name),
+                getattr(_visitor_core, 'process_node_' + name),
+            )
+        self.assertIs(
+            StreamBasedExpressionVisitor._nonrecursive_walker_loop,
+            _visitor_core.nonrecursive_walker_loop,
+        )
+        self.assertIn(_visitor_core.compiled, (True, False))
+
+
 def fill_stack(n, fcn, *args):
     if n:
         return fill_stack(n - 1, fcn, *args)
@@ -1802,6 +1853,10 @@ class TestStreamBasedExpressionVisitor_Deep(unittest.TestCase):
             # We have not yet determined how to trigger the
             # RecursionError on PyPy
             cases = [(0, "")]
+        elif _visitor_core.compiled:
+            # The compiled node processors do not consume Python stack
+            # frames, so we cannot trigger the RecursionError here
+            cases = [(0, "")]
         elif os.environ.get('GITHUB_ACTIONS', '') and sys.platform.startswith('win'):
             # The test for handling RecursionError appears to fail
             # inexplicably on GHA/Windows under pytest: the
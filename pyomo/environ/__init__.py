@@ -174,6 +174,7 @@ from pyomo.core import (
     name,
     Component,
     ComponentUID,
+    ComponentUIDIndex,
     BuildAction,
     BuildCheck,
     Set,
@@ -243,6 +244,8 @@ from pyomo.core import (
     Transformation,
     TransformationFactory,
     instance2dat,
+    save_model,
+    load_model,
     set_options,
     RealSet,
     IntegerSet,
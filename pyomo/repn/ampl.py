@@ -933,14 +933,12 @@ class AMPLBeforeChildDispatcher(BeforeChildDispatcher):
         # order in which we would see the variables)
         vm = visitor.var_map
         try:
-            _iter = var.parent_component().values(visitor.sorter)
+            _iter = var.parent_component()._unfixed_items(visitor.sorter)
         except AttributeError:
             # Note that this only works for the AML, as kernel does not
             # provide a parent_component()
-            _iter = (var,)
-        for v in _iter:
-            if v.fixed:
-                continue
+            _iter = () if var.fixed else ((None, var),)
+        for _, v in _iter:
             vm[id(v)] = v
 
     @staticmethod
@@ -1272,6 +1270,219 @@ class AMPLRepnVisitor(StreamBasedExpressionVisitor):
         return ans
 
 
+class AMPLRepnCSEVisitor(AMPLRepnVisitor):
+    """An :py:class:`AMPLRepnVisitor` that shares common subexpressions
+
+    This visitor treats every node that appears in the
+    `common_subexpressions` map (a dict mapping the ``id()`` of an
+    expression node to a :py:class:`CommonSubexpression`) as if it were
+    a named :py:class:`Expression`: the first occurrence is compiled
+    and recorded in the `subexpression_cache` (so it is emitted as a
+    defined variable), and all structurally identical subtrees
+    reference that defined variable.  See
+    :py:func:`find_common_subexpressions`.
+
+    """
+
+    def __init__(self, *args, common_subexpressions=None):
+        super().__init__(*args)
+        if common_subexpressions is None:
+            common_subexpressions = {}
+        self.common_subexpressions = common_subexpressions
+
+    def beforeChild(self, node, child, child_idx):
+        cse = self.common_subexpressions.get(id(child))
+        if cse is not None and id(cse) in self.subexpression_cache:
+            return _before_child_handlers._before_named_expression(self, cse)
+        return _before_child_handlers[child.__class__](self, child)
+
+    def exitNode(self, node, data):
+        ans = super().exitNode(node, data)
+        cse = self.common_subexpressions.get(id(node))
+        if cse is None:
+            return ans
+        return handle_named_expression_node(self, cse, ans)
+
+
+class CommonSubexpression(object):
+    """This is a mock "component" for a repeated subexpression.
+
+    It stands in for the named :py:class:`Expression` that the user
+    could have declared for a set of structurally identical subtrees
+    (see :py:func:`find_common_subexpressions`).
+
+    """
+
+    __slots__ = ('_index', '_node')
+
+    def __init__(self, index, node):
+        self._index = index
+        self._node = node
+
+    @property
+    def name(self):
+        return 'cse[%s]' % (self._index,)
+
+    @property
+    def expr(self):
+        return self._node
+
+
+# Operators that can become defined variables (sums are merged into
+# their parent expressions by the AMPLRepnVisitor, so we do not share
+# them)
+_cse_node_types = {
+    ProductExpression,
+    DivisionExpression,
+    PowExpression,
+    AbsExpression,
+    UnaryFunctionExpression,
+    Expr_ifExpression,
+}
+
+
+class _StructureVisitor(StreamBasedExpressionVisitor):
+    """Hash-cons expression trees
+
+    Each (sub)tree is mapped to an integer "structure id" so that
+    structurally identical subtrees (the same operators applied to the
+    same leaves) map to the same id.  Keys are built from the child
+    structure ids, so hashing a node is O(number of args) and not
+    O(size of the subtree).  Structure ids are also cached by node
+    ``id()`` so that subtrees shared between expressions are only
+    walked once.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Map of structure key to structure id
+        self.structure = {}
+        # The following are indexed by structure id:
+        #   - tuple of child structure ids
+        self.children = []
+        #   - True if the structure can become a defined variable
+        self.candidate = []
+        #   - 0 (constant), 1 (linear), or 2 (nonlinear)
+        self.degree = []
+        # Map of node id() to structure id
+        self.node_structure = {}
+        # Map of (candidate) structure id to the first node with that
+        # structure
+        self.example = {}
+
+    def _intern(self, key, children, degree, candidate):
+        sid = self.structure.get(key, None)
+        if sid is None:
+            sid = self.structure[key] = len(self.children)
+            self.children.append(children)
+            self.degree.append(degree)
+            self.candidate.append(candidate)
+        return sid
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, expr
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, self._intern((child,), (), 0, False)
+        _id = id(child)
+        sid = self.node_structure.get(_id, None)
+        if sid is not None:
+            return False, sid
+        if not hasattr(child, 'is_expression_type') or not child.is_expression_type():
+            # Var, Param, and other leaf components
+            degree = 1 if child.is_potentially_variable() and not child.fixed else 0
+        elif (
+            child.is_named_expression_type()
+            or child.__class__ is ExternalFunctionExpression
+        ):
+            # Named expressions are already defined variables, and
+            # external function calls are not shared
+            degree = 2
+        else:
+            return True, None
+        sid = self.node_structure[_id] = self._intern((_id,), (), degree, False)
+        return False, sid
+
+    def exitNode(self, node, data):
+        cls = node.__class__
+        degree = max(map(self.degree.__getitem__, data), default=0)
+        # The AMPLRepnVisitor folds negation and scaling by a constant
+        # into the multiplier of the (single) nonconstant argument, so
+        # those nodes are never emitted as separate operators and
+        # cannot be shared without losing the reference to the
+        # argument.
+        scaled = False
+        if degree:
+            if cls is ProductExpression or cls is MonomialTermExpression:
+                if self.degree[data[0]] and self.degree[data[1]]:
+                    degree = 2
+                else:
+                    scaled = True
+            elif cls is DivisionExpression:
+                if self.degree[data[1]]:
+                    degree = 2
+                else:
+                    scaled = True
+            elif cls is not NegationExpression and cls not in sum_like_expression_types:
+                degree = 2
+        if isinstance(node, UnaryFunctionExpression):
+            key = (cls, node.getname()) + tuple(data)
+        elif cls is InequalityExpression or cls is RangedExpression:
+            key = (cls, node.strict) + tuple(data)
+        else:
+            key = (cls,) + tuple(data)
+        candidate = degree == 2 and not scaled and cls in _cse_node_types
+        sid = self._intern(key, tuple(data), degree, candidate)
+        if candidate and sid not in self.example:
+            self.example[sid] = node
+        self.node_structure[id(node)] = sid
+        return sid
+
+
+def find_common_subexpressions(exprs):
+    """Identify nonlinear subexpressions that appear more than once
+
+    This hash-conses all the expressions in `exprs` and returns a dict
+    that maps the ``id()`` of every expression node that belongs to a
+    repeated (structurally identical) nonlinear subtree to the
+    :py:class:`CommonSubexpression` shared by all the copies of that
+    subtree.  Occurrences are only counted outside other repeated
+    subtrees, so (for example) the argument of a repeated ``exp()`` is
+    not also reported unless it appears elsewhere.
+
+    As the returned map is keyed by ``id()``, the caller must hold
+    references to `exprs` for as long as the map is used.
+
+    """
+    visitor = _StructureVisitor()
+    stack = [visitor.walk_expression(expr) for expr in exprs]
+    stack.reverse()
+    children = visitor.children
+    candidate = visitor.candidate
+    count = [0] * len(children)
+    while stack:
+        sid = stack.pop()
+        if candidate[sid]:
+            count[sid] += 1
+            if count[sid] > 1:
+                # We have already counted the contents of this subtree
+                continue
+        stack.extend(reversed(children[sid]))
+    shared = {}
+    ans = {}
+    for node_id, sid in visitor.node_structure.items():
+        if count[sid] > 1:
+            if sid not in shared:
+                shared[sid] = CommonSubexpression(len(shared), visitor.example[sid])
+            ans[node_id] = shared[sid]
+    return ans
+
+
 def evaluate_ampl_nl_expression(nl, external_functions):
     expr = nl.splitlines()
     stack = []
@@ -0,0 +1,362 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""A model-attached cache of compiled expression representations
+
+Writers (LP, NL, standard form) and solver interfaces compile every
+constraint and objective into a representation (e.g.,
+:py:class:`LinearRepn`, :py:class:`AMPLRepn`, or
+:py:class:`StandardRepn`) each time a model is written.  Attaching a
+:py:class:`RepnCache` to a model allows all of these consumers to
+retain (and share) those representations between writes:
+
+.. doctest::
+
+    >>> from pyomo.environ import ConcreteModel, Var, Constraint
+    >>> from pyomo.repn.cache import attach_repn_cache
+    >>> m = ConcreteModel()
+    >>> m.x = Var([1, 2])
+    >>> m.c = Constraint(expr=m.x[1] + 2 * m.x[2] >= 1)
+    >>> cache = attach_repn_cache(m)
+    >>> m.write('model.lp')  # doctest: +SKIP
+
+Entries are namespaced by the "kind" of representation (consumers that
+generate the same representation share entries), held weakly by the
+owning component data (e.g., :py:class:`ConstraintData`), and
+invalidated when the expression is replaced (e.g., by
+:py:meth:`ConstraintData.set_value`), when a named Expression that it
+references is replaced, or when the value of a mutable Param or the
+fixed status (or fixed value) of a Var that it references changes.
+
+"""
+
+import weakref
+
+from pyomo.common.numeric_types import native_types
+from pyomo.core.base.observer import (
+    ChangeLog,
+    register_change_log,
+    unregister_change_log,
+)
+
+
+def _collect_leaves(expr):
+    """Return the unique Var, mutable Param, and named expression
+    leaves in an expression
+
+    Variables are returned in the order in which they are first
+    encountered by a depth-first walk (the same order that the
+    writers' repn visitors encounter them).
+
+    """
+    variables = []
+    params = []
+    named = []
+    seen = set()
+    stack = []
+    args = iter((expr,))
+    while 1:
+        for child in args:
+            if child.__class__ in native_types:
+                continue
+            if child.is_expression_type():
+                if child.is_named_expression_type():
+                    if id(child) in seen:
+                        continue
+                    seen.add(id(child))
+                    named.append(child)
+                stack.append(args)
+                args = iter(child.args)
+                break
+            if id(child) in seen:
+                continue
+            seen.add(id(child))
+            if child.is_variable_type():
+                variables.append(child)
+            elif child.is_parameter_type() and not child.is_constant():
+                params.append(child)
+        else:
+            if not stack:
+                return variables, params, named
+            args = stack.pop()
+
+
+class RepnCache(object):
+    """Compiled expression representations retained between writes
+
+    Each entry records (a weak reference to) the owning component data,
+    the expression object, an optional consumer-specific value (e.g.,
+    a scaling factor), and the Vars, mutable Params, and named
+    Expressions in the expression, along with the representation itself
+    (always the last element of the entry).  The cache registers a
+    :py:class:`ChangeLog`, and an entry is only returned if none of
+    those leaves were modified (e.g., a Param value changed, or a Var
+    was fixed) since the representation was compiled.  As long as the
+    change log is empty, entries are validated without looking at the
+    leaves at all.  The number of cache hits and misses (through
+    :py:meth:`lookup`) are recorded in :py:attr:`hits` and
+    :py:attr:`misses`.
+
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        # The change log version is incremented every time modifications
+        # are drained from the log; _changed maps the id of each
+        # modified object to the version when it was last modified.
+        self._log = register_change_log(ChangeLog())
+        weakref.finalize(self, unregister_change_log, self._log)
+        self._version = 0
+        self._changed = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _sync(self):
+        modified = self._log.modified
+        if modified:
+            self._log.clear()
+            self._version += 1
+            version = self._version
+            changed = self._changed
+            for refs in modified.values():
+                for obj_id in refs:
+                    changed[obj_id] = version
+
+    def __len__(self):
+        return sum(map(len, self._buckets.values()))
+
+    def clear(self):
+        """Discard all cached representations"""
+        self._buckets = {}
+        self.hits = self.misses = 0
+
+    def bucket(self, kind):
+        """Return the (mutable) dict of entries for `kind`, keyed by the
+        id of the owning component data"""
+        ans = self._buckets.get(kind, None)
+        if ans is None:
+            ans = self._buckets[kind] = {}
+        return ans
+
+    def replace_bucket(self, kind):
+        """Replace the entries for `kind` with an empty dict
+
+        Returns the 2-tuple (previous entries, new entries).  This
+        supports consumers that only retain the entries they actually
+        used during a write.
+
+        """
+        previous = self._buckets.get(kind, {})
+        new = self._buckets[kind] = {}
+        return previous, new
+
+    def _purge(self, obj_id, ref):
+        for bucket in self._buckets.values():
+            entry = bucket.get(obj_id, None)
+            if entry is not None and entry[0] is ref:
+                del bucket[obj_id]
+
+    def make_entry(self, obj, expr, body, repn, var_map=None, extra=None, values=True):
+        """Create a cache entry for the representation of `body`
+
+        Parameters
+        ----------
+        obj: ComponentData
+            The component data that owns the expression
+
+        expr:
+            The object whose identity identifies the expression (e.g.,
+            ``con.expr``)
+
+        body:
+            The expression that was compiled into `repn`
+
+        repn:
+            The compiled representation
+
+        var_map: dict, optional
+            Variables (by id) that the consumer treats as variables
+            even if they are fixed.  If None, the leaves of `body` are
+            not collected until the entry is first validated (consumers
+            that always compile fixed Vars as constants should pass
+            None, so that storing an entry does not walk `body`).
+
+        extra: optional
+            Additional state that must match for the entry to be valid
+
+        values: bool
+            If True, the entry is invalidated when the value of a fixed
+            Var or a mutable Param changes (e.g., for representations
+            where those values are compiled in as constants).  If False,
+            changes to the mutable Params are ignored.
+
+        """
+        self._sync()
+        if var_map is None:
+            leaves = fixed = None
+        else:
+            leaves = self._collect_leaves(body, values)
+            # Fixed Vars are compiled as variables if they are in the
+            # consumer's var_map (and as constants otherwise)
+            fixed = [(v, id(v) in var_map) for v in leaves[0] if v.fixed]
+        obj_id = id(obj)
+        ref = weakref.ref(obj, lambda r: self._purge(obj_id, r))
+        return [ref, expr, extra, values, body, leaves, fixed, self._version, repn]
+
+    @staticmethod
+    def _collect_leaves(body, values):
+        variables, params, named = _collect_leaves(body)
+        if not values:
+            params = ()
+        return variables, params, named
+
+    def variables(self, entry):
+        """Return the Vars in the expression for `entry`, in the order
+        they would be encountered by a depth-first walk"""
+        leaves = entry[5]
+        if leaves is None:
+            leaves = entry[5] = self._collect_leaves(entry[4], entry[3])
+        return leaves[0]
+
+    def is_valid(self, entry, obj, expr, var_map=None, extra=None):
+        """Return True if `entry` is still valid for `obj`"""
+        ref, _expr, _extra, values, body, leaves, fixed, version, repn = entry
+        if ref() is not obj or _expr is not expr or _extra != extra:
+            return False
+        self._sync()
+        if version != self._version:
+            if leaves is None:
+                leaves = entry[5] = self._collect_leaves(body, values)
+            changed = self._changed
+            for objs in leaves:
+                for leaf in objs:
+                    if changed.get(id(leaf), 0) > version:
+                        return False
+            # None of the leaves changed: the entry is current
+            entry[-2] = self._version
+        if fixed:
+            if var_map is None:
+                var_map = ()
+            for v, in_var_map in fixed:
+                if (id(v) in var_map) != in_var_map:
+                    return False
+        return True
+
+    def lookup(self, kind, obj, expr, var_map=None, extra=None):
+        """Return the cached (repn, variables) for `obj`, or None
+
+        `variables` lists the Vars in the expression in the order they
+        would be encountered by a depth-first walk of the expression
+        (so consumers can record them in their variable maps).
+
+        """
+        entry = self.bucket(kind).get(id(obj), None)
+        if entry is None or not self.is_valid(entry, obj, expr, var_map, extra):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[-1], self.variables(entry)
+
+    def store(self, kind, obj, expr, body, repn, var_map=None, extra=None, values=True):
+        """Store the representation `repn` of `obj` (see :py:meth:`make_entry`)"""
+        self.bucket(kind)[id(obj)] = self.make_entry(
+            obj, expr, body, repn, var_map, extra, values
+        )
+
+    def walk_expression(self, visitor, obj, body, expr=None, kind=None):
+        """Compile `body` with a (LinearRepnVisitor-like) `visitor`,
+        reusing the cached representation when possible
+
+        The cached representations are shared by all visitors of the
+        same class (`kind` defaults to the visitor class).  On a cache
+        hit, the variables in the expression are recorded in the
+        visitor's var_recorder exactly as if the visitor had walked the
+        expression.
+
+        """
+        if expr is None:
+            expr = obj.expr
+        if kind is None:
+            kind = visitor.__class__
+        var_map = visitor.var_map
+        ans = self.lookup(kind, obj, expr, var_map)
+        if ans is not None:
+            repn, variables = ans
+            add = visitor.var_recorder.add
+            for v in variables:
+                if id(v) not in var_map and not v.fixed:
+                    add(v)
+            return repn.duplicate()
+        repn = visitor.walk_expression(body)
+        self.store(kind, obj, expr, body, repn.duplicate(), var_map)
+        return repn
+
+    def standard_repn(self, obj, expr, **kwds):
+        """Return :py:func:`generate_standard_repn(expr, **kwds)
+        <pyomo.repn.standard_repn.generate_standard_repn>` for the
+        expression owned by `obj`, reusing the cached representation
+        when possible.
+
+        Note that the returned StandardRepn may be shared with other
+        consumers, and must not be modified.
+
+        """
+        from pyomo.repn.standard_repn import generate_standard_repn
+
+        compute_values = kwds.get('compute_values', True)
+        kind = ('standard', compute_values, kwds.get('quadratic', True))
+        ans = self.lookup(kind, obj, obj.expr)
+        if ans is not None:
+            return ans[0]
+        repn = generate_standard_repn(expr, **kwds)
+        self.store(kind, obj, obj.expr, expr, repn, values=compute_values)
+        return repn
+
+
+# Caches attached to models: id(model) -> (weakref(model), RepnCache)
+_attached_caches = {}
+
+
+def _detach(model_id, ref):
+    if _attached_caches.get(model_id, (None,))[0] is ref:
+        del _attached_caches[model_id]
+
+
+def attach_repn_cache(model):
+    """Attach a :py:class:`RepnCache` to `model` (if one is not already
+    attached) and return it
+
+    Writers and solver interfaces that support the cache will consult
+    it when writing `model`.  The cache is discarded when the model is
+    garbage collected or :py:func:`detach_repn_cache` is called.
+
+    """
+    ans = get_repn_cache(model)
+    if ans is None:
+        model_id = id(model)
+        ref = weakref.ref(model, lambda r: _detach(model_id, r))
+        ans = RepnCache()
+        _attached_caches[model_id] = ref, ans
+    return ans
+
+
+def get_repn_cache(model):
+    """Return the :py:class:`RepnCache` attached to `model` (or None)"""
+    ans = _attached_caches.get(id(model), None)
+    if ans is None or ans[0]() is not model:
+        return None
+    return ans[1]
+
+
+def detach_repn_cache(model):
+    """Detach (and discard) the :py:class:`RepnCache` attached to `model`"""
+    ans = _attached_caches.get(id(model), None)
+    if ans is not None and ans[0]() is model:
+        del _attached_caches[id(model)]
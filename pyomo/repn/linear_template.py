@@ -29,6 +29,12 @@ _LINEAR = util.ExprType.LINEAR
 code_type = deepcopy.__class__
 
 
+def _is_template_expr(obj):
+    # Note: IndexTemplate objects are not expressions, but (like
+    # expressions) must be evaluated when the template is expanded
+    return obj.__class__ is expr.IndexTemplate or obj.is_expression_type()
+
+
 class LinearTemplateRepn(LinearRepn):
     __slots__ = ("linear_sum",)
 
@@ -93,7 +99,7 @@ class LinearTemplateRepn(LinearRepn):
         if constant.__class__ not in native_types or constant:
             constant *= multiplier
             if not repetitions or (
-                constant.__class__ not in native_types and constant.is_expression_type()
+                constant.__class__ not in native_types and _is_template_expr(constant)
             ):
                 ans.append('const += ' + constant.to_string(smap=smap))
                 constant = 0
@@ -101,7 +107,7 @@ class LinearTemplateRepn(LinearRepn):
                 constant *= repetitions
         for k, coef in list(self.linear.items()):
             coef *= multiplier
-            if coef.__class__ not in native_types and coef.is_expression_type():
+            if coef.__class__ not in native_types and _is_template_expr(coef):
                 coef = coef.to_string(smap=smap)
             elif coef:
                 coef = repr(coef)
@@ -116,7 +122,7 @@ class LinearTemplateRepn(LinearRepn):
                     k = 'v'
                     if remove_fixed_vars:
                         ans.append('if v.__class__ is tuple:')
-                        ans.append('    const += v[0] * {coef}')
+                        ans.append(f'    const += v[0] * {coef}')
                         ans.append('    v = None')
                         ans.append('else:')
                         indent = '    '
@@ -221,7 +227,12 @@ class LinearTemplateBeforeChildDispatcher(linear.LinearBeforeChildDispatcher):
         if child not in visitor.indexed_params:
             visitor.indexed_params.add(child)
             name = visitor.symbolmap.getSymbol(child)
-            visitor.env[name] = child.extract_values()
+            # Note: the environment is only used for lookups, so we can
+            # use the (faster) unordered iteration over the defined data
+            if child.mutable:
+                visitor.env[name] = {k: v() for k, v in child.sparse_iteritems()}
+            else:
+                visitor.env[name] = dict(child.sparse_iteritems())
         return False, (_CONSTANT, child)
 
     def _before_indexed_component(self, visitor, child):
@@ -283,7 +294,13 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         util.initialize_exit_node_dispatcher(define_exit_node_handlers())
     )
 
-    def __init__(self, subexpression_cache, var_recorder, remove_fixed_vars=False):
+    def __init__(
+        self,
+        subexpression_cache,
+        var_recorder,
+        remove_fixed_vars=False,
+        check_duplicates=False,
+    ):
         super().__init__(subexpression_cache, var_recorder=var_recorder)
         self.indexed_vars = set()
         self.indexed_params = set()
@@ -292,6 +309,7 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         self.symbolmap = var_recorder.symbolmap
         self.expanded_templates = {}
         self.remove_fixed_vars = remove_fixed_vars
+        self.check_duplicates = check_duplicates
 
     def enterNode(self, node):
         # SumExpression are potentially large nary operators.  Directly
@@ -303,45 +321,85 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         else:
             return node.args, []
 
-    def expand_expression(self, obj, template_info):
-        env = self.env
+    def _compile(self, expr, args, remove_fixed_vars, check_duplicates=False):
         try:
-            body, lb, ub = self.expanded_templates[id(template_info)]
-        except KeyError:
+            repn = self.walk_expression(expr)
+        except MouseTrap:
+            raise
+        except Exception as e:
+            # The linear template walker does not support all
+            # expressions (notably, nonlinear expressions): callers are
+            # expected to fall back on the explicit (rule-generated)
+            # expressions.
+            raise MouseTrap(
+                f"Error compiling template expression ({type(e).__name__}: {e})"
+            ) from e
+        if repn.nonlinear is not None:
+            raise MouseTrap(
+                "Nonlinear templates are not supported by the linear "
+                "template compiler"
+            )
+        return repn.compile(
+            self.env,
+            self.symbolmap,
+            self.expr_cache,
+            args,
+            remove_fixed_vars,
+            check_duplicates,
+        )
+
+    def _get_template(self, obj, template_info):
+        """Return the compiled (body, lb, ub) functions for a template
+
+        The template is compiled the first time it is encountered, and
+        the compiled functions are cached for subsequent indices.
+
+        """
+        if id(template_info) not in self.expanded_templates:
             smap = self.symbolmap
             expr, indices = template_info
             args = [smap.getSymbol(i) for i in indices]
-            if expr.is_expression_type(ExpressionType.RELATIONAL):
-                lb, body, ub = obj.to_bounded_expression()
-                if body is not None:
-                    body = self.walk_expression(body).compile(
-                        env, smap, self.expr_cache, args, False
-                    )
-                if lb is not None:
-                    lb = self.walk_expression(lb).compile(
-                        env, smap, self.expr_cache, args, True
-                    )
-                if ub is not None:
-                    ub = self.walk_expression(ub).compile(
-                        env, smap, self.expr_cache, args, True
+            try:
+                if expr.is_expression_type(ExpressionType.RELATIONAL):
+                    lb, body, ub = obj.to_bounded_expression()
+                    if body is not None:
+                        body = self._compile(
+                            body, args, self.remove_fixed_vars, self.check_duplicates
+                        )
+                    if lb is not None:
+                        lb = self._compile(lb, args, True)
+                    if ub is not None:
+                        ub = self._compile(ub, args, True)
+                elif expr is not None:
+                    lb = ub = None
+                    body = self._compile(
+                        expr, args, self.remove_fixed_vars, self.check_duplicates
                     )
-            elif expr is not None:
-                lb = ub = None
-                body = self.walk_expression(expr).compile(
-                    env, smap, self.expr_cache, args, False
-                )
-            else:
-                body = lb = ub = None
+                else:
+                    body = lb = ub = None
+            except MouseTrap:
+                # Record the failure so that we do not attempt to
+                # recompile the template for every index
+                self.expanded_templates[id(template_info)] = None
+                raise
             self.expanded_templates[id(template_info)] = body, lb, ub
 
-        linear_indices = []
-        linear_data = []
+        expanded = self.expanded_templates[id(template_info)]
+        if expanded is None:
+            raise MouseTrap(
+                f"The template for '{obj.parent_component().name}' cannot be "
+                "compiled to a linear template representation"
+            )
+        body, lb, ub = expanded
+
         index = obj.index()
         if index.__class__ is not tuple:
             if index is None and not obj.parent_component().is_indexed():
                 index = ()
             else:
                 index = (index,)
+        linear_indices = []
+        linear_data = []
         if lb.__class__ is code_type:
             lb = lb(linear_indices, linear_data, *index)
             if linear_indices:
@@ -350,10 +408,38 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
             ub = ub(linear_indices, linear_data, *index)
             if linear_indices:
                 raise RuntimeError(f"Constraint {obj} has non-fixed upper bound")
-        return (
-            body(linear_indices, linear_data, *index),
-            linear_indices,
-            linear_data,
-            lb,
-            ub,
-        )
+        return body, lb, ub, index
+
+    def expand_expression(self, obj, template_info):
+        """Expand the template for `obj`
+
+        Returns
+        -------
+        (constant, linear_indices, linear_data, lb, ub)
+
+        """
+        assert not self.check_duplicates
+        body, lb, ub, index = self._get_template(obj, template_info)
+        linear_indices = []
+        linear_data = []
+        if body.__class__ is code_type:
+            body = body(linear_indices, linear_data, *index)
+        return body, linear_indices, linear_data, lb, ub
+
+    def expand_expression_into(self, obj, template_info, linear):
+        """Expand the template for `obj`, accumulating the linear
+        coefficients into the `linear` dict
+
+        This requires that the visitor was created with
+        `check_duplicates=True`.
+
+        Returns
+        -------
+        (constant, lb, ub)
+
+        """
+        assert self.check_duplicates
+        body, lb, ub, index = self._get_template(obj, template_info)
+        if body.__class__ is code_type:
+            body = body(linear, *index)
+        return body, lb, ub
@@ -16,6 +16,7 @@ def load():
         ampl,
         baron_writer,
         mps,
+        mps_writer,
         gams_writer,
         lp_writer,
         nl_writer,
@@ -46,7 +46,14 @@ from pyomo.core.base.component import ActiveComponent
 import pyomo.core.base.suffix
 import pyomo.core.kernel.suffix
 from pyomo.core.kernel.block import IBlock
-from pyomo.repn.util import valid_expr_ctypes_minlp, valid_active_ctypes_minlp, ftoa
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.util import (
+    VarMapRecorder,
+    compile_linear_part,
+    valid_expr_ctypes_minlp,
+    valid_active_ctypes_minlp,
+    ftoa,
+)
 
 logger = logging.getLogger('pyomo.core')
 
@@ -78,17 +85,18 @@ _log10_e = ftoa(math.log10(math.e))
 
 
 def _handle_UnaryFunctionExpression(visitor, node, values):
-    if node.name == "sqrt":
+    name = node.name
+    if name == "sqrt":
         # Parens are necessary because sqrt() and "^" have different
         # precedence levels.  Instead of parsing the arg, be safe and
         # explicitly add parens
         return f"(({values[0]}) ^ 0.5)"
-    elif node.name == 'log10':
+    elif name == 'log10':
         return f"({_log10_e} * log({values[0]}))"
-    elif node.name not in _allowableUnaryFunctions:
+    elif name not in _allowableUnaryFunctions:
         raise RuntimeError(
             'The BARON .BAR format does not support the unary '
-            'function "%s".' % (node.name,)
+            'function "%s".' % (name,)
         )
     return node._to_string(values, visitor.verbose, visitor.smap)
 
@@ -139,14 +147,15 @@ class ToBaronVisitor(_ToStringVisitor):
             return False, None
 
         if node.is_component_type():
-            if node.ctype not in valid_expr_ctypes_minlp:
+            ctype = node.ctype
+            if ctype not in valid_expr_ctypes_minlp:
                 # Make sure all components in active constraints
                 # are basic ctypes we know how to deal with.
                 raise RuntimeError(
                     "Unallowable component '%s' of type %s found in an active "
                     "constraint or objective.\nThe GAMS writer cannot export "
                     "expressions with this component type."
-                    % (node.name, node.ctype.__name__)
+                    % (node.name, ctype.__name__)
                 )
 
         if node.is_fixed():
@@ -166,13 +175,16 @@ class ToBaronVisitor(_ToStringVisitor):
         # is a trivial term
         if not const:
             return '0'
+        return self._term_to_string(const, var)
+
+    def _term_to_string(self, coef, var):
         self.variables.add(id(var))
-        if const in _plusMinusOne:
-            if const < 0:
+        if coef in _plusMinusOne:
+            if coef < 0:
                 return '-' + self.smap.getSymbol(var)
             else:
                 return self.smap.getSymbol(var)
-        return ftoa(const, True) + '*' + self.smap.getSymbol(var)
+        return ftoa(coef, True) + '*' + self.smap.getSymbol(var)
 
     def _var_to_string(self, node):
         if node.is_fixed():
@@ -199,9 +211,29 @@ class ToBaronVisitor(_ToStringVisitor):
         ]
         return node._to_string(values, False, self.smap)
 
+    def sum_to_string(self, expr, linear_visitor):
+        """Generate the string for ``expr``, writing the linear part of
+        a sum as a coefficient list compiled by ``linear_visitor``"""
+        repn, other = compile_linear_part(expr, linear_visitor)
+        if repn is None:
+            return self.dfs_postorder_stack(expr)
+        var_map = linear_visitor.var_map
+        values = [
+            self._term_to_string(coef, var_map[vid])
+            for vid, coef in repn.linear.items()
+        ]
+        if other is not None:
+            values.append(self.dfs_postorder_stack(other))
+        if repn.constant or not values:
+            values.append(ftoa(repn.constant, True))
+        return expr._to_string(values, False, self.smap)
+
 
-def expression_to_string(expr, variables, smap):
-    return ToBaronVisitor(variables, smap).dfs_postorder_stack(expr)
+def expression_to_string(expr, variables, smap, linear_visitor=None):
+    visitor = ToBaronVisitor(variables, smap)
+    if linear_visitor is None:
+        return visitor.dfs_postorder_stack(expr)
+    return visitor.sum_to_string(expr, linear_visitor)
 
 
 # TODO: The to_string function is handy, but the fact that
@@ -411,13 +443,16 @@ class ProblemWriter_bar(AbstractProblemWriter):
                         yield param_data
 
         # Equation Definition
+        linear_visitor = LinearRepnVisitor({}, var_recorder=VarMapRecorder({}))
         output_file.write('c_e_FIX_ONE_VAR_CONST__:  ONE_VAR_CONST__  == 1;\n')
         for constraint_data, (lb, body, ub) in itertools.chain(
             eqns.items(), r_o_eqns.items(), c_eqns.items(), l_eqns.items()
         ):
             variables = OrderedSet()
             # print(symbol_map.byObject.keys())
-            eqn_body = expression_to_string(body, variables, smap=symbol_map)
+            eqn_body = expression_to_string(
+                body, variables, smap=symbol_map, linear_visitor=linear_visitor
+            )
             # print(symbol_map.byObject.keys())
             referenced_variable_ids.update(variables)
 
@@ -495,7 +530,10 @@ class ProblemWriter_bar(AbstractProblemWriter):
                 variables = OrderedSet()
                 # print(symbol_map.byObject.keys())
                 obj_string = expression_to_string(
-                    objective_data.expr, variables, smap=symbol_map
+                    objective_data.expr,
+                    variables,
+                    smap=symbol_map,
+                    linear_visitor=linear_visitor,
                 )
                 # print(symbol_map.byObject.keys())
                 referenced_variable_ids.update(variables)
@@ -689,7 +727,8 @@ class ProblemWriter_bar(AbstractProblemWriter):
             var_data = symbol_map.bySymbol[name]
 
             if var_data.is_continuous():
-                if var_data.has_lb() and (value(var_data.lb) >= 0):
+                lb = var_data.lb
+                if lb is not None and lb >= 0:
                     TypeList = PosVars
                 else:
                     TypeList = Vars
@@ -740,9 +779,7 @@ class ProblemWriter_bar(AbstractProblemWriter):
                 else:
                     var_data_lb = None
             else:
-                var_data_lb = None
-                if var_data.has_lb():
-                    var_data_lb = ftoa(var_data.lb, False)
+                var_data_lb = ftoa(var_data.lb, False)
 
             if var_data_lb is not None:
                 name_to_output = symbol_map.getSymbol(var_data)
@@ -769,9 +806,7 @@ class ProblemWriter_bar(AbstractProblemWriter):
                 else:
                     var_data_ub = None
             else:
-                var_data_ub = None
-                if var_data.has_ub():
-                    var_data_ub = ftoa(var_data.ub, False)
+                var_data_ub = ftoa(var_data.ub, False)
 
             if var_data_ub is not None:
                 name_to_output = symbol_map.getSymbol(var_data)
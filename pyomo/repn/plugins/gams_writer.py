@@ -39,7 +39,14 @@ from pyomo.core.base.component import ActiveComponent
 from pyomo.core.kernel.base import ICategorizedObject
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import AbstractProblemWriter, WriterFactory
-from pyomo.repn.util import valid_expr_ctypes_minlp, valid_active_ctypes_minlp, ftoa
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.util import (
+    VarMapRecorder,
+    compile_linear_part,
+    valid_expr_ctypes_minlp,
+    valid_active_ctypes_minlp,
+    ftoa,
+)
 
 import logging
 
@@ -65,6 +72,9 @@ _legal_unary_functions = {
 _arc_functions = {'acos', 'asin', 'atan'}
 _dnlp_functions = {'ceil', 'floor', 'abs'}
 _zero_one = {0, 1}
+# Expression types that are always linear (so we can skip the
+# polynomial_degree() walk when determining the model type)
+_linear_expression_types = {EXPR.LinearExpression, EXPR.MonomialTermExpression}
 _plusMinusOne = {-1, 1}
 
 
@@ -79,14 +89,15 @@ def _handle_PowExpression(visitor, node, values):
 
 
 def _handle_UnaryFunctionExpression(visitor, node, values):
-    if node.name not in _legal_unary_functions:
+    name = node.name
+    if name not in _legal_unary_functions:
         raise RuntimeError(
-            "GAMS files cannot represent the unary function %s" % (node.name,)
+            "GAMS files cannot represent the unary function %s" % (name,)
         )
-    if node.name in _dnlp_functions:
+    if name in _dnlp_functions:
         visitor.is_discontinuous = True
-    if node.name in _arc_functions:
-        return f"arc{node.name[1:]}({values[0]})"
+    if name in _arc_functions:
+        return f"arc{name[1:]}({values[0]})"
     else:
         return node._to_string(values, False, visitor.smap)
 
@@ -139,16 +150,17 @@ class ToGamsVisitor(_ToStringVisitor):
             return False, None
 
         if node.is_component_type():
-            if node.ctype not in valid_expr_ctypes_minlp:
+            ctype = node.ctype
+            if ctype not in valid_expr_ctypes_minlp:
                 # Make sure all components in active constraints
                 # are basic ctypes we know how to deal with.
                 raise RuntimeError(
                     "Unallowable component '%s' of type %s found in an active "
                     "constraint or objective.\nThe GAMS writer cannot export "
                     "expressions with this component type."
-                    % (node.name, node.ctype.__name__)
+                    % (node.name, ctype.__name__)
                 )
-            if node.ctype is not Var:
+            if ctype is not Var:
                 # For these, make sure it's on the right model. We can check
                 # Vars later since they don't disappear from the expressions
                 self.treechecker(node)
@@ -171,12 +183,15 @@ class ToGamsVisitor(_ToStringVisitor):
         # is a trivial term
         if not const:
             return '0'
-        if const in _plusMinusOne:
-            if const < 0:
+        return self._term_to_string(const, var)
+
+    def _term_to_string(self, coef, var):
+        if coef in _plusMinusOne:
+            if coef < 0:
                 return '-' + self.smap.getSymbol(var)
             else:
                 return self.smap.getSymbol(var)
-        return ftoa(const, True) + '*' + self.smap.getSymbol(var)
+        return ftoa(coef, True) + '*' + self.smap.getSymbol(var)
 
     def _linear_to_string(self, node):
         values = [
@@ -198,10 +213,35 @@ class ToGamsVisitor(_ToStringVisitor):
         ]
         return node._to_string(values, False, self.smap)
 
+    def sum_to_string(self, expr, linear_visitor):
+        """Generate the string for ``expr``, writing the linear part of
+        a sum as a coefficient list compiled by ``linear_visitor``"""
+        if self.output_fixed_variables:
+            # The LinearRepnVisitor folds fixed variables into the constant
+            return self.dfs_postorder_stack(expr)
+        repn, other = compile_linear_part(expr, linear_visitor)
+        if repn is None:
+            return self.dfs_postorder_stack(expr)
+        var_map = linear_visitor.var_map
+        values = [
+            self._term_to_string(coef, var_map[vid])
+            for vid, coef in repn.linear.items()
+        ]
+        if other is not None:
+            values.append(self.dfs_postorder_stack(other))
+        if repn.constant or not values:
+            values.append(ftoa(repn.constant, True))
+        return expr._to_string(values, False, self.smap)
+
 
-def expression_to_string(expr, treechecker, smap=None, output_fixed_variables=False):
+def expression_to_string(
+    expr, treechecker, smap=None, output_fixed_variables=False, linear_visitor=None
+):
     visitor = ToGamsVisitor(smap, treechecker, output_fixed_variables)
-    expr_str = visitor.dfs_postorder_stack(expr)
+    if linear_visitor is None:
+        expr_str = visitor.dfs_postorder_stack(expr)
+    else:
+        expr_str = visitor.sum_to_string(expr, linear_visitor)
     return expr_str, visitor.is_discontinuous
 
 
@@ -613,6 +653,7 @@ class ProblemWriter_gams(AbstractProblemWriter):
             )
 
         tc = StorageTreeChecker(model)
+        linear_visitor = LinearRepnVisitor({}, var_recorder=VarMapRecorder({}))
 
         # Walk through the model and generate the constraint definition
         # for all active constraints.  Any Vars / Expressions that are
@@ -627,7 +668,7 @@ class ProblemWriter_gams(AbstractProblemWriter):
             con_body = as_numeric(body)
             if skip_trivial_constraints and con_body.is_fixed():
                 continue
-            if linear:
+            if linear and con_body.__class__ not in _linear_expression_types:
                 if con_body.polynomial_degree() not in linear_degree:
                     linear = False
 
@@ -637,6 +678,7 @@ class ProblemWriter_gams(AbstractProblemWriter):
                 tc,
                 smap=symbolMap,
                 output_fixed_variables=output_fixed_variables,
+                linear_visitor=linear_visitor,
             )
             dnlp |= con_discontinuous
             if con.equality:
@@ -666,11 +708,15 @@ class ProblemWriter_gams(AbstractProblemWriter):
                 % (len(obj))
             )
         obj = obj[0]
-        if linear:
+        if linear and obj.expr.__class__ not in _linear_expression_types:
             if obj.polynomial_degree() not in linear_degree:
                 linear = False
         obj_expr_str, obj_discontinuous = expression_to_string(
-            obj.expr, tc, smap=symbolMap, output_fixed_variables=output_fixed_variables
+            obj.expr,
+            tc,
+            smap=symbolMap,
+            output_fixed_variables=output_fixed_variables,
+            linear_visitor=linear_visitor,
         )
         dnlp |= obj_discontinuous
         oName = symbolMap.getSymbol(obj, con_labeler)
@@ -19,6 +19,7 @@ from pyomo.common.config import (
     InEnum,
     document_kwargs_from_configdict,
 )
+from pyomo.common.errors import MouseTrap
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.timing import TicTocTimer
 
@@ -38,12 +39,14 @@ from pyomo.core.base import (
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
 from pyomo.opt import WriterFactory
+from pyomo.repn.cache import get_repn_cache
 from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.linear_template import LinearTemplateRepnVisitor
 from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
-    OrderedVarRecorder,
+    OrderedTemplateVarRecorder,
     categorize_valid_components,
     initialize_var_map_from_column_order,
     int_float,
@@ -309,7 +312,9 @@ class _LPWriter_impl(object):
         self.var_map = {id(ONE_VAR_CONSTANT): ONE_VAR_CONSTANT}
         initialize_var_map_from_column_order(model, self.config, self.var_map)
         self.var_order = {_id: i for i, _id in enumerate(self.var_map)}
-        self.var_recorder = OrderedVarRecorder(self.var_map, self.var_order, sorter)
+        self.var_recorder = OrderedTemplateVarRecorder(
+            self.var_map, self.var_order, sorter
+        )
 
         _qp = self.config.allow_quadratic_objective
         _qc = self.config.allow_quadratic_constraint
@@ -321,6 +326,19 @@ class _LPWriter_impl(object):
             var_recorder=self.var_recorder,
         )
 
+        # Templatized constraints are compiled (once per template) by
+        # the template visitor
+        template_visitor = LinearTemplateRepnVisitor(
+            {},
+            var_recorder=self.var_recorder,
+            remove_fixed_vars=True,
+            check_duplicates=True,
+        )
+
+        # Representations retained between writes (if the model has a
+        # RepnCache attached)
+        repn_cache = get_repn_cache(model)
+
         timer.toc('Initialized column order', level=logging.DEBUG)
 
         # We don't export any suffix information to the LP file
@@ -375,7 +393,11 @@ class _LPWriter_impl(object):
             ("min \n%s:\n" if obj.sense == minimize else "max \n%s:\n")
             % (getSymbol(obj, labeler),)
         )
-        repn = objective_visitor.walk_expression(obj.expr)
+        if repn_cache is None or obj.parent_block() is None:
+            # Note: do not cache the (temporary) default objective
+            repn = objective_visitor.walk_expression(obj.expr)
+        else:
+            repn = repn_cache.walk_expression(objective_visitor, obj, obj.expr)
         if repn.nonlinear is not None:
             raise ValueError(
                 f"Model objective ({obj.name}) contains nonlinear terms that "
@@ -410,10 +432,38 @@ class _LPWriter_impl(object):
             if with_debug_timing and con.parent_component() is not last_parent:
                 timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
+            templated = hasattr(con, 'template_expr')
+            if templated:
+                try:
+                    repn = constraint_visitor.Result()
+                    offset, lb, ub = template_visitor.expand_expression_into(
+                        con, con.template_expr(), repn.linear
+                    )
+                    linear = repn.linear
+                    for vid in [vid for vid, coef in linear.items() if not coef]:
+                        del linear[vid]
+                except MouseTrap:
+                    # The template could not be compiled: regenerate the
+                    # (explicit) constraint expression from the rule
+                    con.expr
+                    templated = False
+            if not templated:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+                if repn_cache is None:
+                    repn = constraint_visitor.walk_expression(body)
+                else:
+                    repn = repn_cache.walk_expression(constraint_visitor, con, body)
+                if repn.nonlinear is not None:
+                    raise ValueError(
+                        f"Model constraint ({con.name}) contains nonlinear terms "
+                        "that cannot be written to LP format"
+                    )
+                # Pull out the constant: we will move it to the bounds
+                offset = repn.constant
+                repn.constant = 0
 
             if lb is None and ub is None:
                 # Note: you *cannot* output trivial (unbounded)
@@ -421,16 +471,6 @@ class _LPWriter_impl(object):
                 # slack variable if skip_trivial_constraints is False,
                 # but that seems rather silly.
                 continue
-            repn = constraint_visitor.walk_expression(body)
-            if repn.nonlinear is not None:
-                raise ValueError(
-                    f"Model constraint ({con.name}) contains nonlinear terms that "
-                    "cannot be written to LP format"
-                )
-
-            # Pull out the constant: we will move it to the bounds
-            offset = repn.constant
-            repn.constant = 0
 
             if repn.linear or getattr(repn, 'quadratic', None):
                 have_nontrivial = True
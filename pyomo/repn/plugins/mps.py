@@ -53,6 +53,7 @@ def _get_bound(exp):
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
 
+@WriterFactory.register('mps_v1', 'Generate the corresponding MPS file')
 @WriterFactory.register('mps', 'Generate the corresponding MPS file')
 class ProblemWriter_mps(AbstractProblemWriter):
     def __init__(self, int_marker=False):
@@ -0,0 +1,747 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+from operator import attrgetter
+
+from pyomo.common.config import (
+    ConfigBlock,
+    ConfigValue,
+    InEnum,
+    document_kwargs_from_configdict,
+)
+from pyomo.common.gc_manager import PauseGC
+from pyomo.common.timing import TicTocTimer
+
+from pyomo.core.base import (
+    Block,
+    Objective,
+    Constraint,
+    Var,
+    Param,
+    Expression,
+    SOSConstraint,
+    Suffix,
+    SymbolMap,
+    NumericLabeler,
+    TextLabeler,
+    minimize,
+)
+from pyomo.opt import WriterFactory
+from pyomo.repn.cache import get_repn_cache
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.quadratic import QuadraticRepnVisitor
+from pyomo.repn.util import (
+    FileDeterminism,
+    FileDeterminism_to_SortComponents,
+    OrderedVarRecorder,
+    categorize_valid_components,
+    initialize_var_map_from_column_order,
+    int_float,
+    ordered_active_constraints,
+)
+
+### FIXME: Remove the following as soon as non-active components no
+### longer report active==True
+from pyomo.core.base import Set, RangeSet, ExternalFunction
+from pyomo.network import Port
+
+logger = logging.getLogger(__name__)
+
+
+class MPSWriterInfo(object):
+    """Return type for MPSWriter.write()
+
+    Attributes
+    ----------
+    symbol_map: SymbolMap
+
+        The :py:class:`SymbolMap` bimap between row/column labels and
+        Pyomo components.
+
+    """
+
+    def __init__(self, symbol_map):
+        self.symbol_map = symbol_map
+
+
+def _num(val):
+    # Never write "-0" (it makes baseline comparisons harder)
+    if not val:
+        return '0'
+    if val.__class__ not in int_float:
+        val = float(val)
+    return str(val)
+
+
+def _name_too_long(name):
+    raise ValueError(
+        f"Name '{name}' is too long for fixed-format MPS (names "
+        "are limited to 8 characters).  Use free-format MPS or "
+        "provide a labeler that generates shorter names."
+    )
+
+
+def _fixed_num(val):
+    # Numeric fields in fixed MPS are limited to 12 characters
+    ans = _num(val)
+    if len(ans) <= 12:
+        return ans
+    for precision in range(12, 0, -1):
+        ans = '%.*g' % (precision, val)
+        if len(ans) <= 12:
+            return ans
+    raise ValueError(f"Cannot represent {val} in a fixed-format MPS field")
+
+
+@WriterFactory.register('mps_v2', 'Generate the corresponding MPS file (version 2).')
+class MPSWriter(object):
+    CONFIG = ConfigBlock('mpswriter')
+    CONFIG.declare(
+        'skip_trivial_constraints',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Skip writing constraints whose body is constant',
+        ),
+    )
+    CONFIG.declare(
+        'file_determinism',
+        ConfigValue(
+            default=FileDeterminism.ORDERED,
+            domain=InEnum(FileDeterminism),
+            description='How much effort to ensure file is deterministic',
+            doc="""
+            How much effort do we want to put into ensuring the
+            MPS file is written deterministically for a Pyomo model:
+
+               - NONE (0) : None
+               - ORDERED (10): rely on underlying component ordering (default)
+               - SORT_INDICES (20) : sort keys of indexed components
+               - SORT_SYMBOLS (30) : sort keys AND sort names (not declaration order)
+
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'symbolic_solver_labels',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write variables/constraints using model names',
+            doc="""
+            Export variables and constraints to the MPS file using human-readable
+            text names derived from the corresponding Pyomo component names.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        'row_order',
+        ConfigValue(
+            default=None,
+            description='Preferred constraint ordering',
+            doc="""
+            List of constraints in the order that they should appear in the
+            MPS file.  Unspecified constraints will appear at the end.""",
+        ),
+    )
+    CONFIG.declare(
+        'column_order',
+        ConfigValue(
+            default=None,
+            description='Preferred variable ordering',
+            doc="""
+            List of variables in the order that they should appear in
+            the MPS file.  Unspecified variables will appear in the
+            order in which they are first encountered in the objective
+            followed by each constraint.""",
+        ),
+    )
+    CONFIG.declare(
+        'labeler',
+        ConfigValue(
+            default=None,
+            description='Callable to use to generate symbol names in MPS file',
+        ),
+    )
+    CONFIG.declare(
+        'allow_quadratic_objective',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='If True, allow quadratic terms in the model objective',
+        ),
+    )
+    CONFIG.declare(
+        'allow_quadratic_constraint',
+        ConfigValue(
+            default=True,
+            domain=bool,
+            description='If True, allow quadratic terms in the model constraints',
+        ),
+    )
+    CONFIG.declare(
+        'skip_objective_sense',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Omit the OBJSENSE section',
+            doc="""
+            Some solvers (e.g., GLPK and older versions of CBC) do not
+            recognize the OBJSENSE section.  Note that maximization
+            problems cannot be written when this option is set.""",
+        ),
+    )
+    CONFIG.declare(
+        'int_marker',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Delimit integer columns with MARKER lines',
+        ),
+    )
+    CONFIG.declare(
+        'fixed_format',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Write fixed-format (instead of free-format) MPS',
+            doc="""
+            Write the file using the original (column-delimited) MPS
+            format.  All names are limited to 8 characters, so rows
+            are labeled directly by the labeler (without the
+            "c_e_"-style prefixes used in free-format files), the
+            column for objective constants is named "ONE_VAR", and
+            ranged constraints are written using the RANGES section.""",
+        ),
+    )
+
+    def __init__(self, int_marker=False):
+        self.config = self.CONFIG()
+        self.config.int_marker = int_marker
+
+    def __call__(self, model, filename, solver_capability, io_options):
+        if filename is None:
+            filename = model.name + ".mps"
+
+        # Duplicate io_options to avoid side-effects
+        io_options = dict(io_options)
+        # Map old solver capabilities to new writer options
+        qp = solver_capability('quadratic_objective')
+        if 'allow_quadratic_objective' not in io_options:
+            io_options['allow_quadratic_objective'] = qp
+        qc = solver_capability('quadratic_constraint')
+        if 'allow_quadratic_constraint' not in io_options:
+            io_options['allow_quadratic_constraint'] = qc
+
+        with open(filename, 'w', newline='') as FILE:
+            info = self.write(model, FILE, **io_options)
+        return filename, info.symbol_map
+
+    @document_kwargs_from_configdict(CONFIG)
+    def write(self, model, ostream, **options):
+        """Write a model in MPS format.
+
+        Returns
+        -------
+        MPSWriterInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: io.TextIOBase
+            The text output stream where the MPS "file" will be written.
+            Could be an opened file or a io.StringIO.
+
+        """
+        config = self.config(options)
+
+        # Pause the GC, as the walker that generates the compiled
+        # representation generates (and disposes of) a large number of
+        # small objects.
+        with PauseGC():
+            return _MPSWriter_impl(ostream, config).write(model)
+
+
+class _MPSWriter_impl(object):
+    def __init__(self, ostream, config):
+        self.ostream = ostream
+        self.config = config
+        self.symbol_map = None
+
+    def _free_line(self, f1, *fields):
+        self.ostream.write(f' {f1:<2} ' + ' '.join(filter(None, fields)) + '\n')
+
+    def _fixed_line(self, f1, f2, f3='', f4='', f5=''):
+        # Fields begin in columns 2, 5, 15, 25, and 40
+        for name in (f2, f3):
+            if len(name) > 8 and name[0] != "'":
+                _name_too_long(name)
+        line = f' {f1:<2} {f2:<8}  {f3:<8}  {f4:<12}   {f5}'
+        self.ostream.write(line.rstrip() + '\n')
+
+    def write(self, model):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        timer = TicTocTimer(logger=timing_logger)
+
+        ostream = self.ostream
+        fixed_format = self.config.fixed_format
+        if fixed_format:
+            num = _fixed_num
+            line = self._fixed_line
+            # Lines in the COLUMNS, RHS, and RANGES sections are
+            # formatted directly
+            entry = '    {:<8}  {:<8}  {}\n'.format
+        else:
+            num = _num
+            line = self._free_line
+            entry = '    {} {} {}\n'.format
+
+        labeler = self.config.labeler
+        if labeler is None:
+            if self.config.symbolic_solver_labels:
+                labeler = TextLabeler()
+            else:
+                labeler = NumericLabeler('x')
+        self.symbol_map = SymbolMap(labeler)
+        addSymbol = self.symbol_map.addSymbol
+        aliasSymbol = self.symbol_map.alias
+        getSymbol = self.symbol_map.getSymbol
+
+        self.sorter = sorter = FileDeterminism_to_SortComponents(
+            self.config.file_determinism
+        )
+        component_map, unknown = categorize_valid_components(
+            model,
+            active=True,
+            sort=sorter,
+            valid={
+                Block,
+                Constraint,
+                Var,
+                Param,
+                Expression,
+                # FIXME: Non-active components should not report as Active
+                ExternalFunction,
+                Set,
+                RangeSet,
+                Port,
+                # TODO: Piecewise, Complementarity
+            },
+            targets={Suffix, SOSConstraint, Objective},
+        )
+        if unknown:
+            raise ValueError(
+                "The model ('%s') contains the following active components "
+                "that the MPS writer does not know how to process:\n\t%s"
+                % (
+                    model.name,
+                    "\n\t".join(
+                        "%s:\n\t\t%s" % (k, "\n\t\t".join(map(attrgetter('name'), v)))
+                        for k, v in unknown.items()
+                    ),
+                )
+            )
+
+        # Note: fixed-format MPS limits names to 8 characters
+        ONE_VAR_CONSTANT = Var(
+            name='ONE_VAR' if fixed_format else 'ONE_VAR_CONSTANT', bounds=(1, 1)
+        )
+        ONE_VAR_CONSTANT.construct()
+
+        self.var_map = var_map = {id(ONE_VAR_CONSTANT): ONE_VAR_CONSTANT}
+        initialize_var_map_from_column_order(model, self.config, var_map)
+        self.var_order = var_order = {_id: i for i, _id in enumerate(var_map)}
+        self.var_recorder = OrderedVarRecorder(var_map, var_order, sorter)
+
+        _qp = self.config.allow_quadratic_objective
+        _qc = self.config.allow_quadratic_constraint
+        objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
+            {}, var_recorder=self.var_recorder
+        )
+        constraint_visitor = (QuadraticRepnVisitor if _qc else LinearRepnVisitor)(
+            objective_visitor.subexpression_cache if _qp == _qc else {},
+            var_recorder=self.var_recorder,
+        )
+
+        # Representations retained between writes (if the model has a
+        # RepnCache attached)
+        repn_cache = get_repn_cache(model)
+
+        timer.toc('Initialized column order', level=logging.DEBUG)
+
+        # We don't export any suffix information to the MPS file
+        #
+        if component_map[Suffix]:
+            suffixesByName = {}
+            for block in component_map[Suffix]:
+                for suffix in block.component_objects(
+                    Suffix, active=True, descend_into=False, sort=sorter
+                ):
+                    if not suffix.export_enabled() or not suffix:
+                        continue
+                    name = suffix.local_name
+                    if name in suffixesByName:
+                        suffixesByName[name].append(suffix)
+                    else:
+                        suffixesByName[name] = [suffix]
+            for name, suffixes in suffixesByName.items():
+                n = len(suffixes)
+                plural = 's' if n > 1 else ''
+                logger.warning(
+                    f"EXPORT Suffix '{name}' found on {n} block{plural}:\n    "
+                    + "\n    ".join(s.name for s in suffixes)
+                    + "\nMPS writer cannot export suffixes to MPS files.  Skipping."
+                )
+
+        # The coefficient matrix is collected column-major (in a CSC-like
+        # buffer): columns[vid] is the list of (row index, coefficient)
+        # for that column.  The rows (type, label, rhs, range) are
+        # collected in `rows`, and the quadratic terms for the
+        # objective and each constraint in `quadratic_rows`.
+        columns = {}
+        rows = []
+        quadratic_rows = []
+
+        def add_row(row_type, label, repn, rhs=None, rng=None):
+            row = len(rows)
+            rows.append((row_type, label, rhs, rng))
+            for vid, coef in repn.linear.items():
+                if not coef:
+                    continue
+                if vid in columns:
+                    columns[vid].append((row, coef))
+                else:
+                    columns[vid] = [(row, coef)]
+            quadratic = getattr(repn, 'quadratic', None)
+            if quadratic:
+                quadratic_rows.append((row, quadratic))
+
+        #
+        # Process objective
+        #
+        if not component_map[Objective]:
+            objectives = [Objective(expr=1)]
+            objectives[0].construct()
+        else:
+            objectives = []
+            for blk in component_map[Objective]:
+                objectives.extend(
+                    blk.component_data_objects(
+                        Objective, active=True, descend_into=False, sort=sorter
+                    )
+                )
+        if len(objectives) > 1:
+            raise ValueError(
+                "More than one active objective defined for input model '%s'; "
+                "Cannot write legal MPS file\nObjectives: %s"
+                % (model.name, ' '.join(obj.name for obj in objectives))
+            )
+
+        obj = objectives[0]
+        if obj.sense != minimize and self.config.skip_objective_sense:
+            raise ValueError(
+                f"Cannot write maximization objective ({obj.name}) to an MPS "
+                "file with 'skip_objective_sense=True'"
+            )
+        if repn_cache is None or obj.parent_block() is None:
+            # Note: do not cache the (temporary) default objective
+            repn = objective_visitor.walk_expression(obj.expr)
+        else:
+            repn = repn_cache.walk_expression(objective_visitor, obj, obj.expr)
+        if repn.nonlinear is not None:
+            raise ValueError(
+                f"Model objective ({obj.name}) contains nonlinear terms that "
+                "cannot be written to MPS format"
+            )
+        if repn.constant or not (repn.linear or getattr(repn, 'quadratic', None)):
+            # Not all solvers support constants in the objective (RHS
+            # entries for the objective row), and most do not tolerate
+            # an empty objective.  We will move the constant to the
+            # coefficient of a "variable" fixed to 1.
+            repn.linear[id(ONE_VAR_CONSTANT)] = repn.constant
+            columns[id(ONE_VAR_CONSTANT)] = []
+            repn.constant = 0
+        obj_label = getSymbol(obj, labeler)
+        aliasSymbol(obj, '__default_objective__')
+        add_row('N', obj_label, repn)
+        timer.toc('Objective %s', obj, level=logging.DEBUG)
+
+        #
+        # Process constraints
+        #
+        skip_trivial_constraints = self.config.skip_trivial_constraints
+        for con in ordered_active_constraints(model, self.config):
+            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+            # guarantee a return value that is either a (finite)
+            # native_numeric_type, or None
+            lb, body, ub = con.to_bounded_expression(True)
+            if lb is None and ub is None:
+                # Non-binding constraint
+                continue
+            if repn_cache is None:
+                repn = constraint_visitor.walk_expression(body)
+            else:
+                repn = repn_cache.walk_expression(constraint_visitor, con, body)
+            if repn.nonlinear is not None:
+                raise ValueError(
+                    f"Model constraint ({con.name}) contains nonlinear terms "
+                    "that cannot be written to MPS format"
+                )
+            # Pull out the constant: we will move it to the bounds
+            offset = repn.constant
+            repn.constant = 0
+
+            if (
+                skip_trivial_constraints
+                and not any(repn.linear.values())
+                and not getattr(repn, 'quadratic', None)
+                and (lb is None or lb <= offset)
+                and (ub is None or ub >= offset)
+            ):
+                continue
+
+            symbol = labeler(con)
+            if fixed_format:
+                addSymbol(con, symbol)
+                if lb == ub:
+                    add_row('E', symbol, repn, lb - offset)
+                elif ub is None:
+                    add_row('G', symbol, repn, lb - offset)
+                elif lb is None:
+                    add_row('L', symbol, repn, ub - offset)
+                else:
+                    add_row('G', symbol, repn, lb - offset, ub - lb)
+            elif lb == ub:
+                label = f'c_e_{symbol}_'
+                addSymbol(con, label)
+                add_row('E', label, repn, lb - offset)
+            elif ub is None:
+                label = f'c_l_{symbol}_'
+                addSymbol(con, label)
+                add_row('G', label, repn, lb - offset)
+            elif lb is None:
+                label = f'c_u_{symbol}_'
+                addSymbol(con, label)
+                add_row('L', label, repn, ub - offset)
+            else:
+                label = f'r_l_{symbol}_'
+                addSymbol(con, label)
+                add_row('G', label, repn, lb - offset)
+                label = f'r_u_{symbol}_'
+                aliasSymbol(con, label)
+                add_row('L', label, repn, ub - offset)
+        timer.toc('Processed constraints', level=logging.DEBUG)
+
+        #
+        # Collect SOS constraints (variables that only appear in SOS
+        # constraints must still be written to the COLUMNS section)
+        #
+        sos = []
+        if component_map[SOSConstraint]:
+            for blk in component_map[SOSConstraint]:
+                sos.extend(
+                    blk.component_data_objects(
+                        SOSConstraint, active=True, descend_into=False, sort=sorter
+                    )
+                )
+            for soscon in sos:
+                if soscon.level not in (1, 2):
+                    raise ValueError(
+                        f"SOSConstraint '{soscon.name}' has level "
+                        f"{soscon.level}; only SOS1 and SOS2 constraints can "
+                        "be written to MPS files"
+                    )
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    if v.fixed:
+                        raise RuntimeError(
+                            f"SOSConstraint '{soscon.name}' includes a fixed "
+                            f"variable '{v.name}'. This is currently not "
+                            "supported. Deactivate this constraint in order "
+                            "to proceed."
+                        )
+                    if id(v) not in var_map:
+                        self.var_recorder.add(v)
+                    if id(v) not in columns:
+                        columns[id(v)] = []
+
+        # Variables that only appear in quadratic terms
+        for row, quadratic in quadratic_rows:
+            for vid1, vid2 in quadratic:
+                if vid1 not in columns:
+                    columns[vid1] = []
+                if vid2 not in columns:
+                    columns[vid2] = []
+
+        #
+        # Write the file
+        #
+        ostream.write("* Source:     Pyomo MPS Writer (version 2)\n")
+        ostream.write("* Format:     %s MPS\n" % ('Fixed' if fixed_format else 'Free',))
+        ostream.write("*\n")
+        ostream.write(f"NAME          {model.name}\n")
+        if not self.config.skip_objective_sense:
+            ostream.write("OBJSENSE\n")
+            ostream.write("    MIN\n" if obj.sense == minimize else "    MAX\n")
+
+        ostream.write("ROWS\n")
+        if fixed_format:
+            for row_type, label, rhs, rng in rows:
+                if len(label) > 8:
+                    _name_too_long(label)
+        ostream.write(''.join([f' {row[0]}  {row[1]}\n' for row in rows]))
+
+        # Columns are written in the order that the variables were
+        # first encountered (or specified by column_order)
+        ostream.write("COLUMNS\n")
+        labels = [row[1] for row in rows]
+        col_labels = {}
+        int_marker = self.config.int_marker
+        in_integer_section = False
+        mark_cnt = 0
+        for vid in sorted(columns, key=var_order.__getitem__):
+            v = var_map[vid]
+            col_labels[vid] = col = getSymbol(v, labeler)
+            if fixed_format and len(col) > 8:
+                _name_too_long(col)
+            if int_marker and v.is_integer() != in_integer_section:
+                in_integer_section = not in_integer_section
+                line(
+                    '',
+                    f'MARK{mark_cnt:04d}',
+                    "'MARKER'",
+                    '',
+                    "'INTORG'" if in_integer_section else "'INTEND'",
+                )
+                mark_cnt += 1
+            col_data = columns[vid]
+            if not col_data:
+                # Declare the column (with a zero objective coefficient)
+                line('', col, obj_label, '0')
+            ostream.write(
+                ''.join([entry(col, labels[row], num(coef)) for row, coef in col_data])
+            )
+        if in_integer_section:
+            line('', f'MARK{mark_cnt:04d}', "'MARKER'", '', "'INTEND'")
+        timer.toc('Wrote COLUMNS section', level=logging.DEBUG)
+
+        ostream.write("RHS\n")
+        ostream.write(
+            ''.join(
+                [
+                    entry('RHS', row[1], num(row[2]))
+                    for row in rows
+                    if row[2] is not None
+                ]
+            )
+        )
+
+        if any(row[3] is not None for row in rows):
+            ostream.write("RANGES\n")
+            ostream.write(
+                ''.join(
+                    [
+                        entry('RNG', row[1], num(row[3]))
+                        for row in rows
+                        if row[3] is not None
+                    ]
+                )
+            )
+
+        ostream.write("BOUNDS\n")
+        for vid, col in col_labels.items():
+            v = var_map[vid]
+            # Note: Var.bounds guarantees the values are either (finite)
+            # native_numeric_types or None
+            lb, ub = v.bounds
+            if v.is_binary() and lb == 0 and ub == 1:
+                line('BV', 'BOUND', col)
+            elif v.is_integer():
+                # Integrality can only be declared in the BOUNDS section
+                # (if MARKERs are not used), so unbounded integers are
+                # written using a "large" bound (some versions of CPLEX
+                # do not accept "inf")
+                line('LI', 'BOUND', col, '-10E20' if lb is None else num(lb))
+                line('UI', 'BOUND', col, '10E20' if ub is None else num(ub))
+            elif lb is not None and lb == ub:
+                line('FX', 'BOUND', col, num(lb))
+            elif lb is None and ub is None:
+                line('FR', 'BOUND', col)
+            else:
+                if lb is None:
+                    line('MI', 'BOUND', col)
+                else:
+                    line('LO', 'BOUND', col, num(lb))
+                if ub is not None:
+                    line('UP', 'BOUND', col, num(ub))
+        timer.toc('Wrote BOUNDS section', level=logging.DEBUG)
+
+        if sos:
+            ostream.write("SOS\n")
+            for soscon in sos:
+                line(f'S{soscon.level}', 'SOS', getSymbol(soscon, labeler))
+                for v, w in getattr(soscon, 'get_items', soscon.items)():
+                    if w.__class__ not in int_float:
+                        w = float(w)
+                    if w < 0:
+                        raise ValueError(
+                            f"Cannot use negative weight {w} for variable "
+                            f"{v.name} in special ordered set {soscon.name}"
+                        )
+                    line('', col_labels[id(v)], num(w))
+
+        for row, quadratic in quadratic_rows:
+            self._write_quadratic(
+                line, num, labels[row], quadratic, col_labels, row == 0
+            )
+
+        ostream.write("ENDATA\n")
+
+        info = MPSWriterInfo(self.symbol_map)
+        timer.toc("Generated MPS representation", delta=False)
+        return info
+
+    def _write_quadratic(self, line, num, label, quadratic, col_labels, objective):
+        getVarOrder = self.var_order.__getitem__
+        terms = {}
+        for (vid1, vid2), coef in quadratic.items():
+            if not coef:
+                continue
+            if getVarOrder(vid2) < getVarOrder(vid1):
+                vid1, vid2 = vid2, vid1
+            key = getVarOrder(vid1), getVarOrder(vid2)
+            if key in terms:
+                terms[key][2] += coef
+            else:
+                terms[key] = [vid1, vid2, coef]
+        if not terms:
+            return
+        if objective:
+            # QUADOBJ holds the upper triangle of Q in (1/2 x'Qx)
+            self.ostream.write("QUADOBJ\n")
+            for key in sorted(terms):
+                vid1, vid2, coef = terms[key]
+                if vid1 == vid2:
+                    coef *= 2
+                line('', col_labels[vid1], col_labels[vid2], num(coef))
+        else:
+            # QCMATRIX holds the full (symmetric) Q in (x'Qx)
+            self.ostream.write(f"QCMATRIX   {label}\n")
+            for key in sorted(terms):
+                vid1, vid2, coef = terms[key]
+                if vid1 == vid2:
+                    line('', col_labels[vid1], col_labels[vid2], num(coef))
+                else:
+                    coef /= 2
+                    line('', col_labels[vid1], col_labels[vid2], num(coef))
+                    line('', col_labels[vid2], col_labels[vid1], num(coef))
@@ -10,10 +10,13 @@
 #  ___________________________________________________________________________
 
 import logging
+import multiprocessing
 import os
+import struct
+import sys
 from collections import defaultdict, namedtuple
 from contextlib import nullcontext
-from itertools import filterfalse, product
+from itertools import filterfalse, islice, product
 from math import log10 as _log10
 from operator import itemgetter, attrgetter
 
@@ -22,11 +25,13 @@ from pyomo.common.config import (
     ConfigDict,
     ConfigValue,
     InEnum,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import relocated_module_attribute
 from pyomo.common.errors import DeveloperError, InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_types
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -49,12 +54,22 @@ from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.expression import ScalarExpression, ExpressionData
 from pyomo.core.base.objective import ScalarObjective, ObjectiveData
 from pyomo.core.base.suffix import SuffixFinder
-from pyomo.core.base.var import VarData
+from pyomo.core.base.var import VarData, _var_bounds, _var_values
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
 import pyomo.core.kernel as kernel
 from pyomo.core.pyomoobject import PyomoObject
 from pyomo.opt import WriterFactory
 
-from pyomo.repn.ampl import AMPLRepnVisitor, evaluate_ampl_nl_expression, TOL
+from pyomo.repn.cache import RepnCache, get_repn_cache
+from pyomo.repn.ampl import (
+    AMPLBeforeChildDispatcher,
+    AMPLRepnVisitor,
+    AMPLRepnCSEVisitor,
+    NLFragment,
+    evaluate_ampl_nl_expression,
+    find_common_subexpressions,
+    TOL,
+)
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
@@ -270,6 +285,24 @@ class NLWriter(object):
         variables'.""",
         ),
     )
+    CONFIG.declare(
+        'common_subexpressions',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Export repeated subexpressions as defined variables',
+            doc="""
+        If True, identify nonlinear subexpressions (products, divisions,
+        powers, and unary / Expr_if functions involving variables) that
+        appear more than once in the active objectives and constraints
+        (i.e., structurally identical subtrees, and not just the same
+        Python object) and export each of them to the NL file once as a
+        'defined variable' that is referenced by every occurrence.  This
+        reduces the size of the NL file and the work the solver spends
+        evaluating (and differentiating) the repeated subexpression.
+        Ignored if `export_defined_variables` is False.""",
+        ),
+    )
     CONFIG.declare(
         'linear_presolve',
         ConfigValue(
@@ -281,9 +314,61 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'binary',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description="Write the NL file in the ASL binary ('b') format",
+            doc="""
+        If True, the NL file is written using the ASL binary format:
+        the header is the same as the text ('g') format, but all
+        segments are written as packed native-endian integers and
+        doubles.  The output stream must be opened in binary mode.
+        Binary files are smaller and faster to write and load than the
+        text format, but cannot contain comments (symbolic solver
+        labels are still written to the row / col files).""",
+        ),
+    )
+    CONFIG.declare(
+        'parallel',
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description='Number of processes used to compile constraints',
+            doc="""
+        Number of worker processes to use when generating the AMPL
+        representation of the active constraints.  Values greater than
+        1 partition the (ordered) constraints into contiguous shards
+        that are compiled in a pool of forked processes and merged back
+        in order, so the resulting NL file is identical to the one
+        generated serially.  Shards that reference external functions
+        (or components that cannot be resolved in the parent process)
+        are compiled serially.  Ignored on platforms that do not
+        support the 'fork' process start method, and when
+        `incremental` is True.""",
+        ),
+    )
+    CONFIG.declare(
+        'incremental',
+        ConfigValue(
+            default=False,
+            domain=bool,
+            description='Reuse compiled constraints between calls to write()',
+            doc="""
+        If True, this writer will retain the compiled (AMPL)
+        representation of each constraint between calls to write().
+        Subsequent writes of the same model will only recompile
+        constraints whose expression was replaced, or where the value
+        of a mutable Param or the fixed status / value of a Var in the
+        constraint body changed.  Constraints that reference named
+        Expressions or ExternalFunctions are always recompiled.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
+        self._repn_cache = None
 
     def __call__(self, model, filename, solver_capability, io_options):
         if filename is None:
@@ -309,9 +394,13 @@ class NLWriter(object):
             _open = lambda fname: open(fname, 'w')
         else:
             _open = nullcontext
-        with open(filename, 'w', newline='') as FILE, _open(
-            row_fname
-        ) as ROWFILE, _open(col_fname) as COLFILE:
+        if config.binary:
+            nl_mode = {'mode': 'wb'}
+        else:
+            nl_mode = {'mode': 'w', 'newline': ''}
+        with open(filename, **nl_mode) as FILE, _open(row_fname) as ROWFILE, _open(
+            col_fname
+        ) as COLFILE:
             info = self.write(model, FILE, ROWFILE, COLFILE, config=config)
         if not info.variables:
             # This exception is included for compatibility with the
@@ -352,7 +441,9 @@ class NLWriter(object):
 
         ostream: io.TextIOBase
             The text output stream where the NL "file" will be written.
-            Could be an opened file or a io.StringIO.
+            Could be an opened file or a io.StringIO.  If writing the
+            binary NL format, this must be a binary stream
+            (e.g., a file opened with mode 'wb' or a io.BytesIO).
 
         rowstream: io.TextIOBase
             A text output stream to write the ASL "row file" (list of
@@ -366,10 +457,19 @@ class NLWriter(object):
         """
         config = options.pop('config', self.config)(options)
 
+        if config.incremental or get_repn_cache(model) is not None:
+            if self._repn_cache is None:
+                self._repn_cache = _ConstraintRepnCache()
+            self._repn_cache.reset(model, config)
+        else:
+            self._repn_cache = None
+
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
         # small objects.
-        with _NLWriter_impl(ostream, rowstream, colstream, config) as impl:
+        with _NLWriter_impl(
+            ostream, rowstream, colstream, config, self._repn_cache
+        ) as impl:
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
@@ -497,8 +597,207 @@ class _NoScalingFactor(object):
         return 1
 
 
+# Packers for the ASL binary NL format (native byte order, standard
+# sizes, no alignment)
+_pack_i = struct.Struct('=i').pack
+_pack_d = struct.Struct('=d').pack
+_pack_ii = struct.Struct('=ii').pack
+_pack_id = struct.Struct('=id').pack
+_pack_dd = struct.Struct('=dd').pack
+_pack_iii = struct.Struct('=iii').pack
+
+
+def _pack_str(val):
+    val = val.encode()
+    return _pack_i(len(val)) + val
+
+
+def _binary_nl_expression(nl):
+    """Convert a (text) NL expression fragment to the ASL binary format
+
+    Every node in the text format is a single line (optionally followed
+    by a comment), with the exception of string arguments (``h``
+    nodes), which contain the string length and may span lines.
+
+    """
+    ans = []
+    pos = 0
+    n = len(nl)
+    while pos < n:
+        if nl[pos] == 'h':
+            # String argument: h<len>:<string>
+            sep = nl.index(':', pos)
+            end = sep + 1 + int(nl[pos + 1 : sep])
+            ans.append(b'h' + _pack_str(nl[sep + 1 : end]))
+            # skip the trailing newline
+            pos = end + 1
+            continue
+        end = nl.find('\n', pos)
+        if end < 0:
+            end = n
+        line = nl[pos:end]
+        pos = end + 1
+        comment = line.find('#')
+        if comment >= 0:
+            line = line[:comment]
+        tokens = line.split()
+        if not tokens:
+            continue
+        term = tokens[0]
+        cmd = term[0]
+        if cmd == 'o' or cmd == 'v':
+            ans.append(cmd.encode() + _pack_i(int(term[1:])))
+        elif cmd == 'n':
+            ans.append(b'n' + _pack_d(float(term[1:])))
+        elif cmd == 'f':
+            ans.append(b'f' + _pack_ii(int(term[1:]), int(tokens[1])))
+        else:
+            # The argument count for n-ary operators
+            ans.append(_pack_i(int(term)))
+    return b''.join(ans)
+
+
+def _binary_bound(lb, ub):
+    """Generate the binary ASL bound ('r' / 'b' segment) record"""
+    if lb == ub:
+        if lb is None:
+            return b'3'
+        return b'4' + _pack_d(lb)
+    elif lb is None:
+        return b'1' + _pack_d(ub)
+    elif ub is None:
+        return b'2' + _pack_d(lb)
+    return b'0' + _pack_dd(lb, ub)
+
+
+class _ConstraintRepnCache(object):
+    """Compiled constraint representations retained between calls to
+    :py:meth:`NLWriter.write` (see the `incremental` option)
+
+    The entries are stored in a :py:class:`RepnCache` (either the cache
+    attached to the model being written, or one private to this
+    writer).  Each entry records the constraint expression object, the
+    scaling factor, and the Var and mutable Param leaves in the
+    constraint body, along with a pristine copy of the compiled
+    :py:class:`AMPLRepn`.  An entry is reused only if none of the leaves
+    were modified since the constraint was compiled (as reported by the
+    cache's :py:class:`ChangeLog`, so writing an unmodified model does
+    not revisit the leaves).  The number of cache hits and misses
+    during the most recent write are recorded in :py:attr:`hits` and
+    :py:attr:`misses`.
+
+    """
+
+    def __init__(self):
+        self.model = None
+        self.cache = None
+        self.kind = None
+        self.entries = {}
+        self.previous = {}
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self, model, config):
+        cache = get_repn_cache(model)
+        if cache is None:
+            if model is not self.model or self.cache is None:
+                self.cache = RepnCache()
+        else:
+            self.cache = cache
+        self.model = model
+        self.kind = (
+            'nl',
+            config.symbolic_solver_labels,
+            config.export_defined_variables,
+            config.common_subexpressions,
+            config.file_determinism,
+        )
+        # Only retain entries for the constraints that are written by
+        # the next call to write()
+        self.previous, self.entries = self.cache.replace_bucket(self.kind)
+        self.hits = self.misses = 0
+
+    def lookup(self, con, scale, visitor):
+        entry = self.previous.get(id(con))
+        if entry is None:
+            return None
+        # Note: the var_map only contains unfixed variables while the
+        # constraints are compiled (so fixed variables are always
+        # compiled as constants), and is not part of the cache key
+        if not self.cache.is_valid(entry, con, con.expr, None, scale):
+            return None
+        # Record the variables in the var_map in the same order that
+        # the AMPLRepnVisitor would have encountered them
+        var_map = visitor.var_map
+        for v in self.cache.variables(entry):
+            if id(v) not in var_map and not v.fixed:
+                AMPLBeforeChildDispatcher._record_var(visitor, v)
+        self.entries[id(con)] = entry
+        return entry[-1].duplicate()
+
+    def store(self, con, scale, body, visitor, repn):
+        self.entries[id(con)] = self.cache.make_entry(
+            con, con.expr, body, repn.duplicate(), None, scale
+        )
+
+
+def _fork_available():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+# Data shared (through fork) with the worker processes used by
+# _NLWriter_impl._compile_constraints_parallel()
+_parallel_shard_data = None
+
+
+def _compile_constraint_shard(shard):
+    """Compile a contiguous range of constraints in a worker process
+
+    Returns a 3-tuple of (the ids of variables added to the var_map in
+    the order they were encountered, the named subexpressions
+    encountered as (id, node id, is_fragment, repn, info) tuples in
+    insertion order, and the list of compiled (lb, ub, AMPLRepn)
+    tuples), or None if the shard must be compiled serially.
+
+    """
+    impl, constraints, scales = _parallel_shard_data
+    start, end = shard
+    var_map = dict(impl.var_map)
+    n_known_vars = len(var_map)
+    visitor = impl._create_visitor({}, {}, var_map, set())
+    compiled = []
+    for con, scale in zip(constraints[start:end], scales[start:end]):
+        lb, body, ub = con.to_bounded_expression(True)
+        compiled.append((lb, ub, visitor.walk_expression((body, con, 0, scale))))
+    if visitor.external_functions:
+        # The external function IDs are embedded in the NL strings and
+        # cannot be (easily) remapped: fall back on compiling this
+        # shard in the parent process.
+        return None
+    subexpressions = [
+        (
+            (_id, id(node._node), True, repn, info)
+            if node.__class__ is NLFragment
+            else (_id, id(node), False, repn, info)
+        )
+        for _id, (node, repn, info) in visitor.subexpression_cache.items()
+    ]
+    return list(islice(var_map, n_known_vars, None)), subexpressions, compiled
+
+
+def _remap_repn_ids(repn, remap):
+    if repn.nonlinear:
+        nl, args = repn.nonlinear
+        repn.nonlinear = nl, [remap.get(_id, _id) for _id in args]
+    if repn.nl:
+        nl, args = repn.nl
+        repn.nl = nl, tuple(remap.get(_id, _id) for _id in args)
+    if repn.named_exprs:
+        repn.named_exprs = {remap.get(_id, _id) for _id in repn.named_exprs}
+
+
 class _NLWriter_impl(object):
-    def __init__(self, ostream, rowstream, colstream, config):
+    def __init__(self, ostream, rowstream, colstream, config, repn_cache=None):
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -511,19 +810,45 @@ class _NLWriter_impl(object):
         self.var_map = {}
         self.var_id_to_nl_map = {}
         self.sorter = FileDeterminism_to_SortComponents(config.file_determinism)
-        self.visitor = AMPLRepnVisitor(
+        if config.common_subexpressions and config.export_defined_variables:
+            self.common_subexpressions = {}
+        else:
+            self.common_subexpressions = None
+        self.visitor = self._create_visitor(
             self.subexpression_cache,
             self.external_functions,
             self.var_map,
             self.used_named_expressions,
-            self.symbolic_solver_labels,
-            self.config.export_defined_variables,
-            self.sorter,
         )
         self.next_V_line_id = 0
+        self.repn_cache = repn_cache
+        if config.binary:
+            # Expression fragments are generated using the text
+            # templates and converted to binary when they are written
+            self.write_expression = lambda nl: ostream.write(_binary_nl_expression(nl))
+        else:
+            self.write_expression = ostream.write
         self.pause_gc = None
         self.template = self.visitor.Result.template
 
+    def _create_visitor(
+        self, subexpression_cache, external_functions, var_map, used_named_expressions
+    ):
+        args = (
+            subexpression_cache,
+            external_functions,
+            var_map,
+            used_named_expressions,
+            self.symbolic_solver_labels,
+            self.config.export_defined_variables,
+            self.sorter,
+        )
+        if self.common_subexpressions is None:
+            return AMPLRepnVisitor(*args)
+        return AMPLRepnCSEVisitor(
+            *args, common_subexpressions=self.common_subexpressions
+        )
+
     def __enter__(self):
         self.pause_gc = PauseGC()
         self.pause_gc.__enter__()
@@ -578,6 +903,7 @@ class _NLWriter_impl(object):
         visitor = self.visitor
         ostream = self.ostream
         linear_presolve = self.config.linear_presolve
+        binary = self.config.binary
 
         nl_map = self.var_id_to_nl_map
         var_map = self.var_map
@@ -624,6 +950,30 @@ class _NLWriter_impl(object):
         # expression
         comp_by_linear_var = defaultdict(list)
 
+        #
+        # Identify repeated subexpressions
+        #
+        if self.common_subexpressions is not None:
+            # Note: the common_subexpressions map is keyed by id(), so
+            # we need to hold on to the expressions until we are done
+            # writing the model
+            cse_exprs = [
+                obj.expr
+                for obj in model.component_data_objects(
+                    Objective, active=True, sort=sorter
+                )
+            ]
+            cse_exprs.extend(
+                con.to_bounded_expression(True)[1]
+                for con in ordered_active_constraints(model, self.config)
+            )
+            self.common_subexpressions.update(find_common_subexpressions(cse_exprs))
+            timer.toc(
+                'Identified %s common subexpressions',
+                len(set(self.common_subexpressions.values())),
+                level=logging.DEBUG,
+            )
+
         #
         # Tabulate the model expressions
         #
@@ -671,20 +1021,15 @@ class _NLWriter_impl(object):
         n_complementarity_range = 0
         n_complementarity_nz_var_lb = 0
         #
-        last_parent = None
-        for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
-                if last_parent is None:
-                    timer.toc(None)
-                else:
-                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-                last_parent = con.parent_component()
-            scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
+        if self.config.parallel > 1 and self.repn_cache is None and _fork_available():
+            compiled_constraints = self._compile_constraints_parallel(
+                model, scaling_factor
+            )
+        else:
+            compiled_constraints = self._compile_constraints(
+                model, scaling_factor, timer, with_debug_timing
+            )
+        for con, expr_info, lb, ub, scale in compiled_constraints:
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -704,10 +1049,7 @@ class _NLWriter_impl(object):
                     lcon_by_linear_nnz[len(expr_info.linear)][con_id] = expr_info, lb
                 for _id in expr_info.linear:
                     comp_by_linear_var[_id].append((con_id, expr_info))
-        if with_debug_timing:
-            # report the last constraint
-            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-        else:
+        if not with_debug_timing:
             timer.toc('Processed %s constraints', len(all_constraints))
 
         # We have identified all the external functions (resolving them
@@ -720,8 +1062,10 @@ class _NLWriter_impl(object):
         # where variables were completely eliminated while walking the
         # expressions, or when users provide superfluous variables in
         # the column ordering.
-        var_bounds = {_id: v.bounds for _id, v in var_map.items()}
-        var_values = {_id: v.value for _id, v in var_map.items()}
+        var_list = list(var_map.values())
+        var_bounds = dict(zip(var_map, _var_bounds(var_list)))
+        var_values = dict(zip(var_map, _var_values(var_list)))
+        del var_list
 
         eliminated_cons, eliminated_vars = self._linear_presolve(
             comp_by_linear_var, lcon_by_linear_nnz, var_bounds, var_values
@@ -1101,7 +1445,17 @@ class _NLWriter_impl(object):
 
         r_lines = [None] * n_cons
         for idx, (con, expr_info, lb, ub) in enumerate(constraints):
-            if lb == ub:  # TBD: should this be within tolerance?
+            if binary:
+                const = expr_info.const
+                r_lines[idx] = _binary_bound(
+                    None if lb is None else lb - const,
+                    None if ub is None else ub - const,
+                )
+                if lb == ub and lb is not None:
+                    n_equality += 1
+                elif lb is not None and ub is not None:
+                    n_ranges += 1
+            elif lb == ub:  # TBD: should this be within tolerance?
                 if lb is None:
                     # type = 3  # -inf <= c <= inf
                     r_lines[idx] = "3"
@@ -1126,12 +1480,19 @@ class _NLWriter_impl(object):
             # that they are in an acceptable form).
             if hasattr(con, '_complementarity'):
                 # _type = 5
-                r_lines[idx] = f"5 {con._complementarity} {1+column_order[con._vid]}"
+                if binary:
+                    r_lines[idx] = b'5' + _pack_ii(
+                        con._complementarity, 1 + column_order[con._vid]
+                    )
+                else:
+                    r_lines[idx] = (
+                        f"5 {con._complementarity} {1+column_order[con._vid]}"
+                    )
                 if expr_info.nonlinear:
                     n_complementarity_nonlin += 1
                 else:
                     n_complementarity_lin += 1
-        if symbolic_solver_labels:
+        if symbolic_solver_labels and not binary:
             for idx in range(len(constraints)):
                 r_lines[idx] += row_comments[idx]
 
@@ -1142,26 +1503,39 @@ class _NLWriter_impl(object):
         #
         # LINE 1
         #
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
-        ):
+        if binary:
+            # The header is always text.  Note that the ASL uses the
+            # 'arith' field (line 6) to detect the byte order of binary
+            # files.
+            _write = ostream.write
+            write_header = lambda txt: _write(txt.encode())
+            arith = 1 if sys.byteorder == 'little' else 2
+            file_format = 'b'
+        else:
+            write_header = ostream.write
+            arith = 0
+            file_format = 'g'
+        check_newlines = (
+            visitor.encountered_string_arguments
+            and not binary
+            and 'b' not in getattr(ostream, 'mode', '')
+        )
+        if check_newlines:
             # Not all streams support tell()
             try:
                 _written_bytes = ostream.tell()
             except IOError:
                 _written_bytes = None
 
-        line_1_txt = f"g3 1 1 0\t# problem {model.name}\n"
-        ostream.write(line_1_txt)
+        line_1_txt = f"{file_format}3 1 1 0\t# problem {model.name}\n"
+        write_header(line_1_txt)
 
         # If there were any string arguments, then we need to ensure
         # that ostream is not converting newlines to something other
         # than '\n'.  Binary files do not perform newline mapping (of
         # course, we will also need to map all the str to bytes for
         # binary-mode I/O).
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
-        ):
+        if check_newlines:
             if _written_bytes is None:
                 _written_bytes = 0
             else:
@@ -1193,7 +1567,7 @@ class _NLWriter_impl(object):
         #
         # LINE 2
         #
-        ostream.write(
+        write_header(
             " %d %d %d %d %d \t"
             "# vars, constraints, objectives, ranges, eqns\n"
             % (n_vars, n_cons, n_objs, n_ranges, n_equality)
@@ -1201,7 +1575,7 @@ class _NLWriter_impl(object):
         #
         # LINE 3
         #
-        ostream.write(
+        write_header(
             " %d %d %d %d %d %d\t"
             "# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb\n"
             % (
@@ -1221,7 +1595,7 @@ class _NLWriter_impl(object):
         #
         # LINE 4
         #
-        ostream.write(" 0 0\t# network constraints: nonlinear, linear\n")
+        write_header(" 0 0\t# network constraints: nonlinear, linear\n")
         #
         # LINE 5
         #
@@ -1239,7 +1613,7 @@ class _NLWriter_impl(object):
         _n_obj_vars = _n_con_vars + len(obj_vars_nonlinear) - _n_both_vars
         if _n_obj_vars == _n_con_vars:
             _n_obj_vars = _n_both_vars
-        ostream.write(
+        write_header(
             " %d %d %d \t"
             "# nonlinear vars in constraints, objectives, both\n"
             % (_n_con_vars, _n_obj_vars, _n_both_vars)
@@ -1248,15 +1622,15 @@ class _NLWriter_impl(object):
         #
         # LINE 6
         #
-        ostream.write(
-            " 0 %d 0 1\t"
+        write_header(
+            " 0 %d %d 1\t"
             "# linear network variables; functions; arith, flags\n"
-            % (len(self.external_functions),)
+            % (len(self.external_functions), arith)
         )
         #
         # LINE 7
         #
-        ostream.write(
+        write_header(
             " %d %d %d %d %d \t"
             "# discrete variables: binary, integer, nonlinear (b,c,o)\n"
             % (
@@ -1271,14 +1645,14 @@ class _NLWriter_impl(object):
         # LINE 8
         #
         # objective info computed above
-        ostream.write(
+        write_header(
             " %d %d \t# nonzeros in Jacobian, obj. gradient\n"
             % (sum(con_nnz_by_var.values()), sum(obj_nnz_by_var.values()))
         )
         #
         # LINE 9
         #
-        ostream.write(
+        write_header(
             " %d %d\t# max name lengths: constraints, variables\n"
             % (
                 max(map(len, row_labels), default=0),
@@ -1288,7 +1662,7 @@ class _NLWriter_impl(object):
         #
         # LINE 10
         #
-        ostream.write(
+        write_header(
             " %d %d %d %d %d\t# common exprs: b,c,o,c1,o1\n" % tuple(n_subexpressions)
         )
 
@@ -1298,7 +1672,10 @@ class _NLWriter_impl(object):
         amplfunc_libraries = set()
         for fid, fcn in self.external_functions:
             amplfunc_libraries.add(fcn._library)
-            ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
+            if binary:
+                ostream.write(b'F' + _pack_iii(fid, 1, -1) + _pack_str(fcn._function))
+            else:
+                ostream.write("F%d 1 -1 %s\n" % (fid, fcn._function))
 
         #
         # "S" lines (suffixes)
@@ -1329,6 +1706,15 @@ class _NLWriter_impl(object):
             ):
                 if not _vals:
                     continue
+                if binary:
+                    _pack = _pack_id if _float else _pack_ii
+                    ostream.write(
+                        b'S'
+                        + _pack_ii(_field | _float, len(_vals))
+                        + _pack_str(name)
+                        + b''.join(_pack(_id, _vals[_id]) for _id in sorted(_vals))
+                    )
+                    continue
                 ostream.write(f"S{_field|_float} {len(_vals)} {name}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1374,6 +1760,15 @@ class _NLWriter_impl(object):
                 # beginning, we can very quickly write all the linear
                 # constraints at the end (as their nonlinear expressions
                 # are the constant 0).
+                if binary:
+                    _expr = b'n' + _pack_d(0)
+                    ostream.write(
+                        b''.join(
+                            b'C' + _pack_i(i) + _expr
+                            for i in range(row_idx, len(constraints))
+                        )
+                    )
+                    break
                 _expr = self.template.const % 0
                 if symbolic_solver_labels:
                     ostream.write(
@@ -1395,7 +1790,10 @@ class _NLWriter_impl(object):
             if single_use_subexpressions:
                 for _id in single_use_subexpressions.get(id(info[0]), ()):
                     self._write_v_line(_id, row_idx + 1)
-            ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
+            if binary:
+                ostream.write(b'C' + _pack_i(row_idx))
+            else:
+                ostream.write(f'C{row_idx}{row_comments[row_idx]}\n')
             self._write_nl_expression(info[1], False)
 
         #
@@ -1410,7 +1808,10 @@ class _NLWriter_impl(object):
                     self._write_v_line(_id, n_cons + n_lcons + obj_idx + 1)
             lbl = row_comments[n_cons + obj_idx]
             sense = 0 if info[0].sense == minimize else 1
-            ostream.write(f'O{obj_idx} {sense}{lbl}\n')
+            if binary:
+                ostream.write(b'O' + _pack_ii(obj_idx, sense))
+            else:
+                ostream.write(f'O{obj_idx} {sense}{lbl}\n')
             self._write_nl_expression(info[1], True)
 
         #
@@ -1438,7 +1839,13 @@ class _NLWriter_impl(object):
                 logger.warning("ignoring 'dual' suffix for Objective types")
             if data.prob:
                 logger.warning("ignoring 'dual' suffix for Model")
-            if data.con:
+            if data.con and binary:
+                ostream.write(
+                    b'd'
+                    + _pack_i(len(data.con))
+                    + b''.join(_pack_id(_id, data.con[_id]) for _id in sorted(data.con))
+                )
+            elif data.con:
                 ostream.write(f"d{len(data.con)}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
                 ostream.write(
@@ -1458,79 +1865,109 @@ class _NLWriter_impl(object):
                 (var_idx, val * variable_scaling[var_idx])
                 for var_idx, val in _init_lines
             ]
-        ostream.write(
-            'x%d%s\n'
-            % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
-        )
-        ostream.write(
-            ''.join(
-                f'{var_idx} {val!s}{col_comments[var_idx]}\n'
-                for var_idx, val in _init_lines
+        if binary:
+            ostream.write(
+                b'x'
+                + _pack_i(len(_init_lines))
+                + b''.join(_pack_id(var_idx, val) for var_idx, val in _init_lines)
+            )
+        else:
+            ostream.write(
+                'x%d%s\n'
+                % (
+                    len(_init_lines),
+                    "\t# initial guess" if symbolic_solver_labels else '',
+                )
+            )
+            ostream.write(
+                ''.join(
+                    f'{var_idx} {val!s}{col_comments[var_idx]}\n'
+                    for var_idx, val in _init_lines
+                )
             )
-        )
 
         #
         # "r" lines (constraint bounds)
         #
-        ostream.write(
-            'r%s\n'
-            % (
-                (
-                    "\t#%d ranges (rhs's)" % len(constraints)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ostream.write(b'r' + b''.join(r_lines))
+        else:
+            ostream.write(
+                'r%s\n'
+                % (
+                    (
+                        "\t#%d ranges (rhs's)" % len(constraints)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
             )
-        )
-        ostream.write("\n".join(r_lines))
-        if r_lines:
-            ostream.write("\n")
+            ostream.write("\n".join(r_lines))
+            if r_lines:
+                ostream.write("\n")
 
         #
         # "b" lines (variable bounds)
         #
-        ostream.write(
-            'b%s\n'
-            % (
-                (
-                    "\t#%d bounds (on variables)" % len(variables)
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ostream.write(
+                b'b' + b''.join(_binary_bound(*var_bounds[_id]) for _id in variables)
             )
-        )
-        for var_idx, _id in enumerate(variables):
-            lb, ub = var_bounds[_id]
-            if lb == ub:
-                if lb is None:  # unbounded
-                    ostream.write(f"3{col_comments[var_idx]}\n")
-                else:  # ==
-                    ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
-            elif lb is None:  # var <= ub
-                ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
-            elif ub is None:  # lb <= body
-                ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
-            else:  # lb <= body <= ub
-                ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
+        else:
+            ostream.write(
+                'b%s\n'
+                % (
+                    (
+                        "\t#%d bounds (on variables)" % len(variables)
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
+            )
+            for var_idx, _id in enumerate(variables):
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        ostream.write(f"3{col_comments[var_idx]}\n")
+                    else:  # ==
+                        ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
+                elif lb is None:  # var <= ub
+                    ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
+                elif ub is None:  # lb <= body
+                    ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
+                else:  # lb <= body <= ub
+                    ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
 
         #
         # "k" lines (column offsets in Jacobian NNZ)
         #
-        ostream.write(
-            'k%d%s\n'
-            % (
-                len(variables) - 1,
-                (
-                    "\t#intermediate Jacobian column lengths"
-                    if symbolic_solver_labels
-                    else ''
-                ),
+        if binary:
+            ktot = 0
+            k_lines = []
+            for _id in variables[:-1]:
+                ktot += con_nnz_by_var.get(_id, 0)
+                k_lines.append(ktot)
+            ostream.write(
+                b'k'
+                + _pack_i(len(k_lines))
+                + struct.pack(f'={len(k_lines)}i', *k_lines)
             )
-        )
-        ktot = 0
-        for var_idx, _id in enumerate(variables[:-1]):
-            ktot += con_nnz_by_var.get(_id, 0)
-            ostream.write(f"{ktot}\n")
+        else:
+            ostream.write(
+                'k%d%s\n'
+                % (
+                    len(variables) - 1,
+                    (
+                        "\t#intermediate Jacobian column lengths"
+                        if symbolic_solver_labels
+                        else ''
+                    ),
+                )
+            )
+            ktot = 0
+            for var_idx, _id in enumerate(variables[:-1]):
+                ktot += con_nnz_by_var.get(_id, 0)
+                ostream.write(f"{ktot}\n")
 
         #
         # "J" lines (non-empty terms in the Jacobian)
@@ -1544,6 +1981,16 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write(
+                    b'J'
+                    + _pack_ii(row_idx, len(linear))
+                    + b''.join(
+                        _pack_id(column_order[_id], linear[_id])
+                        for _id in sorted(linear, key=column_order.__getitem__)
+                    )
+                )
+                continue
             ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1560,6 +2007,16 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
+            if binary:
+                ostream.write(
+                    b'G'
+                    + _pack_ii(obj_idx, len(linear))
+                    + b''.join(
+                        _pack_id(column_order[_id], linear[_id])
+                        for _id in sorted(linear, key=column_order.__getitem__)
+                    )
+                )
+                continue
             ostream.write(f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n')
             for _id in sorted(linear, key=column_order.__getitem__):
                 ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
@@ -1592,6 +2049,169 @@ class _NLWriter_impl(object):
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _compile_constraints(self, model, scaling_factor, timer, with_debug_timing):
+        """Generate the AMPL representation of each active constraint
+
+        Yields 5-tuples of (constraint, AMPLRepn, lb, ub, scale) in the
+        order that the constraints should appear in the NL file.
+
+        """
+        visitor = self.visitor
+        repn_cache = self.repn_cache
+        last_parent = None
+        for con in ordered_active_constraints(model, self.config):
+            if with_debug_timing and con.parent_component() is not last_parent:
+                if last_parent is None:
+                    timer.toc(None)
+                else:
+                    timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                last_parent = con.parent_component()
+            scale = scaling_factor(con)
+            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+            # guarantee a return value that is either a (finite)
+            # native_numeric_type, or None
+            lb, body, ub = con.to_bounded_expression(True)
+            if repn_cache is None:
+                expr_info = visitor.walk_expression((body, con, 0, scale))
+            else:
+                expr_info = repn_cache.lookup(con, scale, visitor)
+                if expr_info is None:
+                    repn_cache.misses += 1
+                    n_ef = len(self.external_functions)
+                    expr_info = visitor.walk_expression((body, con, 0, scale))
+                    # Named subexpressions and external function IDs
+                    # are specific to a single write: only retain
+                    # "self-contained" representations
+                    if not expr_info.named_exprs and n_ef == len(
+                        self.external_functions
+                    ):
+                        repn_cache.store(con, scale, body, visitor, expr_info)
+                else:
+                    repn_cache.hits += 1
+            yield con, expr_info, lb, ub, scale
+        if with_debug_timing:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+
+    def _compile_constraints_parallel(self, model, scaling_factor):
+        """Generate the AMPL representation of the active constraints
+        using a pool of forked worker processes
+
+        The ordered constraint list is partitioned into contiguous
+        shards that are compiled by the workers.  Shards are merged
+        back into this writer (in order) so that the var_map and the
+        subexpression_cache are populated exactly as they would be by
+        :py:meth:`_compile_constraints`.  This relies on the 'fork'
+        start method: the workers inherit the model, so the ids in the
+        returned :py:class:`AMPLRepn` objects refer to the same
+        components in this process.
+
+        """
+        global _parallel_shard_data
+
+        visitor = self.visitor
+        constraints = list(ordered_active_constraints(model, self.config))
+        scales = list(map(scaling_factor, constraints))
+        n_cons = len(constraints)
+        n_shards = min(n_cons, 4 * self.config.parallel)
+        shards = [
+            (n_cons * i // n_shards, n_cons * (i + 1) // n_shards)
+            for i in range(n_shards)
+        ]
+        # Map of id() to the Var / Expression data objects on the
+        # model.  This is only needed if the workers encounter
+        # variables / named expressions not already known to this
+        # writer, so we defer generating it until it is needed.
+        lookup = []
+
+        _parallel_shard_data = self, constraints, scales
+        try:
+            with multiprocessing.get_context('fork').Pool(self.config.parallel) as pool:
+                for (start, end), result in zip(
+                    shards, pool.imap(_compile_constraint_shard, shards)
+                ):
+                    if result is not None:
+                        result = self._merge_constraint_shard(model, result, lookup)
+                    if result is None:
+                        # Could not merge the shard: compile it serially
+                        for con, scale in zip(
+                            constraints[start:end], scales[start:end]
+                        ):
+                            lb, body, ub = con.to_bounded_expression(True)
+                            expr_info = visitor.walk_expression((body, con, 0, scale))
+                            yield con, expr_info, lb, ub, scale
+                        continue
+                    for con, scale, (lb, ub, expr_info) in zip(
+                        constraints[start:end], scales[start:end], result
+                    ):
+                        yield con, expr_info, lb, ub, scale
+        finally:
+            _parallel_shard_data = None
+
+    def _merge_constraint_shard(self, model, shard, lookup):
+        """Merge the variables and named subexpressions from a shard
+        compiled by :py:func:`_compile_constraint_shard`
+
+        Returns the list of compiled (lb, ub, AMPLRepn) tuples for the
+        shard, or None (without modifying the writer state) if the
+        shard references components that cannot be resolved from the
+        model.
+
+        """
+        new_vars, subexpressions, compiled = shard
+        var_map = self.var_map
+        subexpression_cache = self.subexpression_cache
+
+        new_vars = [_id for _id in new_vars if _id not in var_map]
+        if new_vars or subexpressions:
+            if not lookup:
+                lookup.append(
+                    {
+                        id(obj): obj
+                        for obj in model.component_data_objects(
+                            (Var, Expression), descend_into=True
+                        )
+                    }
+                )
+                if self.common_subexpressions:
+                    lookup[0].update(
+                        (id(cse), cse) for cse in self.common_subexpressions.values()
+                    )
+            known = lookup[0]
+            if not all(map(known.__contains__, new_vars)) or not all(
+                info[1] in known for info in subexpressions
+            ):
+                return None
+            for _id in new_vars:
+                var_map[_id] = known[_id]
+
+        # NLFragment objects were created in the worker process: we need
+        # to create (or find) the corresponding fragments here and remap
+        # the fragment ids in the compiled representations.
+        remap = {}
+        fragments = None
+        for _id, node_id, is_fragment, repn, info in subexpressions:
+            if is_fragment:
+                if fragments is None:
+                    fragments = {
+                        id(node._node): key
+                        for key, (node, _, _) in subexpression_cache.items()
+                        if node.__class__ is NLFragment
+                    }
+                if node_id not in fragments:
+                    node = NLFragment(repn, known[node_id])
+                    fragments[node_id] = id(node)
+                    subexpression_cache[id(node)] = (node, repn, info)
+                remap[_id] = fragments[node_id]
+            elif _id not in subexpression_cache:
+                subexpression_cache[_id] = (known[node_id], repn, info)
+        if remap:
+            for info in subexpressions:
+                _remap_repn_ids(info[3], remap)
+            for info in compiled:
+                _remap_repn_ids(info[2], remap)
+        return compiled
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1970,16 +2590,16 @@ class _NLWriter_impl(object):
                 # constant as the second argument, so we will too.
                 nl = self.template.binary_sum + nl + self.template.const % repn.const
             try:
-                self.ostream.write(
+                self.write_expression(
                     nl % tuple(map(self.var_id_to_nl_map.__getitem__, args))
                 )
             except KeyError:
-                self.ostream.write(self._resolve_subexpression_args(nl, args))
+                self.write_expression(self._resolve_subexpression_args(nl, args))
 
         elif include_const:
-            self.ostream.write(self.template.const % repn.const)
+            self.write_expression(self.template.const % repn.const)
         else:
-            self.ostream.write(self.template.const % 0)
+            self.write_expression(self.template.const % 0)
 
     def _write_v_line(self, expr_id, k):
         ostream = self.ostream
@@ -1995,8 +2615,18 @@ class _NLWriter_impl(object):
         # the Hessian results.
         linear = dict(item for item in info[1].linear.items() if item[1])
         #
-        ostream.write(f'V{self.next_V_line_id} {len(linear)} {k}{lbl}\n')
-        for _id in sorted(linear, key=column_order.__getitem__):
-            ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+        if self.config.binary:
+            ostream.write(
+                b'V'
+                + _pack_iii(self.next_V_line_id, len(linear), k)
+                + b''.join(
+                    _pack_id(column_order[_id], linear[_id])
+                    for _id in sorted(linear, key=column_order.__getitem__)
+                )
+            )
+        else:
+            ostream.write(f'V{self.next_V_line_id} {len(linear)} {k}{lbl}\n')
+            for _id in sorted(linear, key=column_order.__getitem__):
+                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
         self._write_nl_expression(info[1], True)
         self.next_V_line_id += 1
@@ -296,6 +296,11 @@ class _ParameterizedLinearStandardFormCompiler_impl(_LinearStandardFormCompiler_
             subexpression_cache, wrt=wrt, var_recorder=var_recorder
         )
 
+    def _data_buffer(self):
+        # The coefficients may be Pyomo expressions, so we cannot store
+        # them in an array of doubles
+        return []
+
     def _to_vector(self, data, N, vector_type):
         # override this to not attempt conversion to float since that will fail
         # on the Pyomo expressions
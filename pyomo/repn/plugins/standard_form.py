@@ -10,10 +10,11 @@
 #  ___________________________________________________________________________
 
 import collections
-import itertools
 import operator
 import logging
 
+from array import array
+
 from pyomo.common.config import (
     ConfigBlock,
     ConfigValue,
@@ -22,6 +23,7 @@ from pyomo.common.config import (
 )
 from pyomo.common.dependencies import scipy, numpy as np
 from pyomo.common.enums import ObjectiveSense
+from pyomo.common.errors import MouseTrap
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.numeric_types import native_types, value
 from pyomo.common.timing import TicTocTimer
@@ -38,6 +40,7 @@ from pyomo.core.base import (
     SymbolMap,
 )
 from pyomo.opt import WriterFactory
+from pyomo.repn.cache import get_repn_cache
 from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.linear_template import LinearTemplateRepnVisitor
 from pyomo.repn.util import (
@@ -271,7 +274,6 @@ class LinearStandardFormCompiler(object):
 class _LinearStandardFormCompiler_impl(object):
     # Making these methods class attributes so that others can change the hooks
     _get_visitor = LinearRepnVisitor
-    _to_vector = None
     _csc_matrix = None
     _csr_matrix = None
 
@@ -280,8 +282,7 @@ class _LinearStandardFormCompiler_impl(object):
         # We defer the first instantiation of these attributes so we do
         # not trigger the numpy / scipy imports when the module is
         # imported
-        if _LinearStandardFormCompiler_impl._to_vector is None:
-            _LinearStandardFormCompiler_impl._to_vector = np.fromiter
+        if _LinearStandardFormCompiler_impl._csc_matrix is None:
             _LinearStandardFormCompiler_impl._csc_matrix = scipy.sparse.csc_array
             _LinearStandardFormCompiler_impl._csr_matrix = scipy.sparse.csr_array
 
@@ -334,6 +335,15 @@ class _LinearStandardFormCompiler_impl(object):
         visitor = self._get_visitor({}, var_recorder=var_recorder)
         template_visitor = LinearTemplateRepnVisitor({}, var_recorder=var_recorder)
 
+        # Representations retained between writes (if the model has a
+        # RepnCache attached).  Derived compilers that use other
+        # visitors (which may be configured differently for each
+        # write) do not use the cache.
+        if visitor.__class__ is LinearRepnVisitor:
+            repn_cache = get_repn_cache(model)
+        else:
+            repn_cache = None
+
         timer.toc('Initialized column order', level=logging.DEBUG)
 
         # We don't export any suffix information to the Standard Form
@@ -371,38 +381,44 @@ class _LinearStandardFormCompiler_impl(object):
                     Objective, active=True, descend_into=False, sort=sorter
                 )
             )
-        obj_nnz = 0
         obj_offset = []
-        obj_data = []
-        obj_index = []
-        obj_index_ptr = [0]
+        obj_data = self._data_buffer()
+        obj_index = array('i')
+        obj_index_ptr = array('i', [0])
         for obj in objectives:
-            if hasattr(obj, 'template_expr'):
-                offset, linear_index, linear_data, _, _ = (
-                    template_visitor.expand_expression(obj, obj.template_expr())
-                )
-                N = len(linear_index)
-                obj_index.append(linear_index)
-                obj_data.append(linear_data)
-                obj_offset.append(offset)
-            else:
-                repn = visitor.walk_expression(obj.expr)
-                N = len(repn.linear)
-                obj_index.append(map(var_recorder.var_order.__getitem__, repn.linear))
-                obj_data.append(repn.linear.values())
-                obj_offset.append(repn.constant)
-
+            templated = hasattr(obj, 'template_expr')
+            if templated:
+                try:
+                    offset, linear_index, linear_data, _, _ = (
+                        template_visitor.expand_expression(obj, obj.template_expr())
+                    )
+                except MouseTrap:
+                    # The template could not be compiled: regenerate the
+                    # (explicit) objective expression from the rule
+                    obj.expr
+                    templated = False
+            if not templated:
+                if repn_cache is None:
+                    repn = visitor.walk_expression(obj.expr)
+                else:
+                    repn = repn_cache.walk_expression(visitor, obj, obj.expr)
                 if repn.nonlinear is not None:
                     raise ValueError(
                         f"Model objective ({obj.name}) contains nonlinear terms that "
                         "cannot be compiled to standard (linear) form."
                     )
+                offset = repn.constant
+                linear_index = map(var_recorder.var_order.__getitem__, repn.linear)
+                linear_data = repn.linear.values()
 
-            obj_nnz += N
+            obj_index.extend(linear_index)
             if set_sense is not None and set_sense != obj.sense:
-                obj_data[-1] = -self._to_vector(obj_data[-1], float, N)
-                obj_offset[-1] *= -1
-            obj_index_ptr.append(obj_index_ptr[-1] + N)
+                obj_data.extend(map(operator.neg, linear_data))
+                obj_offset.append(-offset)
+            else:
+                obj_data.extend(linear_data)
+                obj_offset.append(offset)
+            obj_index_ptr.append(len(obj_index))
             if with_debug_timing:
                 timer.toc('Objective %s', obj, level=logging.DEBUG)
 
@@ -415,10 +431,9 @@ class _LinearStandardFormCompiler_impl(object):
             raise ValueError("cannot specify both slack_form and mixed_form")
         rows = []
         rhs = []
-        con_nnz = 0
-        con_data = []
-        con_index = []
-        con_index_ptr = [0]
+        con_data = self._data_buffer()
+        con_index = array('i')
+        con_index_ptr = array('i', [0])
         last_parent = None
         for con in ordered_active_constraints(model, self.config):
             if with_debug_timing and con._component is not last_parent:
@@ -426,19 +441,29 @@ class _LinearStandardFormCompiler_impl(object):
                     timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
                 last_parent = con._component
 
-            if hasattr(con, 'template_expr'):
-                offset, linear_index, linear_data, lb, ub = (
-                    template_visitor.expand_expression(con, con.template_expr())
-                )
-                N = len(linear_data)
-            else:
+            templated = hasattr(con, 'template_expr')
+            if templated:
+                try:
+                    offset, linear_index, linear_data, lb, ub = (
+                        template_visitor.expand_expression(con, con.template_expr())
+                    )
+                    N = len(linear_data)
+                except MouseTrap:
+                    # The template could not be compiled: regenerate the
+                    # (explicit) constraint expression from the rule
+                    con.expr
+                    templated = False
+            if not templated:
                 # Note: lb and ub could be a number, expression, or None
                 lb, body, ub = con.to_bounded_expression()
                 if lb.__class__ not in native_types:
                     lb = value(lb)
                 if ub.__class__ not in native_types:
                     ub = value(ub)
-                repn = visitor.walk_expression(body)
+                if repn_cache is None:
+                    repn = visitor.walk_expression(body)
+                else:
+                    repn = repn_cache.walk_expression(visitor, con, body)
                 if repn.nonlinear is not None:
                     raise ValueError(
                         f"Model constraint ({con.name}) contains nonlinear terms that "
@@ -466,37 +491,43 @@ class _LinearStandardFormCompiler_impl(object):
                     f"model contains a trivially infeasible constraint, '{con.name}'"
                 )
 
+            # Note: rows are streamed directly into the (growable)
+            # con_index / con_data buffers so that we do not hold on to
+            # the per-constraint LinearRepn dicts until the end of the
+            # compilation.  Constraints that generate two rows copy the
+            # entries from the first row (the linear_index / linear_data
+            # iterators can only be consumed once).
             if mixed_form:
                 if lb == ub:
-                    con_nnz += N
                     rows.append(RowEntry(con, 0))
                     rhs.append(ub - offset)
-                    con_data.append(linear_data)
-                    con_index.append(linear_index)
-                    con_index_ptr.append(con_nnz)
+                    con_index.extend(linear_index)
+                    con_data.extend(linear_data)
+                    con_index_ptr.append(len(con_index))
                 else:
                     if ub is not None:
-                        if lb is not None:
-                            linear_index = list(linear_index)
-                        con_nnz += N
                         rows.append(RowEntry(con, 1))
                         rhs.append(ub - offset)
-                        con_data.append(linear_data)
-                        con_index.append(linear_index)
-                        con_index_ptr.append(con_nnz)
+                        con_index.extend(linear_index)
+                        con_data.extend(linear_data)
+                        con_index_ptr.append(len(con_index))
                     if lb is not None:
-                        con_nnz += N
                         rows.append(RowEntry(con, -1))
                         rhs.append(lb - offset)
-                        con_data.append(linear_data)
-                        con_index.append(linear_index)
-                        con_index_ptr.append(con_nnz)
+                        if ub is not None:
+                            con_index.extend(con_index[-N:])
+                            con_data.extend(con_data[-N:])
+                        else:
+                            con_index.extend(linear_index)
+                            con_data.extend(linear_data)
+                        con_index_ptr.append(len(con_index))
             elif slack_form:
+                con_index.extend(linear_index)
+                con_data.extend(linear_data)
                 if lb == ub:  # TODO: add tolerance?
                     rhs.append(ub - offset)
                 else:
                     # add slack variable
-                    con_nnz += 1
                     v = Var(name=f'_slack_{len(rhs)}', bounds=(None, None))
                     v.construct()
                     if lb is None:
@@ -512,32 +543,27 @@ class _LinearStandardFormCompiler_impl(object):
                         var_recorder.var_order[id(v)] = slack_col = len(
                             var_recorder.var_order
                         )
-                    linear_data = list(linear_data)
-                    linear_data.append(1)
-                    linear_index = list(linear_index)
-                    linear_index.append(slack_col)
-                con_nnz += N
+                    con_data.append(1)
+                    con_index.append(slack_col)
                 rows.append(RowEntry(con, 1))
-                con_data.append(linear_data)
-                con_index.append(linear_index)
-                con_index_ptr.append(con_nnz)
+                con_index_ptr.append(len(con_index))
             else:
                 if ub is not None:
-                    if lb is not None:
-                        linear_index = list(linear_index)
-                    con_nnz += N
                     rows.append(RowEntry(con, 1))
                     rhs.append(ub - offset)
-                    con_data.append(linear_data)
-                    con_index.append(linear_index)
-                    con_index_ptr.append(con_nnz)
+                    con_index.extend(linear_index)
+                    con_data.extend(linear_data)
+                    con_index_ptr.append(len(con_index))
                 if lb is not None:
-                    con_nnz += N
                     rows.append(RowEntry(con, -1))
                     rhs.append(offset - lb)
-                    con_data.append(-np.array(list(linear_data)))
-                    con_index.append(linear_index)
-                    con_index_ptr.append(con_nnz)
+                    if ub is not None:
+                        con_index.extend(con_index[-N:])
+                        con_data.extend(map(operator.neg, con_data[-N:]))
+                    else:
+                        con_index.extend(linear_index)
+                        con_data.extend(map(operator.neg, linear_data))
+                    con_index_ptr.append(len(con_index))
 
         if with_debug_timing:
             # report the last constraint
@@ -548,8 +574,8 @@ class _LinearStandardFormCompiler_impl(object):
         n_cols = len(columns)
 
         # Convert the compiled data to scipy sparse matrices
-        c = self._create_csc(obj_data, obj_index, obj_index_ptr, obj_nnz, n_cols)
-        A = self._create_csc(con_data, con_index, con_index_ptr, con_nnz, n_cols)
+        c = self._create_csc(obj_data, obj_index, obj_index_ptr, n_cols)
+        A = self._create_csc(con_data, con_index, con_index_ptr, n_cols)
 
         if with_debug_timing:
             timer.toc('Formed matrices', level=logging.DEBUG)
@@ -596,25 +622,27 @@ class _LinearStandardFormCompiler_impl(object):
         timer.toc("Generated linear standard form representation", delta=False)
         return info
 
-    def _create_csc(self, data, index, index_ptr, nnz, n_cols):
-        if not nnz:
-            # The empty CSC has no (or few) rows and a large number of
-            # columns and no nonzeros: it is faster / easier to create
-            # the empty CSR on the python side and convert it to CSC on
-            # the C (numpy) side, as opposed to creating the large [0] *
-            # (n_cols + 1) array on the Python side and transfer it to C
-            # (numpy)
-            return self._csr_matrix(
-                (data, index, index_ptr), [len(index_ptr) - 1, n_cols]
-            ).tocsc()
-
-        data = self._to_vector(itertools.chain.from_iterable(data), np.float64, nnz)
-        index = self._to_vector(itertools.chain.from_iterable(index), np.int32, nnz)
-        index_ptr = np.array(index_ptr, dtype=np.int32)
+    def _data_buffer(self):
+        # The compiled coefficients are accumulated in a (growable)
+        # array of doubles and not a list of Python floats
+        return array('d')
+
+    def _to_vector(self, data, N, vector_type):
+        # Note: this wraps the array.array buffer without copying it
+        return np.asarray(data, dtype=vector_type)
+
+    def _create_csc(self, data, index, index_ptr, n_cols):
+        # Note: data, index, and index_ptr are the buffers of the
+        # compiled CSR rows.  The CSR -> CSC conversion is a single pass
+        # (on the C side) over the nonzeros.
+        data = self._to_vector(data, len(data), np.float64)
+        index = np.asarray(index)
+        index_ptr = np.asarray(index_ptr)
         A = self._csr_matrix((data, index, index_ptr), [len(index_ptr) - 1, n_cols])
         A = A.tocsc()
-        A.sum_duplicates()
-        A.eliminate_zeros()
+        if len(data):
+            A.sum_duplicates()
+            A.eliminate_zeros()
         return A
 
     def _csc_to_nonnegative_vars(self, c, A, columns):
@@ -0,0 +1,457 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Vectorized evaluation of many expressions at once
+
+This module provides :class:`ExpressionTape`, which compiles a list of
+Pyomo expressions (e.g., the bodies of all constraints in a model) over
+a fixed variable ordering into a flat "tape".  The tape groups the nodes
+of all expressions by depth and operation, so that evaluating all
+expressions (or the Jacobian of all expressions) requires a number of
+numpy operations that is proportional to the depth of the expressions
+and not to the number of expressions:
+
+.. doctest::
+    :skipif: not numpy_available
+
+    >>> from pyomo.environ import ConcreteModel, Var, exp
+    >>> from pyomo.repn.tape import ExpressionTape
+    >>> m = ConcreteModel()
+    >>> m.x = Var([1, 2], initialize=2)
+    >>> tape = ExpressionTape([m.x[1] * m.x[2], exp(m.x[1]) - m.x[2]], [m.x[1], m.x[2]])
+    >>> print(tape.evaluate([1, 3]))
+    [ 3.         -0.28171817]
+    >>> print(tape.evaluate([[1, 3], [2, 2]]))
+    [[ 3.         -0.28171817]
+     [ 4.          5.3890561 ]]
+    >>> rows, cols = tape.jacobian_structure()
+    >>> print(rows, cols, tape.jacobian([1, 3]))
+    [0 0 1 1] [0 1 0 1] [ 3.          1.          2.71828183 -1.        ]
+
+Leaves that are not in the variable ordering (parameters, fixed
+variables, etc.) are evaluated when the tape is compiled.  The tape
+must be recompiled if their values change.
+
+Evaluation errors (e.g., ``log(0)``) do not raise exceptions: as with
+numpy, the result is ``nan`` or ``inf``.
+
+"""
+
+import math
+
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.numeric_types import native_numeric_types, native_types, value
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+import pyomo.core.expr as EXPR
+
+# Operations that map a fixed number of arguments to a result
+_unary_ops = {
+    'neg': lambda a: np.negative(a),
+    'abs': lambda a: np.abs(a),
+    'log': lambda a: np.log(a),
+    'log10': lambda a: np.log10(a),
+    'sin': lambda a: np.sin(a),
+    'cos': lambda a: np.cos(a),
+    'tan': lambda a: np.tan(a),
+    'sinh': lambda a: np.sinh(a),
+    'cosh': lambda a: np.cosh(a),
+    'tanh': lambda a: np.tanh(a),
+    'asin': lambda a: np.arcsin(a),
+    'acos': lambda a: np.arccos(a),
+    'atan': lambda a: np.arctan(a),
+    'exp': lambda a: np.exp(a),
+    'sqrt': lambda a: np.sqrt(a),
+    'asinh': lambda a: np.arcsinh(a),
+    'acosh': lambda a: np.arccosh(a),
+    'atanh': lambda a: np.arctanh(a),
+    'ceil': lambda a: np.ceil(a),
+    'floor': lambda a: np.floor(a),
+}
+
+_binary_ops = {
+    'mul': lambda a, b: a * b,
+    'div': lambda a, b: a / b,
+    'pow': lambda a, b: a**b,
+    'le': lambda a, b: a <= b,
+    'lt': lambda a, b: a < b,
+    'eq': lambda a, b: a == b,
+}
+
+_ternary_ops = {'if': lambda a, b, c: np.where(a != 0, b, c)}
+
+# Derivatives of the unary operations, as a function of the argument
+# (a) and the result (r)
+_unary_derivatives = {
+    'neg': lambda a, r: -1.0,
+    'abs': lambda a, r: np.sign(a),
+    'log': lambda a, r: 1 / a,
+    'log10': lambda a, r: 1 / (a * math.log(10)),
+    'sin': lambda a, r: np.cos(a),
+    'cos': lambda a, r: -np.sin(a),
+    'tan': lambda a, r: 1 + r**2,
+    'sinh': lambda a, r: np.cosh(a),
+    'cosh': lambda a, r: np.sinh(a),
+    'tanh': lambda a, r: 1 - r**2,
+    'asin': lambda a, r: 1 / np.sqrt(1 - a**2),
+    'acos': lambda a, r: -1 / np.sqrt(1 - a**2),
+    'atan': lambda a, r: 1 / (1 + a**2),
+    'exp': lambda a, r: r,
+    'sqrt': lambda a, r: 0.5 / r,
+    'asinh': lambda a, r: 1 / np.sqrt(a**2 + 1),
+    'acosh': lambda a, r: 1 / np.sqrt(a**2 - 1),
+    'atanh': lambda a, r: 1 / (1 - a**2),
+    'ceil': lambda a, r: 0.0,
+    'floor': lambda a, r: 0.0,
+}
+
+
+class _TapeCompiler(StreamBasedExpressionVisitor):
+    """Walker that appends the nodes of an expression to a tape
+
+    Every node is assigned a "slot" in the tape's value vector.  Slots
+    for variables and named expressions are shared within (but not
+    across) expressions, so that each slot contributes to exactly one
+    expression (which allows computing the Jacobian of all expressions
+    with a single reverse sweep).
+
+    """
+
+    def __init__(self, var_map):
+        super().__init__()
+        self.var_map = var_map
+        # slot data: the level (depth) of every slot
+        self.level = []
+        # leaf slots: (slot, variable index) and (slot, value)
+        self.loads = []
+        self.consts = []
+        self.const_slots = {}
+        # operations: (level, opcode) -> list of (out slot, arg slots)
+        self.ops = {}
+        # per-expression state
+        self.expr_idx = None
+        self.load_rows = []
+        self.var_slots = None
+        self.named = None
+
+    def compile(self, expr, expr_idx):
+        self.expr_idx = expr_idx
+        self.var_slots = {}
+        self.named = {}
+        return self.walk_expression(expr)
+
+    def _new_slot(self, level):
+        self.level.append(level)
+        return len(self.level) - 1
+
+    def _const(self, val):
+        val = float(val)
+        slot = self.const_slots.get(val, None)
+        if slot is None:
+            slot = self.const_slots[val] = self._new_slot(0)
+            self.consts.append((slot, val))
+        return slot
+
+    def _op(self, opcode, args):
+        slot = self._new_slot(1 + max(self.level[a] for a in args))
+        self.ops.setdefault((self.level[slot], opcode), []).append((slot, args))
+        return slot
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, None
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            if child.__class__ not in native_numeric_types:
+                raise ValueError(
+                    f"Cannot compile non-numeric value '{child}' in expression {node}"
+                )
+            return False, self._const(child)
+        if child.is_expression_type():
+            if child.is_named_expression_type():
+                slot = self.named.get(id(child), None)
+                if slot is not None:
+                    return False, slot
+            elif not child.is_potentially_variable():
+                return False, self._const(value(child))
+            return True, None
+        if child.is_potentially_variable():
+            slot = self.var_slots.get(id(child), None)
+            if slot is not None:
+                return False, slot
+            idx = self.var_map.get(id(child), None)
+            if idx is None:
+                if not child.fixed:
+                    raise ValueError(
+                        f"Variable '{child.name}' appears in an expression, "
+                        "but is neither fixed nor included in the variable "
+                        "ordering"
+                    )
+                return False, self._const(value(child))
+            slot = self.var_slots[id(child)] = self._new_slot(0)
+            self.loads.append((slot, idx))
+            self.load_rows.append(self.expr_idx)
+            return False, slot
+        return False, self._const(value(child))
+
+    def exitNode(self, node, data):
+        if node.is_named_expression_type():
+            self.named[id(node)] = data[0]
+            return data[0]
+        handler = _exit_handlers.get(node.__class__, None)
+        if handler is None:
+            for cls in node.__class__.__mro__:
+                if cls in _exit_handlers:
+                    handler = _exit_handlers[node.__class__] = _exit_handlers[cls]
+                    break
+            else:
+                raise ValueError(
+                    "Cannot compile expression nodes of type "
+                    f"'{type(node).__name__}': {node}"
+                )
+        return handler(self, node, data)
+
+    def finalizeResult(self, result):
+        return result
+
+
+def _handle_sum(visitor, node, data):
+    if len(data) == 1:
+        return data[0]
+    return visitor._op('sum', tuple(data))
+
+
+def _handle_unary_function(visitor, node, data):
+    name = node.getname()
+    if name not in _unary_ops:
+        raise ValueError(f"Cannot compile unary function '{name}': {node}")
+    return visitor._op(name, tuple(data))
+
+
+def _handle_inequality(visitor, node, data):
+    return visitor._op('lt' if node.strict else 'le', tuple(data))
+
+
+def _generic_handler(opcode):
+    return lambda visitor, node, data: visitor._op(opcode, tuple(data))
+
+
+_exit_handlers = {
+    EXPR.SumExpression: _handle_sum,
+    EXPR.LinearExpression: _handle_sum,
+    EXPR.ProductExpression: _generic_handler('mul'),
+    EXPR.MonomialTermExpression: _generic_handler('mul'),
+    EXPR.DivisionExpression: _generic_handler('div'),
+    EXPR.PowExpression: _generic_handler('pow'),
+    EXPR.NegationExpression: _generic_handler('neg'),
+    EXPR.AbsExpression: _generic_handler('abs'),
+    EXPR.UnaryFunctionExpression: _handle_unary_function,
+    EXPR.Expr_ifExpression: _generic_handler('if'),
+    EXPR.InequalityExpression: _handle_inequality,
+    EXPR.EqualityExpression: _generic_handler('eq'),
+}
+
+
+class _TapeSegment(object):
+    """All operations of one type at one level of the tape"""
+
+    __slots__ = ('opcode', 'out', 'args', 'starts', 'unique', 'active')
+
+    def __init__(self, opcode, ops):
+        self.opcode = opcode
+        self.out = np.fromiter((op[0] for op in ops), dtype=np.int64, count=len(ops))
+        if opcode == 'sum':
+            counts = [len(op[1]) for op in ops]
+            self.starts = np.zeros(len(ops), dtype=np.int64)
+            np.cumsum(counts[:-1], out=self.starts[1:])
+            self.args = (
+                np.fromiter(
+                    (a for op in ops for a in op[1]), dtype=np.int64, count=sum(counts)
+                ),
+            )
+        else:
+            self.starts = None
+            self.args = tuple(
+                np.array(a, dtype=np.int64) for a in zip(*(op[1] for op in ops))
+            )
+        # Reverse-mode accumulation can use (fast) fancy indexing if
+        # the arguments do not contain duplicate slots
+        self.unique = tuple(len(np.unique(a)) == len(a) for a in self.args)
+        self.active = None
+
+
+class ExpressionTape(object):
+    """Compiled tape for evaluating many expressions at once
+
+    Parameters
+    ----------
+    exprs: Sequence
+        The expressions to compile (e.g., constraint bodies)
+
+    variables: Sequence[VarData]
+        The variable ordering.  Every unfixed variable that appears in
+        `exprs` must be included in this list.  Values passed to
+        :meth:`evaluate` and :meth:`jacobian` are in this order.
+
+    """
+
+    def __init__(self, exprs, variables):
+        self.variables = list(variables)
+        var_map = {id(v): i for i, v in enumerate(self.variables)}
+        compiler = _TapeCompiler(var_map)
+        outputs = [compiler.compile(e, i) for i, e in enumerate(exprs)]
+
+        self._n_slots = len(compiler.level)
+        self._outputs = np.array(outputs, dtype=np.int64)
+        loads = compiler.loads
+        self._load_slots = np.array([l[0] for l in loads], dtype=np.int64)
+        self._load_vars = np.array([l[1] for l in loads], dtype=np.int64)
+        self._load_rows = np.array(compiler.load_rows, dtype=np.int64)
+        self._const_slots = np.array([c[0] for c in compiler.consts], dtype=np.int64)
+        self._const_vals = np.array([c[1] for c in compiler.consts], dtype=float)
+        level = compiler.level
+        self._segments = []
+        for key in sorted(compiler.ops, key=lambda k: (k[0], k[1])):
+            seg = _TapeSegment(key[1], compiler.ops[key])
+            if seg.opcode == 'pow':
+                # Only differentiate with respect to non-constant exponents
+                is_const = np.zeros(self._n_slots, dtype=bool)
+                is_const[self._const_slots] = True
+                seg.active = ~is_const[seg.args[1]]
+            self._segments.append(seg)
+
+    def __len__(self):
+        return len(self._outputs)
+
+    def _get_x(self, x):
+        if x is None:
+            x = [v.value for v in self.variables]
+        x = np.asarray(x, dtype=float)
+        if x.shape[-1] != len(self.variables):
+            raise ValueError(
+                f"Expected values for {len(self.variables)} variables "
+                f"(got array with shape {x.shape})"
+            )
+        return x
+
+    def _forward(self, x):
+        # Note: for multiple points, x is (n_points, n_vars), and the
+        # value vector is (n_slots, n_points)
+        x = x.T
+        v = np.empty((self._n_slots,) + x.shape[1:])
+        if x.ndim == 1:
+            v[self._const_slots] = self._const_vals
+        else:
+            v[self._const_slots] = self._const_vals[:, None]
+        v[self._load_slots] = x[self._load_vars]
+        with np.errstate(all='ignore'):
+            for seg in self._segments:
+                op = seg.opcode
+                if op == 'sum':
+                    v[seg.out] = np.add.reduceat(v[seg.args[0]], seg.starts, axis=0)
+                elif op in _binary_ops:
+                    v[seg.out] = _binary_ops[op](v[seg.args[0]], v[seg.args[1]])
+                elif op in _unary_ops:
+                    v[seg.out] = _unary_ops[op](v[seg.args[0]])
+                else:
+                    v[seg.out] = _ternary_ops[op](*(v[a] for a in seg.args))
+        return v
+
+    def evaluate(self, x=None):
+        """Evaluate all expressions
+
+        Parameters
+        ----------
+        x: array-like, optional
+            The variable values, either as a vector (one value per
+            variable), or as a 2-D array with one row per point.  If
+            not specified, the current variable values are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of every expression (a vector for a single
+            point, or an array with one row per point)
+
+        """
+        v = self._forward(self._get_x(x))
+        return v[self._outputs].T
+
+    def jacobian_structure(self):
+        """Return the (row, column) indices of the Jacobian entries
+
+        Rows correspond to expressions and columns to variables.  The
+        entries are in the same order as the values returned by
+        :meth:`jacobian`.
+
+        """
+        return self._load_rows, self._load_vars
+
+    def jacobian(self, x=None):
+        """Evaluate the Jacobian of all expressions (by reverse-mode AD)
+
+        Parameters
+        ----------
+        x: array-like, optional
+            The variable values (a vector with one value per variable).
+            If not specified, the current variable values are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of the Jacobian entries (see
+            :meth:`jacobian_structure`)
+
+        """
+        x = self._get_x(x)
+        if x.ndim != 1:
+            raise ValueError("jacobian() only supports evaluating a single point")
+        v = self._forward(x)
+        g = np.zeros(self._n_slots)
+        g[self._outputs] = 1
+        with np.errstate(all='ignore'):
+            for seg in reversed(self._segments):
+                op = seg.opcode
+                go = g[seg.out]
+                if op == 'sum':
+                    counts = np.diff(np.append(seg.starts, len(seg.args[0])))
+                    grads = (np.repeat(go, counts),)
+                elif op == 'mul':
+                    a, b = seg.args
+                    grads = (go * v[b], go * v[a])
+                elif op == 'div':
+                    a, b = seg.args
+                    grads = (go / v[b], -go * v[seg.out] / v[b])
+                elif op == 'pow':
+                    a, b = seg.args
+                    va, vb = v[a], v[b]
+                    gb = np.zeros(len(go))
+                    act = seg.active
+                    gb[act] = go[act] * v[seg.out][act] * np.log(va[act])
+                    grads = (go * vb * va ** (vb - 1), gb)
+                elif op == 'if':
+                    cond = v[seg.args[0]] != 0
+                    grads = (None, np.where(cond, go, 0.0), np.where(cond, 0.0, go))
+                elif op in _unary_derivatives:
+                    a = seg.args[0]
+                    grads = (go * _unary_derivatives[op](v[a], v[seg.out]),)
+                else:
+                    # relational operators are piecewise constant
+                    continue
+                for arg, grad, unique in zip(seg.args, grads, seg.unique):
+                    if grad is None:
+                        continue
+                    if unique:
+                        g[arg] += grad
+                    else:
+                        np.add.at(g, arg, grad)
+        return g[self._load_slots]
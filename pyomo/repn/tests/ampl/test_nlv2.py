@@ -17,9 +17,12 @@ import logging
 import math
 import os
 import re
+import struct
+import sys
 
 import pyomo.repn.util as repn_util
 import pyomo.repn.plugins.nl_writer as nl_writer
+from pyomo.repn.ampl import nl_operators, find_common_subexpressions
 from pyomo.repn.util import InvalidNumber
 from pyomo.repn.tests.nl_diff import nl_diff
 
@@ -51,6 +54,93 @@ import pyomo.environ as pyo
 nan = float('nan')
 
 
+def _tokenize_text_nl(nl):
+    """Return the NL file body (after the header) as a list of tokens
+
+    Segment / node keys are split from their leading integer argument
+    and all numeric values are converted to floats so that the token
+    stream can be directly compared to the one from _tokenize_binary_nl()
+
+    """
+    tokens = []
+    for line in nl.splitlines()[10:]:
+        if line.startswith('h'):
+            tokens.append(line)
+            continue
+        for token in line.split('#', 1)[0].split():
+            if token[0].isalpha():
+                tokens.append(token[0])
+                token = token[1:]
+                if not token:
+                    continue
+            tokens.append(float(token))
+    return tokens
+
+
+def _tokenize_binary_nl(nl, n_vars, n_cons):
+    """Decode the body of a binary NL file into the token stream that
+    _tokenize_text_nl() generates for the equivalent text NL file"""
+    header_end = 0
+    for i in range(10):
+        header_end = nl.index(b'\n', header_end) + 1
+    buf = io.BytesIO(nl[header_end:])
+    tokens = []
+
+    def read(fmt):
+        fmt = '=' + fmt
+        ans = struct.unpack(fmt, buf.read(struct.calcsize(fmt)))
+        tokens.extend(float(x) for x in ans)
+        return ans
+
+    def read_expr():
+        key = buf.read(1).decode()
+        if key == 'h':
+            (n,) = struct.unpack('=i', buf.read(4))
+            tokens.append(f'h{n}:{buf.read(n).decode()}')
+            return
+        tokens.append(key)
+        if key == 'n':
+            read('d')
+        elif key == 'v':
+            read('i')
+        elif key == 'o':
+            (opcode,) = read('i')
+            nargs = nl_operators[opcode][0]
+            if nargs is None:
+                (nargs,) = read('i')
+            for i in range(nargs):
+                read_expr()
+        else:
+            raise ValueError(f"unexpected expression node '{key}'")
+
+    bound_fmt = {'0': 'dd', '1': 'd', '2': 'd', '3': '', '4': 'd', '5': 'ii'}
+    while True:
+        key = buf.read(1).decode()
+        if not key:
+            break
+        tokens.append(key)
+        if key in 'VCO':
+            n = read({'V': 'iii', 'C': 'i', 'O': 'ii'}[key])
+            for i in range(n[1] if key == 'V' else 0):
+                read('id')
+            read_expr()
+        elif key in 'dxJG':
+            (n,) = read('ii' if key in 'JG' else 'i')[-1:]
+            for i in range(n):
+                read('id')
+        elif key == 'k':
+            (n,) = read('i')
+            read(f'{n}i')
+        elif key in 'rb':
+            for i in range(n_cons if key == 'r' else n_vars):
+                bound = buf.read(1).decode()
+                tokens.append(float(bound))
+                read(bound_fmt[bound])
+        else:
+            raise ValueError(f"unexpected segment '{key}'")
+    return tokens
+
+
 class INFO(object):
     def __init__(self, symbolic=False):
         self.subexpression_cache = {}
@@ -2797,3 +2887,257 @@ k-1
                 OUT.getvalue(),
             )
         )
+
+    @unittest.skipUnless(
+        nl_writer._fork_available(), "parallel compilation requires 'fork'"
+    )
+    def test_parallel_constraint_compilation(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(12)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.b = pyo.Block(m.I)
+        for i in m.I:
+            m.b[i].y = Var(initialize=i)
+            m.b[i].e = Expression(expr=m.x[i] * m.b[i].y + m.x[i])
+            m.b[i].c = Constraint(expr=pyo.exp(m.b[i].e) + m.b[i].y ** 2 <= 10 + i)
+            m.b[i].d = Constraint(expr=m.b[i].e + m.x[i % 12 + 1] == 3)
+        m.E = Expression(expr=pyo.sin(m.x[1]) + m.x[2])
+        m.o = Objective(expr=m.E + m.x[3] ** 2)
+        m.c = Constraint(m.I, rule=lambda m, i: m.E * m.x[i] >= 0)
+        # A variable that does not belong to the model forces the
+        # corresponding shard to be compiled serially
+        other = ConcreteModel()
+        other.z = Var()
+        m.co = Constraint(expr=other.z + m.x[1] >= 1)
+
+        for symbolic in (False, True):
+            serial_out = io.StringIO()
+            serial = nl_writer.NLWriter().write(
+                m, serial_out, symbolic_solver_labels=symbolic
+            )
+            parallel_out = io.StringIO()
+            parallel = nl_writer.NLWriter().write(
+                m, parallel_out, symbolic_solver_labels=symbolic, parallel=3
+            )
+            self.assertEqual(serial_out.getvalue(), parallel_out.getvalue())
+            self.assertEqual(serial.variables, parallel.variables)
+            self.assertEqual(serial.constraints, parallel.constraints)
+
+    def test_incremental_write(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(4)
+        m.p = Param(m.I, mutable=True, initialize=2)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1)
+        m.y = Var(m.I, initialize=1)
+        m.c = Constraint(
+            m.I, rule=lambda m, i: pyo.exp(m.x[i] * m.y[i]) + m.p[i] * m.y[i] <= 10
+        )
+        m.e = Expression(expr=m.x[1] ** 3)
+        m.d = Constraint(expr=m.e + m.y[1] >= 0)
+        m.o = Objective(expr=sum(m.x.values()))
+
+        writer = nl_writer.NLWriter()
+
+        def check():
+            incremental = io.StringIO()
+            writer.write(m, incremental, incremental=True)
+            baseline = io.StringIO()
+            nl_writer.NLWriter().write(m, baseline)
+            self.assertEqual(*nl_diff(baseline.getvalue(), incremental.getvalue()))
+            return writer._repn_cache
+
+        cache = check()
+        # Constraints referencing named expressions are not cached
+        self.assertEqual(set(cache.entries), {id(c) for c in m.c.values()})
+        repns = {k: v[-1] for k, v in cache.entries.items()}
+
+        self.assertEqual((cache.hits, cache.misses), (0, 5))
+
+        check()
+        self.assertEqual((cache.hits, cache.misses), (4, 1))
+        self.assertEqual(repns, {k: v[-1] for k, v in cache.entries.items()})
+        self.assertTrue(all(repns[k] is v[-1] for k, v in cache.entries.items()))
+
+        m.p[2] = 5
+        check()
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+        self.assertIsNot(repns[id(m.c[2])], cache.entries[id(m.c[2])][-1])
+        self.assertIs(repns[id(m.c[3])], cache.entries[id(m.c[3])][-1])
+
+        m.y[3].fix(3)
+        check()
+        self.assertIsNot(repns[id(m.c[3])], cache.entries[id(m.c[3])][-1])
+        m.y[3].unfix()
+        check()
+
+        m.c[4].set_value(m.x[4] + m.y[1] <= 3)
+        m.x[1].setub(4)
+        check()
+
+        m.c[1].deactivate()
+        check()
+        self.assertNotIn(id(m.c[1]), cache.entries)
+
+        # Switching off incremental mode discards the cache
+        writer.write(m, io.StringIO())
+        self.assertIsNone(writer._repn_cache)
+
+    def test_find_common_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=2)
+        e1 = pyo.exp(-m.p / m.x) + m.y
+        e2 = m.y * pyo.exp(-m.p / m.x)
+        e3 = pyo.sin(m.x * m.y) + pyo.sin(m.x * m.y) + m.x * m.y
+        e4 = 2 * m.x + m.p * m.y
+        cse = find_common_subexpressions([e1, e2, e3, e4])
+        # Every occurrence of a shared subexpression is mapped
+        self.assertEqual(
+            sorted((v.name, str(v.expr)) for v in cse.values()),
+            [
+                ('cse[0]', 'exp(- p/x)'),
+                ('cse[0]', 'exp(- p/x)'),
+                ('cse[1]', 'x*y'),
+                ('cse[1]', 'x*y'),
+                ('cse[1]', 'x*y'),
+                ('cse[2]', 'sin(x*y)'),
+                ('cse[2]', 'sin(x*y)'),
+            ],
+        )
+        # The products nested in the shared sin() are only counted once
+        cse = find_common_subexpressions([e1, e2, pyo.sin(m.x * m.y) ** 2])
+        self.assertEqual(sorted(set(str(v.expr) for v in cse.values())), ['exp(- p/x)'])
+        # Linear and constant subexpressions are never shared
+        self.assertEqual(find_common_subexpressions([e4, e4, m.p**2, m.p**2]), {})
+        # Scaling by a constant is folded into the shared argument
+        cse = find_common_subexpressions(
+            [2 * m.y**2, m.y**2 * 2, m.p * m.y**2, m.y**2 / 3]
+        )
+        self.assertEqual(sorted(set(str(v.expr) for v in cse.values())), ['y**2'])
+
+    def test_common_subexpressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=2)
+        m.c1 = Constraint(expr=pyo.exp(-m.p / m.x) + m.y <= 1)
+        m.c2 = Constraint(expr=m.y * pyo.exp(-m.p / m.x) >= 0)
+        m.o = Objective(expr=pyo.exp(-m.p / m.x) + m.x * m.y)
+
+        OUT = io.StringIO()
+        nl_writer.NLWriter().write(
+            m, OUT, symbolic_solver_labels=True, common_subexpressions=True
+        )
+        self.assertEqual(
+            *nl_diff(
+                """g3 1 1 0	# problem unknown
+ 2 2 1 0 0 	# vars, constraints, objectives, ranges, eqns
+ 2 1 0 0 0 0	# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb
+ 0 0	# network constraints: nonlinear, linear
+ 2 2 2 	# nonlinear vars in constraints, objectives, both
+ 0 0 0 1	# linear network variables; functions; arith, flags
+ 0 0 0 0 0 	# discrete variables: binary, integer, nonlinear (b,c,o)
+ 4 2 	# nonzeros in Jacobian, obj. gradient
+ 2 1	# max name lengths: constraints, variables
+ 1 0 0 0 0	# common exprs: b,c,o,c1,o1
+V2 0 0	#cse[0]
+o44	#exp
+o3	# /
+n-2
+v0	#x
+C0	#c1
+v2	#cse[0]
+C1	#c2
+o2	#*
+v1	#y
+v2	#cse[0]
+O0 0	#o
+o0	#+
+v2	#cse[0]
+o2	#*
+v0	#x
+v1	#y
+x0	# initial guess
+r	#2 ranges (rhs's)
+1 1	#c1
+2 0	#c2
+b	#2 bounds (on variables)
+3	#x
+3	#y
+k1	#intermediate Jacobian column lengths
+2
+J0 2	#c1
+0 0
+1 1
+J1 2	#c2
+0 0
+1 0
+G0 2	#o
+0 0
+1 0
+""",
+                OUT.getvalue(),
+            )
+        )
+
+        # The option is off by default, and the parallel compilation
+        # generates the same file
+        baseline = io.StringIO()
+        nl_writer.NLWriter().write(m, baseline)
+        self.assertNotIn('V2', baseline.getvalue())
+        for parallel in (1, 2):
+            OUT = io.StringIO()
+            nl_writer.NLWriter().write(
+                m,
+                OUT,
+                symbolic_solver_labels=True,
+                common_subexpressions=True,
+                parallel=parallel,
+            )
+            self.assertIn('V2 0 0\t#cse[0]', OUT.getvalue())
+            self.assertEqual(OUT.getvalue().count('#cse[0]'), 4)
+
+    def test_binary_write(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.x = Var(m.I, bounds=(0, 10), initialize=1.5)
+        m.y = Var(m.I, within=pyo.Integers, bounds=(None, 5))
+        m.z = Var(bounds=(-1, None))
+        m.w = Var(bounds=(2, 2))
+        m.e = Expression(expr=m.x[1] ** 3 + 2 * m.x[2])
+        m.c = Constraint(
+            m.I, rule=lambda m, i: pyo.exp(m.x[i] * m.y[i]) + 3.5 * m.z <= 10
+        )
+        m.d = Constraint(expr=(m.e + pyo.sin(m.e), m.y[1] + m.w, None))
+        m.f = Constraint(expr=(-2, m.x[1] + m.x[2] + m.x[3], 5))
+        m.g = Constraint(expr=m.y[2] + 2 * m.y[3] == 1)
+        m.o = Objective(expr=m.x[1] * m.x[2] + m.e - 4 * m.z, sense=pyo.maximize)
+        m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
+        m.dual[m.c[2]] = 0.5
+        m.dual[m.g] = -1
+
+        text = io.StringIO()
+        nl_writer.NLWriter().write(m, text, binary=False)
+        binary = io.BytesIO()
+        nl_writer.NLWriter().write(m, binary, binary=True)
+        text = text.getvalue()
+        binary = binary.getvalue()
+
+        text_header = text.splitlines()[:10]
+        binary_header = binary.decode('latin-1').splitlines()[:10]
+        self.assertEqual(text_header[0][0], 'g')
+        self.assertEqual(binary_header[0][0], 'b')
+        self.assertEqual(text_header[0][1:], binary_header[0][1:])
+        self.assertEqual(
+            binary_header[5].split()[2], '1' if sys.byteorder == 'little' else '2'
+        )
+        binary_header[5] = binary_header[5].split()
+        text_header[5] = text_header[5].split()
+        binary_header[5][2] = text_header[5][2]
+        self.assertEqual(text_header[1:], binary_header[1:])
+
+        n_vars, n_cons = map(int, text_header[1].split()[:2])
+        self.assertEqual(
+            _tokenize_text_nl(text), _tokenize_binary_nl(binary, n_vars, n_cons)
+        )
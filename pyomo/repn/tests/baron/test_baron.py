@@ -34,6 +34,7 @@ from pyomo.environ import (
     Binary,
     Suffix,
 )
+from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.plugins.baron_writer import expression_to_string
 
 thisdir = this_file_dir()
@@ -273,6 +274,22 @@ class TestToBaronVisitor(unittest.TestCase):
         test = expression_to_string(e, variables, smap)
         self.assertEqual(test, '(-0.5) ^ 2 + (z - 1) ^ 2 + (-0.55)')
 
+    def test_linear_part(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.z = Var()
+        m.x.fix(3.5)
+        e = m.y + (m.z - 1) ** 2 + 2 * m.x - m.y + 4 * m.z
+
+        variables = OrderedSet()
+        smap = SymbolMap()
+        linear_visitor = LinearRepnVisitor({})
+        test = expression_to_string(e, variables, smap, linear_visitor)
+        self.assertEqual(test, '4*z + (z - 1) ^ 2 + 7')
+        # y cancelled out of the linear part, so it is not referenced
+        self.assertEqual(list(variables), [id(m.z)])
+
 
 # class TestBaron_writer(unittest.TestCase):
 class XTestBaron_writer(object):
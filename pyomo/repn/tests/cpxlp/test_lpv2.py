@@ -16,6 +16,7 @@ import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
 
 import pyomo.environ as pyo
+import pyomo.core.base.constraint as constraint
 
 from pyomo.repn.plugins.lp_writer import LPWriter
 
@@ -139,3 +140,45 @@ end
         self.assertEqual(LOG.getvalue(), "")
 
         self.assertEqual(ref, OUT.getvalue())
+
+    def test_templatized_constraints(self):
+        def build():
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(3)
+            m.J = pyo.RangeSet(4)
+            m.p = pyo.Param(m.I, m.J, initialize=lambda m, i, j: i - j, mutable=True)
+            m.x = pyo.Var(m.I, m.J, bounds=(0, 1))
+            m.y = pyo.Var(m.I)
+            m.z = pyo.Var()
+            m.c = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: sum(m.p[i, j] * m.x[i, j] for j in m.J) + m.y[i]
+                <= 5 * i,
+            )
+            m.d = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: (-i, m.y[i] - sum(m.x[i, j] for j in m.J) + m.z, i),
+            )
+            m.e = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] == m.x[i, 1] + m.x[i, 1])
+            # Quadratic constraints cannot be templatized (these fall
+            # back on the rule-generated expressions)
+            m.q = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] ** 2 <= 4)
+            m.o = pyo.Objective(expr=sum(m.y.values()))
+            m.x[2, 3].fix(0.5)
+            return m
+
+        ref = StringIO()
+        LPWriter().write(build(), ref, symbolic_solver_labels=True)
+        self.assertIn('c_u_c(1)_', ref.getvalue())
+
+        with unittest.mock.patch.object(constraint, 'TEMPLATIZE_CONSTRAINTS', True):
+            m = build()
+        self.assertIs(type(m.c[1]), constraint.TemplateConstraintData)
+        self.assertIs(type(m.q[1]), constraint.TemplateConstraintData)
+        OUT = StringIO()
+        LPWriter().write(m, OUT, symbolic_solver_labels=True)
+        self.assertEqual(ref.getvalue(), OUT.getvalue())
+        # Templates that could not be compiled were converted back to
+        # explicit constraints
+        self.assertIs(type(m.c[1]), constraint.TemplateConstraintData)
+        self.assertIs(type(m.q[1]), constraint.ConstraintData)
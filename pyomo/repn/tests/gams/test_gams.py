@@ -41,6 +41,7 @@ from pyomo.environ import (
 )
 from pyomo.gdp import Disjunction
 from pyomo.network import Port, Arc
+from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.plugins.gams_writer import (
     StorageTreeChecker,
     expression_to_string,
@@ -331,6 +332,60 @@ class Test(unittest.TestCase):
             ("x1*(-8.8) - x2", False),
         )
 
+    def test_linear_part_to_string(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.z = Var()
+        m.z.fix(-3)
+        lbl = NumericLabeler('x')
+        smap = SymbolMap(lbl)
+        tc = StorageTreeChecker(m)
+        linear_visitor = LinearRepnVisitor({})
+        # Linear terms are compiled (and merged) into a coefficient list
+        # with the constant last
+        self.assertEqual(
+            expression_to_string(
+                m.x + 2 + 3 * m.y - m.z + m.x,
+                tc,
+                smap=smap,
+                linear_visitor=linear_visitor,
+            ),
+            ("2*x1 + 3*x2 + 5", False),
+        )
+        self.assertEqual(
+            expression_to_string(
+                m.x - m.x, tc, smap=smap, linear_visitor=linear_visitor
+            ),
+            ("0", False),
+        )
+        # Only the remaining terms are converted by the string visitor
+        self.assertEqual(
+            expression_to_string(
+                m.x * m.y - m.y + ceil(m.x) + 1,
+                tc,
+                smap=smap,
+                linear_visitor=linear_visitor,
+            ),
+            ("-x2 + x1*x2 + ceil(x1) + 1", True),
+        )
+        # Non-sums use the string visitor
+        self.assertEqual(
+            expression_to_string(3 * m.x, tc, smap=smap, linear_visitor=linear_visitor),
+            ("3*x1", False),
+        )
+        # Fixed variables are not folded into the constant
+        self.assertEqual(
+            expression_to_string(
+                m.x + m.z + m.x,
+                tc,
+                smap=smap,
+                output_fixed_variables=True,
+                linear_visitor=linear_visitor,
+            ),
+            ("x1 + x3 + x1", False),
+        )
+
     def test_dnlp_to_string(self):
         m = ConcreteModel()
         m.x = Var()
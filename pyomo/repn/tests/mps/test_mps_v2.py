@@ -0,0 +1,323 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from io import StringIO
+
+import pyomo.common.unittest as unittest
+
+from pyomo.common.log import LoggingIntercept
+from pyomo.common.tempfiles import TempfileManager
+from pyomo.opt import WriterFactory
+
+import pyomo.environ as pyo
+
+from pyomo.repn.cache import attach_repn_cache
+from pyomo.repn.plugins.mps_writer import MPSWriter
+
+
+def _model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], bounds=(0, 4))
+    m.y = pyo.Var(domain=pyo.Integers, bounds=(None, 5))
+    m.z = pyo.Var(domain=pyo.Binary)
+    m.w = pyo.Var()
+    m.f = pyo.Var()
+    m.f.fix(2)
+    m.o = pyo.Objective(
+        expr=m.x[1] + 2 * m.x[2] ** 2 + m.x[1] * m.x[2] + 3 + m.f * m.y,
+        sense=pyo.maximize,
+    )
+    m.c1 = pyo.Constraint(expr=m.x[1] + m.y + 1 <= 5)
+    m.c2 = pyo.Constraint(expr=(1, m.x[2] - m.z + m.w, 3))
+    m.c3 = pyo.Constraint(expr=m.x[3] ** 2 + m.x[1] * m.x[3] == 2)
+    m.s = pyo.SOSConstraint(var=m.x, sos=1)
+    return m
+
+
+class TestMPSv2(unittest.TestCase):
+    def _write(self, m, **options):
+        OUT = StringIO()
+        info = MPSWriter().write(m, OUT, **options)
+        return OUT.getvalue(), info
+
+    def test_free_format(self):
+        m = _model()
+        out, info = self._write(m, symbolic_solver_labels=True, int_marker=True)
+        self.assertEqual(
+            out,
+            """* Source:     Pyomo MPS Writer (version 2)
+* Format:     Free MPS
+*
+NAME          unknown
+OBJSENSE
+    MAX
+ROWS
+ N  o
+ L  c_u_c1_
+ G  r_l_c2_
+ L  r_u_c2_
+ E  c_e_c3_
+COLUMNS
+    ONE_VAR_CONSTANT o 3
+    x(1) o 1
+    x(1) c_u_c1_ 1
+    x(2) r_l_c2_ 1
+    x(2) r_u_c2_ 1
+    x(3) o 0
+    MARK0000 'MARKER' 'INTORG'
+    y o 2
+    y c_u_c1_ 1
+    z r_l_c2_ -1
+    z r_u_c2_ -1
+    MARK0001 'MARKER' 'INTEND'
+    w r_l_c2_ 1
+    w r_u_c2_ 1
+RHS
+    RHS c_u_c1_ 4
+    RHS r_l_c2_ 1
+    RHS r_u_c2_ 3
+    RHS c_e_c3_ 2
+BOUNDS
+ FX BOUND ONE_VAR_CONSTANT 1
+ LO BOUND x(1) 0
+ UP BOUND x(1) 4
+ LO BOUND x(2) 0
+ UP BOUND x(2) 4
+ LO BOUND x(3) 0
+ UP BOUND x(3) 4
+ LI BOUND y -10E20
+ UI BOUND y 5
+ BV BOUND z
+ FR BOUND w
+SOS
+ S1 SOS s
+    x(1) 1
+    x(2) 2
+    x(3) 3
+QUADOBJ
+    x(1) x(2) 1
+    x(2) x(2) 4
+QCMATRIX   c_e_c3_
+    x(1) x(3) 0.5
+    x(3) x(1) 0.5
+    x(3) x(3) 1
+ENDATA
+""",
+        )
+        smap = info.symbol_map
+        self.assertIs(smap.getObject('o'), m.o)
+        self.assertIs(smap.getObject('__default_objective__'), m.o)
+        self.assertIs(smap.getObject('r_l_c2_'), m.c2)
+        self.assertIs(smap.getObject('r_u_c2_'), m.c2)
+        self.assertIs(smap.getObject('x(3)'), m.x[3])
+        # The fixed variable was compiled into the coefficients
+        self.assertNotIn(id(m.f), smap.byObject)
+
+    def test_fixed_format(self):
+        m = _model()
+        out, info = self._write(m, fixed_format=True)
+        self.assertEqual(
+            out,
+            """* Source:     Pyomo MPS Writer (version 2)
+* Format:     Fixed MPS
+*
+NAME          unknown
+OBJSENSE
+    MAX
+ROWS
+ N  x1
+ L  x2
+ G  x3
+ E  x4
+COLUMNS
+    x5        x1        3
+    x6        x1        1
+    x6        x2        1
+    x7        x3        1
+    x8        x1        0
+    x9        x1        2
+    x9        x2        1
+    x10       x3        -1
+    x11       x3        1
+RHS
+    RHS       x2        4
+    RHS       x3        1
+    RHS       x4        2
+RANGES
+    RNG       x3        2
+BOUNDS
+ FX BOUND     x5        1
+ LO BOUND     x6        0
+ UP BOUND     x6        4
+ LO BOUND     x7        0
+ UP BOUND     x7        4
+ LO BOUND     x8        0
+ UP BOUND     x8        4
+ LI BOUND     x9        -10E20
+ UI BOUND     x9        5
+ BV BOUND     x10
+ FR BOUND     x11
+SOS
+ S1 SOS       x12
+    x6        1
+    x7        2
+    x8        3
+QUADOBJ
+    x6        x7        1
+    x7        x7        4
+QCMATRIX   x4
+    x6        x8        0.5
+    x8        x6        0.5
+    x8        x8        1
+ENDATA
+""",
+        )
+        self.assertIs(info.symbol_map.getObject('x3'), m.c2)
+
+        m.c2.deactivate()
+        m.c3.deactivate()
+        m.s.deactivate()
+        m.x[1].setlb(-1e-300 / 3)
+        # The objective constant column also fits in fixed-format MPS
+        out, info = self._write(m, fixed_format=True, symbolic_solver_labels=True)
+        self.assertIn("    ONE_VAR   o         3\n", out)
+        self.assertIn(" FX BOUND     ONE_VAR   1\n", out)
+        # Numeric fields are truncated to 12 characters
+        m.c1.set_value(m.x[1] / 3 <= 1)
+        out, info = self._write(m, fixed_format=True)
+        self.assertIn("    x4        x2        0.3333333333\n", out)
+        self.assertIn(" LO BOUND     x4        -3.3333e-301\n", out)
+
+    def test_column_and_row_order(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3])
+        m.o = pyo.Objective(expr=m.x[1])
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: m.x[i] + m.x[3] >= i)
+        out, info = self._write(
+            m,
+            symbolic_solver_labels=True,
+            column_order=[m.x[3], m.x[2]],
+            row_order=[m.c[2]],
+            skip_objective_sense=True,
+        )
+        self.assertEqual(
+            out,
+            """* Source:     Pyomo MPS Writer (version 2)
+* Format:     Free MPS
+*
+NAME          unknown
+ROWS
+ N  o
+ G  c_l_c(2)_
+ G  c_l_c(1)_
+COLUMNS
+    x(3) c_l_c(2)_ 1
+    x(3) c_l_c(1)_ 1
+    x(2) c_l_c(2)_ 1
+    x(1) o 1
+    x(1) c_l_c(1)_ 1
+RHS
+    RHS c_l_c(2)_ 2
+    RHS c_l_c(1)_ 1
+BOUNDS
+ FR BOUND x(3)
+ FR BOUND x(2)
+ FR BOUND x(1)
+ENDATA
+""",
+        )
+
+    def test_trivial_constraints_and_default_objective(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.x.fix(1)
+        m.y = pyo.Var(bounds=(None, -1))
+        m.c1 = pyo.Constraint(expr=m.x >= 0)
+        m.c2 = pyo.Constraint(expr=m.x + m.y <= 5)
+        out, info = self._write(m, symbolic_solver_labels=True)
+        self.assertIn(" G  c_l_c1_\n", out)
+        self.assertIn("    RHS c_l_c1_ -1\n", out)
+        self.assertIn("    ONE_VAR_CONSTANT ScalarObjective 1.0\n", out)
+        self.assertIn(" MI BOUND y\n UP BOUND y -1\n", out)
+        out, info = self._write(
+            m, symbolic_solver_labels=True, skip_trivial_constraints=True
+        )
+        self.assertNotIn("c_l_c1_", out)
+        self.assertIn("    RHS c_u_c2_ 4\n", out)
+
+    def test_errors(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.o = pyo.Objective(expr=m.x**2, sense=pyo.maximize)
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Model objective \(o\) contains nonlinear terms that cannot be "
+            "written to MPS format",
+        ):
+            self._write(m, allow_quadratic_objective=False)
+        with self.assertRaisesRegex(ValueError, "Cannot write maximization objective"):
+            self._write(m, skip_objective_sense=True)
+        m.o.sense = pyo.minimize
+        m.c = pyo.Constraint(expr=pyo.exp(m.x) <= 1)
+        with self.assertRaisesRegex(
+            ValueError, r"Model constraint \(c\) contains nonlinear terms"
+        ):
+            self._write(m)
+        m.c.deactivate()
+        m.p = pyo.Objective(expr=m.x)
+        with self.assertRaisesRegex(
+            ValueError, "More than one active objective defined"
+        ):
+            self._write(m)
+
+    def test_warn_export_suffixes(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var()
+        m.obj = pyo.Objective(expr=m.x)
+        m.duals = pyo.Suffix(direction=pyo.Suffix.IMPORT_EXPORT)
+        m.duals[m.x] = 5
+        with LoggingIntercept() as LOG:
+            self._write(m)
+        self.assertEqual(
+            LOG.getvalue(),
+            """EXPORT Suffix 'duals' found on 1 block:
+    duals
+MPS writer cannot export suffixes to MPS files.  Skipping.
+""",
+        )
+
+    def test_repn_cache(self):
+        m = _model()
+        ref, _ = self._write(m)
+        cache = attach_repn_cache(m)
+        self.assertEqual(self._write(m)[0], ref)
+        self.assertEqual(self._write(m)[0], ref)
+        self.assertEqual((cache.hits, cache.misses), (4, 4))
+
+    def test_model_write(self):
+        m = _model()
+        self.assertIs(WriterFactory.get_class('mps_v2'), MPSWriter)
+        with TempfileManager.new_context() as tempfile:
+            fname = tempfile.create_tempfile(suffix='.mps')
+            _, smap_id = m.write(
+                fname,
+                format='mps_v2',
+                io_options={'symbolic_solver_labels': True},
+                int_marker=True,
+            )
+            with open(fname) as FILE:
+                out = FILE.read()
+        self.assertIn("    MARK0000 'MARKER' 'INTORG'\n", out)
+        self.assertIs(m.solutions.symbol_map[smap_id].getObject('c_u_c1_'), m.c1)
+
+
+if __name__ == "__main__":
+    unittest.main()
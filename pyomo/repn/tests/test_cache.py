@@ -0,0 +1,218 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import gc
+from io import StringIO
+from unittest import mock
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import scipy_available
+
+from pyomo.environ import (
+    ConcreteModel,
+    Var,
+    Param,
+    Expression,
+    Constraint,
+    Objective,
+    exp,
+)
+import pyomo.repn.cache as repn_cache
+from pyomo.repn.cache import (
+    RepnCache,
+    _attached_caches,
+    attach_repn_cache,
+    detach_repn_cache,
+    get_repn_cache,
+)
+from pyomo.repn.linear import LinearRepnVisitor
+from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.nl_writer import NLWriter
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+from pyomo.repn.tests.nl_diff import nl_diff
+
+
+def _model():
+    m = ConcreteModel()
+    m.I = [1, 2, 3]
+    m.p = Param(m.I, mutable=True, initialize=2)
+    m.x = Var(m.I, bounds=(0, 10))
+    m.y = Var(m.I)
+    m.e = Expression(expr=m.x[1] + m.x[2])
+    m.c = Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] + m.y[i] <= 10)
+    m.d = Constraint(expr=m.e + m.y[1] >= 0)
+    m.o = Objective(expr=sum(m.x.values()))
+    return m
+
+
+class TestRepnCache(unittest.TestCase):
+    def _write_lp(self, m, **options):
+        ans = StringIO()
+        LPWriter().write(m, ans, **options)
+        return ans.getvalue()
+
+    def test_attach_detach(self):
+        m = ConcreteModel()
+        self.assertIsNone(get_repn_cache(m))
+        cache = attach_repn_cache(m)
+        self.assertIsInstance(cache, RepnCache)
+        self.assertIs(attach_repn_cache(m), cache)
+        self.assertIs(get_repn_cache(m), cache)
+        detach_repn_cache(m)
+        self.assertIsNone(get_repn_cache(m))
+
+        cache = attach_repn_cache(m)
+        model_id = id(m)
+        self.assertIn(model_id, _attached_caches)
+        del m
+        gc.collect()
+        self.assertNotIn(model_id, _attached_caches)
+
+    def test_lp_writer(self):
+        m = _model()
+        baseline = self._write_lp(m)
+        cache = attach_repn_cache(m)
+        self.assertEqual(self._write_lp(m), baseline)
+        self.assertEqual((cache.hits, cache.misses), (0, 5))
+        self.assertEqual(self._write_lp(m), baseline)
+        self.assertEqual((cache.hits, cache.misses), (5, 5))
+
+        # Changing a mutable Param invalidates the constraints that use it
+        m.p[2] = 5
+        cache.hits = cache.misses = 0
+        self.assertEqual(self._write_lp(m), self._uncached_lp(m))
+        self.assertEqual((cache.hits, cache.misses), (4, 1))
+
+        # ... as does fixing a variable
+        m.y[3].fix(1)
+        cache.hits = cache.misses = 0
+        self.assertEqual(self._write_lp(m), self._uncached_lp(m))
+        self.assertEqual((cache.hits, cache.misses), (4, 1))
+
+        # ... or replacing the constraint (or a named) expression
+        m.c[1].set_value(m.x[1] + m.x[3] <= 5)
+        m.e.expr = 2 * m.x[1]
+        cache.hits = cache.misses = 0
+        self.assertEqual(self._write_lp(m), self._uncached_lp(m))
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+    def _uncached_lp(self, m):
+        # Note: the cache is not attached to the clone
+        return self._write_lp(m.clone())
+
+    @unittest.skipUnless(scipy_available, "standard form requires scipy")
+    def test_shared_between_lp_and_standard_form(self):
+        m = _model()
+        cache = attach_repn_cache(m)
+        self._write_lp(
+            m, allow_quadratic_objective=False, allow_quadratic_constraint=False
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 5))
+        self.assertEqual(len(cache.bucket(LinearRepnVisitor)), 5)
+
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertEqual((cache.hits, cache.misses), (5, 5))
+        detach_repn_cache(m)
+        ref = LinearStandardFormCompiler().write(m)
+        self.assertEqual(repn.rows, ref.rows)
+        self.assertEqual(repn.columns, ref.columns)
+        self.assertEqual(repn.A.todense().tolist(), ref.A.todense().tolist())
+        self.assertEqual(list(repn.rhs), list(ref.rhs))
+        self.assertEqual(repn.c.todense().tolist(), ref.c.todense().tolist())
+
+    def test_nl_writer(self):
+        m = _model()
+        m.c[3].set_value(exp(m.x[3]) + m.y[3] <= 10)
+        cache = attach_repn_cache(m)
+        writer = NLWriter()
+        for i in range(2):
+            OUT = StringIO()
+            writer.write(m, OUT)
+            baseline = StringIO()
+            NLWriter().write(m.clone(), baseline)
+            self.assertEqual(*nl_diff(baseline.getvalue(), OUT.getvalue()))
+        self.assertEqual(
+            set(writer._repn_cache.entries),
+            {id(c) for c in m.component_data_objects(Constraint)},
+        )
+        self.assertIs(writer._repn_cache.cache, cache)
+        self.assertEqual((writer._repn_cache.hits, writer._repn_cache.misses), (4, 0))
+
+    def test_nl_writer_validation_uses_change_log(self):
+        m = _model()
+        m.c[3].set_value(exp(m.x[3]) + m.y[3] <= 10)
+        writer = NLWriter()
+        with mock.patch.object(
+            repn_cache, '_collect_leaves', wraps=repn_cache._collect_leaves
+        ) as collect:
+            # Storing the entries does not walk the constraint bodies
+            writer.write(m, StringIO(), incremental=True)
+            self.assertEqual(collect.call_count, 0)
+            # The leaves are collected (once) when the entries are reused
+            writer.write(m, StringIO(), incremental=True)
+            self.assertEqual(collect.call_count, 4)
+            self.assertEqual(writer._repn_cache.hits, 4)
+
+            # Nothing changed: the entries are validated through the
+            # (empty) change log without revisiting the leaves
+            with mock.patch.object(
+                repn_cache.RepnCache, '_collect_leaves'
+            ) as recollect:
+                writer.write(m, StringIO(), incremental=True)
+                self.assertEqual(recollect.call_count, 0)
+            self.assertEqual(writer._repn_cache.hits, 4)
+
+            # Modifications are reported by the change log
+            m.p[2] = 5
+            m.y[3].fix(1)
+            OUT = StringIO()
+            writer.write(m, OUT, incremental=True)
+            self.assertEqual(
+                (writer._repn_cache.hits, writer._repn_cache.misses), (2, 2)
+            )
+            baseline = StringIO()
+            NLWriter().write(m, baseline)
+            self.assertEqual(*nl_diff(baseline.getvalue(), OUT.getvalue()))
+
+    def test_standard_repn(self):
+        m = _model()
+        cache = RepnCache()
+        c = m.c[1]
+        repn = cache.standard_repn(c, c.body, compute_values=False)
+        self.assertIs(cache.standard_repn(c, c.body, compute_values=False), repn)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # The parameter is not evaluated with compute_values=False
+        m.p[1] = 10
+        self.assertIs(cache.standard_repn(c, c.body, compute_values=False), repn)
+        self.assertIs(repn.linear_coefs[0], m.p[1])
+        # ... but is for compute_values=True
+        repn = cache.standard_repn(c, c.body)
+        self.assertEqual(repn.linear_coefs, (10, 1))
+        m.p[1] = 3
+        repn = cache.standard_repn(c, c.body)
+        self.assertEqual(repn.linear_coefs, (3, 1))
+        # Fixing variables always invalidates the entry
+        m.y[1].fix(0)
+        repn = cache.standard_repn(c, c.body, compute_values=False)
+        self.assertEqual(repn.linear_vars, (m.x[1],))
+
+    def test_entries_are_weak(self):
+        m = _model()
+        cache = attach_repn_cache(m)
+        self._write_lp(m)
+        self.assertEqual(len(cache), 5)
+        m.del_component(m.d)
+        gc.collect()
+        self.assertEqual(len(cache), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,11 @@
 import pyomo.common.unittest as unittest
 
 import pyomo.environ as pyo
+import pyomo.core.base.constraint as constraint
 
 from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
 from pyomo.common.log import LoggingIntercept
+from pyomo.repn import generate_standard_repn
 from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
 
 for sol in ['glpk', 'cbc', 'gurobi', 'cplex', 'xpress']:
@@ -77,6 +79,250 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         self.assertEqual(repn.rows, [(m.d, 1), (m.c, -1)])
         self.assertEqual(repn.columns, [m.y[3], m.x, m.y[1]])
 
+    def test_templatized_constraints(self):
+        def build():
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(3)
+            m.J = pyo.RangeSet(4)
+            m.p = pyo.Param(m.I, m.J, initialize=lambda m, i, j: i - j, mutable=True)
+            m.x = pyo.Var(m.I, m.J, bounds=(0, 1))
+            m.y = pyo.Var(m.I)
+            m.c = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: sum(m.p[i, j] * m.x[i, j] for j in m.J) + m.y[i]
+                <= 5 * i,
+            )
+            m.d = pyo.Constraint(
+                m.I, rule=lambda m, i: (-i, m.y[i] - sum(m.x[i, j] for j in m.J), i)
+            )
+            m.o = pyo.Objective(expr=sum(m.y.values()))
+            return m
+
+        ref_model = build()
+        ref = LinearStandardFormCompiler().write(ref_model)
+        with unittest.mock.patch.object(constraint, 'TEMPLATIZE_CONSTRAINTS', True):
+            m = build()
+        self.assertIs(type(m.c[1]), constraint.TemplateConstraintData)
+        repn = LinearStandardFormCompiler().write(m)
+        self.assertTrue(np.all(repn.A.todense() == ref.A.todense()))
+        self.assertTrue(np.all(repn.c.todense() == ref.c.todense()))
+        self.assertEqual(list(repn.rhs), list(ref.rhs))
+        self.assertEqual([v.name for v in repn.columns], [v.name for v in ref.columns])
+        self.assertEqual(
+            [(r.constraint.name, r.bound_type) for r in repn.rows],
+            [(r.constraint.name, r.bound_type) for r in ref.rows],
+        )
+
+        # Nonlinear templates fall back on the rule-generated expressions
+        with unittest.mock.patch.object(constraint, 'TEMPLATIZE_CONSTRAINTS', True):
+            m.q = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] ** 2 <= 4)
+        self.assertIs(type(m.q[1]), constraint.TemplateConstraintData)
+        with self.assertRaisesRegex(
+            ValueError, r"Model constraint \(q\[1\]\) contains nonlinear terms"
+        ):
+            LinearStandardFormCompiler().write(m)
+        self.assertIs(type(m.q[1]), constraint.ConstraintData)
+
+    def _assert_csc(self, M, shape, data, indices, indptr):
+        self.assertEqual(M.format, 'csc')
+        self.assertEqual(M.shape, shape)
+        self.assertEqual(M.data.tolist(), data)
+        self.assertEqual(M.indices.tolist(), indices)
+        self.assertEqual(M.indptr.tolist(), indptr)
+
+    def test_empty_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2])
+
+        repn = LinearStandardFormCompiler().write(m)
+        self._assert_csc(repn.c, (0, 0), [], [], [0])
+        self._assert_csc(repn.A, (0, 0), [], [], [0])
+        self.assertEqual(list(repn.rhs), [])
+        self.assertEqual(repn.rows, [])
+        self.assertEqual(repn.columns, [])
+
+        # Trivial constraints do not generate (empty) rows
+        m.o = pyo.Objective(expr=m.x[1] + 2 * m.x[2] + 3)
+        m.c = pyo.Constraint(expr=pyo.inequality(-5, m.x[1] - m.x[1], 5))
+        for form in ({}, {'slack_form': True}, {'mixed_form': True}):
+            repn = LinearStandardFormCompiler().write(m, **form)
+            self._assert_csc(repn.c, (1, 2), [1, 2], [0, 0], [0, 1, 2])
+            self._assert_csc(repn.A, (0, 2), [], [], [0, 0, 0])
+            self.assertEqual(repn.c_offset.tolist(), [3])
+            self.assertEqual(list(repn.rhs), [])
+            self.assertEqual(repn.rows, [])
+            self.assertEqual(repn.columns, [m.x[1], m.x[2]])
+
+    def test_dense_model(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.x = pyo.Var(m.I)
+        m.o = pyo.Objective(expr=sum(i * m.x[i] for i in m.I))
+        m.c = pyo.Constraint(
+            m.I, rule=lambda m, i: sum((i + j) * m.x[j] for j in m.I) <= 10 * i
+        )
+        m.r = pyo.Constraint(expr=pyo.inequality(-1, sum(m.x.values()), 1))
+        m.e = pyo.Constraint(expr=m.x[1] + 2 * m.x[2] + 3 * m.x[3] == 4)
+
+        repn = LinearStandardFormCompiler().write(m)
+        self._assert_csc(repn.c, (1, 3), [1, 2, 3], [0, 0, 0], [0, 1, 2, 3])
+        self._assert_csc(
+            repn.A,
+            (7, 3),
+            [2, 3, 4, 1, -1, 1, -1, 3, 4, 5, 1, -1, 2, -2, 4, 5, 6, 1, -1, 3, -3],
+            [0, 1, 2, 3, 4, 5, 6] * 3,
+            [0, 7, 14, 21],
+        )
+        self.assertEqual(list(repn.rhs), [10, 20, 30, 1, 1, 4, -4])
+        self.assertEqual(
+            repn.rows,
+            [(m.c[1], 1), (m.c[2], 1), (m.c[3], 1), (m.r, 1), (m.r, -1)]
+            + [(m.e, 1), (m.e, -1)],
+        )
+        self.assertEqual(repn.columns, list(m.x.values()))
+
+        repn = LinearStandardFormCompiler().write(m, slack_form=True)
+        self._assert_csc(repn.c, (1, 7), [1, 2, 3], [0, 0, 0], [0, 1, 2, 3, 3, 3, 3, 3])
+        self._assert_csc(
+            repn.A,
+            (5, 7),
+            [2, 3, 4, 1, 1, 3, 4, 5, 1, 2, 4, 5, 6, 1, 3, 1, 1, 1, 1],
+            [0, 1, 2, 3, 4] * 3 + [0, 1, 2, 3],
+            [0, 5, 10, 15, 16, 17, 18, 19],
+        )
+        self.assertEqual(list(repn.rhs), [10, 20, 30, -1, 4])
+        self.assertEqual(
+            [v.name for v in repn.columns[3:]],
+            ['_slack_0', '_slack_1', '_slack_2', '_slack_3'],
+        )
+
+    def test_mixed_sign_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(-2, 3))
+        m.y = pyo.Var(bounds=(None, 0))
+        m.z = pyo.Var(bounds=(1, None))
+        m.w = pyo.Var()
+        m.o = pyo.Objective(expr=-m.x + 2 * m.y - 3 * m.z + m.w, sense=pyo.maximize)
+        m.c1 = pyo.Constraint(expr=-m.x + m.y >= -4)
+        m.c2 = pyo.Constraint(expr=pyo.inequality(-3, 2 * m.x - m.z + 5 * m.w, 7))
+        m.c3 = pyo.Constraint(expr=-m.y - m.w == 1)
+        m.c4 = pyo.Constraint(expr=m.z - 3 * m.x <= 0)
+
+        repn = LinearStandardFormCompiler().write(m)
+        self._assert_csc(repn.c, (1, 4), [1, -2, 3, -1], [0] * 4, [0, 1, 2, 3, 4])
+        self._assert_csc(
+            repn.A,
+            (6, 4),
+            [1, 2, -2, -3, -1, -1, 1, -1, 1, 1, 5, -5, -1, 1],
+            [0, 1, 2, 5, 0, 3, 4, 1, 2, 5, 1, 2, 3, 4],
+            [0, 4, 7, 10, 14],
+        )
+        self.assertEqual(list(repn.rhs), [4, 7, 3, 1, -1, 0])
+        self.assertEqual(
+            repn.rows,
+            [(m.c1, -1), (m.c2, 1), (m.c2, -1), (m.c3, 1), (m.c3, -1), (m.c4, 1)],
+        )
+        self.assertEqual(repn.columns, [m.x, m.y, m.z, m.w])
+
+        repn = LinearStandardFormCompiler().write(m, mixed_form=True)
+        self._assert_csc(
+            repn.A,
+            (5, 4),
+            [-1, 2, 2, -3, 1, -1, -1, -1, 1, 5, 5, -1],
+            [0, 1, 2, 4, 0, 3, 1, 2, 4, 1, 2, 3],
+            [0, 4, 6, 9, 12],
+        )
+        self.assertEqual(list(repn.rhs), [-4, 7, -3, 1, 0])
+        self.assertEqual(
+            repn.rows, [(m.c1, -1), (m.c2, 1), (m.c2, -1), (m.c3, 0), (m.c4, 1)]
+        )
+
+        repn = LinearStandardFormCompiler().write(m, nonnegative_vars=True)
+        self._assert_csc(
+            repn.c, (1, 6), [-1, 1, 2, 3, 1, -1], [0] * 6, [0, 1, 2, 3, 4, 5, 6]
+        )
+        self._assert_csc(
+            repn.A,
+            (6, 6),
+            [-1, -2, 2, 3, 1, 2, -2, -3, 1, 1, -1]
+            + [-1, 1, 1, -5, 5, 1, -1, 5, -5, -1, 1],
+            [0, 1, 2, 5, 0, 1, 2, 5, 0, 3, 4, 1, 2, 5, 1, 2, 3, 4, 1, 2, 3, 4],
+            [0, 4, 8, 11, 14, 18, 22],
+        )
+        self.assertEqual(list(repn.rhs), [4, 7, 3, 1, -1, 0])
+        self.assertEqual(
+            [v.name for v in repn.columns],
+            ['_neg_0', '_pos_0', '_neg_1', 'z', '_neg_3', '_pos_3'],
+        )
+
+    def _reference_rows(self, m, columns, mixed_form):
+        # Dense rows generated independently of the compiler (from
+        # generate_standard_repn) following the standard form rules
+        col = {id(v): i for i, v in enumerate(columns)}
+        A = []
+        rhs = []
+        for con in m.component_data_objects(pyo.Constraint, active=True):
+            repn = generate_standard_repn(con.body, compute_values=True)
+            row = np.zeros(len(columns))
+            for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+                row[col[id(v)]] += coef
+            lb, ub = con.lb, con.ub
+            if mixed_form:
+                if lb == ub:
+                    A.append(row)
+                    rhs.append(ub - repn.constant)
+                    continue
+                if ub is not None:
+                    A.append(row)
+                    rhs.append(ub - repn.constant)
+                if lb is not None:
+                    A.append(row)
+                    rhs.append(lb - repn.constant)
+            else:
+                if ub is not None:
+                    A.append(row)
+                    rhs.append(ub - repn.constant)
+                if lb is not None:
+                    A.append(-row)
+                    rhs.append(repn.constant - lb)
+        return np.array(A), np.array(rhs)
+
+    def test_matches_reference_assembly(self):
+        # A (deterministic) mix of ranged, equality, and one-sided
+        # constraints with varying densities and constant offsets
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(40)
+        m.J = pyo.RangeSet(120)
+        m.x = pyo.Var(m.I)
+
+        def c_rule(m, j):
+            terms = [i for i in m.I if (i * j) % 7 < 1 + j % 4]
+            body = sum(((i + 2 * j) % 9 - 4.5) * m.x[i] for i in terms) + j % 3
+            if j % 4 == 0:
+                return pyo.inequality(-j, body, j)
+            elif j % 4 == 1:
+                return body == j / 4
+            elif j % 4 == 2:
+                return body <= 2 * j
+            return body >= -j
+
+        m.c = pyo.Constraint(m.J, rule=c_rule)
+        m.o = pyo.Objective(expr=sum((i % 5 - 2) * m.x[i] for i in m.I))
+        nnz = sum(len(generate_standard_repn(c.body).linear_vars) for c in m.c.values())
+        self.assertGreater(nnz, 1000)
+
+        for mixed_form in (False, True):
+            repn = LinearStandardFormCompiler().write(m, mixed_form=mixed_form)
+            A, rhs = self._reference_rows(m, repn.columns, mixed_form)
+            self.assertEqual(repn.A.format, 'csc')
+            self.assertEqual(repn.A.dtype, np.float64)
+            self.assertTrue(repn.A.has_sorted_indices)
+            self.assertTrue(repn.A.has_canonical_format)
+            self.assertEqual(repn.A.shape, A.shape)
+            self.assertEqual(repn.A.nnz, np.count_nonzero(A))
+            self.assertTrue(np.array_equal(repn.A.toarray(), A))
+            self.assertTrue(np.array_equal(np.asarray(repn.rhs), rhs))
+
     def test_suffix_warning(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var()
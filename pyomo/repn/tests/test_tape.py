@@ -0,0 +1,162 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
+
+from pyomo.core.expr import LinearExpression
+from pyomo.environ import (
+    ConcreteModel,
+    Var,
+    Param,
+    Expression,
+    Expr_if,
+    ExternalFunction,
+    value,
+    exp,
+    log,
+    log10,
+    sqrt,
+    sin,
+    cos,
+    tan,
+    sinh,
+    cosh,
+    tanh,
+    asin,
+    acos,
+    atan,
+    asinh,
+    acosh,
+    atanh,
+    floor,
+)
+from pyomo.repn.tape import ExpressionTape
+
+
+@unittest.skipUnless(numpy_available, 'numpy is not available')
+class TestExpressionTape(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize={1: 0.5, 2: 1.5, 3: 2.5})
+        m.y = Var(initialize=3)
+        m.y.fix()
+        m.p = Param(initialize=2, mutable=True)
+        m.e = Expression(expr=m.x[1] * m.x[2] + m.p)
+        m.exprs = [
+            m.x[1] + 2 * m.x[2] - m.y,
+            m.x[1] * m.x[1] * m.x[2],
+            m.x[1] / m.x[2] - m.x[3] ** 2,
+            m.x[2] ** m.x[3] + m.p ** m.x[1],
+            exp(m.x[1]) + log(m.x[2]) + log10(m.x[3]) + sqrt(m.x[2]),
+            sin(m.x[1]) * cos(m.x[2]) + tan(m.x[1]),
+            sinh(m.x[1]) + cosh(m.x[2]) + tanh(m.x[3]),
+            asin(m.x[1]) + acos(m.x[1]) + atan(m.x[2]),
+            asinh(m.x[1]) + acosh(m.x[2]) + atanh(m.x[1]),
+            -abs(m.x[1] - m.x[2]) + floor(m.x[3]),
+            m.e * m.e + m.e / m.x[3],
+            Expr_if(m.x[1] <= m.x[2], m.x[3], m.x[1] * 3),
+            Expr_if(m.x[1] >= m.x[2], m.x[3], m.x[1] * 3),
+            LinearExpression([m.p, 2 * m.x[1], m.p * m.x[2]]),
+            m.x[2],
+            m.p * m.y,
+            m.e,
+        ]
+        return m
+
+    def test_evaluate(self):
+        m = self._model()
+        tape = ExpressionTape(m.exprs, m.x.values())
+        self.assertEqual(len(tape), len(m.exprs))
+        ref = [value(e) for e in m.exprs]
+        self.assertStructuredAlmostEqual(list(tape.evaluate()), ref, places=12)
+
+        pts = np.array([[0.5, 1.5, 2.5], [0.2, 1.2, 0.7], [0.3, 4, 1]])
+        vals = tape.evaluate(pts)
+        self.assertEqual(vals.shape, (3, len(m.exprs)))
+        for pt, row in zip(pts, vals):
+            m.x.set_values(dict(zip([1, 2, 3], pt)))
+            ref = [value(e) for e in m.exprs]
+            self.assertStructuredAlmostEqual(list(row), ref, places=12)
+            self.assertStructuredAlmostEqual(
+                list(tape.evaluate(pt)), list(row), places=15
+            )
+
+    def test_jacobian(self):
+        m = self._model()
+        variables = list(m.x.values())
+        tape = ExpressionTape(m.exprs, variables)
+        rows, cols = tape.jacobian_structure()
+        self.assertEqual(len(rows), len(cols))
+
+        for pt in ([0.5, 1.5, 2.5], [0.2, 1.2, 0.7]):
+            m.x.set_values(dict(zip([1, 2, 3], pt)))
+            jac = tape.jacobian(pt)
+            dense = np.zeros((len(m.exprs), len(variables)))
+            dense[rows, cols] = jac
+            # Compare against central finite differences
+            h = 1e-6
+            ref = np.zeros(dense.shape)
+            for j, v in enumerate(variables):
+                v.value = pt[j] + h
+                ref[:, j] = [value(e) for e in m.exprs]
+                v.value = pt[j] - h
+                ref[:, j] -= [value(e) for e in m.exprs]
+                v.value = pt[j]
+            ref /= 2 * h
+            for i in range(len(m.exprs)):
+                self.assertStructuredAlmostEqual(list(dense[i]), list(ref[i]), places=6)
+
+    def test_parameters_are_compiled(self):
+        m = self._model()
+        tape = ExpressionTape([m.p * m.x[1] + m.y], [m.x[1]])
+        self.assertEqual(list(tape.evaluate([2])), [7])
+        m.p = 10
+        m.y.value = 0
+        # Changing non-variable leaves requires recompiling the tape
+        self.assertEqual(list(tape.evaluate([2])), [7])
+        tape = ExpressionTape([m.p * m.x[1] + m.y], [m.x[1]])
+        self.assertEqual(list(tape.evaluate([2])), [20])
+
+    def test_evaluation_errors(self):
+        m = self._model()
+        tape = ExpressionTape([log(m.x[1]), 1 / m.x[1]], [m.x[1]])
+        vals = tape.evaluate([0])
+        self.assertEqual(vals[0], -float('inf'))
+        self.assertEqual(vals[1], float('inf'))
+        vals = tape.evaluate([-1])
+        self.assertTrue(np.isnan(vals[0]))
+
+    def test_errors(self):
+        m = self._model()
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Variable 'x\[2\]' appears in an expression, but is neither "
+            "fixed nor included in the variable ordering",
+        ):
+            ExpressionTape([m.x[1] + m.x[2]], [m.x[1]])
+
+        m.f = ExternalFunction(library='foo.so', function='bar')
+        with self.assertRaisesRegex(
+            ValueError,
+            "Cannot compile expression nodes of type 'ExternalFunctionExpression'",
+        ):
+            ExpressionTape([m.f(m.x[1])], [m.x[1]])
+
+        tape = ExpressionTape([m.x[1] + m.x[2]], [m.x[1], m.x[2]])
+        with self.assertRaisesRegex(ValueError, r"Expected values for 2 variables"):
+            tape.evaluate([1, 2, 3])
+        with self.assertRaisesRegex(ValueError, "only supports evaluating a single"):
+            tape.jacobian([[1, 2], [3, 4]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,6 +64,7 @@ _named_subexpression_types = (
 HALT_ON_EVALUATION_ERROR = False
 nan = float('nan')
 int_float = {int, float}
+_linear_term_types = {EXPR.MonomialTermExpression, EXPR.LinearExpression}
 
 
 class ExprType(enums.IntEnum):
@@ -771,14 +772,31 @@ class VarRecorder(object):
         # order in which we would see the variables)
         vm = self.var_map
         try:
-            _iter = var.parent_component().values(self.sorter)
+            _iter = var.parent_component()._unfixed_items(self.sorter)
         except AttributeError:
             # Note that this only works for the AML, as kernel does not
             # provide a parent_component()
-            _iter = (var,)
-        for v in _iter:
-            if not v.fixed:
-                vm[id(v)] = v
+            _iter = () if var.fixed else ((None, var),)
+        for _, v in _iter:
+            vm[id(v)] = v
+
+
+class VarMapRecorder(object):
+    """Record only the variables that appear in the compiled expressions
+
+    Unlike :py:class:`VarRecorder`, this does not add the other
+    (unfixed) members of the variable's parent component to the
+    `var_map`.  This is for callers that only use the `var_map` to map
+    variable ids back to the variables (and take the variable order
+    from the compiled representation).
+
+    """
+
+    def __init__(self, var_map):
+        self.var_map = var_map
+
+    def add(self, var):
+        self.var_map[id(var)] = var
 
 
 class OrderedVarRecorder(object):
@@ -796,7 +814,13 @@ class OrderedVarRecorder(object):
         vm = self.var_map
         vo = self.var_order
         try:
-            _iter = var.parent_component().values(self.sorter)
+            var_comp = var.parent_component()
+            if getattr(var_comp, '_array', None) is not None:
+                # Array-backed Var: only record (and create VarData
+                # views for) the elements that are not fixed
+                _iter = (v for _, v in var_comp._unfixed_items(self.sorter))
+            else:
+                _iter = var_comp.values(self.sorter)
         except AttributeError:
             # Note that this only works for the AML, as kernel does not
             # provide a parent_component()
@@ -859,6 +883,55 @@ class TemplateVarRecorder(object):
                 vo[vid] = i
 
 
+class OrderedTemplateVarRecorder(TemplateVarRecorder):
+    """A TemplateVarRecorder following the OrderedVarRecorder conventions
+
+    Fixed variables are recorded in the `var_order` but not in the
+    `var_map`.  The template environment maps each variable index
+    directly to the variable id (and not a column number), or to a
+    1-tuple containing the variable value for fixed variables (see
+    ``LinearTemplateRepnVisitor(remove_fixed_vars=True)``).  This allows
+    a single recorder to be shared between the template and "normal"
+    (e.g., :py:class:`LinearRepnVisitor`) visitors.
+
+    """
+
+    def add(self, var):
+        var_comp = var.parent_component()
+        name = self.symbolmap.getSymbol(var_comp)
+        if name in self.env:
+            return
+        vm = self.var_map
+        ve = self.env[name] = {}
+        vo = self._var_order
+        if getattr(var_comp, '_array', None) is not None:
+            # Array-backed Var: read the fixed elements directly from the
+            # array storage, and only record (and create VarData views
+            # for) the elements that are not fixed
+            for (idx, val), fixed in zip(
+                var_comp.get_values().items(), var_comp.get_fixed_array().tolist()
+            ):
+                if fixed:
+                    ve[idx] = (val,)
+            _iter = var_comp._unfixed_items(self.sorter)
+        else:
+            try:
+                _iter = var_comp.items(self.sorter)
+            except AttributeError:
+                # Note that this only works for the AML, as kernel does
+                # not provide a parent_component()
+                _iter = ((None, var),)
+        for idx, v in _iter:
+            vid = id(v)
+            if vid not in vo:
+                vo[vid] = len(vo)
+            if v.fixed:
+                ve[idx] = (v.value,)
+            else:
+                ve[idx] = vid
+                vm[vid] = v
+
+
 # Copied from cpxlp.py:
 # Keven Hunter made a nice point about using %.16g in his attachment
 # to ticket #4319. I am adjusting this to %.17g as this mocks the
@@ -872,6 +945,7 @@ class TemplateVarRecorder(object):
 #               and you will need to go add extra logic to output
 #               the number's sign.
 _ftoa_precision_str = '%.17g'
+_ftoa_max_int = 2**53
 
 
 def ftoa(val, parenthesize_negative_values=False):
@@ -879,6 +953,11 @@ def ftoa(val, parenthesize_negative_values=False):
         return val
     #
     # Basic checking, including conversion of *fixed* Pyomo types to floats
+    if val.__class__ is int and -_ftoa_max_int < val < _ftoa_max_int:
+        # Fast path: (small) integers are their own shortest representation
+        if parenthesize_negative_values and val < 0:
+            return '(' + str(val) + ')'
+        return str(val)
     if type(val) in native_numeric_types:
         _val = val
     else:
@@ -915,3 +994,71 @@ def ftoa(val, parenthesize_negative_values=False):
         return '(' + a[:i] + ')'
     else:
         return a[:i]
+
+
+def compile_linear_part(expr, linear_visitor):
+    """Compile the linear terms of a sum using a :py:class:`LinearRepnVisitor`
+
+    This allows writers that emit expressions as strings to write the
+    linear part of (potentially very large) sums as a coefficient list
+    and only convert the remaining (nonlinear) terms to strings.  The
+    top-level terms of ``expr`` that are native constants, variables,
+    monomial or linear expressions, or non-potentially-variable
+    expressions are compiled with ``linear_visitor``.  As these terms
+    are leaves for the :py:class:`LinearRepnVisitor`, they are passed
+    directly to its ``beforeChild()`` callback (avoiding the overhead
+    of a full walk for the typically short sums in nonlinear models).
+
+    Returns
+    -------
+    tuple:
+        ``(repn, other)``, where ``repn`` is the linear representation
+        of the linear terms and ``other`` is the sum of the remaining
+        terms (``None`` if all terms are linear).  Returns ``(None,
+        None)`` if ``expr`` is not a sum, has no linear terms, or the
+        linear terms could not be compiled to numeric coefficients.
+
+    """
+    if expr.__class__ is EXPR.LinearExpression:
+        repn = linear_visitor.walk_expression(expr)
+        other = None
+    elif expr.__class__ is EXPR.SumExpression:
+        before_child_dispatcher = linear_visitor.before_child_dispatcher
+        repn = linear_visitor.Result()
+        append = repn.append
+        other = []
+        for arg in expr.args:
+            if arg.__class__ in native_numeric_types:
+                repn.constant += arg
+                continue
+            if arg.__class__ not in _linear_term_types:
+                if arg.is_expression_type():
+                    if arg.is_potentially_variable():
+                        other.append(arg)
+                        continue
+                elif not arg.is_variable_type():
+                    other.append(arg)
+                    continue
+            descend, child_result = before_child_dispatcher[arg.__class__](
+                linear_visitor, arg
+            )
+            if descend:
+                other.append(arg)
+            else:
+                append(child_result)
+        if len(other) == expr.nargs():
+            return None, None
+        repn = linear_visitor.finalizeResult(repn.walker_exitNode())
+        if not other:
+            other = None
+        elif len(other) == 1:
+            other = other[0]
+        else:
+            other = EXPR.SumExpression(other)
+    else:
+        return None, None
+    if repn.nonlinear is not None or (
+        repn.constant.__class__ not in native_numeric_types
+    ):
+        return None, None
+    return repn, other
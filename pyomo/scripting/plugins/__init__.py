@@ -11,4 +11,11 @@
 
 
 def load():
-    from pyomo.scripting.plugins import convert, solve, download, build_ext, extras
+    from pyomo.scripting.plugins import (
+        convert,
+        solve,
+        download,
+        build_ext,
+        extras,
+        benchmark,
+    )
@@ -0,0 +1,171 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2024
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+import json
+import sys
+
+from pyomo.scripting.pyomo_parser import add_subparser
+
+
+class BenchmarkRunner(object):
+    def create_parser(self, parser):
+        return parser
+
+    def call(self, args, unparsed):
+        from pyomo.benchmarks import (
+            BenchmarkModels,
+            run_benchmarks,
+            compare_results,
+            format_comparison,
+        )
+
+        if args.list:
+            for name in BenchmarkModels:
+                print("%-16s %s" % (name, BenchmarkModels.doc(name)))
+            return 0
+        for name in args.models:
+            if name not in BenchmarkModels:
+                sys.stderr.write(
+                    "Unknown benchmark model '%s' (expected one of %s)\n"
+                    % (name, ', '.join(BenchmarkModels))
+                )
+                return 1
+
+        results = run_benchmarks(
+            models=args.models or None,
+            sizes=args.sizes or [100],
+            writers=args.writers or ['nl', 'lp'],
+            repeat=args.repeat,
+            memory=args.memory,
+            log=sys.stderr,
+            visitors=args.visitors or (),
+            serializers=args.serializers or (),
+            cloners=args.cloners or (),
+        )
+        if args.output:
+            with open(args.output, 'w') as FILE:
+                json.dump(results, FILE, indent=2)
+        else:
+            json.dump(results, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+
+        if args.compare:
+            with open(args.compare, 'r') as FILE:
+                baseline = json.load(FILE)
+            format_comparison(compare_results(baseline, results), sys.stderr)
+        return 0
+
+
+#
+# Add a subparser for the benchmark command
+#
+_benchmark_runner = BenchmarkRunner()
+_parser = _benchmark_runner.create_parser(
+    add_subparser(
+        'benchmark',
+        func=_benchmark_runner.call,
+        help='Run the Pyomo performance benchmarks',
+        description='This builds and writes a set of scalable models, '
+        'recording the construction time, write time, model file save / '
+        'load time, clone time, peak memory and representation cache '
+        'statistics as JSON',
+    )
+)
+
+_parser.add_argument(
+    'models', nargs='*', help="The models to run (default: all models)"
+)
+_parser.add_argument(
+    '-l',
+    '--list',
+    action='store_true',
+    dest='list',
+    default=False,
+    help="List the available models and exit",
+)
+_parser.add_argument(
+    '-n',
+    '--size',
+    action='append',
+    type=int,
+    dest='sizes',
+    default=None,
+    help="Size parameter for the models (may be specified multiple times; "
+    "default: 100)",
+)
+_parser.add_argument(
+    '-w',
+    '--writer',
+    action='append',
+    choices=['nl', 'lp', 'gams', 'baron', 'standard_form'],
+    dest='writers',
+    default=None,
+    help="Writer to benchmark (may be specified multiple times; default: nl, lp)",
+)
+_parser.add_argument(
+    '--visitor',
+    action='append',
+    choices=['linear', 'identify_variables', 'fbbt'],
+    dest='visitors',
+    default=None,
+    help="Expression visitor to benchmark (may be specified multiple times; "
+    "default: none)",
+)
+_parser.add_argument(
+    '--serializer',
+    action='append',
+    choices=['model_file'],
+    dest='serializers',
+    default=None,
+    help="Serializer to benchmark (save and load the model; may be specified "
+    "multiple times; default: none)",
+)
+_parser.add_argument(
+    '--cloner',
+    action='append',
+    choices=['copy', 'share'],
+    dest='cloners',
+    default=None,
+    help="Block.clone() variant to benchmark (copy: clone(), share: "
+    "clone(share=True); may be specified multiple times; default: none)",
+)
+_parser.add_argument(
+    '-r',
+    '--repeat',
+    action='store',
+    type=int,
+    dest='repeat',
+    default=1,
+    help="Number of times to repeat each timing (the best time is reported)",
+)
+_parser.add_argument(
+    '--no-memory',
+    action='store_false',
+    dest='memory',
+    default=True,
+    help="Do not record peak memory usage",
+)
+_parser.add_argument(
+    '-o',
+    '--output',
+    action='store',
+    dest='output',
+    default=None,
+    help="Write the results to this JSON file (default: stdout)",
+)
+_parser.add_argument(
+    '--compare',
+    action='store',
+    dest='compare',
+    default=None,
+    help="Compare the results against a previous JSON results file",
+)
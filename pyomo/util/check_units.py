@@ -263,16 +263,20 @@ def assert_units_consistent(obj):
     if handler is None:
         return
 
-    if obj.is_indexed():
-        # check all the component data objects
-        for cdata in obj.values():
-            try:
-                handler(cdata)
-            except UnitsError:
-                logger.error('Error in units when checking {}'.format(cdata))
-                raise
-    else:
-        handler(obj)
+    # Cache the units of named expressions for the duration of the
+    # check (so they are only computed once, regardless of how many
+    # times they appear in the model)
+    with units.units_cache():
+        if obj.is_indexed():
+            # check all the component data objects
+            for cdata in obj.values():
+                try:
+                    handler(cdata)
+                except UnitsError:
+                    logger.error('Error in units when checking {}'.format(cdata))
+                    raise
+        else:
+            handler(obj)
 
 
 def identify_inconsistent_units(block):
@@ -295,11 +299,12 @@ def identify_inconsistent_units(block):
     # so we need to iterate over the block here and do a try/except for each component
 
     inconsistent_units = ComponentSet()
-    for obj in block.component_data_objects(
-        [Constraint, Expression, Objective], descend_into=True
-    ):
-        try:
-            assert_units_consistent(obj)
-        except UnitsError:
-            inconsistent_units.add(obj)
+    with units.units_cache():
+        for obj in block.component_data_objects(
+            [Constraint, Expression, Objective], descend_into=True
+        ):
+            try:
+                assert_units_consistent(obj)
+            except UnitsError:
+                inconsistent_units.add(obj)
     return inconsistent_units
@@ -97,6 +97,7 @@ if using_cython:
             "pyomo/core/expr/numeric_expr.pyx",
             "pyomo/core/expr/logical_expr.pyx",
             # "pyomo/core/expr/visitor.pyx",
+            "pyomo/core/expr/_visitor_core.pyx",
             "pyomo/core/util.pyx",
             "pyomo/repn/standard_repn.pyx",
             "pyomo/repn/plugins/cpxlp.pyx",